@@ -0,0 +1,36 @@
+/**
+ * API Route Dispatch Tests
+ * @jest-environment node
+ */
+import { GET } from '@/app/api/[[...path]]/route'
+
+function apiGet(path) {
+  const request = new Request(`http://localhost/api/${path}`)
+  return GET(request, { params: { path: path.split('/') } })
+}
+
+describe('API route dispatch', () => {
+  const env = { ...process.env }
+
+  beforeEach(() => {
+    // Nothing listens on port 1: any connect attempt fails
+    process.env.MONGO_URL = 'mongodb://127.0.0.1:1'
+    process.env.MONGO_SERVER_SELECTION_TIMEOUT_MS = '200'
+    delete process.env.METRICS_TOKEN
+  })
+
+  afterEach(() => {
+    process.env = { ...env }
+  })
+
+  it('should serve /metrics while MongoDB is unreachable', async () => {
+    const res = await apiGet('metrics')
+    expect(res.status).toBe(200)
+    expect(res.headers.get('content-type')).toContain('text/plain')
+  })
+
+  it('should return 500 for database routes while MongoDB is unreachable', async () => {
+    const res = await apiGet('divisions')
+    expect(res.status).toBe(500)
+  })
+})
@@ -0,0 +1,48 @@
+/**
+ * @jest-environment node
+ */
+/**
+ * Auth Unit Tests
+ */
+import { getUserProfile } from '@/lib/auth'
+import { clearAuthCache, getAuthCacheStats } from '@/lib/authCache'
+import { invalidateMasterData } from '@/lib/masterData'
+
+function createDb() {
+  const docs = {
+    sessions: [{ token: 'tok-1', user_id: 'u-1' }],
+    users: [{ id: 'u-1', name: 'RO', password: 'secret', division_id: 'div-1', range_id: null }],
+    divisions: [{ id: 'div-1', name: 'Dharwad' }],
+    ranges: [],
+  }
+  return {
+    collection: (name) => ({
+      findOne: jest.fn(async (query) => docs[name].find(d => Object.entries(query).every(([k, v]) => d[k] === v)) || null),
+      find: () => ({ toArray: async () => docs[name].map(d => ({ ...d })) }),
+    }),
+  }
+}
+
+describe('Auth', () => {
+  beforeEach(() => {
+    clearAuthCache()
+    invalidateMasterData()
+  })
+
+  it('should count one cache lookup per profile request', async () => {
+    const db = createDb()
+    const before = getAuthCacheStats()
+
+    const profile = await getUserProfile(db, 'tok-1')
+    expect(profile).toMatchObject({ id: 'u-1', division_name: 'Dharwad', range_name: null })
+    expect(profile.password).toBeUndefined()
+    expect(getAuthCacheStats()).toMatchObject({ hits: before.hits, misses: before.misses + 1 })
+
+    expect(await getUserProfile(db, 'tok-1')).toBe(profile)
+    expect(getAuthCacheStats()).toMatchObject({ hits: before.hits + 1, misses: before.misses + 1 })
+  })
+
+  it('should return null for an unknown session', async () => {
+    expect(await getUserProfile(createDb(), 'tok-x')).toBeNull()
+  })
+})
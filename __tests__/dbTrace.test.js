@@ -0,0 +1,86 @@
+/**
+ * DB Trace Unit Tests
+ */
+import { EventEmitter } from 'events'
+import { DbTrace, getCurrentTrace, attachCommandTracing, warnOnCommandCount } from '@/lib/dbTrace'
+
+let nextRequestId = 1
+
+function runCommand(client, commandName, command, reply, duration = 2) {
+  const requestId = nextRequestId++
+  client.emit('commandStarted', { requestId, commandName, command })
+  client.emit('commandSucceeded', { requestId, commandName, duration, reply })
+}
+
+describe('DB Trace', () => {
+  const client = new EventEmitter()
+  attachCommandTracing(client)
+
+  it('should attribute commands to the trace of the running request', async () => {
+    const trace = new DbTrace()
+    await trace.run(async () => {
+      expect(getCurrentTrace()).toBe(trace)
+      runCommand(client, 'find', { find: 'apo_items' }, { cursor: { firstBatch: [{}, {}, {}] } })
+      await Promise.resolve()
+      runCommand(client, 'getMore', { getMore: 1, collection: 'apo_items' }, { cursor: { nextBatch: [{}] } })
+      runCommand(client, 'findAndModify', { findAndModify: 'apo_headers' }, { value: { id: 'apo-1' } }, 3)
+    })
+
+    expect(trace.summary()).toEqual({
+      commands: 3,
+      duration_ms: 7,
+      docs: 5,
+      collections: {
+        apo_items: { commands: 2, duration_ms: 4, docs: 4 },
+        apo_headers: { commands: 1, duration_ms: 3, docs: 1 },
+      },
+    })
+  })
+
+  it('should keep concurrent requests apart', async () => {
+    const first = new DbTrace()
+    const second = new DbTrace()
+    await Promise.all([
+      first.run(async () => {
+        await Promise.resolve()
+        runCommand(client, 'find', { find: 'users' }, { cursor: { firstBatch: [] } })
+      }),
+      second.run(async () => {
+        runCommand(client, 'insert', { insert: 'work_logs' }, { n: 1 })
+        await Promise.resolve()
+        runCommand(client, 'insert', { insert: 'work_logs' }, { n: 1 })
+      }),
+    ])
+
+    expect(first.commands).toBe(1)
+    expect(second.commands).toBe(2)
+    expect(Object.keys(second.collections)).toEqual(['work_logs'])
+  })
+
+  it('should ignore commands outside a request', () => {
+    const trace = new DbTrace()
+    runCommand(client, 'createIndexes', { createIndexes: 'users' }, {})
+    expect(trace.commands).toBe(0)
+    expect(getCurrentTrace()).toBeUndefined()
+  })
+
+  it('should render a Server-Timing header, slowest collection first', () => {
+    const trace = new DbTrace()
+    trace.record('users', 1, 1)
+    trace.record('apo_items', 4.25, 10)
+
+    expect(trace.serverTiming(12)).toBe(
+      'total;dur=12, db;dur=5.3;desc="2 cmd, 11 docs", db.apo_items;dur=4.3;desc="1 cmd", db.users;dur=1.0;desc="1 cmd"'
+    )
+  })
+
+  it('should warn only above the command threshold', () => {
+    const trace = new DbTrace()
+    for (let i = 0; i < 3; i++) trace.record('apo_items', 1, 0)
+    const context = { requestId: 'r-1', method: 'GET', route: '/fund-indent/pending' }
+
+    expect(warnOnCommandCount(trace, context, 0)).toBe(false)
+    expect(warnOnCommandCount(trace, context, 3)).toBe(false)
+    expect(warnOnCommandCount(trace, context, 2)).toBe(true)
+  })
+})
@@ -0,0 +1,58 @@
+/**
+ * Fund Indent Claims Unit Tests
+ * @jest-environment node
+ */
+import { claimFundIndentItems } from '@/lib/fundIndentClaims'
+
+function createDb(totals) {
+  const apoItems = {
+    bulkWrite: jest.fn().mockResolvedValue({}),
+    aggregate: jest.fn(() => ({ toArray: async () => (totals ? [totals] : []) })),
+  }
+  const fundIndents = { insertOne: jest.fn().mockResolvedValue({}) }
+  const collections = { apo_items: apoItems, fund_indents: fundIndents }
+  return { apoItems, fundIndents, collection: (name) => collections[name] }
+}
+
+const INDENT = { id: 'EST-1', status: 'PENDING_DCF', total_amount: 0, item_ids: [] }
+const ITEMS = [{ id: 'apoi-1', fnb_book_no: 'B1' }, { id: 'apoi-2' }, { id: 'apoi-3' }]
+
+describe('Fund Indent Claims', () => {
+  it('should only claim items that no other indent holds', async () => {
+    const db = createDb({ total_amount: 300, item_ids: ['apoi-3', 'apoi-1', 'apoi-2'] })
+    await claimFundIndentItems(db, INDENT, ITEMS)
+
+    const [ops, options] = db.apoItems.bulkWrite.mock.calls[0]
+    expect(options).toMatchObject({ ordered: false })
+    expect(ops).toHaveLength(3)
+    expect(ops[0].updateOne.filter).toEqual({ id: 'apoi-1', fund_indent_id: { $exists: false } })
+    expect(ops[0].updateOne.update.$set).toMatchObject({ fund_indent_id: 'EST-1', fund_indent_status: 'PENDING_DCF', fnb_book_no: 'B1' })
+    expect(db.apoItems.aggregate.mock.calls[0][0][0]).toEqual({ $match: { fund_indent_id: 'EST-1' } })
+  })
+
+  it('should total what was claimed and keep the requested order', async () => {
+    const db = createDb({ total_amount: 300, item_ids: ['apoi-3', 'apoi-1', 'apoi-2'] })
+    const { indent, already_claimed } = await claimFundIndentItems(db, INDENT, ITEMS)
+
+    expect(indent).toMatchObject({ id: 'EST-1', total_amount: 300, item_ids: ['apoi-1', 'apoi-2', 'apoi-3'] })
+    expect(already_claimed).toEqual([])
+    expect(db.fundIndents.insertOne.mock.calls[0][0]).toBe(indent)
+  })
+
+  it('should report items a concurrent indent claimed first', async () => {
+    const db = createDb({ total_amount: 100, item_ids: ['apoi-2'] })
+    const { indent, already_claimed } = await claimFundIndentItems(db, INDENT, ITEMS)
+
+    expect(indent).toMatchObject({ total_amount: 100, item_ids: ['apoi-2'] })
+    expect(already_claimed).toEqual(['apoi-1', 'apoi-3'])
+  })
+
+  it('should not insert an indent when every item was already claimed', async () => {
+    const db = createDb(null)
+    const { indent, already_claimed } = await claimFundIndentItems(db, INDENT, ITEMS)
+
+    expect(indent).toBeNull()
+    expect(already_claimed).toEqual(['apoi-1', 'apoi-2', 'apoi-3'])
+    expect(db.fundIndents.insertOne).not.toHaveBeenCalled()
+  })
+})
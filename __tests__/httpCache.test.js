@@ -0,0 +1,57 @@
+/**
+ * @jest-environment node
+ */
+/**
+ * HTTP Cache Unit Tests
+ */
+import { contentVersion, isNotModified, cacheControl, cachedJson } from '@/lib/httpCache'
+
+function createRequest(ifNoneMatch) {
+  const headers = ifNoneMatch ? { 'If-None-Match': ifNoneMatch } : {}
+  return new Request('http://localhost/api/norms', { headers })
+}
+
+describe('HTTP Cache', () => {
+  it('should version content by its serialised form', () => {
+    expect(contentVersion({ a: 1 })).toMatch(/^[0-9a-f]{20}$/)
+    expect(contentVersion({ a: 1 })).toBe(contentVersion('{"a":1}'))
+    expect(contentVersion({ a: 1 })).not.toBe(contentVersion({ a: 2 }))
+  })
+
+  it('should match If-None-Match lists, weak tags and *', () => {
+    expect(isNotModified(createRequest(), '"abc"')).toBe(false)
+    expect(isNotModified(createRequest('"abc"'), '"abc"')).toBe(true)
+    expect(isNotModified(createRequest('"xyz", W/"abc"'), '"abc"')).toBe(true)
+    expect(isNotModified(createRequest('*'), '"abc"')).toBe(true)
+    expect(isNotModified(createRequest('"xyz"'), '"abc"')).toBe(false)
+  })
+
+  it('should always require revalidation', () => {
+    expect(cacheControl('public')).toMatch(/^public, max-age=\d+, must-revalidate$/)
+  })
+
+  it('should answer a current ETag with 304 and no body', async () => {
+    const data = [{ id: 'n-1', standard_rate: 100 }]
+    const first = cachedJson(createRequest(), data)
+    const etag = first.headers.get('ETag')
+
+    expect(first.status).toBe(200)
+    expect(await first.json()).toEqual(data)
+    expect(etag).toBe(`"${contentVersion(data)}"`)
+
+    const second = cachedJson(createRequest(etag), data)
+    expect(second.status).toBe(304)
+    expect(second.headers.get('ETag')).toBe(etag)
+
+    const changed = cachedJson(createRequest(etag), [{ id: 'n-1', standard_rate: 120 }])
+    expect(changed.status).toBe(200)
+  })
+
+  it('should vary private responses on Authorization', () => {
+    const res = cachedJson(createRequest(), [], { scope: 'private', version: 'v1' })
+    expect(res.headers.get('ETag')).toBe('"v1"')
+    expect(res.headers.get('Cache-Control')).toMatch(/^private/)
+    expect(res.headers.get('Vary')).toBe('Authorization')
+    expect(cachedJson(createRequest(), []).headers.get('Vary')).toBeNull()
+  })
+})
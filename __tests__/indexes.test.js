@@ -0,0 +1,35 @@
+/**
+ * Index Registry Unit Tests
+ */
+import { INDEX_REGISTRY, CANONICAL_QUERIES, planHasCollScan } from '@/lib/indexes'
+
+describe('Index Registry', () => {
+  describe('INDEX_REGISTRY', () => {
+    it('should index session tokens and user emails uniquely', () => {
+      expect(INDEX_REGISTRY.sessions).toContainEqual({ key: { token: 1 }, options: { unique: true } })
+      expect(INDEX_REGISTRY.users).toContainEqual({ key: { email: 1 }, options: { unique: true } })
+    })
+
+    it('should cover the collection of every canonical query', () => {
+      CANONICAL_QUERIES.forEach(q => {
+        expect(INDEX_REGISTRY[q.collection]).toBeDefined()
+      })
+    })
+  })
+
+  describe('planHasCollScan', () => {
+    it('should detect a top-level COLLSCAN', () => {
+      expect(planHasCollScan({ stage: 'COLLSCAN' })).toBe(true)
+    })
+
+    it('should detect a nested COLLSCAN', () => {
+      const plan = { stage: 'SORT', inputStage: { stage: 'OR', inputStages: [{ stage: 'IXSCAN' }, { stage: 'COLLSCAN' }] } }
+      expect(planHasCollScan(plan)).toBe(true)
+    })
+
+    it('should accept index scans', () => {
+      expect(planHasCollScan({ stage: 'FETCH', inputStage: { stage: 'IXSCAN' } })).toBe(false)
+      expect(planHasCollScan(null)).toBe(false)
+    })
+  })
+})
@@ -0,0 +1,44 @@
+/**
+ * Log Buffer Unit Tests
+ */
+import { BufferedLineWriter } from '@/lib/logBuffer'
+
+function createStream(writableLength = 0) {
+  return { writableLength, chunks: [], write(chunk) { this.chunks.push(chunk) } }
+}
+
+describe('BufferedLineWriter', () => {
+  it('should buffer lines until flushed', () => {
+    const stream = createStream()
+    const writer = new BufferedLineWriter({ stream, flushMs: 60000 })
+    writer.write('{"a":1}')
+    writer.write('{"a":2}')
+    expect(stream.chunks).toEqual([])
+
+    writer.flush()
+    expect(stream.chunks).toEqual(['{"a":1}\n{"a":2}\n'])
+    writer.flush()
+    expect(stream.chunks).toHaveLength(1)
+  })
+
+  it('should flush as one chunk when the size limit is reached', () => {
+    const stream = createStream()
+    const writer = new BufferedLineWriter({ stream, maxBytes: 10, flushMs: 60000 })
+    writer.write('12345')
+    writer.write('67890')
+    expect(stream.chunks).toEqual(['12345\n67890\n'])
+  })
+
+  it('should drop lines while the stream is backed up and report them', () => {
+    const stream = createStream(5000)
+    const writer = new BufferedLineWriter({ stream, maxPendingBytes: 1000, flushMs: 60000 })
+    writer.write('lost')
+    writer.write('lost')
+    stream.writableLength = 0
+    writer.flush()
+
+    const lines = stream.chunks[0].trim().split('\n').map(line => JSON.parse(line))
+    expect(lines).toHaveLength(1)
+    expect(lines[0]).toMatchObject({ msg: 'log lines dropped', dropped: 2 })
+  })
+})
@@ -0,0 +1,34 @@
+/**
+ * Logger Unit Tests
+ */
+import { parseSampleRate, shouldLogRequest } from '@/lib/logger'
+
+describe('Logger', () => {
+  describe('parseSampleRate', () => {
+    it('should keep every request when unset, empty or non-numeric', () => {
+      for (const value of [undefined, '', 'abc', 'NaN', 'Infinity']) {
+        expect(parseSampleRate(value)).toBe(1)
+      }
+    })
+
+    it('should clamp the rate to 0-1', () => {
+      expect(parseSampleRate('0.25')).toBe(0.25)
+      expect(parseSampleRate('0')).toBe(0)
+      expect(parseSampleRate('-0.5')).toBe(0)
+      expect(parseSampleRate('5')).toBe(1)
+    })
+  })
+
+  describe('shouldLogRequest', () => {
+    it('should always keep errors and slow requests', () => {
+      expect(shouldLogRequest(500, 5, 0)).toBe(true)
+      expect(shouldLogRequest(404, 5, 0)).toBe(true)
+      expect(shouldLogRequest(200, 60000, 0)).toBe(true)
+    })
+
+    it('should sample fast successful requests', () => {
+      expect(shouldLogRequest(200, 5, 0)).toBe(false)
+      expect(shouldLogRequest(200, 5, 1)).toBe(true)
+    })
+  })
+})
@@ -0,0 +1,70 @@
+/**
+ * LRU Cache Unit Tests
+ */
+import { LRUCache } from '@/lib/lruCache'
+
+describe('LRUCache', () => {
+  describe('get/set', () => {
+    it('should return stored values and count hits', () => {
+      const cache = new LRUCache({ max: 10 })
+      cache.set('a', 1)
+      expect(cache.get('a')).toBe(1)
+      expect(cache.stats().hits).toBe(1)
+    })
+
+    it('should count misses for unknown keys', () => {
+      const cache = new LRUCache({ max: 10 })
+      expect(cache.get('missing')).toBeUndefined()
+      expect(cache.stats().misses).toBe(1)
+    })
+
+    it('should peek without counting or refreshing recency', () => {
+      const cache = new LRUCache({ max: 2 })
+      cache.set('a', 1)
+      cache.set('b', 2)
+      expect(cache.peek('a')).toBe(1)
+      expect(cache.peek('missing')).toBeUndefined()
+      expect(cache.stats()).toMatchObject({ hits: 0, misses: 0 })
+      cache.set('c', 3)
+      expect(cache.has('a')).toBe(false)
+    })
+  })
+
+  describe('eviction', () => {
+    it('should evict the least recently used entry when full', () => {
+      const cache = new LRUCache({ max: 2 })
+      cache.set('a', 1)
+      cache.set('b', 2)
+      cache.get('a') // 'b' is now least recently used
+      cache.set('c', 3)
+      expect(cache.has('a')).toBe(true)
+      expect(cache.has('b')).toBe(false)
+      expect(cache.has('c')).toBe(true)
+      expect(cache.stats().evictions).toBe(1)
+    })
+  })
+
+  describe('ttl', () => {
+    it('should expire entries after their ttl', () => {
+      const now = jest.spyOn(Date, 'now').mockReturnValue(1000)
+      const cache = new LRUCache({ max: 10, ttlMs: 50 })
+      cache.set('a', 1)
+      now.mockReturnValue(1049)
+      expect(cache.get('a')).toBe(1)
+      now.mockReturnValue(1051)
+      expect(cache.get('a')).toBeUndefined()
+      now.mockRestore()
+    })
+  })
+
+  describe('deleteWhere', () => {
+    it('should remove only matching entries', () => {
+      const cache = new LRUCache({ max: 10 })
+      cache.set('t1', { user: { id: 'u1' } })
+      cache.set('t2', { user: { id: 'u1' } })
+      cache.set('t3', { user: { id: 'u2' } })
+      expect(cache.deleteWhere(v => v.user.id === 'u1')).toBe(2)
+      expect(cache.size).toBe(1)
+    })
+  })
+})
@@ -0,0 +1,66 @@
+/**
+ * Master Data Cache Unit Tests
+ */
+import {
+  getMasterList,
+  getMasterMap,
+  getMasterDoc,
+  invalidateMasterData,
+  getMasterVersion,
+  getMasterDataStats
+} from '@/lib/masterData'
+
+function createDb(docs) {
+  const toArray = jest.fn().mockImplementation(async () => docs.map(d => ({ _id: 'oid', ...d })))
+  return { toArray, collection: () => ({ find: () => ({ toArray }) }) }
+}
+
+describe('Master Data Cache', () => {
+  beforeEach(() => {
+    invalidateMasterData()
+  })
+
+  it('should load a collection once and serve later reads from memory', async () => {
+    const db = createDb([{ id: 'div-1', name: 'Dharwad' }])
+    await getMasterList(db, 'divisions')
+    const list = await getMasterList(db, 'divisions')
+    expect(list).toEqual([{ id: 'div-1', name: 'Dharwad' }])
+    expect(db.toArray).toHaveBeenCalledTimes(1)
+  })
+
+  it('should build an id map and resolve single documents', async () => {
+    const db = createDb([{ id: 'rng-1', division_id: 'div-1' }, { id: 'rng-2', division_id: 'div-2' }])
+    const map = await getMasterMap(db, 'ranges')
+    expect(map['rng-2'].division_id).toBe('div-2')
+    expect(await getMasterDoc(db, 'ranges', 'rng-1')).toEqual({ id: 'rng-1', division_id: 'div-1' })
+    expect(await getMasterDoc(db, 'ranges', 'missing')).toBeNull()
+    expect(await getMasterDoc(db, 'ranges', null)).toBeNull()
+  })
+
+  it('should share one query between concurrent misses', async () => {
+    const db = createDb([{ id: 'act-1' }])
+    await Promise.all([getMasterList(db, 'activity_master'), getMasterList(db, 'activity_master')])
+    expect(db.toArray).toHaveBeenCalledTimes(1)
+  })
+
+  it('should drop the cached entry when the version is bumped', async () => {
+    const db = createDb([{ id: 'n-1' }])
+    await getMasterList(db, 'norms_config')
+    const version = getMasterVersion('norms_config')
+    invalidateMasterData('norms_config')
+    expect(getMasterVersion('norms_config')).toBe(version + 1)
+    expect(getMasterDataStats().collections.norms_config.cached).toBe(false)
+    await getMasterList(db, 'norms_config')
+    expect(db.toArray).toHaveBeenCalledTimes(2)
+  })
+
+  it('should freeze cached documents', async () => {
+    const db = createDb([{ id: 'div-1', name: 'Dharwad' }])
+    const [doc] = await getMasterList(db, 'divisions')
+    expect(Object.isFrozen(doc)).toBe(true)
+  })
+
+  it('should reject collections that are not master data', async () => {
+    await expect(getMasterList(createDb([]), 'apo_headers')).rejects.toThrow('not a cached master collection')
+  })
+})
@@ -0,0 +1,60 @@
+/**
+ * Metrics Unit Tests
+ * @jest-environment node
+ */
+import { Histogram, trackRequest, renderMetrics, resetMetrics } from '@/lib/metrics'
+
+describe('Metrics', () => {
+  beforeEach(() => {
+    resetMetrics()
+  })
+
+  describe('Histogram', () => {
+    it('should render cumulative buckets, sum and count per label set', () => {
+      const histogram = new Histogram('test_seconds', 'Test', [0.1, 1])
+      histogram.observe({ route: '/a' }, 0.05)
+      histogram.observe({ route: '/a' }, 0.5)
+      histogram.observe({ route: '/a' }, 5)
+
+      expect(histogram.render()).toEqual([
+        '# HELP test_seconds Test',
+        '# TYPE test_seconds histogram',
+        'test_seconds_bucket{route="/a",le="0.1"} 1',
+        'test_seconds_bucket{route="/a",le="1"} 2',
+        'test_seconds_bucket{route="/a",le="+Inf"} 3',
+        'test_seconds_sum{route="/a"} 5.55',
+        'test_seconds_count{route="/a"} 3',
+      ])
+    })
+
+    it('should escape label values', () => {
+      const histogram = new Histogram('test_seconds', 'Test', [1])
+      histogram.observe({ route: 'a"b' }, 0)
+      expect(histogram.render()[2]).toBe('test_seconds_bucket{route="a\\"b",le="1"} 1')
+    })
+  })
+
+  describe('trackRequest', () => {
+    it('should label by route pattern and track in-flight requests', () => {
+      const finish = trackRequest('GET', '/apo/:id', '120')
+      expect(renderMetrics()).toContain('http_requests_in_flight{method="GET",route="/apo/:id"} 1')
+
+      finish({ status: 200, body: null })
+      const text = renderMetrics()
+      expect(text).toContain('http_requests_in_flight{method="GET",route="/apo/:id"} 0')
+      expect(text).toContain('http_request_duration_seconds_count{method="GET",route="/apo/:id",status="200"} 1')
+      expect(text).toContain('http_request_size_bytes_bucket{method="GET",route="/apo/:id",le="256"} 1')
+    })
+
+    it('should count response bytes as the body is read', async () => {
+      const finish = trackRequest('GET', '/plantations', null)
+      const response = finish(new Response('x'.repeat(300), { status: 200 }))
+      expect(renderMetrics()).not.toContain('http_response_size_bytes_count')
+
+      await new Response(response.body).text()
+      const text = renderMetrics()
+      expect(text).toContain('http_response_size_bytes_bucket{method="GET",route="/plantations",status="200",le="256"} 0')
+      expect(text).toContain('http_response_size_bytes_bucket{method="GET",route="/plantations",status="200",le="1024"} 1')
+    })
+  })
+})
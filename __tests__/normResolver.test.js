@@ -0,0 +1,130 @@
+/**
+ * Norm Resolver Unit Tests
+ */
+import {
+  nearestLowerAge,
+  buildNormIndex,
+  resolveAgedNorms,
+  resolveTypedNorms,
+  getPlantationDraft,
+  draftExpenseType,
+  getNormResolverStats,
+  resetNormResolver
+} from '@/lib/normResolver'
+import { invalidateMasterData } from '@/lib/masterData'
+
+const PLANTATION_NORMS = [
+  { id: 'n-0', activity_id: 'act-survey', applicable_age: 0, species_id: null, standard_rate: 100, financial_year: '2026-27' },
+  { id: 'n-1', activity_id: 'act-planting', applicable_age: 1, species_id: null, standard_rate: 200, financial_year: '2026-27' },
+  { id: 'n-3a', activity_id: 'act-weeding', applicable_age: 3, species_id: null, standard_rate: 300, financial_year: '2026-27' },
+  { id: 'n-3b', activity_id: 'act-teak', applicable_age: 3, species_id: 'Teak', standard_rate: 350, financial_year: '2026-27' },
+  { id: 'n-3c', activity_id: 'act-fireline', applicable_age: 3, species_id: null, standard_rate: 400, financial_year: '2026-27' },
+  { id: 'n-5', activity_id: 'act-teak-thin', applicable_age: 5, species_id: 'Teak', standard_rate: 500, financial_year: '2026-27' },
+  { id: 'n-old', activity_id: 'act-weeding', applicable_age: 3, species_id: null, standard_rate: 250, financial_year: '2025-26' },
+]
+
+function plantationIndex() {
+  return buildNormIndex('plantation', PLANTATION_NORMS, { 'act-weeding': { name: 'Weeding', unit: 'Per Hectare' } })
+}
+
+function createDb(collections) {
+  const find = jest.fn().mockImplementation((name) => ({ toArray: async () => (collections[name] || []).map(d => ({ ...d })) }))
+  return { find, collection: (name) => ({ find: () => find(name) }) }
+}
+
+describe('Norm Resolver', () => {
+  beforeEach(() => {
+    invalidateMasterData()
+    resetNormResolver()
+  })
+
+  describe('nearestLowerAge', () => {
+    it('should find the largest age not above the target', () => {
+      const ages = [0, 1, 3, 8, 15]
+      expect(nearestLowerAge(ages, 3)).toBe(3)
+      expect(nearestLowerAge(ages, 7)).toBe(3)
+      expect(nearestLowerAge(ages, 40)).toBe(15)
+      expect(nearestLowerAge(ages, -1)).toBeNull()
+      expect(nearestLowerAge([], 5)).toBeNull()
+    })
+  })
+
+  describe('resolveAgedNorms', () => {
+    it('should match the exact age, merging species norms in rate card order', () => {
+      const { age, norms } = resolveAgedNorms(plantationIndex(), '2026-27', 'Teak', 3)
+      expect(age).toBe(3)
+      expect(norms.map(n => n.id)).toEqual(['n-3a', 'n-3b', 'n-3c'])
+    })
+
+    it('should fall back to the nearest lower age', () => {
+      expect(resolveAgedNorms(plantationIndex(), '2026-27', 'Eucalyptus', 4).norms.map(n => n.id)).toEqual(['n-3a', 'n-3c'])
+      expect(resolveAgedNorms(plantationIndex(), '2026-27', 'Teak', 9).norms.map(n => n.id)).toEqual(['n-5'])
+    })
+
+    it('should only use age 0 norms for age 0', () => {
+      const index = buildNormIndex('plantation', PLANTATION_NORMS.filter(n => n.applicable_age === 0), {})
+      expect(resolveAgedNorms(index, '2026-27', null, 0).norms).toHaveLength(1)
+      expect(resolveAgedNorms(index, '2026-27', null, 2)).toEqual({ age: null, norms: [] })
+      expect(resolveAgedNorms(plantationIndex(), '2026-27', null, -1)).toEqual({ age: null, norms: [] })
+    })
+
+    it('should keep financial years apart', () => {
+      expect(resolveAgedNorms(plantationIndex(), '2025-26', null, 3).norms.map(n => n.id)).toEqual(['n-old'])
+      expect(resolveAgedNorms(plantationIndex(), '2024-25', null, 3).norms).toEqual([])
+    })
+  })
+
+  it('should group building norms by phase', () => {
+    const index = buildNormIndex('building', [
+      { id: 'b-1', building_phase: 'Creation', financial_year: '2026-27' },
+      { id: 'b-2', building_phase: 'Maintenance', financial_year: '2026-27' },
+    ], {})
+    expect(resolveTypedNorms(index, '2026-27', 'Maintenance').map(n => n.id)).toEqual(['b-2'])
+    expect(resolveTypedNorms(index, '2026-27', 'Unknown')).toEqual([])
+  })
+
+  it('should classify drafts as CAPEX or REVEX', () => {
+    expect(draftExpenseType('plantation', { age: 7 })).toBe('CAPEX')
+    expect(draftExpenseType('plantation', { age: 8 })).toBe('REVEX')
+    expect(draftExpenseType('building', { building_phase: 'Creation' })).toBe('CAPEX')
+    expect(draftExpenseType('building', { building_phase: 'Maintenance' })).toBe('REVEX')
+    expect(draftExpenseType('nursery', { nursery_type: 'Raising' })).toBe('CAPEX')
+  })
+
+  describe('getPlantationDraft', () => {
+    const plantation = { id: 'plt-1', name: 'Plot', species: 'Eucalyptus', year_of_planting: new Date().getFullYear() - 4, total_area_ha: 10 }
+
+    it('should price the nearest-age norms and memoise the draft', async () => {
+      const db = createDb({ norms_config: PLANTATION_NORMS, activity_master: [{ id: 'act-weeding', name: 'Weeding', unit: 'Per Hectare' }] })
+      const builds = getNormResolverStats().builds
+      const draft = await getPlantationDraft(db, plantation, '2026-27')
+      expect(draft.age).toBe(4)
+      expect(draft.items.map(i => i.activity_id)).toEqual(['act-weeding', 'act-fireline'])
+      expect(draft.items[0]).toMatchObject({ activity_name: 'Weeding', suggested_qty: 10, total_cost: 3000 })
+      expect(draft.total_estimated_cost).toBe(7000)
+
+      expect(await getPlantationDraft(db, plantation, '2026-27')).toBe(draft)
+      expect(getNormResolverStats().drafts.hits).toBe(1)
+      expect(getNormResolverStats().builds).toBe(builds + 1)
+    })
+
+    it('should rebuild after the norms change', async () => {
+      const collections = { norms_config: PLANTATION_NORMS, activity_master: [] }
+      const db = createDb(collections)
+      const first = await getPlantationDraft(db, plantation, '2026-27')
+
+      collections.norms_config = PLANTATION_NORMS.map(n => ({ ...n, standard_rate: n.standard_rate * 2 }))
+      invalidateMasterData('norms_config')
+      const second = await getPlantationDraft(db, plantation, '2026-27')
+
+      expect(second.total_estimated_cost).toBe(first.total_estimated_cost * 2)
+    })
+
+    it('should not reuse a draft when the plantation changes', async () => {
+      const db = createDb({ norms_config: PLANTATION_NORMS, activity_master: [] })
+      const first = await getPlantationDraft(db, plantation, '2026-27')
+      const second = await getPlantationDraft(db, { ...plantation, total_area_ha: 20 }, '2026-27')
+      expect(second.total_estimated_cost).toBe(first.total_estimated_cost * 2)
+    })
+  })
+})
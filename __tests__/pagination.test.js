@@ -0,0 +1,115 @@
+/**
+ * @jest-environment node
+ */
+/**
+ * Pagination Unit Tests
+ */
+import {
+  encodeCursor,
+  decodeCursor,
+  getPageParams,
+  keysetFilter,
+  findPage,
+  pageBody,
+  MAX_PAGE_SIZE
+} from '@/lib/pagination'
+
+const req = (query) => ({ url: `http://localhost/api/plantations${query}` })
+
+function createCollection(docs) {
+  const cursor = {
+    sort: jest.fn().mockReturnThis(),
+    limit: jest.fn().mockImplementation(n => ({ toArray: async () => docs.slice(0, n) })),
+    toArray: async () => docs,
+  }
+  return { cursor, find: jest.fn().mockReturnValue(cursor), countDocuments: jest.fn().mockResolvedValue(42) }
+}
+
+describe('Pagination', () => {
+  describe('cursors', () => {
+    it('should round-trip the sort key', () => {
+      const createdAt = new Date('2026-04-01T10:00:00.000Z')
+      const cursor = encodeCursor({ id: 'apo-001', created_at: createdAt, name: 'ignored' })
+      expect(decodeCursor(cursor)).toEqual({ createdAt, id: 'apo-001' })
+    })
+
+    it('should encode documents without created_at', () => {
+      expect(decodeCursor(encodeCursor({ id: 'plt-1' }))).toEqual({ createdAt: null, id: 'plt-1' })
+    })
+
+    it('should reject malformed cursors with a 400', () => {
+      expect(() => decodeCursor('not-a-cursor')).toThrow('Invalid cursor')
+      expect(() => decodeCursor(Buffer.from('["bad-date","x"]').toString('base64url'))).toThrow('Invalid cursor')
+    })
+  })
+
+  describe('getPageParams', () => {
+    it('should return null when the client does not ask for pages', () => {
+      expect(getPageParams(req('?status=DRAFT'))).toBeNull()
+    })
+
+    it('should parse limit, after and include_total', () => {
+      const after = encodeCursor({ id: 'a', created_at: new Date('2026-01-01') })
+      const page = getPageParams(req(`?limit=10&after=${after}&include_total=true`))
+      expect(page).toMatchObject({ limit: 10, includeTotal: true, after: { id: 'a' } })
+    })
+
+    it('should clamp the limit and reject invalid values', () => {
+      expect(getPageParams(req('?limit=100000')).limit).toBe(MAX_PAGE_SIZE)
+      expect(() => getPageParams(req('?limit=0'))).toThrow('limit must be a positive integer')
+      expect(() => getPageParams(req('?limit=abc'))).toThrow('limit must be a positive integer')
+    })
+  })
+
+  describe('keysetFilter', () => {
+    it('should continue after the cursor, with undated documents last', () => {
+      const createdAt = new Date('2026-04-01')
+      expect(keysetFilter({ createdAt, id: 'x' })).toEqual({
+        $or: [
+          { created_at: { $lt: createdAt } },
+          { created_at: createdAt, id: { $lt: 'x' } },
+          { created_at: null },
+        ]
+      })
+      expect(keysetFilter({ createdAt: null, id: 'x' })).toEqual({ created_at: null, id: { $lt: 'x' } })
+    })
+  })
+
+  describe('findPage', () => {
+    const docs = [
+      { id: 'c', created_at: new Date('2026-03-03') },
+      { id: 'b', created_at: new Date('2026-03-02') },
+      { id: 'a', created_at: new Date('2026-03-01') },
+    ]
+
+    it('should return the whole list when not paginated', async () => {
+      const collection = createCollection(docs)
+      expect(await findPage(collection, {}, null)).toEqual({ items: docs })
+      expect(collection.cursor.limit).not.toHaveBeenCalled()
+    })
+
+    it('should fetch one extra document to detect the next page', async () => {
+      const collection = createCollection(docs)
+      const result = await findPage(collection, { range_id: 'r' }, { limit: 2, after: null, includeTotal: false })
+      expect(collection.cursor.limit).toHaveBeenCalledWith(3)
+      expect(result.items.map(d => d.id)).toEqual(['c', 'b'])
+      expect(decodeCursor(result.next_cursor).id).toBe('b')
+      expect(result).not.toHaveProperty('total')
+      expect(collection.countDocuments).not.toHaveBeenCalled()
+    })
+
+    it('should count only when include_total is requested', async () => {
+      const collection = createCollection(docs)
+      const result = await findPage(collection, {}, { limit: 5, after: null, includeTotal: true })
+      expect(result.next_cursor).toBeNull()
+      expect(result.total).toBe(42)
+    })
+  })
+
+  describe('pageBody', () => {
+    it('should keep the bare array for unpaginated requests', () => {
+      expect(pageBody(null, [1, 2], { items: [] })).toEqual([1, 2])
+      expect(pageBody({ limit: 2 }, [1, 2], { next_cursor: 'n', total: 9 })).toEqual({ items: [1, 2], next_cursor: 'n', total: 9 })
+    })
+  })
+})
@@ -0,0 +1,94 @@
+/**
+ * @jest-environment node
+ */
+/**
+ * Plantation History Unit Tests
+ */
+import { historyPipeline, historyBody, getPlantationHistory } from '@/lib/routes/plantations'
+
+const ROWS = [
+  { id: 'apo-3', financial_year: '2026-27', status: 'DRAFT', total_sanctioned_amount: 0, items: [{ _id: 'REVEX', amount: 70, count: 2 }], has_more_years: true },
+  { id: 'apo-2', financial_year: '2026-27', status: 'SANCTIONED', total_sanctioned_amount: 500, items: [{ _id: 'CAPEX', amount: 300, count: 1 }], has_more_years: true },
+  { id: 'apo-1', financial_year: '2025-26', status: 'SANCTIONED', total_sanctioned_amount: 400, items: [{ _id: 'CAPEX', amount: 100, count: 1 }, { _id: 'REVEX', amount: 50, count: 1 }], has_more_years: true },
+]
+
+function createDb(rows) {
+  const aggregate = jest.fn(() => ({ toArray: async () => rows }))
+  return { aggregate, collection: () => ({ aggregate }) }
+}
+
+function historyRequest(query = '') {
+  return new Request(`http://localhost/api/plantations/plt-1/history${query}`)
+}
+
+describe('Plantation History', () => {
+  describe('historyPipeline', () => {
+    it('should probe one extra year and drop it before the item lookup', () => {
+      const pipeline = historyPipeline('plt-1', { yearLimit: 2 })
+      const stages = pipeline.map(stage => Object.keys(stage)[0])
+
+      expect(pipeline.find(stage => stage.$limit)).toEqual({ $limit: 3 })
+      const slice = pipeline.findIndex(stage => stage.$project && stage.$project.years)
+      expect(pipeline[slice].$project.years).toEqual({ $slice: ['$years', 2] })
+      expect(slice).toBeLessThan(stages.indexOf('$lookup'))
+    })
+
+    it('should continue before the given financial year', () => {
+      expect(historyPipeline('plt-1', { before: '2025-26', yearLimit: 2 })[0])
+        .toEqual({ $match: { plantation_id: 'plt-1', financial_year: { $lt: '2025-26' } } })
+    })
+
+    it('should not group by year without pagination', () => {
+      const pipeline = historyPipeline('plt-1')
+      expect(pipeline.some(stage => stage.$limit)).toBe(false)
+      expect(pipeline[0]).toEqual({ $match: { plantation_id: 'plt-1' } })
+    })
+  })
+
+  describe('historyBody', () => {
+    it('should set next_before to the last year when more years exist', () => {
+      const body = historyBody(ROWS, { paginated: true })
+      expect(body.items.map(apo => apo.id)).toEqual(['apo-3', 'apo-2', 'apo-1'])
+      expect(body.items[0].has_more_years).toBeUndefined()
+      expect(body.next_before).toBe('2025-26')
+    })
+
+    it('should end pagination when no more years exist', () => {
+      const rows = ROWS.map(row => ({ ...row, has_more_years: false }))
+      expect(historyBody(rows, { paginated: true }).next_before).toBeNull()
+      expect(historyBody([], { paginated: true })).toEqual({ items: [], next_before: null })
+    })
+
+    it('should total CAPEX and REVEX per financial year', () => {
+      const [current, previous] = historyBody(ROWS, { summary: true })
+      expect(current).toMatchObject({
+        financial_year: '2026-27',
+        apo_count: 2,
+        statuses: { DRAFT: 1, SANCTIONED: 1 },
+        total_sanctioned_amount: 500,
+        capex_amount: 300,
+        revex_amount: 70,
+        item_count: 3,
+      })
+      expect(previous).toMatchObject({ financial_year: '2025-26', capex_amount: 100, revex_amount: 50, items_amount: 150 })
+    })
+  })
+
+  describe('getPlantationHistory', () => {
+    it('should reject a years value that is not a positive integer', async () => {
+      for (const years of ['0', '-1', '1.5', 'abc']) {
+        const db = createDb(ROWS)
+        const res = await getPlantationHistory(historyRequest(`?years=${years}`), { db, params: { id: 'plt-1' } })
+        expect(res.status).toBe(400)
+        expect(db.aggregate).not.toHaveBeenCalled()
+      }
+    })
+
+    it('should page by years when years or before is given', async () => {
+      const db = createDb(ROWS)
+      const res = await getPlantationHistory(historyRequest('?years=2&before=2027-28'), { db, params: { id: 'plt-1' } })
+      expect(await res.json()).toMatchObject({ next_before: '2025-26' })
+      expect(db.aggregate.mock.calls[0][0]).toContainEqual({ $limit: 3 })
+    })
+  })
+})
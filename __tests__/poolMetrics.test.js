@@ -0,0 +1,50 @@
+/**
+ * Pool Metrics Unit Tests
+ */
+import { EventEmitter } from 'events'
+import { attachPoolMetrics, getPoolStats, resetPoolStats } from '@/lib/poolMetrics'
+
+describe('Pool Metrics', () => {
+  let client
+
+  beforeEach(() => {
+    resetPoolStats()
+    client = new EventEmitter()
+    attachPoolMetrics(client)
+  })
+
+  it('should track open connections', () => {
+    client.emit('connectionCreated', {})
+    client.emit('connectionCreated', {})
+    client.emit('connectionClosed', {})
+
+    expect(getPoolStats()).toMatchObject({ connections_open: 1, connections_created: 2 })
+  })
+
+  it('should track checked out connections and the wait queue', () => {
+    client.emit('connectionCheckOutStarted', {})
+    client.emit('connectionCheckOutStarted', {})
+    expect(getPoolStats()).toMatchObject({ wait_queue: 2, checked_out: 0 })
+
+    client.emit('connectionCheckedOut', {})
+    expect(getPoolStats()).toMatchObject({ wait_queue: 1, checked_out: 1, checkouts: 1 })
+
+    client.emit('connectionCheckOutFailed', {})
+    client.emit('connectionCheckedIn', {})
+    expect(getPoolStats()).toMatchObject({ wait_queue: 0, checked_out: 0, checkouts: 1, checkout_failures: 1 })
+  })
+
+  it('should measure checkout latency from the oldest pending start', () => {
+    const now = jest.spyOn(Date, 'now')
+    now.mockReturnValue(1000)
+    client.emit('connectionCheckOutStarted', {})
+    now.mockReturnValue(1040)
+    client.emit('connectionCheckOutStarted', {})
+    client.emit('connectionCheckedOut', {})
+    now.mockReturnValue(1050)
+    client.emit('connectionCheckedOut', {})
+    now.mockRestore()
+
+    expect(getPoolStats()).toMatchObject({ checkouts: 2, checkout_ms_max: 40, checkout_ms_avg: 25 })
+  })
+})
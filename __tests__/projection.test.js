@@ -0,0 +1,74 @@
+/**
+ * @jest-environment node
+ */
+/**
+ * Projection Unit Tests
+ */
+import {
+  FIELD_VIEWS,
+  getFieldSelection,
+  wantsField,
+  projectionOptions,
+  pickFields
+} from '@/lib/projection'
+
+const req = (query) => ({ url: `http://localhost/api/plantations${query}` })
+
+describe('Projection', () => {
+  describe('getFieldSelection', () => {
+    it('should select every field without ?fields or with fields=full', () => {
+      expect(getFieldSelection(req(''), 'plantations')).toBeNull()
+      expect(getFieldSelection(req('?fields=full'), 'plantations')).toBeNull()
+    })
+
+    it('should project requested fields plus id and created_at', () => {
+      const selection = getFieldSelection(req('?fields=name,species'), 'plantations')
+      expect([...selection.fields]).toEqual(['id', 'name', 'species'])
+      expect(selection.projection).toEqual({ _id: 0, id: 1, created_at: 1, name: 1, species: 1 })
+    })
+
+    it('should project the stored fields behind derived fields', () => {
+      const selection = getFieldSelection(req('?fields=age,division_name'), 'plantations')
+      expect(selection.projection).toEqual({ _id: 0, id: 1, created_at: 1, year_of_planting: 1, range_id: 1 })
+      expect(selection.projection).not.toHaveProperty('age')
+    })
+
+    it('should expand presets and combine them with extra fields', () => {
+      const selection = getFieldSelection(req('?fields=summary,village'), 'plantations')
+      FIELD_VIEWS.plantations.presets.summary.forEach(f => expect(selection.fields.has(f)).toBe(true))
+      expect(selection.fields.has('village')).toBe(true)
+    })
+
+    it('should reject field names that are not plain identifiers', () => {
+      expect(() => getFieldSelection(req('?fields=name,$where'), 'plantations')).toThrow('Invalid field: $where')
+      expect(() => getFieldSelection(req('?fields=items.total_cost'), 'apos')).toThrow('Invalid field')
+    })
+  })
+
+  describe('wantsField', () => {
+    it('should report whether a derived field needs computing', () => {
+      const selection = getFieldSelection(req('?fields=summary'), 'fund_indents')
+      expect(wantsField(selection, 'items')).toBe(false)
+      expect(wantsField(selection, 'items', 'created_by_name')).toBe(true)
+      expect(wantsField(null, 'items')).toBe(true)
+    })
+  })
+
+  describe('projectionOptions', () => {
+    it('should only pass a projection when fields were selected', () => {
+      expect(projectionOptions(null)).toEqual({})
+      expect(projectionOptions(getFieldSelection(req('?fields=name'), 'plantations'))).toEqual({
+        projection: { _id: 0, id: 1, created_at: 1, name: 1 }
+      })
+    })
+  })
+
+  describe('pickFields', () => {
+    it('should keep only the selected fields', () => {
+      const doc = { id: 'plt-1', name: 'Agara', created_at: new Date(), range_id: 'rng-1', age: 5 }
+      const selection = getFieldSelection(req('?fields=name,age,missing'), 'plantations')
+      expect(pickFields(doc, selection)).toEqual({ id: 'plt-1', name: 'Agara', age: 5 })
+      expect(pickFields(doc, null)).toBe(doc)
+    })
+  })
+})
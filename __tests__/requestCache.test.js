@@ -0,0 +1,92 @@
+/**
+ * Request Cache Unit Tests
+ */
+import { createRequestCache, urlTags, mutationTags } from '@/components/common/requestCache'
+
+function deferred() {
+  let resolve
+  const promise = new Promise(r => { resolve = r })
+  return { promise, resolve }
+}
+
+describe('Request Cache', () => {
+  let clock
+  let cache
+
+  beforeEach(() => {
+    clock = 0
+    cache = createRequestCache({ persist: false, now: () => clock })
+  })
+
+  it('should tag URLs by resource and bootstrap by set', () => {
+    expect(urlTags('/plantations?fields=summary')).toEqual(['plantations'])
+    expect(urlTags('/fund-indent/work-items/apo-1')).toEqual(['fund-indent'])
+    expect(urlTags('/bootstrap?sets=plantations,building_norms')).toEqual(['bootstrap', 'plantations', 'building-norms'])
+  })
+
+  it('should map mutations to the tags they change', () => {
+    expect(mutationTags('/plantations')).toEqual(['plantations', 'dashboard'])
+    expect(mutationTags('/apo/items/i-1/estimate')).toContain('apo')
+    expect(mutationTags('/apo/generate-drafts')).toEqual([])
+    expect(mutationTags('/seed')).toBeNull()
+  })
+
+  it('should coalesce identical in-flight GETs', async () => {
+    const pending = deferred()
+    const fetcher = jest.fn(() => pending.promise)
+    const first = cache.get('/plantations', fetcher)
+    const second = cache.get('/plantations', fetcher)
+    pending.resolve([{ id: 'plt-1' }])
+
+    expect(await first).toEqual([{ id: 'plt-1' }])
+    expect(await second).toBe(await first)
+    expect(fetcher).toHaveBeenCalledTimes(1)
+    expect(cache.stats().coalesced).toBe(1)
+  })
+
+  it('should serve fresh entries, then stale ones while revalidating', async () => {
+    const fetcher = jest.fn().mockResolvedValueOnce(['v1']).mockResolvedValueOnce(['v2'])
+    await cache.get('/apo', fetcher)
+
+    clock = 10 * 1000
+    expect(await cache.get('/apo', fetcher)).toEqual(['v1'])
+    expect(fetcher).toHaveBeenCalledTimes(1)
+
+    clock = 60 * 1000
+    expect(await cache.get('/apo', fetcher)).toEqual(['v1'])
+    expect(fetcher).toHaveBeenCalledTimes(2)
+    await new Promise(resolve => setTimeout(resolve, 0))
+    expect(await cache.get('/apo', fetcher)).toEqual(['v2'])
+  })
+
+  it('should refetch after a mutation invalidates the tag', async () => {
+    const fetcher = jest.fn().mockResolvedValueOnce(['old']).mockResolvedValueOnce(['new'])
+    const other = jest.fn().mockResolvedValue(['division'])
+    await cache.get('/plantations?fields=summary', fetcher)
+    await cache.get('/divisions', other)
+
+    cache.afterMutation('/plantations')
+
+    expect(await cache.get('/plantations?fields=summary', fetcher)).toEqual(['new'])
+    expect(await cache.get('/divisions', other)).toEqual(['division'])
+    expect(other).toHaveBeenCalledTimes(1)
+  })
+
+  it('should not store a response requested before an invalidation', async () => {
+    const pending = deferred()
+    const fetcher = jest.fn().mockReturnValueOnce(pending.promise).mockResolvedValueOnce(['after'])
+    const before = cache.get('/fund-indent/works', fetcher)
+    cache.afterMutation('/fund-indent/generate')
+    pending.resolve(['before'])
+    await before
+
+    expect(await cache.get('/fund-indent/works', fetcher)).toEqual(['after'])
+  })
+
+  it('should not cache session endpoints', async () => {
+    const fetcher = jest.fn().mockResolvedValue({ id: 'u-1' })
+    await cache.get('/auth/me', fetcher)
+    await cache.get('/auth/me', fetcher)
+    expect(fetcher).toHaveBeenCalledTimes(2)
+  })
+})
@@ -0,0 +1,128 @@
+/**
+ * Revised Totals Unit Tests
+ * @jest-environment node
+ */
+import { parseRevisedQty, revisedCost, backfillRevisedTotal, reviseItemQuantity, REVISED_TOTAL_TOLERANCE } from '@/lib/revisedTotals'
+import { updateItemEstimate } from '@/lib/routes/apo'
+
+const ITEM = { id: 'apoi-1', apo_id: 'apo-1', sanctioned_qty: 10, sanctioned_rate: 100, estimate_status: 'DRAFT' }
+
+function createDb({ budgetMatched = 1, updatedItem = { id: 'apoi-1', revised_qty: 12 }, header = { revised_total: 1000, total_sanctioned_amount: 1100 }, itemTotal = 1000 } = {}) {
+  const apoHeaders = {
+    updateOne: jest.fn().mockResolvedValue({ matchedCount: budgetMatched }),
+    findOne: jest.fn().mockResolvedValue({ id: 'apo-1', ...header }),
+  }
+  const apoItems = {
+    findOne: jest.fn().mockResolvedValue(ITEM),
+    findOneAndUpdate: jest.fn().mockResolvedValue(updatedItem),
+    aggregate: jest.fn(() => ({ toArray: async () => [{ _id: null, revised_total: itemTotal }] })),
+  }
+  const collections = { apo_headers: apoHeaders, apo_items: apoItems }
+  return { apoHeaders, apoItems, collection: (name) => collections[name] }
+}
+
+function estimateRequest(body) {
+  return new Request('http://localhost/api/apo/items/apoi-1/estimate', { method: 'PATCH', body: JSON.stringify(body) })
+}
+
+describe('Revised Totals', () => {
+  describe('parseRevisedQty', () => {
+    it('should accept non-negative numbers', () => {
+      expect(parseRevisedQty('12.5')).toBe(12.5)
+      expect(parseRevisedQty(0)).toBe(0)
+    })
+
+    it('should reject negative or non-numeric quantities', () => {
+      for (const value of [-1, 'abc', '', null, undefined]) {
+        expect(parseRevisedQty(value)).toBeNull()
+      }
+    })
+  })
+
+  describe('revisedCost', () => {
+    it('should use revised_qty when set, else sanctioned_qty', () => {
+      expect(revisedCost(ITEM)).toBe(1000)
+      expect(revisedCost({ ...ITEM, revised_qty: 0 })).toBe(0)
+      expect(revisedCost({ ...ITEM, revised_qty: null })).toBe(1000)
+    })
+  })
+
+  describe('backfillRevisedTotal', () => {
+    it('should set revised_total from the items only where it is missing', async () => {
+      const db = createDb({ itemTotal: 850 })
+      await backfillRevisedTotal(db, 'apo-1')
+
+      expect(db.apoItems.aggregate.mock.calls[0][0][0]).toEqual({ $match: { apo_id: 'apo-1' } })
+      expect(db.apoHeaders.updateOne).toHaveBeenCalledWith(
+        { id: 'apo-1', revised_total: { $exists: false } },
+        { $set: { revised_total: 850 } }
+      )
+    })
+  })
+
+  describe('reviseItemQuantity', () => {
+    it('should move revised_total by the cost delta within the sanctioned amount', async () => {
+      const db = createDb()
+      const outcome = await reviseItemQuantity(db, ITEM, { id: 'apo-1', revised_total: 1000 }, 12)
+
+      expect(outcome).toEqual({ item: { id: 'apoi-1', revised_qty: 12 } })
+      const [filter, update] = db.apoHeaders.updateOne.mock.calls[0]
+      expect(filter.$expr.$lte[1]).toEqual({ $add: ['$total_sanctioned_amount', REVISED_TOTAL_TOLERANCE] })
+      expect(filter.$expr.$lte[0]).toEqual({ $add: ['$revised_total', 200] })
+      expect(update).toEqual({ $inc: { revised_total: 200 } })
+      expect(db.apoItems.findOneAndUpdate.mock.calls[0][0]).toEqual({ id: 'apoi-1', revised_qty: null })
+      expect(db.apoItems.aggregate).not.toHaveBeenCalled()
+    })
+
+    it('should backfill revised_total before the first edit', async () => {
+      const db = createDb()
+      await reviseItemQuantity(db, ITEM, { id: 'apo-1' }, 12)
+
+      expect(db.apoItems.aggregate).toHaveBeenCalled()
+      expect(db.apoHeaders.updateOne.mock.calls[0][0]).toEqual({ id: 'apo-1', revised_total: { $exists: false } })
+      expect(db.apoHeaders.updateOne.mock.calls[1][1]).toEqual({ $inc: { revised_total: 200 } })
+    })
+
+    it('should report the new total when it would exceed the sanctioned amount', async () => {
+      const db = createDb({ budgetMatched: 0 })
+      const outcome = await reviseItemQuantity(db, ITEM, { id: 'apo-1', revised_total: 1000 }, 12)
+
+      expect(outcome).toEqual({ overBudget: true, revised_total: 1200, total_sanctioned_amount: 1100 })
+      expect(db.apoItems.findOneAndUpdate).not.toHaveBeenCalled()
+    })
+
+    it('should give the delta back when the line changed meanwhile', async () => {
+      const db = createDb({ updatedItem: null })
+      const outcome = await reviseItemQuantity(db, { ...ITEM, revised_qty: 8 }, { id: 'apo-1', revised_total: 800 }, 12)
+
+      expect(outcome).toEqual({ conflict: 'item' })
+      expect(db.apoItems.findOneAndUpdate.mock.calls[0][0]).toEqual({ id: 'apoi-1', revised_qty: 8 })
+      expect(db.apoHeaders.updateOne.mock.calls[1].slice(0, 2)).toEqual([{ id: 'apo-1' }, { $inc: { revised_total: -400 } }])
+    })
+
+    it('should report a conflict when works reset the total meanwhile', async () => {
+      const db = createDb({ budgetMatched: 0, header: { total_sanctioned_amount: 1100 } })
+      expect(await reviseItemQuantity(db, ITEM, { id: 'apo-1', revised_total: 1000 }, 12)).toEqual({ conflict: 'apo' })
+    })
+  })
+
+  describe('updateItemEstimate', () => {
+    it('should return 400 for a bad revised_qty', async () => {
+      const db = createDb()
+      const res = await updateItemEstimate(estimateRequest({ revised_qty: -2 }), { db, params: { id: 'apoi-1' } })
+
+      expect(res.status).toBe(400)
+      expect(db.apoHeaders.updateOne).not.toHaveBeenCalled()
+    })
+
+    it('should return 400 when over budget and 409 when works cleared the total', async () => {
+      const overBudget = await updateItemEstimate(estimateRequest({ revised_qty: 12 }), { db: createDb({ budgetMatched: 0 }), params: { id: 'apoi-1' } })
+      expect(overBudget.status).toBe(400)
+      expect((await overBudget.json()).error).toBe('Total cost ₹1200 exceeds sanctioned amount ₹1100')
+
+      const db = createDb({ budgetMatched: 0, header: { total_sanctioned_amount: 1100 } })
+      const cleared = await updateItemEstimate(estimateRequest({ revised_qty: 12 }), { db, params: { id: 'apoi-1' } })
+      expect(cleared.status).toBe(409)
+    })
+  })
+})
@@ -0,0 +1,67 @@
+/**
+ * Dashboard Rollups Unit Tests
+ */
+import {
+  rollupId,
+  dashboardScope,
+  activityKey,
+  diffRollup,
+  recordWorkLog,
+  ALL_YEARS
+} from '@/lib/rollups'
+import { invalidateMasterData } from '@/lib/masterData'
+
+function createDb() {
+  const bulkWrite = jest.fn().mockResolvedValue({})
+  const collections = {
+    users: { findOne: jest.fn().mockResolvedValue({ range_id: 'rng-1' }) },
+    ranges: { find: () => ({ toArray: async () => [{ id: 'rng-1', division_id: 'div-1' }] }) },
+    dashboard_rollups: { bulkWrite },
+  }
+  return { bulkWrite, collection: (name) => collections[name] }
+}
+
+describe('Dashboard Rollups', () => {
+  beforeEach(() => {
+    invalidateMasterData()
+  })
+
+  it('should key rows by scope and financial year', () => {
+    expect(rollupId('org')).toBe(`org|${ALL_YEARS}`)
+    expect(rollupId('range:rng-1', '2026-27')).toBe('range:rng-1|2026-27')
+  })
+
+  it('should pick the dashboard scope from the role', () => {
+    expect(dashboardScope({ role: 'RO', range_id: 'rng-1' })).toBe('range:rng-1')
+    expect(dashboardScope({ role: 'DM', division_id: 'div-1' })).toBe('division:div-1')
+    expect(dashboardScope({ role: 'MD' })).toBe('org')
+  })
+
+  it('should make activity names safe for field paths', () => {
+    expect(activityKey('Misc. items $1')).toBe('Misc_ items _1')
+  })
+
+  it('should report numeric drift beyond rounding', () => {
+    const stored = { _id: 'org|ALL', apo_count: { DRAFT: 1 }, expenditure: 100.001, activities: { a: { name: 'a', spent: 5, order: 1 } } }
+    const expected = { _id: 'org|ALL', apo_count: { DRAFT: 2, SANCTIONED: 0 }, expenditure: 100, activities: { a: { name: 'a', spent: 5, order: 7 } } }
+    expect(diffRollup(stored, expected)).toEqual([{ path: 'apo_count.DRAFT', stored: 1, expected: 2 }])
+    expect(diffRollup(null, { plantation_count: 3 })).toEqual([{ path: 'plantation_count', stored: 0, expected: 3 }])
+  })
+
+  it('should apply a work log to every scope of the APO, per year and for all years', async () => {
+    const db = createDb()
+    await recordWorkLog(db, { created_by: 'usr-1', financial_year: '2026-27' }, { activity_name: 'Fire Lines' }, 250)
+    const [ops] = db.bulkWrite.mock.calls[0]
+    expect(ops.map(op => op.updateOne.filter._id)).toEqual([
+      'org|2026-27', 'org|ALL',
+      'range:rng-1|2026-27', 'range:rng-1|ALL',
+      'division:div-1|2026-27', 'division:div-1|ALL',
+    ])
+    expect(ops[0].updateOne.upsert).toBe(true)
+    expect(ops[0].updateOne.update.$inc).toEqual({
+      expenditure: 250,
+      'activities.Fire Lines.sanctioned': 0,
+      'activities.Fire Lines.spent': 250,
+    })
+  })
+})
@@ -0,0 +1,55 @@
+/**
+ * Router Unit Tests
+ */
+import { Router } from '@/lib/router'
+
+const noop = async () => null
+
+describe('Router', () => {
+  const router = new Router()
+    .add('GET', '/apo', noop)
+    .add('GET', '/apo/:id', noop)
+    .add('PATCH', '/apo/:id/status', noop)
+    .add('PATCH', '/apo/items/:id/status', noop)
+    .add('GET', '/fund-indent/pending', noop)
+    .add('GET', '/fund-indent/:id', noop)
+
+  describe('match', () => {
+    it('should resolve static paths without params', () => {
+      expect(router.match('GET', '/apo')).toMatchObject({ pattern: '/apo', params: {} })
+    })
+
+    it('should extract named params', () => {
+      expect(router.match('GET', '/apo/apo-001')).toMatchObject({ pattern: '/apo/:id', params: { id: 'apo-001' } })
+    })
+
+    it('should prefer static routes over params', () => {
+      expect(router.match('GET', '/fund-indent/pending').pattern).toBe('/fund-indent/pending')
+      expect(router.match('GET', '/fund-indent/EST-1').params).toEqual({ id: 'EST-1' })
+    })
+
+    it('should backtrack to a param when the literal branch has no handler', () => {
+      expect(router.match('PATCH', '/apo/items/status')).toMatchObject({ pattern: '/apo/:id/status', params: { id: 'items' } })
+      expect(router.match('PATCH', '/apo/items/i-1/status').params).toEqual({ id: 'i-1' })
+    })
+
+    it('should return null for unknown paths and methods', () => {
+      expect(router.match('GET', '/unknown')).toBeNull()
+      expect(router.match('DELETE', '/apo/apo-001')).toBeNull()
+    })
+  })
+
+  describe('add', () => {
+    it('should reject duplicate routes', () => {
+      expect(() => new Router().add('GET', '/a/:id', noop).add('GET', '/a/:key', noop)).toThrow('Duplicate route')
+    })
+
+    it('should flag routes that do not need the database', () => {
+      const flagged = new Router().add('GET', '/metrics', noop, { db: false }).add('GET', '/jobs/:id', noop, { db: false })
+      expect(flagged.match('GET', '/metrics').usesDb).toBe(false)
+      expect(flagged.match('GET', '/jobs/j-1').usesDb).toBe(false)
+      expect(router.match('GET', '/apo').usesDb).toBe(true)
+      expect(router.match('GET', '/apo/apo-001').usesDb).toBe(true)
+    })
+  })
+})
@@ -0,0 +1,97 @@
+/**
+ * @jest-environment node
+ */
+/**
+ * Seed Module Unit Tests
+ */
+import { SEED_COLLECTIONS, buildSeedDocuments, seedFingerprint, templateDbName, restoreSeed } from '@/lib/seed'
+
+function createCollection(name, snapshot = null) {
+  return {
+    name,
+    findOne: jest.fn().mockResolvedValue(snapshot),
+    aggregate: jest.fn(() => ({ toArray: jest.fn().mockResolvedValue([]) })),
+    deleteMany: jest.fn().mockResolvedValue({ deletedCount: 0 }),
+    createIndex: jest.fn().mockResolvedValue('idx'),
+  }
+}
+
+function createDbs(snapshot) {
+  const liveCollections = {}
+  const templateCollections = {}
+  const template = {
+    databaseName: 'kfdc_seed_template',
+    collection: (name) => {
+      if (!templateCollections[name]) templateCollections[name] = createCollection(name, name === 'seed_snapshot' ? snapshot : null)
+      return templateCollections[name]
+    },
+  }
+  const live = {
+    databaseName: 'kfdc',
+    client: { db: jest.fn(() => template) },
+    collection: (name) => {
+      if (!liveCollections[name]) liveCollections[name] = createCollection(name)
+      return liveCollections[name]
+    },
+  }
+  return { live, liveCollections, templateCollections }
+}
+
+describe('Seed', () => {
+  afterEach(() => {
+    delete process.env.SEED_TEMPLATE_DB
+  })
+
+  it('should only load collections that a seed resets', () => {
+    const documents = buildSeedDocuments()
+    Object.keys(documents).forEach(name => expect(SEED_COLLECTIONS).toContain(name))
+    expect(documents.plantations[0].created_at).toBeInstanceOf(Date)
+  })
+
+  it('should reset fund indents on seed and restore', async () => {
+    expect(SEED_COLLECTIONS).toContain('fund_indents')
+    expect(buildSeedDocuments().apo_items.some(item => item.fund_indent_id)).toBe(false)
+
+    const { live, liveCollections } = createDbs({ fingerprint: seedFingerprint(), counts: { users: 15 } })
+    await restoreSeed(live)
+    expect(liveCollections.fund_indents.deleteMany).toHaveBeenCalledWith({})
+  })
+
+  it('should fingerprint the seed data deterministically', () => {
+    expect(seedFingerprint()).toMatch(/^[0-9a-f]{40}$/)
+    expect(seedFingerprint()).toBe(seedFingerprint())
+  })
+
+  it('should name the template database after the live one unless configured', () => {
+    expect(templateDbName({ databaseName: 'kfdc' })).toBe('kfdc_seed_template')
+    process.env.SEED_TEMPLATE_DB = 'kfdc_template'
+    expect(templateDbName({ databaseName: 'kfdc' })).toBe('kfdc_template')
+  })
+
+  it('should not restore without a snapshot', async () => {
+    const { live, liveCollections } = createDbs(null)
+    expect(await restoreSeed(live)).toBeNull()
+    expect(liveCollections.users).toBeUndefined()
+  })
+
+  it('should not restore a snapshot of older seed data', async () => {
+    const { live, templateCollections } = createDbs({ fingerprint: 'stale', counts: { users: 15 } })
+    expect(await restoreSeed(live)).toBeNull()
+    expect(templateCollections.users).toBeUndefined()
+  })
+
+  it('should copy non-empty collections back with $out and empty the rest', async () => {
+    const counts = { users: 15, plantations: 44, sessions: 0 }
+    const { live, liveCollections, templateCollections } = createDbs({ fingerprint: seedFingerprint(), counts })
+
+    const result = await restoreSeed(live)
+
+    expect(result.counts).toEqual(counts)
+    expect(templateCollections.users.aggregate).toHaveBeenCalledWith([{ $out: { db: 'kfdc', coll: 'users' } }])
+    expect(templateCollections.plantations.aggregate).toHaveBeenCalled()
+    expect(liveCollections.sessions.deleteMany).toHaveBeenCalledWith({})
+    expect(liveCollections.work_logs.deleteMany).toHaveBeenCalledWith({})
+    expect(liveCollections.users.deleteMany).not.toHaveBeenCalled()
+    expect(Object.keys(result.timings.collections).sort()).toEqual([...SEED_COLLECTIONS].sort())
+  })
+})
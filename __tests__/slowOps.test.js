@@ -0,0 +1,136 @@
+/**
+ * Slow Operations Unit Tests
+ */
+import { redactShape, commandShape, shapeHash, summarizeExplain, captureSlowOp } from '@/lib/slowOps'
+
+function createDb() {
+  const slowOps = { insertOne: jest.fn().mockResolvedValue({}) }
+  return {
+    slowOps,
+    command: jest.fn().mockResolvedValue({
+      queryPlanner: { winningPlan: { stage: 'FETCH', inputStage: { stage: 'COLLSCAN' } } },
+      executionStats: { totalDocsExamined: 5000, totalKeysExamined: 0, nReturned: 3, executionTimeMillis: 120 },
+    }),
+    collection: () => slowOps,
+  }
+}
+
+describe('Slow Operations', () => {
+  describe('redactShape', () => {
+    it('should keep keys, operators and field references but not values', () => {
+      expect(redactShape({
+        division_id: 'div-1',
+        status: { $in: ['DRAFT', 'PENDING_APPROVAL'] },
+        $or: [{ created_by: 'u-1' }, { amount: { $gte: 500 } }],
+        $expr: { $lte: [{ $add: ['$spent_amount', 25] }, '$total_cost'] },
+        created_at: new Date(),
+      })).toEqual({
+        division_id: '?',
+        status: { $in: '?' },
+        $or: [{ created_by: '?' }, { amount: { $gte: '?' } }],
+        $expr: { $lte: [{ $add: ['$spent_amount', '?'] }, '$total_cost'] },
+        created_at: '?',
+      })
+    })
+
+    it('should redact $-prefixed literals outside aggregation expressions', () => {
+      expect(redactShape({ name: '$x', tags: { $in: ['$a', '$b'] }, $expr: { $eq: ['$name', '$alias'] } }))
+        .toEqual({ name: '?', tags: { $in: '?' }, $expr: { $eq: ['$name', '$alias'] } })
+      expect(commandShape('aggregate', { aggregate: 'apo_items', pipeline: [
+        { $match: { name: '$x', $expr: { $gt: ['$spent_amount', '$total_cost'] } } },
+        { $lookup: { from: 'work_logs', let: { item: '$id' }, pipeline: [{ $match: { note: '$y' } }], as: 'logs' } },
+        { $group: { _id: '$apo_id', label: { $first: { $literal: '$z' } } } },
+      ] })).toEqual({ pipeline: [
+        { $match: { name: '?', $expr: { $gt: ['$spent_amount', '$total_cost'] } } },
+        { $lookup: { from: '?', let: { item: '$id' }, pipeline: [{ $match: { note: '?' } }], as: '?' } },
+        { $group: { _id: '$apo_id', label: { $first: { $literal: '?' } } } },
+      ] })
+    })
+
+    it('should give the same shape whatever the values', () => {
+      const first = commandShape('find', { find: 'apo_items', filter: { apo_id: 'apo-1', id: { $in: ['a'] } }, sort: { created_at: -1 } })
+      const second = commandShape('find', { find: 'apo_items', filter: { apo_id: 'apo-2', id: { $in: ['b', 'c'] } }, sort: { created_at: -1 } })
+
+      expect(first).toEqual(second)
+      expect(first.sort).toEqual({ created_at: -1 })
+      expect(shapeHash('apo_items', 'find', first)).toBe(shapeHash('apo_items', 'find', second))
+      expect(shapeHash('apo_items', 'find', first)).not.toBe(shapeHash('work_logs', 'find', first))
+    })
+
+    it('should shape update and aggregate commands', () => {
+      expect(commandShape('update', { update: 'apo_items', updates: [{ q: { id: 'x' }, u: { $set: { a: 1 } } }] }))
+        .toEqual({ q: { id: '?' } })
+      expect(commandShape('aggregate', { aggregate: 'apo_headers', pipeline: [{ $match: { status: 'SANCTIONED' } }, { $limit: 10 }] }))
+        .toEqual({ pipeline: [{ $match: { status: '?' } }, { $limit: '?' }] })
+    })
+  })
+
+  describe('summarizeExplain', () => {
+    it('should read aggregation explains nested under $cursor', () => {
+      const summary = summarizeExplain({
+        stages: [{ $cursor: {
+          queryPlanner: { winningPlan: { stage: 'IXSCAN' } },
+          executionStats: { totalDocsExamined: 10, totalKeysExamined: 10, nReturned: 10, executionTimeMillis: 3 },
+        } }],
+      })
+      expect(summary).toMatchObject({ docs_examined: 10, keys_examined: 10, collscan: false })
+    })
+
+    it('should keep only the structure of the winning plan', () => {
+      const summary = summarizeExplain({
+        queryPlanner: { winningPlan: {
+          stage: 'FETCH',
+          filter: { password: { $eq: 'secret' } },
+          inputStage: {
+            stage: 'IXSCAN',
+            indexName: 'email_1',
+            keyPattern: { email: 1 },
+            direction: 'forward',
+            indexBounds: { email: ['["ro@kfdc.in", "ro@kfdc.in"]'] },
+          },
+        } },
+        executionStats: { totalDocsExamined: 1 },
+      })
+      expect(summary.winning_plan).toEqual({
+        stage: 'FETCH',
+        inputStage: { stage: 'IXSCAN', indexName: 'email_1', keyPattern: { email: 1 }, direction: 'forward' },
+      })
+      expect(JSON.stringify(summary)).not.toMatch(/secret|ro@kfdc/)
+    })
+  })
+
+  describe('captureSlowOp', () => {
+    it('should record a redacted op and explain each shape once per interval', async () => {
+      const db = createDb()
+      const op = { collection: 'plantations', commandName: 'find', command: { find: 'plantations', filter: { range_id: 'rng-1' }, lsid: { id: 'x' } } }
+      await captureSlowOp(db, op, 150, 3)
+      await captureSlowOp(db, { ...op, command: { ...op.command, filter: { range_id: 'rng-2' } } }, 180, 1)
+
+      expect(db.command).toHaveBeenCalledTimes(1)
+      expect(db.command.mock.calls[0][0]).toEqual({
+        explain: { find: 'plantations', filter: { range_id: 'rng-1' } },
+        verbosity: 'executionStats',
+      })
+      const [first, second] = db.slowOps.insertOne.mock.calls.map(call => call[0])
+      expect(first).toMatchObject({
+        collection: 'plantations',
+        command: 'find',
+        shape: { filter: { range_id: '?' } },
+        duration_ms: 150,
+        docs_returned: 3,
+        docs_examined: 5000,
+      })
+      expect(first.explain.collscan).toBe(true)
+      expect(second.shape_hash).toBe(first.shape_hash)
+      expect(second.explain).toBeNull()
+    })
+
+    it('should not explain writes', async () => {
+      const db = createDb()
+      await captureSlowOp(db, { collection: 'apo_items', commandName: 'update', command: { update: 'apo_items', updates: [{ q: { id: 'x' } }] } }, 200, 0)
+
+      expect(db.command).not.toHaveBeenCalled()
+      expect(db.slowOps.insertOne.mock.calls[0][0].docs_examined).toBeNull()
+    })
+  })
+})
@@ -0,0 +1,83 @@
+/**
+ * Spend Counters Unit Tests
+ * @jest-environment node
+ */
+import { logWorkWithinBudget, reconcileSpendCounters } from '@/lib/spendCounters'
+
+function createDb({ updated = { id: 'apoi-1' }, aggregateRows = [], matchedCount = 0 } = {}) {
+  const apoItems = {
+    findOneAndUpdate: jest.fn().mockResolvedValue(updated),
+    updateOne: jest.fn().mockResolvedValue({}),
+    aggregate: jest.fn(() => ({ toArray: async () => aggregateRows })),
+    bulkWrite: jest.fn().mockResolvedValue({ matchedCount }),
+  }
+  const workLogs = {
+    insertOne: jest.fn().mockResolvedValue({}),
+    aggregate: jest.fn(() => ({ toArray: async () => [{ spent: 40, qty: 4 }] })),
+  }
+  const collections = { apo_items: apoItems, work_logs: workLogs }
+  return { apoItems, workLogs, collection: (name) => collections[name] }
+}
+
+describe('Spend Counters', () => {
+  describe('logWorkWithinBudget', () => {
+    it('should make the counter update conditional on the remaining budget', async () => {
+      const db = createDb()
+      const ok = await logWorkWithinBudget(db, { id: 'apoi-1', spent_amount: 10 }, { id: 'wl-1', expenditure: 25, actual_qty: 2 })
+
+      expect(ok).toBe(true)
+      const [filter, update] = db.apoItems.findOneAndUpdate.mock.calls[0]
+      expect(filter).toEqual({ id: 'apoi-1', $expr: { $lte: [{ $add: ['$spent_amount', 25] }, '$total_cost'] } })
+      expect(update).toEqual({ $inc: { spent_amount: 25, logged_qty: 2 } })
+      expect(db.workLogs.insertOne).toHaveBeenCalled()
+      expect(db.apoItems.updateOne).not.toHaveBeenCalled()
+    })
+
+    it('should not insert the log when the budget is exceeded', async () => {
+      const db = createDb({ updated: null })
+      const ok = await logWorkWithinBudget(db, { id: 'apoi-1', spent_amount: 10 }, { id: 'wl-1', expenditure: 25 })
+
+      expect(ok).toBe(false)
+      expect(db.workLogs.insertOne).not.toHaveBeenCalled()
+    })
+
+    it('should backfill counters of items logged before they existed', async () => {
+      const db = createDb()
+      await logWorkWithinBudget(db, { id: 'apoi-1' }, { id: 'wl-1', expenditure: 5, actual_qty: 1 })
+
+      expect(db.apoItems.updateOne).toHaveBeenCalledWith(
+        { id: 'apoi-1', spent_amount: { $exists: false } },
+        { $set: { spent_amount: 40, logged_qty: 4 } }
+      )
+    })
+  })
+
+  describe('reconcileSpendCounters', () => {
+    const rows = [
+      { id: 'a', spent_amount: 10, logged_qty: 1, expected_spent: 10.001, expected_qty: 1 },
+      { id: 'b', spent_amount: 10, logged_qty: 1, expected_spent: 30, expected_qty: 3 },
+      { id: 'c', expected_spent: 0, expected_qty: 0 },
+    ]
+
+    it('should report drift without writing on a dry run', async () => {
+      const db = createDb({ aggregateRows: rows })
+      const result = await reconcileSpendCounters(db, { dryRun: true })
+
+      expect(result).toMatchObject({ items: 3, backfilled: 1, drifted: 1, applied: false })
+      expect(result.drift[0].id).toBe('b')
+      expect(db.apoItems.bulkWrite).not.toHaveBeenCalled()
+    })
+
+    it('should correct counters only if they are unchanged since the read', async () => {
+      const db = createDb({ aggregateRows: rows, matchedCount: 1 })
+      const result = await reconcileSpendCounters(db)
+
+      const ops = db.apoItems.bulkWrite.mock.calls[0][0]
+      expect(ops.map(op => op.updateOne.filter)).toEqual([
+        { id: 'c', spent_amount: { $exists: false }, logged_qty: { $exists: false } },
+        { id: 'b', spent_amount: 10, logged_qty: 1 },
+      ])
+      expect(result.skipped).toBe(1)
+    })
+  })
+})
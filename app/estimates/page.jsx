@@ -1,12 +1,13 @@
 'use client';
 import { useState, useEffect } from 'react';
 import { TreePine, User, LogOut, CheckCircle, XCircle, AlertTriangle, Send, Clock } from 'lucide-react';
+import { requestCache } from '@/components/common/requestCache';
 
 // ===================== API HELPER =====================
 const api = {
     token: null,
     user: null,
-    setToken(t) { this.token = t; if (t) localStorage.setItem('kfdc_token', t); else localStorage.removeItem('kfdc_token') },
+    setToken(t) { if (t !== this.token) requestCache.clear(); this.token = t; if (t) localStorage.setItem('kfdc_token', t); else localStorage.removeItem('kfdc_token') },
     setUser(u) { this.user = u; if (u) localStorage.setItem('kfdc_user', JSON.stringify(u)); else localStorage.removeItem('kfdc_user') },
     getToken() { if (!this.token) this.token = localStorage.getItem('kfdc_token'); return this.token },
     getUser() { if (!this.user) { const u = localStorage.getItem('kfdc_user'); if (u) this.user = JSON.parse(u); } return this.user },
@@ -24,9 +25,11 @@ const api = {
         if (!res.ok) throw new Error(data.error || data.message || 'Request failed')
         return data
     },
-    get(url) { return this.fetch(url) },
-    post(url, body) { return this.fetch(url, { method: 'POST', body: JSON.stringify(body) }) },
-    patch(url, body) { return this.fetch(url, { method: 'PATCH', body: JSON.stringify(body) }) },
+    // GETs share the app's request cache; writes drop the reads they affect
+    get(url) { return requestCache.get(url, () => this.fetch(url)) },
+    async mutate(url, options) { const data = await this.fetch(url, options); requestCache.afterMutation(url); return data },
+    post(url, body) { return this.mutate(url, { method: 'POST', body: JSON.stringify(body) }) },
+    patch(url, body) { return this.mutate(url, { method: 'PATCH', body: JSON.stringify(body) }) },
 }
 
 // ===================== LOGIN COMPONENT =====================
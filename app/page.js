@@ -1,6 +1,6 @@
 'use client'
 
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
 import { Card, CardContent, CardDescription, CardHeader, CardTitle, CardFooter } from '@/components/ui/card'
 import { Button } from '@/components/ui/button'
 import { Input } from '@/components/ui/input'
@@ -22,37 +22,7 @@ import {
   User, Shield, Building2, Layers, BookOpen, Trash2, Upload, File, X, Bell, Search,
   Users, BarChart3, Wallet, FolderTree, CheckSquare, Sprout, Home
 } from 'lucide-react'
-
-// ===================== API HELPER =====================
-const api = {
-  token: null,
-  setToken(t) { this.token = t; if (t) localStorage.setItem('kfdc_token', t); else localStorage.removeItem('kfdc_token') },
-  getToken() { if (!this.token) this.token = localStorage.getItem('kfdc_token'); return this.token },
-  async fetch(url, options = {}) {
-    const headers = { 'Content-Type': 'application/json', ...options.headers }
-    const token = this.getToken()
-    if (token) headers['Authorization'] = `Bearer ${token}`
-    // Use /api prefix for Next.js API routes
-    const res = await fetch(`/api${url}`, { ...options, headers })
-    const data = await res.json()
-    if (!res.ok) throw new Error(data.error || data.message || 'Request failed')
-    return data
-  },
-  get(url) { return this.fetch(url) },
-  post(url, body) { return this.fetch(url, { method: 'POST', body: JSON.stringify(body) }) },
-  patch(url, body) { return this.fetch(url, { method: 'PATCH', body: JSON.stringify(body) }) },
-  delete(url) { return this.fetch(url, { method: 'DELETE' }) },
-  // Special method for file uploads (no Content-Type header - browser sets it automatically with boundary)
-  async uploadFile(url, formData) {
-    const token = this.getToken()
-    const headers = {}
-    if (token) headers['Authorization'] = `Bearer ${token}`
-    const res = await fetch(`/api${url}`, { method: 'POST', headers, body: formData })
-    const data = await res.json()
-    if (!res.ok) throw new Error(data.error || data.message || 'Upload failed')
-    return data
-  },
-}
+import api from '@/components/common/ApiHelper'
 
 // ===================== CONSTANTS =====================
 // APO Status Flow: DRAFT → PENDING_DM_APPROVAL → PENDING_HO_APPROVAL → SANCTIONED
@@ -90,6 +60,71 @@ const formatCurrency = (n) => {
   return '₹' + Math.round(Number(n)).toLocaleString('en-IN')
 }
 
+// ===================== PAGINATED LISTS =====================
+const PAGE_SIZE = 50
+
+// Loads a list endpoint one keyset page at a time (?limit=&after=).
+// `path` may carry its own query string; `itemsKey` names the array in the response.
+function usePaginatedList(path, itemsKey = 'items') {
+  const [items, setItems] = useState([])
+  const [total, setTotal] = useState(null)
+  const [nextCursor, setNextCursor] = useState(null)
+  const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [error, setError] = useState('')
+  const requestId = useRef(0)
+
+  const fetchPage = useCallback((after) => {
+    const sep = path.includes('?') ? '&' : '?'
+    const cursor = after ? `&after=${encodeURIComponent(after)}` : '&include_total=true'
+    return api.get(`${path}${sep}limit=${PAGE_SIZE}${cursor}`)
+  }, [path])
+
+  const reload = useCallback(() => {
+    const id = ++requestId.current
+    setLoading(true)
+    setError('')
+    return fetchPage(null).then(data => {
+      if (id !== requestId.current) return
+      setItems(data[itemsKey] || [])
+      setTotal(data.total ?? null)
+      setNextCursor(data.next_cursor || null)
+    }).catch(e => {
+      if (id === requestId.current) setError(e.message)
+      console.error(e)
+    }).finally(() => {
+      if (id === requestId.current) setLoading(false)
+    })
+  }, [fetchPage, itemsKey])
+
+  const loadMore = useCallback(() => {
+    if (!nextCursor) return
+    const id = requestId.current
+    setLoadingMore(true)
+    fetchPage(nextCursor).then(data => {
+      if (id !== requestId.current) return
+      setItems(prev => [...prev, ...(data[itemsKey] || [])])
+      setNextCursor(data.next_cursor || null)
+    }).catch(console.error).finally(() => setLoadingMore(false))
+  }, [fetchPage, nextCursor, itemsKey])
+
+  useEffect(() => { reload() }, [reload])
+
+  return { items, total, loading, loadingMore, error, hasMore: Boolean(nextCursor), loadMore, reload }
+}
+
+function LoadMoreButton({ list }) {
+  if (!list.hasMore) return null
+  return (
+    <div className="flex justify-center pt-2">
+      <Button variant="outline" size="sm" onClick={list.loadMore} disabled={list.loadingMore}>
+        {list.loadingMore ? <RefreshCw className="w-4 h-4 mr-2 animate-spin" /> : <ChevronDown className="w-4 h-4 mr-2" />}
+        Load more{list.total != null ? ` (${list.items.length} of ${list.total})` : ''}
+      </Button>
+    </div>
+  )
+}
+
 // ===================== LOGIN PAGE =====================
 function LoginPage({ onLogin }) {
   const [email, setEmail] = useState('')
@@ -785,8 +820,8 @@ function Dashboard({ user }) {
 
 // ===================== PLANTATIONS =====================
 function PlantationsView({ user, setView, setSelectedPlantation }) {
-  const [plantations, setPlantations] = useState([])
-  const [loading, setLoading] = useState(true)
+  const plantationList = usePaginatedList('/plantations')
+  const { items: plantations, loading, reload: load } = plantationList
   const [showCreate, setShowCreate] = useState(false)
   const [form, setForm] = useState({ 
     name: '', 
@@ -832,13 +867,6 @@ function PlantationsView({ user, setView, setSelectedPlantation }) {
     "Marihal Bamboo", "Dowga Bamboo", "Red sanders", "Teak", "Rubber"
   ]
 
-  const load = useCallback(() => {
-    setLoading(true)
-    api.get('/plantations').then(setPlantations).catch(console.error).finally(() => setLoading(false))
-  }, [])
-
-  useEffect(() => { load() }, [load])
-
   // Load districts data on mount
   useEffect(() => {
     api.get('/districts').then(setDistrictsData).catch(console.error)
@@ -1118,6 +1146,7 @@ function PlantationsView({ user, setView, setSelectedPlantation }) {
           ))}
         </div>
       )}
+      {!loading && <LoadMoreButton list={plantationList} />}
     </div>
   )
 }
@@ -1212,8 +1241,8 @@ function PlantationDetail({ plantation, setView }) {
 
 // ===================== BUILDINGS VIEW =====================
 function BuildingsView({ user }) {
-  const [buildings, setBuildings] = useState([])
-  const [loading, setLoading] = useState(true)
+  const buildingList = usePaginatedList('/buildings?fields=summary')
+  const { items: buildings, loading, reload: load } = buildingList
   const [showCreate, setShowCreate] = useState(false)
   const [form, setForm] = useState({
     name: '',
@@ -1234,13 +1263,6 @@ function BuildingsView({ user }) {
 
   const division_options = ["Dharwad", "Belagavi", "Bengaluru", "Chikkaballapura", "Shivamogga", "Chikkamagalore"]
   
-  const load = useCallback(() => {
-    setLoading(true)
-    api.get('/buildings').then(setBuildings).catch(console.error).finally(() => setLoading(false))
-  }, [])
-
-  useEffect(() => { load() }, [load])
-
   useEffect(() => {
     api.get('/districts').then(setDistrictsData).catch(console.error)
   }, [])
@@ -1421,14 +1443,15 @@ function BuildingsView({ user }) {
           )}
         </div>
       )}
+      {!loading && <LoadMoreButton list={buildingList} />}
     </div>
   )
 }
 
 // ===================== NURSERIES VIEW =====================
 function NurseriesView({ user }) {
-  const [nurseries, setNurseries] = useState([])
-  const [loading, setLoading] = useState(true)
+  const nurseryList = usePaginatedList('/nurseries?fields=summary')
+  const { items: nurseries, loading, reload: load } = nurseryList
   const [showCreate, setShowCreate] = useState(false)
   const [form, setForm] = useState({
     name: '',
@@ -1439,13 +1462,6 @@ function NurseriesView({ user }) {
     capacity_seedlings: ''
   })
 
-  const load = useCallback(() => {
-    setLoading(true)
-    api.get('/nurseries').then(setNurseries).catch(console.error).finally(() => setLoading(false))
-  }, [])
-
-  useEffect(() => { load() }, [load])
-
   const createNursery = async () => {
     try {
       await api.post('/nurseries', form)
@@ -1584,6 +1600,7 @@ function NurseriesView({ user }) {
           )}
         </div>
       )}
+      {!loading && <LoadMoreButton list={nurseryList} />}
     </div>
   )
 }
@@ -1628,130 +1645,34 @@ function ApoWizard({ user, setView }) {
   const [searchTerm, setSearchTerm] = useState('')
   const [activeTab, setActiveTab] = useState('capex') // capex or revex
 
-  // Load all data on mount
+  // Load all data on mount in one request
   useEffect(() => {
-    Promise.all([
-      api.get('/plantations'),
-      api.get('/buildings'),
-      api.get('/nurseries'),
-      api.get('/activities'),
-      api.get('/norms'),
-      api.get('/building-activities'),
-      api.get('/building-norms'),
-      api.get('/nursery-activities'),
-      api.get('/nursery-norms'),
-    ]).then(([plts, blds, nurs, pActs, pNorms, bActs, bNorms, nActs, nNorms]) => {
-      setPlantations(plts)
-      setBuildings(blds)
-      setNurseries(nurs)
-      setPlantationActivities(pActs)
-      setPlantationNorms(pNorms)
-      setBuildingActivities(bActs)
-      setBuildingNorms(bNorms)
-      setNurseryActivities(nActs)
-      setNurseryNorms(nNorms)
-    }).catch(console.error)
+    api.get('/bootstrap?sets=plantations,buildings,nurseries,activities,norms,building_activities,building_norms,nursery_activities,nursery_norms')
+      .then(({ sets }) => {
+        setPlantations(sets.plantations || [])
+        setBuildings(sets.buildings || [])
+        setNurseries(sets.nurseries || [])
+        setPlantationActivities(sets.activities || [])
+        setPlantationNorms(sets.norms || [])
+        setBuildingActivities(sets.building_activities || [])
+        setBuildingNorms(sets.building_norms || [])
+        setNurseryActivities(sets.nursery_activities || [])
+        setNurseryNorms(sets.nursery_norms || [])
+      }).catch(console.error)
   }, [])
 
-  // Determine expense type based on categorization rules
-  // Plantations: CapEx (Age 1-7), RevEx (Age 8+)
-  // Buildings: CapEx (Creation), RevEx (Maintenance)
-  // Nurseries: CapEx only (New + Raising)
-  const getExpenseType = (item, type) => {
-    if (type === 'plantation') {
-      const age = item.age || (new Date().getFullYear() - item.year_of_planting)
-      return age <= 7 ? 'CAPEX' : 'REVEX'
-    }
-    if (type === 'building') {
-      return item.building_phase === 'Creation' ? 'CAPEX' : 'REVEX'
-    }
-    if (type === 'nursery') {
-      return 'CAPEX' // All nursery expenses are CapEx
-    }
-    return 'CAPEX'
-  }
-
-  // Generate draft items for all selected sources
+  // Generate draft items for all selected sources in one request
   const generateDraft = async () => {
     setLoading(true)
-    const newCapexItems = []
-    const newRevexItems = []
-    
     try {
-      // Generate for plantations
-      for (const pltId of selectedPlantations) {
-        const plt = plantations.find(p => p.id === pltId)
-        if (!plt) continue
-        
-        const data = await api.post('/apo/generate-draft', { plantation_id: pltId, financial_year: financialYear })
-        const expenseType = getExpenseType(plt, 'plantation')
-        
-        data.items.forEach(item => {
-          const enrichedItem = {
-            ...item,
-            sanctioned_qty: item.suggested_qty,
-            source_type: 'plantation',
-            source_id: pltId,
-            source_name: plt.name,
-            expense_type: expenseType,
-            plantation_age: data.age,
-          }
-          if (expenseType === 'CAPEX') {
-            newCapexItems.push(enrichedItem)
-          } else {
-            newRevexItems.push(enrichedItem)
-          }
-        })
-      }
-      
-      // Generate for buildings
-      for (const bldId of selectedBuildings) {
-        const bld = buildings.find(b => b.id === bldId)
-        if (!bld) continue
-        
-        const data = await api.post('/buildings/generate-draft', { building_id: bldId, financial_year: financialYear })
-        const expenseType = getExpenseType(bld, 'building')
-        
-        data.items.forEach(item => {
-          const enrichedItem = {
-            ...item,
-            sanctioned_qty: item.suggested_qty,
-            source_type: 'building',
-            source_id: bldId,
-            source_name: bld.name,
-            expense_type: expenseType,
-            building_phase: bld.building_phase,
-          }
-          if (expenseType === 'CAPEX') {
-            newCapexItems.push(enrichedItem)
-          } else {
-            newRevexItems.push(enrichedItem)
-          }
-        })
-      }
-      
-      // Generate for nurseries
-      for (const nurId of selectedNurseries) {
-        const nur = nurseries.find(n => n.id === nurId)
-        if (!nur) continue
-        
-        const data = await api.post('/nurseries/generate-draft', { nursery_id: nurId, financial_year: financialYear })
-        // All nursery expenses are CapEx
-        data.items.forEach(item => {
-          newCapexItems.push({
-            ...item,
-            sanctioned_qty: item.suggested_qty,
-            source_type: 'nursery',
-            source_id: nurId,
-            source_name: nur.name,
-            expense_type: 'CAPEX',
-            nursery_type: nur.nursery_type,
-          })
-        })
-      }
-      
-      setCapexItems(newCapexItems)
-      setRevexItems(newRevexItems)
+      const data = await api.post('/apo/generate-drafts', {
+        financial_year: financialYear,
+        plantation_ids: selectedPlantations,
+        building_ids: selectedBuildings,
+        nursery_ids: selectedNurseries,
+      })
+      setCapexItems(data.capex_items)
+      setRevexItems(data.revex_items)
       setStep(2)
     } catch (e) {
       alert(e.message)
@@ -2206,17 +2127,9 @@ function ApoWizard({ user, setView }) {
 
 // ===================== APO LIST =====================
 function ApoList({ user, setView, setSelectedApo }) {
-  const [apos, setApos] = useState([])
-  const [loading, setLoading] = useState(true)
   const [filter, setFilter] = useState('all')
-
-  const load = useCallback(() => {
-    setLoading(true)
-    const url = filter === 'all' ? '/apo' : `/apo?status=${filter}`
-    api.get(url).then(setApos).catch(console.error).finally(() => setLoading(false))
-  }, [filter])
-
-  useEffect(() => { load() }, [load])
+  const apoList = usePaginatedList(filter === 'all' ? '/apo?fields=summary' : `/apo?status=${filter}&fields=summary`)
+  const { items: apos, loading } = apoList
 
   return (
     <div className="space-y-6">
@@ -2280,6 +2193,7 @@ function ApoList({ user, setView, setSelectedApo }) {
           ))}
         </div>
       )}
+      {!loading && <LoadMoreButton list={apoList} />}
     </div>
   )
 }
@@ -2702,11 +2616,9 @@ function NormsView({ user }) {
 // ===================== FUND INDENT - RFO VIEW (Generate Fund Indent) =====================
 function FundIndentRFOView({ user, setView, setSelectedWork }) {
   const [works, setWorks] = useState([])
-  const [myIndents, setMyIndents] = useState([])
   const [years, setYears] = useState([])
   const [selectedYear, setSelectedYear] = useState('2026-27')
   const [loading, setLoading] = useState(true)
-  const [loadingIndents, setLoadingIndents] = useState(true)
   const [error, setError] = useState('')
   const [activeTab, setActiveTab] = useState('generate')
   
@@ -2728,21 +2640,12 @@ function FundIndentRFOView({ user, setView, setSelectedWork }) {
     setLoading(false)
   }, [selectedYear])
 
-  const fetchMyIndents = useCallback(async () => {
-    setLoadingIndents(true)
-    try {
-      const data = await api.get('/fund-indent/pending')
-      setMyIndents(data.indents || [])
-    } catch (e) {
-      console.error(e)
-    }
-    setLoadingIndents(false)
-  }, [])
+  const myIndentList = usePaginatedList('/fund-indent/pending?fields=summary', 'indents')
+  const { items: myIndents, loading: loadingIndents, reload: fetchMyIndents } = myIndentList
 
   useEffect(() => {
     fetchWorks()
-    fetchMyIndents()
-  }, [fetchWorks, fetchMyIndents])
+  }, [fetchWorks])
 
   // Fetch work activities for preview
   const handleViewWork = async (work) => {
@@ -2921,7 +2824,7 @@ function FundIndentRFOView({ user, setView, setSelectedWork }) {
       <Tabs value={activeTab} onValueChange={setActiveTab}>
         <TabsList className="grid w-full grid-cols-2 max-w-md">
           <TabsTrigger value="generate" className="gap-2"><Plus className="w-4 h-4" /> Generate GFI</TabsTrigger>
-          <TabsTrigger value="my-indents" className="gap-2"><FileText className="w-4 h-4" /> My Fund Indents ({myIndents.length})</TabsTrigger>
+          <TabsTrigger value="my-indents" className="gap-2"><FileText className="w-4 h-4" /> My Fund Indents ({myIndentList.total ?? myIndents.length})</TabsTrigger>
         </TabsList>
 
         {/* Generate GFI Tab */}
@@ -3054,6 +2957,7 @@ function FundIndentRFOView({ user, setView, setSelectedWork }) {
                   ))}
                 </TableBody>
               </Table>
+              {!loadingIndents && <LoadMoreButton list={myIndentList} />}
             </CardContent>
           </Card>
 
@@ -3340,29 +3244,14 @@ function FundIndentItemsView({ user, apoId, setView }) {
 
 // ===================== FUND INDENT - APPROVAL VIEW (DCF/ED/MD) =====================
 function FundIndentApprovalView({ user }) {
-  const [indents, setIndents] = useState([])
-  const [loading, setLoading] = useState(true)
-  const [error, setError] = useState('')
+  const indentList = usePaginatedList('/fund-indent/pending', 'indents')
+  const { items: indents, loading, reload: fetchIndents } = indentList
+  const [actionError, setError] = useState('')
+  const error = actionError || indentList.error
   const [expandedIndent, setExpandedIndent] = useState(null)
   const [selectedItems, setSelectedItems] = useState({})
   const [submitting, setSubmitting] = useState(false)
 
-  const fetchIndents = useCallback(async () => {
-    setLoading(true)
-    setError('')
-    try {
-      const data = await api.get('/fund-indent/pending')
-      setIndents(data.indents || [])
-    } catch (e) {
-      setError(e.message)
-    }
-    setLoading(false)
-  }, [])
-
-  useEffect(() => {
-    fetchIndents()
-  }, [fetchIndents])
-
   const handleApprove = async (estId) => {
     const indent = indents.find(i => i.id === estId)
     if (!indent) return
@@ -3370,6 +3259,7 @@ function FundIndentApprovalView({ user }) {
     const approved = indent.items.filter(item => selectedItems[item.id] !== false).map(i => i.id)
     const rejected = indent.items.filter(item => selectedItems[item.id] === false).map(i => i.id)
 
+    setError('')
     setSubmitting(true)
     try {
       await api.post(`/fund-indent/${estId}/approve`, { approved_items: approved, rejected_items: rejected })
@@ -3418,7 +3308,7 @@ function FundIndentApprovalView({ user }) {
             <div>
               <div className="text-xs text-blue-600 uppercase font-medium">Your Role</div>
               <div className="text-lg font-bold text-blue-900">{user.role} - {user.name}</div>
-              <div className="text-xs text-blue-700">Pending Indents: {indents.length}</div>
+              <div className="text-xs text-blue-700">Pending Indents: {indentList.total ?? indents.length}</div>
             </div>
           </div>
         </CardContent>
@@ -3508,31 +3398,29 @@ function FundIndentApprovalView({ user }) {
           ))}
         </div>
       )}
+      {!loading && <LoadMoreButton list={indentList} />}
     </div>
   )
 }
 
 // ===================== APO APPROVAL VIEW (ED/MD) =====================
 function ApoApprovalView({ user, setView, setSelectedApo }) {
-  const [apos, setApos] = useState([])
-  const [loading, setLoading] = useState(true)
-
-  const load = useCallback(() => {
-    setLoading(true)
-    api.get('/apo').then(setApos).catch(console.error).finally(() => setLoading(false))
-  }, [])
-
-  useEffect(() => { load() }, [load])
-
-  // Filter APOs based on role
-  const pendingApos = apos.filter(a => {
-    if (user.role === 'ED') return a.status === 'PENDING_ED_APPROVAL'
-    if (user.role === 'MD') return a.status === 'PENDING_MD_APPROVAL'
-    return false
-  })
-
-  const approvedApos = apos.filter(a => a.status === 'SANCTIONED')
-  const rejectedApos = apos.filter(a => a.status === 'REJECTED')
+  // Pending status depends on role: ED sees PENDING_ED_APPROVAL, MD sees PENDING_MD_APPROVAL
+  const pendingStatus = user.role === 'ED' ? 'PENDING_ED_APPROVAL' : 'PENDING_MD_APPROVAL'
+  const pendingList = usePaginatedList(`/apo?status=${pendingStatus}&fields=summary`)
+  const approvedList = usePaginatedList('/apo?status=SANCTIONED&fields=summary')
+  const rejectedList = usePaginatedList('/apo?status=REJECTED&fields=summary')
+  const loading = pendingList.loading
+
+  const pendingApos = (user.role === 'ED' || user.role === 'MD') ? pendingList.items : []
+  const approvedApos = approvedList.items
+  const rejectedApos = rejectedList.items
+
+  const load = () => {
+    pendingList.reload()
+    approvedList.reload()
+    rejectedList.reload()
+  }
 
   const handleApprove = async (apoId, action) => {
     try {
@@ -3555,13 +3443,13 @@ function ApoApprovalView({ user, setView, setSelectedApo }) {
       <Tabs defaultValue="pending">
         <TabsList>
           <TabsTrigger value="pending">
-            Pending Approval ({pendingApos.length})
+            Pending Approval ({pendingList.total ?? pendingApos.length})
           </TabsTrigger>
           <TabsTrigger value="approved">
-            Sanctioned ({approvedApos.length})
+            Sanctioned ({approvedList.total ?? approvedApos.length})
           </TabsTrigger>
           <TabsTrigger value="rejected">
-            Rejected ({rejectedApos.length})
+            Rejected ({rejectedList.total ?? rejectedApos.length})
           </TabsTrigger>
         </TabsList>
 
@@ -3622,6 +3510,7 @@ function ApoApprovalView({ user, setView, setSelectedApo }) {
               </Card>
             ))
           )}
+          {!loading && <LoadMoreButton list={pendingList} />}
         </TabsContent>
 
         <TabsContent value="approved" className="mt-4">
@@ -3665,6 +3554,7 @@ function ApoApprovalView({ user, setView, setSelectedApo }) {
               </CardContent>
             </Card>
           )}
+          <LoadMoreButton list={approvedList} />
         </TabsContent>
 
         <TabsContent value="rejected" className="mt-4">
@@ -3702,6 +3592,7 @@ function ApoApprovalView({ user, setView, setSelectedApo }) {
               </CardContent>
             </Card>
           )}
+          <LoadMoreButton list={rejectedList} />
         </TabsContent>
       </Tabs>
     </div>
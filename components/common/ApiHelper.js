@@ -1,12 +1,18 @@
 /**
  * API Helper Module
  * Centralized API communication with authentication
+ *
+ * GETs go through the shared request cache; a successful mutation
+ * invalidates the cached reads it can change.
  */
+import { requestCache } from './requestCache'
 
 const api = {
   token: null,
   
   setToken(t) {
+    // Cached reads belong to the previous session
+    if (t !== this.token) requestCache.clear()
     this.token = t
     if (t) {
       localStorage.setItem('kfdc_token', t)
@@ -38,23 +44,30 @@ const api = {
   },
   
   get(url) {
-    return this.fetch(url)
+    return requestCache.get(url, () => this.fetch(url))
+  },
+  
+  // Send a write and drop the cached reads it affects
+  async mutate(url, options) {
+    const data = await this.fetch(url, options)
+    requestCache.afterMutation(url)
+    return data
   },
   
   post(url, body) {
-    return this.fetch(url, { method: 'POST', body: JSON.stringify(body) })
+    return this.mutate(url, { method: 'POST', body: JSON.stringify(body) })
   },
   
   put(url, body) {
-    return this.fetch(url, { method: 'PUT', body: JSON.stringify(body) })
+    return this.mutate(url, { method: 'PUT', body: JSON.stringify(body) })
   },
   
   patch(url, body) {
-    return this.fetch(url, { method: 'PATCH', body: JSON.stringify(body) })
+    return this.mutate(url, { method: 'PATCH', body: JSON.stringify(body) })
   },
   
   delete(url) {
-    return this.fetch(url, { method: 'DELETE' })
+    return this.mutate(url, { method: 'DELETE' })
   },
   
   // Special method for file uploads (no Content-Type header - browser sets it automatically)
@@ -69,6 +82,7 @@ const api = {
     if (!res.ok) {
       throw new Error(data.error || data.message || 'Upload failed')
     }
+    requestCache.afterMutation(url)
     return data
   },
 }
@@ -0,0 +1,293 @@
+/**
+ * Request Cache Module
+ * Stale-while-revalidate cache for API GETs, shared by the API helpers
+ *
+ * Responses are kept in memory per URL and tagged by resource (the first
+ * path segment, e.g. /plantations?fields=summary -> plantations). A fresh
+ * entry is returned without a request; a stale one is returned at once and
+ * refreshed in the background. Identical GETs in flight share one request.
+ * A mutation invalidates the tags it can change (POST /plantations ->
+ * plantations, dashboard), so the next read after a save goes to the
+ * server. Reference data (rate cards, activities, divisions, districts) is
+ * the same for every user and is also persisted to IndexedDB, so a reload
+ * starts warm; the server's ETag keeps the revalidation cheap.
+ */
+
+const FRESH_MS = 30 * 1000
+const STALE_MS = 5 * 60 * 1000
+const REFERENCE_FRESH_MS = 10 * 60 * 1000
+const REFERENCE_STALE_MS = 24 * 60 * 60 * 1000
+const MAX_ENTRIES = 200
+
+const IDB_NAME = 'kfdc_api_cache'
+const IDB_STORE = 'responses'
+const IDB_VERSION = 1
+
+/**
+ * Master and rate-card resources, identical for every user
+ */
+export const REFERENCE_TAGS = new Set([
+  'divisions', 'ranges', 'districts', 'taluks',
+  'activities', 'norms',
+  'building-activities', 'building-norms',
+  'nursery-activities', 'nursery-norms',
+])
+
+// Session and operational endpoints are never cached
+const UNCACHED_TAGS = new Set(['auth', 'admin', 'metrics', 'seed'])
+
+// POSTs that compute a result without writing anything
+const READ_ONLY_POSTS = new Set([
+  '/apo/generate-draft',
+  '/apo/generate-drafts',
+  '/buildings/generate-draft',
+  '/nurseries/generate-draft',
+  '/works/suggest-activities',
+])
+
+/**
+ * Resource written by a mutation -> tags whose cached reads it can change
+ */
+export const MUTATION_TAGS = {
+  plantations: ['plantations', 'dashboard'],
+  buildings: ['buildings', 'dashboard'],
+  nurseries: ['nurseries', 'dashboard'],
+  norms: ['norms'],
+  apo: ['apo', 'plantations', 'dashboard', 'fund-indent'],
+  works: ['apo', 'dashboard', 'fund-indent'],
+  'work-logs': ['work-logs', 'apo', 'dashboard', 'fund-indent'],
+  'fund-indent': ['fund-indent', 'apo', 'dashboard'],
+  auth: [],
+}
+
+/**
+ * Split an API URL into its path and query
+ * @param {string} url - URL relative to /api, e.g. /plantations?fields=summary
+ * @returns {{path: string, query: URLSearchParams}}
+ */
+function parseUrl(url) {
+  const [path, search = ''] = url.split('?')
+  return { path: path.replace(/\/+$/, '') || '/', query: new URLSearchParams(search) }
+}
+
+/**
+ * Resource tags of a GET URL. /bootstrap is tagged with each set it carries.
+ * @param {string} url - URL relative to /api
+ * @returns {string[]} Tags
+ */
+export function urlTags(url) {
+  const { path, query } = parseUrl(url)
+  const resource = path.split('/')[1] || ''
+  if (resource !== 'bootstrap') return [resource]
+  const sets = (query.get('sets') || '').split(',').filter(Boolean).map(s => s.replace(/_/g, '-'))
+  return ['bootstrap', ...sets]
+}
+
+/**
+ * Tags a mutation invalidates
+ * @param {string} url - URL relative to /api
+ * @returns {string[]|null} Tags, or null if every entry may be affected
+ */
+export function mutationTags(url) {
+  const { path } = parseUrl(url)
+  if (READ_ONLY_POSTS.has(path)) return []
+  const resource = path.split('/')[1] || ''
+  return MUTATION_TAGS[resource] || null
+}
+
+/**
+ * Whether a GET URL is reference data (every tag is a reference resource)
+ * @param {string[]} tags - Tags from urlTags
+ * @returns {boolean}
+ */
+function isReference(tags) {
+  const resources = tags.filter(tag => tag !== 'bootstrap')
+  return resources.length > 0 && resources.every(tag => REFERENCE_TAGS.has(tag))
+}
+
+/**
+ * Minimal promise wrapper around the IndexedDB response store.
+ * Persistence is best effort: any failure reads as a miss.
+ * @returns {object} Store with get, put, delete and clear
+ */
+function createPersistentStore() {
+  let dbPromise = null
+
+  const open = () => {
+    if (typeof indexedDB === 'undefined') return Promise.resolve(null)
+    if (!dbPromise) {
+      dbPromise = new Promise(resolve => {
+        const req = indexedDB.open(IDB_NAME, IDB_VERSION)
+        req.onupgradeneeded = () => req.result.createObjectStore(IDB_STORE, { keyPath: 'url' })
+        req.onsuccess = () => resolve(req.result)
+        req.onerror = () => resolve(null)
+      })
+    }
+    return dbPromise
+  }
+
+  const run = async (mode, action) => {
+    try {
+      const db = await open()
+      if (!db) return null
+      return await new Promise(resolve => {
+        const req = action(db.transaction(IDB_STORE, mode).objectStore(IDB_STORE))
+        req.onsuccess = () => resolve(req.result ?? null)
+        req.onerror = () => resolve(null)
+      })
+    } catch (e) {
+      return null
+    }
+  }
+
+  return {
+    get: (url) => run('readonly', store => store.get(url)),
+    put: (record) => run('readwrite', store => store.put(record)),
+    delete: (url) => run('readwrite', store => store.delete(url)),
+    clear: () => run('readwrite', store => store.clear()),
+  }
+}
+
+/**
+ * Create a request cache
+ * @param {object} options
+ * @param {boolean} options.persist - Persist reference data to IndexedDB (default true)
+ * @param {Function} options.now - Clock, for tests
+ * @returns {object} Cache with get, afterMutation, invalidate, clear and stats
+ */
+export function createRequestCache({ persist = true, now = () => Date.now() } = {}) {
+  const entries = new Map() // url -> { data, storedAt, tags, reference }
+  const inflight = new Map() // url -> { promise, dropped }
+  const store = persist ? createPersistentStore() : null
+  const stats = { hits: 0, stale: 0, misses: 0, coalesced: 0, invalidations: 0 }
+  // Bumped on every invalidation so a persisted entry read across one is not used
+  let generation = 0
+
+  const remember = (url, entry) => {
+    entries.delete(url)
+    entries.set(url, entry)
+    if (entries.size > MAX_ENTRIES) entries.delete(entries.keys().next().value)
+  }
+
+  const revalidate = (url, tags, reference, fetcher) => {
+    const running = inflight.get(url)
+    if (running) {
+      stats.coalesced++
+      return running.promise
+    }
+    // Invalidation marks the request dropped so its (older) response is not stored
+    const request = { dropped: false }
+    request.promise = fetcher().then(data => {
+      if (!request.dropped) {
+        const entry = { url, data, storedAt: now(), tags, reference }
+        remember(url, entry)
+        if (reference && store) store.put(entry)
+      }
+      return data
+    }).finally(() => {
+      if (inflight.get(url) === request) inflight.delete(url)
+    })
+    inflight.set(url, request)
+    return request.promise
+  }
+
+  const drop = (url) => {
+    inflight.get(url).dropped = true
+    inflight.delete(url)
+  }
+
+  /**
+   * Serve a GET from the cache, fetching or revalidating as needed
+   * @param {string} url - URL relative to /api
+   * @param {Function} fetcher - Performs the network request, resolves to the body
+   * @returns {Promise<*>} Response body
+   */
+  const get = async (url, fetcher) => {
+    const tags = urlTags(url)
+    if (tags.some(tag => UNCACHED_TAGS.has(tag))) return fetcher()
+    const reference = isReference(tags)
+
+    let entry = entries.get(url)
+    if (!entry && reference && store) {
+      const started = generation
+      const record = await store.get(url)
+      if (record && started === generation && !entries.has(url)) {
+        entry = record
+        remember(url, entry)
+      } else {
+        entry = entries.get(url)
+      }
+    }
+
+    if (entry) {
+      const age = now() - entry.storedAt
+      const freshMs = reference ? REFERENCE_FRESH_MS : FRESH_MS
+      const staleMs = reference ? REFERENCE_STALE_MS : STALE_MS
+      if (age < freshMs) {
+        stats.hits++
+        return entry.data
+      }
+      if (age < freshMs + staleMs) {
+        stats.stale++
+        revalidate(url, tags, reference, fetcher).catch(() => {})
+        return entry.data
+      }
+    }
+    stats.misses++
+    return revalidate(url, tags, reference, fetcher)
+  }
+
+  /**
+   * Drop every entry and in-flight read carrying one of the tags
+   * @param {string[]} tags - Tags to invalidate
+   */
+  const invalidate = (tags) => {
+    if (tags.length === 0) return
+    const hit = (entryTags) => entryTags.some(tag => tags.includes(tag))
+    generation++
+    stats.invalidations++
+    for (const [url, entry] of entries) {
+      if (!hit(entry.tags)) continue
+      entries.delete(url)
+      if (entry.reference && store) store.delete(url)
+    }
+    for (const url of [...inflight.keys()]) {
+      if (hit(urlTags(url))) drop(url)
+    }
+  }
+
+  /**
+   * Drop all in-memory entries (and the persisted ones if asked)
+   * @param {object} options
+   * @param {boolean} options.persisted - Also clear IndexedDB
+   */
+  const clear = ({ persisted = false } = {}) => {
+    generation++
+    entries.clear()
+    for (const url of [...inflight.keys()]) drop(url)
+    if (persisted && store) store.clear()
+  }
+
+  /**
+   * Invalidate whatever a completed mutation can have changed
+   * @param {string} url - Mutated URL relative to /api
+   */
+  const afterMutation = (url) => {
+    const tags = mutationTags(url)
+    if (tags === null) clear({ persisted: true })
+    else invalidate(tags)
+  }
+
+  return {
+    get,
+    invalidate,
+    clear,
+    afterMutation,
+    stats: () => ({ ...stats, size: entries.size, inflight: inflight.size }),
+  }
+}
+
+// Shared by every API helper in the app
+export const requestCache = createRequestCache()
+
+export default requestCache
@@ -73,7 +73,7 @@ def test_comprehensive_work_type():
     try:
         # Step 1: Seed the database
         print("🔄 Step 1: Seeding database...")
-        response = requests.post(f"{BASE_URL}/seed", headers=HEADERS, timeout=30)
+        response = requests.post(f"{BASE_URL}/seed?mode=restore", headers=HEADERS, timeout=30)
         if response.status_code == 200:
             seed_data = response.json()
             result.add_result("Database Seeding", True, 
@@ -120,7 +120,7 @@ def debug_apo_item_cost():
 
 if __name__ == "__main__":
     # Seed first
-    seed_response = requests.post(f"{BASE_URL}/seed")
+    seed_response = requests.post(f"{BASE_URL}/seed?mode=restore")
     print(f"Seed status: {seed_response.status_code}")
     
     debug_ro_plantations()
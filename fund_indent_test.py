@@ -99,7 +99,7 @@ class FundIndentTester:
         """Test 1: Seed Database"""
         self.log("\n=== TEST 1: SEED DATABASE ===")
         
-        response = self.make_request("POST", "/seed")
+        response = self.make_request("POST", "/seed?mode=restore")
         
         success = self.test_assertion(
             response["success"],
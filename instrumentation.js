@@ -0,0 +1,17 @@
+/**
+ * Server Instrumentation
+ * Runs once when the Next.js server starts, before any request is served
+ */
+
+/**
+ * Warm the MongoDB pool so the first burst of requests after a deploy
+ * does not wait on the initial connect and index setup
+ */
+export async function register() {
+  if (process.env.NEXT_RUNTIME !== 'nodejs' || process.env.MONGO_WARM_POOL === 'false') return
+
+  const { connectToMongo } = await import('./lib/db')
+  const { logError } = await import('./lib/logger')
+  // Not fatal: requests retry the connect if this fails
+  await connectToMongo().catch(error => logError(error, { context: 'instrumentation warm-up' }))
+}
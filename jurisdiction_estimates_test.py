@@ -47,7 +47,7 @@ class JurisdictionEstimatesTester:
         """1. SEED DATABASE"""
         try:
             print("📊 1. Seeding Database...")
-            response = self.session.post(f"{API_BASE}/seed")
+            response = self.session.post(f"{API_BASE}/seed?mode=restore")
             if response.status_code == 200:
                 data = response.json()
                 counts = data.get('counts', {})
@@ -4,29 +4,106 @@
  */
 import { connectToMongo } from './db'
 import { logError } from './logger'
+import { getCachedAuth, setCachedAuth, setCachedProfile } from './authCache'
+import { getMasterDoc } from './masterData'
+
+/**
+ * Extract the bearer token from the Authorization header
+ * @param {Request} request - Next.js request object
+ * @returns {string|null} Token or null if absent
+ */
+export function getBearerToken(request) {
+  const authHeader = request.headers.get('Authorization')
+  if (!authHeader || !authHeader.startsWith('Bearer ')) {
+    return null
+  }
+  return authHeader.split(' ')[1] || null
+}
+
+/**
+ * Resolve the auth cache entry for a session token, loading it on a miss
+ * Counts exactly one cache lookup per call.
+ * @param {Db} db - MongoDB database instance
+ * @param {string} token - Bearer token
+ * @returns {object|null} { user, profile } or null if the session is unknown
+ */
+async function resolveSessionEntry(db, token) {
+  if (!token) return null
+  const cached = getCachedAuth(token)
+  if (cached) return cached
+
+  const session = await db.collection('sessions').findOne({ token })
+  if (!session) {
+    return null
+  }
+
+  const user = await db.collection('users').findOne({ id: session.user_id })
+  return user ? setCachedAuth(token, user) : null
+}
+
+/**
+ * Resolve the user for a session token, served from the auth cache when possible
+ * Database errors propagate to the caller.
+ * @param {Db} db - MongoDB database instance
+ * @param {string} token - Bearer token
+ * @returns {object|null} User object or null if the session is unknown
+ */
+export async function resolveSessionUser(db, token) {
+  const entry = await resolveSessionEntry(db, token)
+  return entry ? entry.user : null
+}
+
+/**
+ * Get the user for the request's bearer token
+ * Unlike getUser(), database errors propagate so route handlers return 500.
+ * @param {Request} request - Next.js request object
+ * @param {Db} db - MongoDB database instance
+ * @returns {object|null} User object or null if not authenticated
+ */
+export async function getSessionUser(request, db) {
+  return resolveSessionUser(db, getBearerToken(request))
+}
+
+/**
+ * Build the /auth/me payload (user without secrets plus division/range names)
+ * The result is cached alongside the session entry.
+ * @param {Db} db - MongoDB database instance
+ * @param {string} token - Bearer token
+ * @returns {object|null} Profile or null if not authenticated
+ */
+export async function getUserProfile(db, token) {
+  const entry = await resolveSessionEntry(db, token)
+  if (!entry) return null
+  if (entry.profile) return entry.profile
+
+  const { password: _, _id, ...userData } = entry.user
+  const [div, rng] = await Promise.all([
+    getMasterDoc(db, 'divisions', userData.division_id),
+    getMasterDoc(db, 'ranges', userData.range_id),
+  ])
+  const profile = {
+    ...userData,
+    division_name: userData.division_id ? div?.name : null,
+    range_name: userData.range_id ? rng?.name : null,
+  }
+  setCachedProfile(token, profile)
+  return profile
+}
 
 /**
  * Get authenticated user from request
  * @param {Request} request - Next.js request object
+ * @param {Db} db - Optional database instance (connects if omitted)
  * @returns {object|null} User object or null if not authenticated
  */
-export async function getUser(request) {
+export async function getUser(request, db = null) {
   try {
-    const authHeader = request.headers.get('Authorization')
-    if (!authHeader || !authHeader.startsWith('Bearer ')) {
-      return null
-    }
-    
-    const token = authHeader.split(' ')[1]
-    const db = await connectToMongo()
-    
-    const session = await db.collection('sessions').findOne({ token })
-    if (!session) {
+    const token = getBearerToken(request)
+    if (!token) {
       return null
     }
-    
-    const user = await db.collection('users').findOne({ id: session.user_id })
-    return user
+    const database = db || await connectToMongo()
+    return await resolveSessionUser(database, token)
   } catch (error) {
     logError(error, { context: 'getUser' })
     return null
@@ -71,6 +148,10 @@ export function hasDivisionAccess(user, divisionId) {
 }
 
 export default {
+  getBearerToken,
+  resolveSessionUser,
+  getSessionUser,
+  getUserProfile,
   getUser,
   hasRole,
   hasRangeAccess,
@@ -0,0 +1,88 @@
+/**
+ * Auth Cache Module
+ * In-process cache of resolved sessions, keyed by bearer token
+ *
+ * Each entry holds the user document and, once requested, the enriched
+ * profile served by /auth/me (division and range names).
+ */
+import { LRUCache } from './lruCache'
+
+const authCache = new LRUCache({
+  max: parseInt(process.env.AUTH_CACHE_MAX) || 5000,
+  ttlMs: parseInt(process.env.AUTH_CACHE_TTL_MS) || 60000,
+})
+
+/**
+ * Get cached auth entry for a token
+ * @param {string} token - Bearer token
+ * @returns {object|undefined} { user, profile } or undefined on miss
+ */
+export function getCachedAuth(token) {
+  return authCache.get(token)
+}
+
+/**
+ * Cache the user resolved for a token
+ * @param {string} token - Bearer token
+ * @param {object} user - User document
+ * @param {object|null} profile - Enriched /auth/me payload, if already built
+ * @returns {object} The stored { user, profile } entry
+ */
+export function setCachedAuth(token, user, profile = null) {
+  const entry = { user, profile }
+  authCache.set(token, entry)
+  return entry
+}
+
+/**
+ * Attach the enriched profile to an existing entry
+ * @param {string} token - Bearer token
+ * @param {object} profile - Enriched /auth/me payload
+ */
+export function setCachedProfile(token, profile) {
+  // Not a lookup: the caller already resolved the session
+  const entry = authCache.peek(token)
+  if (entry) entry.profile = profile
+}
+
+/**
+ * Drop the entry for a single token (logout)
+ * @param {string} token - Bearer token
+ */
+export function invalidateToken(token) {
+  authCache.delete(token)
+}
+
+/**
+ * Drop every cached session belonging to a user (user record changed)
+ * @param {string} userId - User ID
+ * @returns {number} Number of entries removed
+ */
+export function invalidateUser(userId) {
+  return authCache.deleteWhere(entry => entry.user?.id === userId)
+}
+
+/**
+ * Drop all entries (seed / bulk user changes)
+ */
+export function clearAuthCache() {
+  authCache.clear()
+}
+
+/**
+ * Get auth cache counters
+ * @returns {object} Cache statistics
+ */
+export function getAuthCacheStats() {
+  return authCache.stats()
+}
+
+export default {
+  getCachedAuth,
+  setCachedAuth,
+  setCachedProfile,
+  invalidateToken,
+  invalidateUser,
+  clearAuthCache,
+  getAuthCacheStats
+}
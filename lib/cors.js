@@ -12,7 +12,8 @@ import { NextResponse } from 'next/server'
 export function handleCORS(response) {
   response.headers.set('Access-Control-Allow-Origin', process.env.CORS_ORIGINS || '*')
   response.headers.set('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS, PATCH')
-  response.headers.set('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+  response.headers.set('Access-Control-Allow-Headers', 'Content-Type, Authorization, If-None-Match')
+  response.headers.set('Access-Control-Expose-Headers', 'ETag')
   response.headers.set('Access-Control-Allow-Credentials', 'true')
   return response
 }
@@ -3,23 +3,84 @@
  * Centralized MongoDB connection management
  */
 import { MongoClient } from 'mongodb'
+import { ensureIndexes, verifyQueryPlans } from './indexes'
+import { logError } from './logger'
+import { attachPoolMetrics, resetPoolStats } from './poolMetrics'
+import { attachCommandTracing } from './dbTrace'
+import { attachSlowOpCapture, ensureSlowOpsCollection } from './slowOps'
 
 let client = null
 let db = null
+let connecting = null
+let transactionsSupported = true
 
 /**
- * Connect to MongoDB and return database instance
- * Uses connection pooling for efficiency
+ * Pool and timeout options, from the environment
+ * @returns {object} MongoClient options
+ */
+export function getPoolOptions() {
+  return {
+    maxPoolSize: parseInt(process.env.MONGO_MAX_POOL_SIZE) || 50,
+    minPoolSize: parseInt(process.env.MONGO_MIN_POOL_SIZE) || 5,
+    maxIdleTimeMS: parseInt(process.env.MONGO_MAX_IDLE_TIME_MS) || 60000,
+    waitQueueTimeoutMS: parseInt(process.env.MONGO_WAIT_QUEUE_TIMEOUT_MS) || 10000,
+    serverSelectionTimeoutMS: parseInt(process.env.MONGO_SERVER_SELECTION_TIMEOUT_MS) || 5000,
+    connectTimeoutMS: parseInt(process.env.MONGO_CONNECT_TIMEOUT_MS) || 10000,
+  }
+}
+
+/**
+ * Open the client, apply the index registry and start the plan check
+ * Command monitoring feeds the per-request DB trace (dbTrace.js) and the
+ * slow-op capture (slowOps.js) unless MONGO_TRACE_COMMANDS=false /
+ * MONGO_SLOW_OPS=false.
+ * @returns {Db} MongoDB database instance
  */
-export async function connectToMongo() {
-  if (!client) {
-    client = new MongoClient(process.env.MONGO_URL)
-    await client.connect()
-    db = client.db(process.env.DB_NAME)
+async function openConnection() {
+  const traceCommands = process.env.MONGO_TRACE_COMMANDS !== 'false'
+  const captureSlowOps = process.env.MONGO_SLOW_OPS !== 'false'
+  const newClient = new MongoClient(process.env.MONGO_URL, {
+    ...getPoolOptions(),
+    monitorCommands: traceCommands || captureSlowOps,
+  })
+  resetPoolStats()
+  attachPoolMetrics(newClient)
+  if (traceCommands) attachCommandTracing(newClient)
+  if (captureSlowOps) attachSlowOpCapture(newClient, newClient.db(process.env.DB_NAME))
+  try {
+    await newClient.connect()
+  } catch (error) {
+    await newClient.close().catch(() => {})
+    throw error
+  }
+  client = newClient
+  db = client.db(process.env.DB_NAME)
+  await ensureIndexes(db)
+  if (captureSlowOps) await ensureSlowOpsCollection(db)
+  if (process.env.MONGO_VERIFY_QUERY_PLANS !== 'false') {
+    verifyQueryPlans(db).catch(error => logError(error, { context: 'verifyQueryPlans' }))
   }
   return db
 }
 
+/**
+ * Connect to MongoDB and return database instance
+ * The connection promise, not the client, is cached: concurrent cold
+ * requests all await the same connect and share one pool. A failed
+ * connect is forgotten so the next request retries. On first connect the
+ * index registry is applied and, unless MONGO_VERIFY_QUERY_PLANS=false,
+ * the canonical route queries are explained in the background.
+ */
+export function connectToMongo() {
+  if (!connecting) {
+    connecting = openConnection().catch(error => {
+      connecting = null
+      throw error
+    })
+  }
+  return connecting
+}
+
 /**
  * Get the current database instance
  * @returns {Db} MongoDB database instance
@@ -28,10 +89,50 @@ export function getDb() {
   return db
 }
 
+/**
+ * Whether an error means the server cannot run transactions (standalone mongod)
+ * @param {Error} error - Error thrown by the driver
+ * @returns {boolean}
+ */
+function isTransactionUnsupported(error) {
+  return error?.code === 20 || /replica set member or mongos/.test(error?.message || '')
+}
+
+/**
+ * Run work inside a multi-document transaction
+ * Pass the session to every operation inside work. On a standalone server,
+ * which cannot run transactions, work runs once without a session and the
+ * fallback is remembered for later calls.
+ * @param {function} work - async (session) => result
+ * @returns {*} Result of work
+ */
+export async function withTransaction(work) {
+  if (!client || !transactionsSupported) return work(undefined)
+
+  const session = client.startSession()
+  try {
+    let result
+    await session.withTransaction(async () => {
+      result = await work(session)
+    })
+    return result
+  } catch (error) {
+    if (!isTransactionUnsupported(error)) throw error
+    transactionsSupported = false
+    return work(undefined)
+  } finally {
+    await session.endSession()
+  }
+}
+
 /**
  * Close the MongoDB connection
  */
 export async function closeConnection() {
+  if (connecting) {
+    await connecting.catch(() => {})
+    connecting = null
+  }
   if (client) {
     await client.close()
     client = null
@@ -39,4 +140,4 @@ export async function closeConnection() {
   }
 }
 
-export default { connectToMongo, getDb, closeConnection }
+export default { connectToMongo, getDb, getPoolOptions, withTransaction, closeConnection }
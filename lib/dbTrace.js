@@ -0,0 +1,196 @@
+/**
+ * DB Trace Module
+ * Request-scoped tracing of MongoDB commands
+ *
+ * Each API request runs inside an AsyncLocalStorage context holding a
+ * DbTrace. The driver's command monitoring events (monitorCommands) are
+ * attributed to the trace that was active when the command started, so
+ * every request knows how many round trips it made, per collection, how
+ * long they took and how many documents came back. The totals go out in
+ * the Server-Timing header (visible in the browser devtools) and in the
+ * request log; routes above DB_TRACE_WARN_COMMANDS commands log a warning.
+ */
+import { AsyncLocalStorage } from 'async_hooks'
+import logger from './logger'
+
+const traceStorage = new AsyncLocalStorage()
+
+// Driver requestId -> { trace, collection } for commands still in flight
+const inFlight = new Map()
+
+// Collections listed individually in Server-Timing (slowest first)
+const MAX_TIMING_ENTRIES = 10
+// Warn when one request runs more commands than this (0 = off)
+const WARN_COMMANDS = parseInt(process.env.DB_TRACE_WARN_COMMANDS) || 0
+
+/**
+ * Command counters of one request
+ */
+export class DbTrace {
+  constructor() {
+    this.commands = 0
+    this.durationMs = 0
+    this.docs = 0
+    this.collections = {}
+  }
+
+  /**
+   * Run work with this trace as the active one
+   * @param {function} work - async () => result
+   * @returns {*} Result of work
+   */
+  run(work) {
+    return traceStorage.run(this, work)
+  }
+
+  /**
+   * Record a finished command
+   * @param {string} collection - Collection (or command name when there is none)
+   * @param {number} durationMs - Round trip time
+   * @param {number} docs - Documents returned
+   */
+  record(collection, durationMs, docs) {
+    const entry = this.collections[collection] || { commands: 0, duration_ms: 0, docs: 0 }
+    entry.commands++
+    entry.duration_ms += durationMs
+    entry.docs += docs
+    this.collections[collection] = entry
+    this.commands++
+    this.durationMs += durationMs
+    this.docs += docs
+  }
+
+  /**
+   * Totals for the request log
+   * @returns {object} { commands, duration_ms, docs, collections }
+   */
+  summary() {
+    const collections = {}
+    Object.entries(this.collections).forEach(([name, entry]) => {
+      collections[name] = { ...entry, duration_ms: Math.round(entry.duration_ms * 100) / 100 }
+    })
+    return {
+      commands: this.commands,
+      duration_ms: Math.round(this.durationMs * 100) / 100,
+      docs: this.docs,
+      collections,
+    }
+  }
+
+  /**
+   * Server-Timing header value
+   * @param {number} totalMs - Whole request duration
+   * @returns {string} e.g. total;dur=41, db;dur=12.5;desc="7 cmd, 120 docs", db.apo_items;dur=8.1;desc="3 cmd"
+   */
+  serverTiming(totalMs) {
+    const entries = [
+      `total;dur=${totalMs}`,
+      `db;dur=${this.durationMs.toFixed(1)};desc="${this.commands} cmd, ${this.docs} docs"`,
+    ]
+    Object.entries(this.collections)
+      .sort((a, b) => b[1].duration_ms - a[1].duration_ms)
+      .slice(0, MAX_TIMING_ENTRIES)
+      .forEach(([name, entry]) => {
+        entries.push(`db.${name.replace(/[^\w.-]/g, '_')};dur=${entry.duration_ms.toFixed(1)};desc="${entry.commands} cmd"`)
+      })
+    return entries.join(', ')
+  }
+}
+
+/**
+ * Get the trace of the current request
+ * @returns {DbTrace|undefined} undefined outside a request (startup, background jobs)
+ */
+export function getCurrentTrace() {
+  return traceStorage.getStore()
+}
+
+/**
+ * Run work outside any request trace
+ * For bookkeeping writes made from event handlers (e.g. slow-op capture),
+ * which must not count against the request that triggered them.
+ * @param {function} work - () => result
+ * @returns {*} Result of work
+ */
+export function runUntraced(work) {
+  return traceStorage.exit(work)
+}
+
+/**
+ * Collection a command targets
+ * @param {object} event - commandStarted event
+ * @returns {string} Collection name, or the command name (e.g. commitTransaction)
+ */
+export function commandTarget(event) {
+  const { command, commandName } = event
+  if (commandName === 'getMore' && typeof command.collection === 'string') return command.collection
+  const target = command ? command[commandName] : undefined
+  return typeof target === 'string' ? target : commandName
+}
+
+/**
+ * Documents in a command reply
+ * @param {object} reply - commandSucceeded reply
+ * @returns {number}
+ */
+export function countReplyDocs(reply) {
+  if (!reply) return 0
+  if (reply.cursor) {
+    const batch = reply.cursor.firstBatch || reply.cursor.nextBatch
+    return Array.isArray(batch) ? batch.length : 0
+  }
+  // findAndModify
+  if (reply.value !== undefined) return reply.value ? 1 : 0
+  return 0
+}
+
+/**
+ * Subscribe to the command monitoring events of a client
+ * The client must be created with monitorCommands: true.
+ * @param {MongoClient} client - Client, before connect()
+ */
+export function attachCommandTracing(client) {
+  client.on('commandStarted', (event) => {
+    const trace = traceStorage.getStore()
+    if (trace) inFlight.set(event.requestId, { trace, collection: commandTarget(event) })
+  })
+  client.on('commandSucceeded', (event) => {
+    const started = inFlight.get(event.requestId)
+    if (!started) return
+    inFlight.delete(event.requestId)
+    started.trace.record(started.collection, event.duration, countReplyDocs(event.reply))
+  })
+  client.on('commandFailed', (event) => {
+    const started = inFlight.get(event.requestId)
+    if (!started) return
+    inFlight.delete(event.requestId)
+    started.trace.record(started.collection, event.duration, 0)
+  })
+}
+
+/**
+ * Log a warning when a request ran more commands than DB_TRACE_WARN_COMMANDS
+ * @param {DbTrace} trace - Finished request trace
+ * @param {object} context - { requestId, method, route } of the request
+ * @param {number} limit - Command threshold (0 = off)
+ * @returns {boolean} Whether the warning was logged
+ */
+export function warnOnCommandCount(trace, context, limit = WARN_COMMANDS) {
+  if (!limit || trace.commands <= limit) return false
+  logger.warn(`DB command count over ${limit}: ${context.method} ${context.route}`, {
+    ...context,
+    commands: trace.commands,
+    collections: Object.fromEntries(Object.entries(trace.collections).map(([name, entry]) => [name, entry.commands])),
+  })
+  return true
+}
+
+export default {
+  DbTrace,
+  getCurrentTrace,
+  runUntraced,
+  commandTarget,
+  countReplyDocs,
+  attachCommandTracing,
+  warnOnCommandCount
+}
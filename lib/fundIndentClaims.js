@@ -0,0 +1,65 @@
+/**
+ * Fund Indent Claims Module
+ * Claiming apo_items for a new fund indent
+ *
+ * An item can sit on one fund indent only. The claim is one unordered
+ * bulkWrite whose filters only match items without a fund_indent_id, so
+ * two RFOs selecting the same items never both get them. The total is then
+ * summed from what this indent actually claimed, and the claim, total and
+ * indent insert commit together.
+ */
+import { withTransaction } from './db'
+
+/**
+ * Claim the requested items and insert the indent with what was claimed
+ * @param {Db} db - MongoDB database instance
+ * @param {object} fundIndent - Indent to insert; id must be unique, total_amount and item_ids are filled in
+ * @param {Array} items - Requested items ({ id, period_from, period_to, cm_*, fnb_* })
+ * @returns {object} { indent, already_claimed } - indent is null when no item could be claimed
+ */
+export async function claimFundIndentItems(db, fundIndent, items) {
+  const itemIds = items.map(item => item.id)
+  const indent = await withTransaction(async (session) => {
+    await db.collection('apo_items').bulkWrite(items.map(item => ({
+      updateOne: {
+        filter: { id: item.id, fund_indent_id: { $exists: false } },
+        update: {
+          $set: {
+            fund_indent_id: fundIndent.id,
+            fund_indent_status: fundIndent.status,
+            period_from: item.period_from,
+            period_to: item.period_to,
+            cm_date: item.cm_date,
+            cm_by: item.cm_by,
+            fnb_book_no: item.fnb_book_no,
+            fnb_page_no: item.fnb_page_no,
+            fnb_pdf_url: item.fnb_pdf_url,
+          }
+        },
+      }
+    })), { ordered: false, session })
+
+    const [totals] = await db.collection('apo_items').aggregate([
+      { $match: { fund_indent_id: fundIndent.id } },
+      { $group: { _id: null, total_amount: { $sum: '$total_cost' }, item_ids: { $push: '$id' } } },
+    ], { session }).toArray()
+    if (!totals) return null
+
+    // Keep the requested order
+    const claimedIds = new Set(totals.item_ids)
+    const claimed = {
+      ...fundIndent,
+      item_ids: itemIds.filter(id => claimedIds.has(id)),
+      total_amount: totals.total_amount,
+    }
+    await db.collection('fund_indents').insertOne(claimed, { session })
+    return claimed
+  })
+
+  const claimedIds = new Set(indent ? indent.item_ids : [])
+  return { indent, already_claimed: itemIds.filter(id => !claimedIds.has(id)) }
+}
+
+export default {
+  claimFundIndentItems
+}
@@ -0,0 +1,72 @@
+/**
+ * HTTP Cache Module
+ * ETag validators and Cache-Control for read-mostly GET endpoints
+ *
+ * The ETag is a hash of the serialised body (or a caller-supplied content
+ * version), so a client that sends it back in If-None-Match gets
+ * 304 Not Modified with no body when nothing changed. Reference data is
+ * the same for every caller and marked public. Role-scoped lists are
+ * private and vary on Authorization. Both must revalidate once
+ * HTTP_CACHE_MAX_AGE_S (default 0) has passed, so an edit, e.g. a new
+ * norm, shows on the next load.
+ */
+import { createHash } from 'crypto'
+import { NextResponse } from 'next/server'
+
+const MAX_AGE_S = parseInt(process.env.HTTP_CACHE_MAX_AGE_S) || 0
+
+/**
+ * Short content hash of a JSON-serialisable value
+ * @param {*} value - Value, or an already serialised string
+ * @returns {string} 20 hex characters
+ */
+export function contentVersion(value) {
+  const text = typeof value === 'string' ? value : JSON.stringify(value)
+  return createHash('sha1').update(text).digest('hex').slice(0, 20)
+}
+
+/**
+ * Check If-None-Match against an ETag (weak comparison, lists and *)
+ * @param {Request} request - Incoming request
+ * @param {string} etag - Quoted ETag of the current representation
+ * @returns {boolean} True if the client's copy is current
+ */
+export function isNotModified(request, etag) {
+  const header = request.headers.get('if-none-match')
+  if (!header) return false
+  if (header.trim() === '*') return true
+  const strip = tag => tag.trim().replace(/^W\//, '')
+  return header.split(',').some(tag => strip(tag) === strip(etag))
+}
+
+/**
+ * Cache-Control header for a scope
+ * @param {string} scope - 'public' (same for every caller) or 'private' (per user)
+ * @returns {string} Header value
+ */
+export function cacheControl(scope) {
+  return `${scope}, max-age=${MAX_AGE_S}, must-revalidate`
+}
+
+/**
+ * JSON response with an ETag, answering a matching If-None-Match with 304
+ * @param {Request} request - Incoming request
+ * @param {*} data - Response body
+ * @param {object} options
+ * @param {string} options.scope - 'public' or 'private' (default 'public')
+ * @param {string} options.version - Content version to use instead of hashing the body
+ * @returns {NextResponse} 200 with body or 304 without
+ */
+export function cachedJson(request, data, { scope = 'public', version } = {}) {
+  const body = JSON.stringify(data)
+  const etag = `"${version || contentVersion(body)}"`
+  const headers = { ETag: etag, 'Cache-Control': cacheControl(scope) }
+  if (scope === 'private') headers.Vary = 'Authorization'
+
+  if (isNotModified(request, etag)) {
+    return new NextResponse(null, { status: 304, headers })
+  }
+  return new NextResponse(body, { status: 200, headers: { ...headers, 'Content-Type': 'application/json' } })
+}
+
+export default { contentVersion, isNotModified, cacheControl, cachedJson }
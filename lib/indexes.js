@@ -0,0 +1,182 @@
+/**
+ * Index Registry Module
+ * Declarative list of the indexes every collection needs, plus a query-plan check
+ *
+ * ensureIndexes() is idempotent: createIndex on an existing, identical spec
+ * is a no-op on the server, so it is safe to run on every cold start and
+ * again after /seed drops the collections.
+ */
+import logger, { logError } from './logger'
+
+/**
+ * Index definitions grouped by collection
+ * Keys mirror the filters and sorts used by the handlers in lib/routes
+ */
+export const INDEX_REGISTRY = {
+  sessions: [
+    { key: { token: 1 }, options: { unique: true } },
+    { key: { user_id: 1 } },
+  ],
+  users: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { email: 1 }, options: { unique: true } },
+    { key: { range_id: 1 } },
+  ],
+  divisions: [
+    { key: { id: 1 }, options: { unique: true } },
+  ],
+  ranges: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { division_id: 1 } },
+  ],
+  activity_master: [
+    { key: { id: 1 }, options: { unique: true } },
+  ],
+  norms_config: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { financial_year: 1, applicable_age: 1 } },
+  ],
+  plantations: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { range_id: 1, created_at: -1, id: -1 } },
+    { key: { created_at: -1, id: -1 } },
+  ],
+  buildings: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { range_id: 1, created_at: -1, id: -1 } },
+    { key: { created_at: -1, id: -1 } },
+  ],
+  building_activities: [
+    { key: { id: 1 }, options: { unique: true } },
+  ],
+  building_norms: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { building_phase: 1, financial_year: 1 } },
+  ],
+  nurseries: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { range_id: 1, created_at: -1, id: -1 } },
+    { key: { created_at: -1, id: -1 } },
+  ],
+  nursery_activities: [
+    { key: { id: 1 }, options: { unique: true } },
+  ],
+  nursery_norms: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { nursery_type: 1, financial_year: 1 } },
+  ],
+  apo_headers: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { created_at: -1, id: -1 } },
+    { key: { status: 1, created_at: -1, id: -1 } },
+    { key: { division_id: 1, created_at: -1, id: -1 } },
+    { key: { plantation_id: 1, created_at: -1 } },
+    { key: { created_by: 1 } },
+  ],
+  apo_items: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { apo_id: 1 } },
+    { key: { fund_indent_id: 1 } },
+  ],
+  work_logs: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { apo_item_id: 1 } },
+    { key: { logged_by: 1, created_at: -1, id: -1 } },
+    { key: { created_at: -1, id: -1 } },
+  ],
+  fund_indents: [
+    { key: { id: 1 }, options: { unique: true } },
+    { key: { status: 1, created_at: -1, id: -1 } },
+    { key: { created_by: 1, created_at: -1, id: -1 } },
+    { key: { created_at: -1, id: -1 } },
+  ],
+}
+
+/**
+ * Canonical query of each route, checked with explain() at startup
+ */
+export const CANONICAL_QUERIES = [
+  { route: 'auth (getUser)', collection: 'sessions', filter: { token: '?' } },
+  { route: 'auth (getUser)', collection: 'users', filter: { id: '?' } },
+  { route: 'POST /auth/login', collection: 'users', filter: { email: '?', password: '?' } },
+  { route: 'GET /ranges', collection: 'ranges', filter: { division_id: '?' } },
+  { route: 'GET /plantations', collection: 'plantations', filter: { range_id: '?' }, sort: { created_at: -1, id: -1 } },
+  { route: 'GET /plantations/:id', collection: 'plantations', filter: { id: '?' } },
+  { route: 'GET /plantations/:id/history', collection: 'apo_headers', filter: { plantation_id: '?' }, sort: { created_at: -1 } },
+  { route: 'GET /buildings', collection: 'buildings', filter: { range_id: '?' }, sort: { created_at: -1, id: -1 } },
+  { route: 'POST /buildings/generate-draft', collection: 'building_norms', filter: { building_phase: '?', financial_year: '?' } },
+  { route: 'GET /nurseries', collection: 'nurseries', filter: { range_id: '?' }, sort: { created_at: -1, id: -1 } },
+  { route: 'POST /nurseries/generate-draft', collection: 'nursery_norms', filter: { nursery_type: '?', financial_year: '?' } },
+  { route: 'POST /apo/generate-draft', collection: 'norms_config', filter: { applicable_age: 1, financial_year: '?' } },
+  { route: 'GET /apo', collection: 'apo_headers', filter: { division_id: '?' }, sort: { created_at: -1, id: -1 } },
+  { route: 'GET /apo (ED/MD)', collection: 'apo_headers', filter: { status: { $in: ['?'] } }, sort: { created_at: -1, id: -1 } },
+  { route: 'GET /apo/:id', collection: 'apo_items', filter: { apo_id: '?' } },
+  { route: 'GET /fund-indent/works', collection: 'apo_headers', filter: { plantation_id: { $in: ['?'] }, status: 'SANCTIONED', financial_year: '?' } },
+  { route: 'GET /fund-indent/pending', collection: 'fund_indents', filter: { status: '?' }, sort: { created_at: -1, id: -1 } },
+  { route: 'GET /fund-indent/pending (RFO)', collection: 'fund_indents', filter: { created_by: '?' }, sort: { created_at: -1, id: -1 } },
+  { route: 'GET /fund-indent/pending, /fund-indent/:id (items)', collection: 'apo_items', filter: { fund_indent_id: { $in: ['?'] } } },
+  { route: 'POST /work-logs', collection: 'work_logs', filter: { apo_item_id: '?' } },
+  { route: 'GET /work-logs', collection: 'work_logs', filter: { logged_by: '?' }, sort: { created_at: -1, id: -1 } },
+]
+
+/**
+ * Create every registered index (idempotent)
+ * Failures are logged per index so one conflicting spec does not block the rest.
+ * @param {Db} db - MongoDB database instance
+ * @returns {object} { created, failed } counts
+ */
+export async function ensureIndexes(db) {
+  let created = 0
+  let failed = 0
+  await Promise.all(Object.entries(INDEX_REGISTRY).flatMap(([collection, specs]) =>
+    specs.map(async ({ key, options = {} }) => {
+      try {
+        await db.collection(collection).createIndex(key, options)
+        created++
+      } catch (error) {
+        failed++
+        logError(error, { context: 'ensureIndexes', collection, key })
+      }
+    })
+  ))
+  logger.info('Index registry applied', { created, failed })
+  return { created, failed }
+}
+
+/**
+ * Find the first COLLSCAN stage in an explain plan
+ * @param {object} plan - Plan node from explain() output
+ * @returns {boolean} True if the plan scans the whole collection
+ */
+export function planHasCollScan(plan) {
+  if (!plan || typeof plan !== 'object') return false
+  if (plan.stage === 'COLLSCAN') return true
+  return Object.values(plan).some(value =>
+    Array.isArray(value) ? value.some(planHasCollScan) : planHasCollScan(value)
+  )
+}
+
+/**
+ * Explain each canonical query and warn about any collection scans
+ * @param {Db} db - MongoDB database instance
+ * @returns {array} Canonical queries that resolved to a COLLSCAN
+ */
+export async function verifyQueryPlans(db) {
+  const collScans = []
+  for (const query of CANONICAL_QUERIES) {
+    try {
+      let cursor = db.collection(query.collection).find(query.filter)
+      if (query.sort) cursor = cursor.sort(query.sort)
+      const explain = await cursor.explain('queryPlanner')
+      if (planHasCollScan(explain?.queryPlanner?.winningPlan)) {
+        collScans.push(query)
+        logger.warn(`COLLSCAN for ${query.route}`, { collection: query.collection, filter: Object.keys(query.filter) })
+      }
+    } catch (error) {
+      logError(error, { context: 'verifyQueryPlans', route: query.route })
+    }
+  }
+  return collScans
+}
+
+export default { INDEX_REGISTRY, CANONICAL_QUERIES, ensureIndexes, planHasCollScan, verifyQueryPlans }
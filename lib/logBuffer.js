@@ -0,0 +1,103 @@
+/**
+ * Log Buffer Module
+ * Buffered, non-blocking newline-delimited log writer
+ *
+ * Lines are collected in memory and written as one chunk when the buffer
+ * reaches maxBytes or flushMs after the first buffered line, whichever
+ * comes first. When the destination stream is not draining, lines are
+ * dropped (and counted) instead of growing the process memory; the next
+ * chunk reports how many were lost. Whatever is still buffered at exit is
+ * written synchronously.
+ */
+import { writeSync } from 'fs'
+import { Writable } from 'stream'
+
+export class BufferedLineWriter {
+  /**
+   * @param {object} options
+   * @param {Writable} options.stream - Destination (default process.stdout)
+   * @param {number} options.maxBytes - Flush when this many bytes are buffered
+   * @param {number} options.flushMs - Flush this long after the first buffered line
+   * @param {number} options.maxPendingBytes - Drop lines while the stream holds more than this unwritten
+   */
+  constructor({ stream = process.stdout, maxBytes = 65536, flushMs = 1000, maxPendingBytes = 1048576 } = {}) {
+    this.stream = stream
+    this.maxBytes = maxBytes
+    this.flushMs = flushMs
+    this.maxPendingBytes = maxPendingBytes
+    this.lines = []
+    this.bytes = 0
+    this.dropped = 0
+    this.timer = null
+  }
+
+  /**
+   * Buffer one line (without the trailing newline)
+   * @param {string} line - Serialized log line
+   */
+  write(line) {
+    if ((this.stream.writableLength || 0) > this.maxPendingBytes) {
+      this.dropped++
+      return
+    }
+    this.lines.push(line)
+    this.bytes += line.length + 1
+    if (this.bytes >= this.maxBytes) {
+      this.flush()
+    } else if (!this.timer) {
+      this.timer = setTimeout(() => this.flush(), this.flushMs)
+      if (this.timer.unref) this.timer.unref()
+    }
+  }
+
+  /**
+   * Take the buffered lines as one chunk and reset the buffer
+   * @returns {string|null} Chunk, or null when there is nothing to write
+   */
+  drain() {
+    if (this.timer) {
+      clearTimeout(this.timer)
+      this.timer = null
+    }
+    if (this.dropped > 0) {
+      this.lines.push(JSON.stringify({ time: new Date().toISOString(), level: 'warn', msg: 'log lines dropped', dropped: this.dropped }))
+      this.dropped = 0
+    }
+    if (this.lines.length === 0) return null
+    const chunk = this.lines.join('\n') + '\n'
+    this.lines = []
+    this.bytes = 0
+    return chunk
+  }
+
+  /**
+   * Hand the buffered lines to the stream (asynchronous for pipes)
+   */
+  flush() {
+    const chunk = this.drain()
+    if (chunk) this.stream.write(chunk)
+  }
+
+  /**
+   * Write the buffered lines synchronously (process exit)
+   */
+  flushSync() {
+    const chunk = this.drain()
+    if (chunk) writeSync(this.stream.fd === undefined ? 1 : this.stream.fd, chunk)
+  }
+
+  /**
+   * Writable adapter, e.g. for a winston Stream transport
+   * @returns {Writable}
+   */
+  asStream() {
+    return new Writable({
+      write: (chunk, encoding, callback) => {
+        this.write(chunk.toString().replace(/\n$/, ''))
+        callback()
+      }
+    })
+  }
+}
+
+export default BufferedLineWriter
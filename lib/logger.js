@@ -1,10 +1,29 @@
 /**
  * Application Logger Module
  * Centralized logging using Winston
+ *
+ * LOG_FORMAT=json switches to newline-delimited JSON on stdout through a
+ * buffered writer (see logBuffer.js) instead of colourised console text.
+ * Completed requests are logged once, with request id and duration;
+ * successful fast requests are sampled at LOG_SAMPLE_RATE, while 4xx/5xx
+ * responses and requests slower than LOG_SLOW_MS are always kept.
  */
 import winston from 'winston'
+import { BufferedLineWriter } from './logBuffer'
 
-const { combine, timestamp, printf, colorize, errors } = winston.format
+const { combine, timestamp, printf, colorize, errors, json } = winston.format
+
+const JSON_MODE = process.env.LOG_FORMAT === 'json'
+const SAMPLE_RATE = parseSampleRate(process.env.LOG_SAMPLE_RATE)
+const SLOW_MS = parseInt(process.env.LOG_SLOW_MS) || 1000
+
+const lineWriter = JSON_MODE
+  ? new BufferedLineWriter({
+      maxBytes: parseInt(process.env.LOG_BUFFER_BYTES) || 65536,
+      flushMs: parseInt(process.env.LOG_FLUSH_MS) || 1000,
+    })
+  : null
+if (lineWriter) process.on('exit', () => lineWriter.flushSync())
 
 // Custom log format
 const logFormat = printf(({ level, message, timestamp, stack, ...meta }) => {
@@ -19,25 +38,32 @@ const logFormat = printf(({ level, message, timestamp, stack, ...meta }) => {
 })
 
 // Create logger instance
-const logger = winston.createLogger({
-  level: process.env.LOG_LEVEL || 'info',
-  format: combine(
-    timestamp({ format: 'YYYY-MM-DD HH:mm:ss' }),
-    errors({ stack: true }),
-    logFormat
-  ),
-  transports: [
-    // Console transport
-    new winston.transports.Console({
+const logger = JSON_MODE
+  ? winston.createLogger({
+      level: process.env.LOG_LEVEL || 'info',
+      format: combine(timestamp(), errors({ stack: true }), json()),
+      transports: [new winston.transports.Stream({ stream: lineWriter.asStream() })],
+      exitOnError: false
+    })
+  : winston.createLogger({
+      level: process.env.LOG_LEVEL || 'info',
       format: combine(
-        colorize(),
+        timestamp({ format: 'YYYY-MM-DD HH:mm:ss' }),
+        errors({ stack: true }),
         logFormat
-      )
+      ),
+      transports: [
+        // Console transport
+        new winston.transports.Console({
+          format: combine(
+            colorize(),
+            logFormat
+          )
+        })
+      ],
+      // Don't exit on error
+      exitOnError: false
     })
-  ],
-  // Don't exit on error
-  exitOnError: false
-})
 
 // Add file transport in production
 if (process.env.NODE_ENV === 'production') {
@@ -61,6 +87,8 @@ if (process.env.NODE_ENV === 'production') {
  * @param {string} userId - User ID (if authenticated)
  */
 export function logRequest(method, path, userId = null) {
+  // JSON mode logs each request once, on completion
+  if (JSON_MODE) return
   logger.info(`API Request: ${method} ${path}`, { userId })
 }
 
@@ -76,6 +104,68 @@ export function logResponse(method, path, statusCode, duration) {
   logger[level](`API Response: ${method} ${path} - ${statusCode}`, { duration: `${duration}ms` })
 }
 
+/**
+ * Parse LOG_SAMPLE_RATE
+ * Unset, empty or non-numeric values keep every request, so a typo cannot silence success logs.
+ * @param {string} value - Raw env value
+ * @returns {number} Sample rate clamped to 0-1
+ */
+export function parseSampleRate(value) {
+  const rate = parseFloat(value)
+  if (!Number.isFinite(rate)) return 1
+  return Math.min(Math.max(rate, 0), 1)
+}
+
+/**
+ * Whether a completed request should be logged
+ * @param {number} statusCode - Response status code
+ * @param {number} duration - Request duration in ms
+ * @param {number} sampleRate - Share of other requests to keep (0-1)
+ * @returns {boolean}
+ */
+export function shouldLogRequest(statusCode, duration, sampleRate = SAMPLE_RATE) {
+  if (statusCode >= 400 || duration >= SLOW_MS) return true
+  return sampleRate >= 1 || Math.random() < sampleRate
+}
+
+/**
+ * Log a completed request (sampled)
+ * @param {object} entry
+ * @param {string} entry.requestId - Request id (X-Request-Id)
+ * @param {string} entry.method - HTTP method
+ * @param {string} entry.path - Request path
+ * @param {number} entry.statusCode - Response status code
+ * @param {number} entry.duration - Request duration in ms
+ * @param {object} entry.db - DB trace summary (commands, duration_ms, docs, collections)
+ */
+export function logRequestComplete({ requestId, method, path, statusCode, duration, db }) {
+  if (!shouldLogRequest(statusCode, duration)) return
+  const level = statusCode >= 500 ? 'error' : statusCode >= 400 ? 'warn' : 'info'
+  if (!JSON_MODE) {
+    logger[level](`API Response: ${method} ${path} - ${statusCode}`, {
+      requestId,
+      duration: `${duration}ms`,
+      dbCommands: db ? db.commands : undefined,
+      dbDuration: db ? `${db.duration_ms}ms` : undefined,
+    })
+    return
+  }
+  // Written directly: one JSON.stringify per kept request, no winston pipeline
+  lineWriter.write(JSON.stringify({
+    time: new Date().toISOString(),
+    level,
+    msg: 'request',
+    request_id: requestId,
+    method,
+    path,
+    status: statusCode,
+    duration_ms: duration,
+    db,
+    slow: duration >= SLOW_MS || undefined,
+    sample_rate: statusCode < 400 && duration < SLOW_MS ? SAMPLE_RATE : undefined,
+  }))
+}
+
 /**
  * Log error with context
  * @param {Error} error - Error object
@@ -92,6 +182,8 @@ export function logError(error, context = {}) {
  * @param {object} details - Additional details
  */
 export function logDbOperation(operation, collection, details = {}) {
+  // Skip building the entry at all unless debug logging is on
+  if (!logger.isDebugEnabled()) return
   logger.debug(`DB ${operation}: ${collection}`, details)
 }
 
@@ -0,0 +1,126 @@
+/**
+ * LRU Cache Module
+ * Bounded least-recently-used cache with per-entry TTL and hit/miss counters
+ */
+
+export class LRUCache {
+  /**
+   * @param {object} options
+   * @param {number} options.max - Maximum number of entries kept
+   * @param {number} options.ttlMs - Default entry lifetime in ms (0 = no expiry)
+   */
+  constructor({ max = 1000, ttlMs = 0 } = {}) {
+    this.max = max
+    this.ttlMs = ttlMs
+    this.map = new Map()
+    this.hits = 0
+    this.misses = 0
+    this.evictions = 0
+  }
+
+  /**
+   * Get a value, refreshing its recency
+   * @param {string} key - Cache key
+   * @returns {*} Cached value or undefined on miss/expiry
+   */
+  get(key) {
+    const entry = this.map.get(key)
+    if (!entry) {
+      this.misses++
+      return undefined
+    }
+    if (entry.expiresAt && entry.expiresAt <= Date.now()) {
+      this.map.delete(key)
+      this.misses++
+      return undefined
+    }
+    // Re-insert so Map iteration order reflects recency
+    this.map.delete(key)
+    this.map.set(key, entry)
+    this.hits++
+    return entry.value
+  }
+
+  /**
+   * Store a value, evicting the least recently used entry when full
+   * @param {string} key - Cache key
+   * @param {*} value - Value to store
+   * @param {number} ttlMs - Entry lifetime in ms (defaults to cache TTL)
+   */
+  set(key, value, ttlMs = this.ttlMs) {
+    if (this.map.has(key)) this.map.delete(key)
+    this.map.set(key, { value, expiresAt: ttlMs > 0 ? Date.now() + ttlMs : 0 })
+    while (this.map.size > this.max) {
+      const oldest = this.map.keys().next().value
+      this.map.delete(oldest)
+      this.evictions++
+    }
+    return this
+  }
+
+  /**
+   * Check for a live entry without touching counters or recency
+   * @param {string} key - Cache key
+   * @returns {boolean} True if present and not expired
+   */
+  has(key) {
+    const entry = this.map.get(key)
+    return !!entry && (!entry.expiresAt || entry.expiresAt > Date.now())
+  }
+
+  /**
+   * Get a live value without touching counters or recency
+   * @param {string} key - Cache key
+   * @returns {*} Cached value or undefined if absent/expired
+   */
+  peek(key) {
+    return this.has(key) ? this.map.get(key).value : undefined
+  }
+
+  delete(key) {
+    return this.map.delete(key)
+  }
+
+  /**
+   * Delete every entry whose value matches the predicate
+   * @param {function} predicate - Called with (value, key)
+   * @returns {number} Number of entries removed
+   */
+  deleteWhere(predicate) {
+    let removed = 0
+    for (const [key, entry] of this.map) {
+      if (predicate(entry.value, key)) {
+        this.map.delete(key)
+        removed++
+      }
+    }
+    return removed
+  }
+
+  clear() {
+    this.map.clear()
+  }
+
+  get size() {
+    return this.map.size
+  }
+
+  /**
+   * Snapshot of cache counters
+   * @returns {object} Size, capacity, hits, misses, evictions and hit rate
+   */
+  stats() {
+    const lookups = this.hits + this.misses
+    return {
+      size: this.map.size,
+      max: this.max,
+      ttl_ms: this.ttlMs,
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      hit_rate: lookups > 0 ? Math.round((this.hits / lookups) * 1000) / 1000 : 0,
+    }
+  }
+}
+
+export default LRUCache
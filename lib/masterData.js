@@ -0,0 +1,178 @@
+/**
+ * Master Data Cache Module
+ * Versioned in-process cache of the reference collections
+ *
+ * Master collections only change through POST /norms and /seed, yet most
+ * handlers re-read them in full. Each collection is loaded once into a
+ * list plus an id→document map. Writers call invalidateMasterData(), which
+ * bumps the collection's version; entries built for an older version are
+ * dropped on the next read, and a load that races with a bump is served
+ * but not cached. MASTER_CACHE_TTL_MS (default 5 min) bounds staleness for
+ * writes made by other server processes or directly in the database.
+ *
+ * Cached documents are frozen and shared between requests - copy before
+ * modifying.
+ */
+
+export const MASTER_COLLECTIONS = [
+  'activity_master',
+  'norms_config',
+  'building_activities',
+  'building_norms',
+  'nursery_activities',
+  'nursery_norms',
+  'divisions',
+  'ranges',
+]
+
+const TTL_MS = parseInt(process.env.MASTER_CACHE_TTL_MS) || 5 * 60 * 1000
+
+const versions = new Map(MASTER_COLLECTIONS.map(name => [name, 0]))
+const entries = new Map()
+const loading = new Map()
+const counters = new Map(MASTER_COLLECTIONS.map(name => [name, { hits: 0, misses: 0, loads: 0, invalidations: 0 }]))
+
+function assertMasterCollection(collection) {
+  if (!versions.has(collection)) {
+    throw new Error(`${collection} is not a cached master collection`)
+  }
+}
+
+async function loadEntry(db, collection, version) {
+  const docs = await db.collection(collection).find({}).toArray()
+  const list = Object.freeze(docs.map(({ _id, ...doc }) => Object.freeze(doc)))
+  const byId = {}
+  list.forEach(doc => { byId[doc.id] = doc })
+  counters.get(collection).loads++
+  return { version, list, byId: Object.freeze(byId), loadedAt: Date.now() }
+}
+
+/**
+ * Get the cached entry for a master collection, loading it on a miss
+ * Concurrent misses share a single query.
+ * @param {Db} db - MongoDB database instance
+ * @param {string} collection - One of MASTER_COLLECTIONS
+ * @returns {object} { version, list, byId, loadedAt }
+ */
+export async function getMasterData(db, collection) {
+  assertMasterCollection(collection)
+  const version = versions.get(collection)
+  const stats = counters.get(collection)
+
+  const entry = entries.get(collection)
+  if (entry && entry.version === version && Date.now() - entry.loadedAt < TTL_MS) {
+    stats.hits++
+    return entry
+  }
+  // Stale version or expired - drop it so it can be garbage collected
+  if (entry) entries.delete(collection)
+  stats.misses++
+
+  const key = `${collection}@${version}`
+  if (!loading.has(key)) {
+    loading.set(key, loadEntry(db, collection, version)
+      .then(loaded => {
+        if (versions.get(collection) === version) entries.set(collection, loaded)
+        return loaded
+      })
+      .finally(() => loading.delete(key)))
+  }
+  return loading.get(key)
+}
+
+/**
+ * Get every document of a master collection
+ * @param {Db} db - MongoDB database instance
+ * @param {string} collection - One of MASTER_COLLECTIONS
+ * @returns {array} Frozen documents (without _id), in natural order
+ */
+export async function getMasterList(db, collection) {
+  return (await getMasterData(db, collection)).list
+}
+
+/**
+ * Get a master collection keyed by id
+ * @param {Db} db - MongoDB database instance
+ * @param {string} collection - One of MASTER_COLLECTIONS
+ * @returns {object} Map of id → frozen document
+ */
+export async function getMasterMap(db, collection) {
+  return (await getMasterData(db, collection)).byId
+}
+
+/**
+ * Get one master document by id
+ * @param {Db} db - MongoDB database instance
+ * @param {string} collection - One of MASTER_COLLECTIONS
+ * @param {string} id - Document id
+ * @returns {object|null} Frozen document or null if not found
+ */
+export async function getMasterDoc(db, collection, id) {
+  if (!id) return null
+  return (await getMasterMap(db, collection))[id] || null
+}
+
+/**
+ * Bump the version of one or more master collections after a write
+ * @param {...string} collections - Collections written (none = all)
+ */
+export function invalidateMasterData(...collections) {
+  const targets = collections.length > 0 ? collections : MASTER_COLLECTIONS
+  targets.forEach(collection => {
+    assertMasterCollection(collection)
+    versions.set(collection, versions.get(collection) + 1)
+    entries.delete(collection)
+    counters.get(collection).invalidations++
+  })
+}
+
+/**
+ * Get the current version of a master collection
+ * @param {string} collection - One of MASTER_COLLECTIONS
+ * @returns {number} Version, incremented on every invalidation
+ */
+export function getMasterVersion(collection) {
+  assertMasterCollection(collection)
+  return versions.get(collection)
+}
+
+/**
+ * Get master data cache counters
+ * @returns {object} Totals plus per-collection version, size, age and counters
+ */
+export function getMasterDataStats() {
+  let hits = 0
+  let misses = 0
+  const collections = {}
+  MASTER_COLLECTIONS.forEach(name => {
+    const entry = entries.get(name)
+    const stats = counters.get(name)
+    hits += stats.hits
+    misses += stats.misses
+    collections[name] = {
+      version: versions.get(name),
+      cached: Boolean(entry),
+      size: entry ? entry.list.length : 0,
+      age_ms: entry ? Date.now() - entry.loadedAt : null,
+      ...stats,
+    }
+  })
+  return {
+    ttl_ms: TTL_MS,
+    hits,
+    misses,
+    hit_rate: hits + misses > 0 ? hits / (hits + misses) : 0,
+    collections,
+  }
+}
+
+export default {
+  MASTER_COLLECTIONS,
+  getMasterData,
+  getMasterList,
+  getMasterMap,
+  getMasterDoc,
+  invalidateMasterData,
+  getMasterVersion,
+  getMasterDataStats
+}
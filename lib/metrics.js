@@ -0,0 +1,212 @@
+/**
+ * Metrics Module
+ * In-process request metrics rendered in the Prometheus text format
+ *
+ * Requests are labelled by method, the router pattern they matched
+ * (e.g. /apo/:id/approve, or "unmatched") and status code, so the label
+ * set stays bounded however many ids the clients use. Each server
+ * process keeps its own series; Prometheus aggregates across instances.
+ */
+import { getPoolStats } from './poolMetrics'
+
+// Seconds: 5ms .. 10s
+export const DURATION_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+// Bytes: 256B .. 4MB
+export const SIZE_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304]
+
+/**
+ * Serialize a label set
+ * @param {object} labels - Label name/value pairs
+ * @returns {string} {a="1",b="2"} or '' for no labels
+ */
+function formatLabels(labels) {
+  const parts = Object.entries(labels).map(([name, value]) =>
+    `${name}="${String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n')}"`)
+  return parts.length > 0 ? `{${parts.join(',')}}` : ''
+}
+
+/**
+ * Histogram with fixed buckets, one series per label set
+ */
+export class Histogram {
+  constructor(name, help, buckets) {
+    this.name = name
+    this.help = help
+    this.buckets = buckets
+    this.series = new Map()
+  }
+
+  /**
+   * Record one observation
+   * @param {object} labels - Label values
+   * @param {number} value - Observed value
+   */
+  observe(labels, value) {
+    const key = formatLabels(labels)
+    let series = this.series.get(key)
+    if (!series) {
+      series = { labels, counts: new Array(this.buckets.length).fill(0), sum: 0, count: 0 }
+      this.series.set(key, series)
+    }
+    const index = this.buckets.findIndex(bound => value <= bound)
+    if (index >= 0) series.counts[index]++
+    series.sum += value
+    series.count++
+  }
+
+  /**
+   * Prometheus text lines (cumulative buckets)
+   * @returns {Array<string>}
+   */
+  render() {
+    const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} histogram`]
+    for (const { labels, counts, sum, count } of this.series.values()) {
+      let cumulative = 0
+      this.buckets.forEach((bound, i) => {
+        cumulative += counts[i]
+        lines.push(`${this.name}_bucket${formatLabels({ ...labels, le: bound })} ${cumulative}`)
+      })
+      lines.push(`${this.name}_bucket${formatLabels({ ...labels, le: '+Inf' })} ${count}`)
+      lines.push(`${this.name}_sum${formatLabels(labels)} ${sum}`)
+      lines.push(`${this.name}_count${formatLabels(labels)} ${count}`)
+    }
+    return lines
+  }
+}
+
+/**
+ * Gauge, one series per label set
+ */
+export class Gauge {
+  constructor(name, help) {
+    this.name = name
+    this.help = help
+    this.series = new Map()
+  }
+
+  /**
+   * Add to the gauge
+   * @param {object} labels - Label values
+   * @param {number} delta - Amount (negative to decrement)
+   */
+  add(labels, delta) {
+    const key = formatLabels(labels)
+    const series = this.series.get(key) || { labels, value: 0 }
+    series.value += delta
+    this.series.set(key, series)
+  }
+
+  /**
+   * Prometheus text lines
+   * @returns {Array<string>}
+   */
+  render() {
+    const lines = [`# HELP ${this.name} ${this.help}`, `# TYPE ${this.name} gauge`]
+    for (const { labels, value } of this.series.values()) {
+      lines.push(`${this.name}${formatLabels(labels)} ${value}`)
+    }
+    return lines
+  }
+}
+
+const requestDuration = new Histogram('http_request_duration_seconds', 'Time to produce the response, by route pattern', DURATION_BUCKETS)
+const requestSize = new Histogram('http_request_size_bytes', 'Request body size (Content-Length), by route pattern', SIZE_BUCKETS)
+const responseSize = new Histogram('http_response_size_bytes', 'Response body size, by route pattern', SIZE_BUCKETS)
+const inFlight = new Gauge('http_requests_in_flight', 'Requests being handled, by route pattern')
+
+/**
+ * Count the bytes of a response body as it is streamed to the client
+ * @param {Response} response - Handler response
+ * @param {function} onDone - Called with the byte count once the body has been read
+ * @returns {Response} Response to return (the same one when there is no body)
+ */
+function countResponseBytes(response, onDone) {
+  if (!response.body || typeof response.body.pipeThrough !== 'function') {
+    onDone(0)
+    return response
+  }
+  let bytes = 0
+  const counter = new TransformStream({
+    transform(chunk, controller) {
+      bytes += chunk.byteLength
+      controller.enqueue(chunk)
+    },
+    flush() {
+      onDone(bytes)
+    },
+  })
+  return new Response(response.body.pipeThrough(counter), {
+    status: response.status,
+    statusText: response.statusText,
+    headers: response.headers,
+  })
+}
+
+/**
+ * Start timing a request
+ * @param {string} method - HTTP method
+ * @param {string} route - Router pattern, or 'unmatched'
+ * @param {string|null} contentLength - Request Content-Length header
+ * @returns {function} (response) => response; call once with the handler's response
+ */
+export function trackRequest(method, route, contentLength = null) {
+  const started = process.hrtime.bigint()
+  const routeLabels = { method, route }
+  inFlight.add(routeLabels, 1)
+  const requestBytes = parseInt(contentLength)
+  if (requestBytes >= 0) requestSize.observe(routeLabels, requestBytes)
+
+  return (response) => {
+    inFlight.add(routeLabels, -1)
+    const labels = { method, route, status: response.status }
+    requestDuration.observe(labels, Number(process.hrtime.bigint() - started) / 1e9)
+    return countResponseBytes(response, bytes => responseSize.observe(labels, bytes))
+  }
+}
+
+/**
+ * Render every metric in the Prometheus text exposition format
+ * @returns {string}
+ */
+export function renderMetrics() {
+  const pool = getPoolStats()
+  const lines = [
+    ...requestDuration.render(),
+    ...requestSize.render(),
+    ...responseSize.render(),
+    ...inFlight.render(),
+    '# HELP mongodb_pool_connections Open connections in the driver pool',
+    '# TYPE mongodb_pool_connections gauge',
+    `mongodb_pool_connections ${pool.connections_open}`,
+    '# HELP mongodb_pool_checked_out Connections currently checked out',
+    '# TYPE mongodb_pool_checked_out gauge',
+    `mongodb_pool_checked_out ${pool.checked_out}`,
+    '# HELP mongodb_pool_wait_queue Operations waiting for a connection',
+    '# TYPE mongodb_pool_wait_queue gauge',
+    `mongodb_pool_wait_queue ${pool.wait_queue}`,
+    '# HELP mongodb_pool_checkouts_total Connection checkouts',
+    '# TYPE mongodb_pool_checkouts_total counter',
+    `mongodb_pool_checkouts_total ${pool.checkouts}`,
+    '# HELP mongodb_pool_checkout_failures_total Failed connection checkouts',
+    '# TYPE mongodb_pool_checkout_failures_total counter',
+    `mongodb_pool_checkout_failures_total ${pool.checkout_failures}`,
+  ]
+  return lines.join('\n') + '\n'
+}
+
+/**
+ * Drop every series (tests)
+ */
+export function resetMetrics() {
+  [requestDuration, requestSize, responseSize, inFlight].forEach(metric => metric.series.clear())
+}
+
+export default {
+  DURATION_BUCKETS,
+  SIZE_BUCKETS,
+  Histogram,
+  Gauge,
+  trackRequest,
+  renderMetrics,
+  resetMetrics
+}
@@ -0,0 +1,351 @@
+/**
+ * Norm Resolver Module
+ * In-memory rate card lookup and memoised draft generation
+ *
+ * The plantation, building and nursery norms are indexed per module by
+ * (financial_year, species or type). Plantation groups also keep a sorted
+ * array of applicable ages, and a binary search over it finds the exact
+ * or nearest lower age. Indexes are built from the master data cache
+ * and rebuilt whenever it hands out a new norms or activities list, that
+ * is after invalidateMasterData() or a TTL reload.
+ *
+ * Draft results are memoised per (module, entity, financial year, index
+ * version). The entity's draft-relevant fields and its current age are
+ * part of the key. Repeated wizard steps are then served without
+ * touching the rate card. Memoised drafts are shared - copy before
+ * modifying.
+ */
+import { LRUCache } from './lruCache'
+import { getMasterData } from './masterData'
+
+/**
+ * Rate card collections per module
+ * groupKey picks the species (null = any species) or type a norm applies to
+ */
+export const NORM_MODULES = {
+  plantation: { norms: 'norms_config', activities: 'activity_master', groupKey: norm => norm.species_id || '', aged: true },
+  building: { norms: 'building_norms', activities: 'building_activities', groupKey: norm => norm.building_phase },
+  nursery: { norms: 'nursery_norms', activities: 'nursery_activities', groupKey: norm => norm.nursery_type },
+}
+
+// Plantation works are CAPEX up to this age, REVEX (maintenance) after it
+export const CAPEX_MAX_PLANTATION_AGE = 7
+
+const indexes = new Map()
+let builds = 0
+
+const draftCache = new LRUCache({
+  max: parseInt(process.env.NORM_DRAFT_CACHE_MAX) || 2000,
+})
+
+/**
+ * Binary search a sorted age array for the largest age <= target
+ * @param {number[]} ages - Ascending, distinct ages
+ * @param {number} target - Age to match
+ * @returns {number|null} Matching age or null if every age is greater
+ */
+export function nearestLowerAge(ages, target) {
+  let low = 0
+  let high = ages.length - 1
+  let found = null
+  while (low <= high) {
+    const mid = (low + high) >> 1
+    if (ages[mid] <= target) {
+      found = ages[mid]
+      low = mid + 1
+    } else {
+      high = mid - 1
+    }
+  }
+  return found
+}
+
+/**
+ * Group one module's norms by financial year and species/type
+ * @param {string} module - Key of NORM_MODULES
+ * @param {array} norms - Norm documents
+ * @param {object} activities - Activity id → document
+ * @returns {object} { version, norms, activities, groups, positions }
+ */
+export function buildNormIndex(module, norms, activities) {
+  const config = NORM_MODULES[module]
+  const groups = new Map()
+  const positions = new Map()
+  norms.forEach((norm, position) => {
+    positions.set(norm, position)
+    const key = `${norm.financial_year}|${config.groupKey(norm)}`
+    if (!groups.has(key)) groups.set(key, { norms: [], byAge: new Map(), ages: [] })
+    const group = groups.get(key)
+    group.norms.push(norm)
+    if (config.aged) {
+      const age = norm.applicable_age
+      if (!group.byAge.has(age)) group.byAge.set(age, [])
+      group.byAge.get(age).push(norm)
+    }
+  })
+  groups.forEach(group => {
+    group.ages = [...group.byAge.keys()].sort((a, b) => a - b)
+  })
+  builds++
+  return { module, version: builds, norms, activities, groups, positions }
+}
+
+/**
+ * Get the norm index of a module, rebuilding it if the master data changed
+ * @param {Db} db - MongoDB database instance
+ * @param {string} module - Key of NORM_MODULES
+ * @returns {object} Index from buildNormIndex
+ */
+export async function getNormIndex(db, module) {
+  const config = NORM_MODULES[module]
+  const [norms, activities] = await Promise.all([
+    getMasterData(db, config.norms),
+    getMasterData(db, config.activities),
+  ])
+  const index = indexes.get(module)
+  if (index && index.norms === norms.list && index.activities === activities.byId) return index
+
+  const rebuilt = buildNormIndex(module, norms.list, activities.byId)
+  indexes.set(module, rebuilt)
+  return rebuilt
+}
+
+/**
+ * Norms of a plantation age: the exact age, else the nearest lower age above 0
+ * Species-specific norms are merged with the generic (species_id null) ones.
+ * @param {object} index - Plantation norm index
+ * @param {string} financialYear - Financial year
+ * @param {string} species - Plantation species
+ * @param {number} age - Plantation age in years
+ * @returns {object} { age (matched, or null), norms (rate card order) }
+ */
+export function resolveAgedNorms(index, financialYear, species, age) {
+  const groups = [index.groups.get(`${financialYear}|`)]
+  if (species) groups.push(index.groups.get(`${financialYear}|${species}`))
+  const candidates = groups.filter(Boolean)
+
+  let matched = null
+  candidates.forEach(group => {
+    const found = nearestLowerAge(group.ages, age)
+    if (found !== null && (matched === null || found > matched)) matched = found
+  })
+  // Age 0 (site preparation) norms only apply to age 0 itself
+  if (matched === null || (matched !== age && (age <= 0 || matched <= 0))) {
+    return { age: null, norms: [] }
+  }
+
+  const norms = candidates.flatMap(group => group.byAge.get(matched) || [])
+  if (candidates.length > 1) norms.sort((a, b) => index.positions.get(a) - index.positions.get(b))
+  return { age: matched, norms }
+}
+
+/**
+ * Norms of a building phase or nursery type
+ * @param {object} index - Building or nursery norm index
+ * @param {string} financialYear - Financial year
+ * @param {string} type - building_phase or nursery_type
+ * @returns {array} Norms in rate card order
+ */
+export function resolveTypedNorms(index, financialYear, type) {
+  return index.groups.get(`${financialYear}|${type}`)?.norms || []
+}
+
+/**
+ * Memoise a draft per (module, key, index version)
+ * @param {object} index - Norm index the draft is built from
+ * @param {string} key - Entity id, financial year and draft-relevant fields
+ * @param {Function} build - Builds the draft on a miss
+ * @returns {object} Draft (shared - do not modify)
+ */
+function memoizeDraft(index, key, build) {
+  const cacheKey = `${index.module}|${index.version}|${key}`
+  let draft = draftCache.get(cacheKey)
+  if (draft === undefined) {
+    draft = build()
+    draftCache.set(cacheKey, draft)
+  }
+  return draft
+}
+
+/**
+ * Draft line item from a norm
+ */
+function draftItem(index, norm, qty) {
+  const activity = index.activities[norm.activity_id]
+  return {
+    activity_id: norm.activity_id,
+    activity_name: activity?.name || 'Unknown',
+    category: activity?.category || 'Unknown',
+    unit: activity?.unit || 'Unknown',
+    sanctioned_rate: norm.standard_rate,
+    suggested_qty: qty,
+    total_cost: norm.standard_rate * qty,
+  }
+}
+
+/**
+ * Age of a plantation (or building) this calendar year
+ * @param {number} year - Year of planting or creation
+ * @returns {number} Age in years
+ */
+export function ageInYears(year) {
+  return new Date().getFullYear() - year
+}
+
+/**
+ * Draft items for a plantation from the age-based norms
+ * @param {Db} db - MongoDB database instance
+ * @param {object} plantation - Plantation document
+ * @param {string} financialYear - Financial year
+ * @returns {object} /apo/generate-draft response body
+ */
+export async function getPlantationDraft(db, plantation, financialYear) {
+  const index = await getNormIndex(db, 'plantation')
+  const age = ageInYears(plantation.year_of_planting)
+  const key = [plantation.id, financialYear, age, plantation.species, plantation.total_area_ha].join('|')
+  return memoizeDraft(index, key, () => {
+    const { norms } = resolveAgedNorms(index, financialYear, plantation.species, age)
+    const items = norms.map(norm => draftItem(index, norm, plantation.total_area_ha))
+    return {
+      plantation_id: plantation.id,
+      plantation_name: plantation.name,
+      species: plantation.species,
+      age,
+      financial_year: financialYear,
+      total_area_ha: plantation.total_area_ha,
+      items,
+      total_estimated_cost: items.reduce((sum, i) => sum + i.total_cost, 0),
+    }
+  })
+}
+
+/**
+ * Suggested activities for a work on a plantation
+ * @param {Db} db - MongoDB database instance
+ * @param {object} plantation - Plantation document
+ * @param {string} financialYear - Financial year
+ * @returns {array} Suggested activities with rate and matched age
+ */
+export async function getPlantationSuggestions(db, plantation, financialYear) {
+  const index = await getNormIndex(db, 'plantation')
+  const age = ageInYears(plantation.year_of_planting)
+  const key = ['suggest', plantation.id, financialYear, age, plantation.species].join('|')
+  return memoizeDraft(index, key, () => {
+    const { norms } = resolveAgedNorms(index, financialYear, plantation.species, age)
+    return norms.map(norm => {
+      const activity = index.activities[norm.activity_id]
+      return {
+        activity_id: norm.activity_id,
+        activity_name: activity?.name || 'Unknown',
+        ssr_no: activity?.ssr_no,
+        unit: activity?.unit,
+        category: activity?.category,
+        sanctioned_rate: norm.standard_rate,
+        applicable_age: norm.applicable_age,
+      }
+    })
+  })
+}
+
+/**
+ * Draft items for a building from the norms of its phase
+ * @param {Db} db - MongoDB database instance
+ * @param {object} building - Building document
+ * @param {string} financialYear - Financial year
+ * @returns {object} /buildings/generate-draft response body
+ */
+export async function getBuildingDraft(db, building, financialYear) {
+  const index = await getNormIndex(db, 'building')
+  const age = ageInYears(building.year_of_creation)
+  const key = [building.id, financialYear, age, building.building_phase].join('|')
+  return memoizeDraft(index, key, () => {
+    // Default quantity for buildings
+    const items = resolveTypedNorms(index, financialYear, building.building_phase).map(norm => draftItem(index, norm, 1))
+    return {
+      building_id: building.id,
+      building_name: building.name,
+      building_phase: building.building_phase,
+      age,
+      financial_year: financialYear,
+      items,
+      total_estimated_cost: items.reduce((sum, i) => sum + i.total_cost, 0),
+    }
+  })
+}
+
+/**
+ * Draft items for a nursery from the norms of its type
+ * @param {Db} db - MongoDB database instance
+ * @param {object} nursery - Nursery document
+ * @param {string} financialYear - Financial year
+ * @returns {object} /nurseries/generate-draft response body
+ */
+export async function getNurseryDraft(db, nursery, financialYear) {
+  const index = await getNormIndex(db, 'nursery')
+  const key = [nursery.id, financialYear, nursery.nursery_type, nursery.capacity_seedlings].join('|')
+  return memoizeDraft(index, key, () => {
+    // Calculate quantity based on capacity (1000 seedlings = 1 unit typically)
+    const unitQty = Math.ceil(nursery.capacity_seedlings / 1000) || 1
+    const items = resolveTypedNorms(index, financialYear, nursery.nursery_type).map(norm => draftItem(index, norm, unitQty))
+    return {
+      nursery_id: nursery.id,
+      nursery_name: nursery.name,
+      nursery_type: nursery.nursery_type,
+      capacity_seedlings: nursery.capacity_seedlings,
+      financial_year: financialYear,
+      items,
+      total_estimated_cost: items.reduce((sum, i) => sum + i.total_cost, 0),
+    }
+  })
+}
+
+/**
+ * CAPEX/REVEX classification of a draft
+ * Plantations: CAPEX up to age 7; buildings: CAPEX while in Creation; nurseries: always CAPEX
+ * @param {string} sourceType - plantation, building or nursery
+ * @param {object} draft - Draft from one of the get*Draft functions
+ * @returns {string} CAPEX or REVEX
+ */
+export function draftExpenseType(sourceType, draft) {
+  if (sourceType === 'plantation') return draft.age <= CAPEX_MAX_PLANTATION_AGE ? 'CAPEX' : 'REVEX'
+  if (sourceType === 'building') return draft.building_phase === 'Creation' ? 'CAPEX' : 'REVEX'
+  return 'CAPEX'
+}
+
+/**
+ * Get norm index and draft cache counters
+ * @returns {object} { builds, modules (index version and size), drafts (LRU stats) }
+ */
+export function getNormResolverStats() {
+  const modules = {}
+  indexes.forEach((index, module) => {
+    modules[module] = { version: index.version, norms: index.norms.length, groups: index.groups.size }
+  })
+  return { builds, modules, drafts: draftCache.stats() }
+}
+
+/**
+ * Drop the indexes and memoised drafts (tests)
+ */
+export function resetNormResolver() {
+  indexes.clear()
+  draftCache.clear()
+}
+
+export default {
+  NORM_MODULES,
+  CAPEX_MAX_PLANTATION_AGE,
+  nearestLowerAge,
+  buildNormIndex,
+  getNormIndex,
+  resolveAgedNorms,
+  resolveTypedNorms,
+  ageInYears,
+  getPlantationDraft,
+  getPlantationSuggestions,
+  getBuildingDraft,
+  getNurseryDraft,
+  draftExpenseType,
+  getNormResolverStats,
+  resetNormResolver,
+}
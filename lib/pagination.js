@@ -0,0 +1,145 @@
+/**
+ * Pagination Module
+ * Keyset (cursor) pagination on (created_at, id) for list endpoints
+ *
+ * Pages are ordered newest first: created_at descending with id as the
+ * tie-breaker, documents without created_at last. The cursor is an opaque
+ * base64url token holding the sort key of the last item served, so each
+ * page is an index range scan regardless of how deep the client has read.
+ *
+ * Pagination is opt-in: without ?limit or ?after the endpoints keep
+ * returning the full array, which the existing API clients rely on.
+ */
+import { ApiError } from './errorHandler'
+
+export const DEFAULT_PAGE_SIZE = 50
+export const MAX_PAGE_SIZE = 200
+export const KEYSET_SORT = { created_at: -1, id: -1 }
+
+/**
+ * Encode the sort key of a document as an opaque cursor
+ * @param {object} doc - Last document of a page
+ * @returns {string} base64url cursor
+ */
+export function encodeCursor(doc) {
+  const createdAt = doc.created_at ? new Date(doc.created_at).toISOString() : null
+  return Buffer.from(JSON.stringify([createdAt, doc.id])).toString('base64url')
+}
+
+/**
+ * Decode a cursor produced by encodeCursor
+ * @param {string} cursor - base64url cursor
+ * @returns {object} { createdAt: Date|null, id }
+ * @throws {ApiError} 400 if the cursor is malformed
+ */
+export function decodeCursor(cursor) {
+  let createdAt
+  let id
+  try {
+    [createdAt, id] = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'))
+  } catch (e) {
+    throw new ApiError('Invalid cursor', 400, 'VALIDATION_ERROR')
+  }
+  const date = createdAt === null ? null : new Date(createdAt)
+  if (typeof id !== 'string' || (date && isNaN(date.getTime()))) {
+    throw new ApiError('Invalid cursor', 400, 'VALIDATION_ERROR')
+  }
+  return { createdAt: date, id }
+}
+
+/**
+ * Read limit/after/include_total from the query string
+ * @param {Request} request - Next.js request object
+ * @returns {object|null} { limit, after, includeTotal }, or null when the client did not ask for pages
+ * @throws {ApiError} 400 on an invalid limit or cursor
+ */
+export function getPageParams(request) {
+  const { searchParams } = new URL(request.url)
+  const limitParam = searchParams.get('limit')
+  const afterParam = searchParams.get('after')
+  if (limitParam === null && afterParam === null) return null
+
+  const limit = limitParam === null ? DEFAULT_PAGE_SIZE : Number(limitParam)
+  if (!Number.isInteger(limit) || limit < 1) {
+    throw new ApiError('limit must be a positive integer', 400, 'VALIDATION_ERROR')
+  }
+  return {
+    limit: Math.min(limit, MAX_PAGE_SIZE),
+    after: afterParam ? decodeCursor(afterParam) : null,
+    includeTotal: searchParams.get('include_total') === 'true',
+  }
+}
+
+/**
+ * Build the filter selecting documents that sort after a cursor
+ * @param {object} after - Decoded cursor
+ * @returns {object} MongoDB filter
+ */
+export function keysetFilter(after) {
+  if (after.createdAt === null) {
+    return { created_at: null, id: { $lt: after.id } }
+  }
+  return {
+    $or: [
+      { created_at: { $lt: after.createdAt } },
+      { created_at: after.createdAt, id: { $lt: after.id } },
+      { created_at: null },
+    ]
+  }
+}
+
+/**
+ * Fetch one page of a collection, or the whole filtered list when page is null
+ * @param {Collection} collection - MongoDB collection
+ * @param {object} filter - Base filter of the endpoint
+ * @param {object|null} page - Result of getPageParams
+ * @param {object} options
+ * @param {object} options.sort - Sort for the unpaginated list (keeps legacy ordering)
+ * @param {object} options.projection - Fields to read (see projection.js); must keep created_at and id
+ * @returns {object} { items, next_cursor, total } (next_cursor/total only when paginated)
+ */
+export async function findPage(collection, filter, page, { sort = null, projection = null } = {}) {
+  const options = projection ? { projection } : {}
+  if (!page) {
+    let cursor = collection.find(filter, options)
+    if (sort) cursor = cursor.sort(sort)
+    return { items: await cursor.toArray() }
+  }
+
+  const query = page.after ? { $and: [filter, keysetFilter(page.after)] } : filter
+  const [docs, total] = await Promise.all([
+    collection.find(query, options).sort(KEYSET_SORT).limit(page.limit + 1).toArray(),
+    page.includeTotal ? collection.countDocuments(filter) : null,
+  ])
+  const hasMore = docs.length > page.limit
+  const items = hasMore ? docs.slice(0, page.limit) : docs
+  const result = { items, next_cursor: hasMore ? encodeCursor(items[items.length - 1]) : null }
+  if (page.includeTotal) result.total = total
+  return result
+}
+
+/**
+ * Shape a list response: a bare array when unpaginated, a page envelope otherwise
+ * @param {object|null} page - Result of getPageParams
+ * @param {array} items - Response items (already enriched)
+ * @param {object} result - Result of findPage
+ * @returns {array|object} items, or { items, next_cursor, total? }
+ */
+export function pageBody(page, items, result) {
+  if (!page) return items
+  const body = { items, next_cursor: result.next_cursor }
+  if ('total' in result) body.total = result.total
+  return body
+}
+
+export default {
+  DEFAULT_PAGE_SIZE,
+  MAX_PAGE_SIZE,
+  KEYSET_SORT,
+  encodeCursor,
+  decodeCursor,
+  getPageParams,
+  keysetFilter,
+  findPage,
+  pageBody
+}
@@ -0,0 +1,93 @@
+/**
+ * Pool Metrics Module
+ * Connection pool statistics collected from the driver's CMAP events
+ *
+ * The driver emits connection monitoring (CMAP) events on the MongoClient
+ * for every checkout, checkin and connection lifecycle change. Checkouts
+ * leave the pool's wait queue in FIFO order, so pairing each checkout with
+ * the oldest pending start gives its wait time without per-request state.
+ */
+
+const stats = {
+  connections_open: 0,
+  connections_created: 0,
+  checked_out: 0,
+  wait_queue: 0,
+  checkouts: 0,
+  checkout_failures: 0,
+  checkout_ms_total: 0,
+  checkout_ms_max: 0,
+  pool_cleared: 0,
+}
+let pendingStarts = []
+
+/**
+ * Record the wait of the oldest pending checkout
+ * @returns {number} Wait in milliseconds
+ */
+function finishCheckout() {
+  const startedAt = pendingStarts.shift()
+  stats.wait_queue = pendingStarts.length
+  return startedAt === undefined ? 0 : Date.now() - startedAt
+}
+
+/**
+ * Subscribe to the CMAP events of a client
+ * @param {MongoClient} client - Client, before connect()
+ */
+export function attachPoolMetrics(client) {
+  client.on('connectionCreated', () => {
+    stats.connections_open++
+    stats.connections_created++
+  })
+  client.on('connectionClosed', () => {
+    stats.connections_open = Math.max(0, stats.connections_open - 1)
+  })
+  client.on('connectionCheckOutStarted', () => {
+    pendingStarts.push(Date.now())
+    stats.wait_queue = pendingStarts.length
+  })
+  client.on('connectionCheckedOut', () => {
+    const waitMs = finishCheckout()
+    stats.checked_out++
+    stats.checkouts++
+    stats.checkout_ms_total += waitMs
+    stats.checkout_ms_max = Math.max(stats.checkout_ms_max, waitMs)
+  })
+  client.on('connectionCheckOutFailed', () => {
+    finishCheckout()
+    stats.checkout_failures++
+  })
+  client.on('connectionCheckedIn', () => {
+    stats.checked_out = Math.max(0, stats.checked_out - 1)
+  })
+  client.on('connectionPoolCleared', () => {
+    stats.pool_cleared++
+  })
+}
+
+/**
+ * Get pool statistics
+ * @returns {object} Gauges (connections_open, checked_out, wait_queue) and checkout counters
+ */
+export function getPoolStats() {
+  const { checkout_ms_total, ...counters } = stats
+  return {
+    ...counters,
+    checkout_ms_avg: stats.checkouts > 0 ? Math.round((checkout_ms_total / stats.checkouts) * 100) / 100 : 0,
+  }
+}
+
+/**
+ * Reset all counters (on reconnect and in tests)
+ */
+export function resetPoolStats() {
+  Object.keys(stats).forEach(key => { stats[key] = 0 })
+  pendingStarts = []
+}
+
+export default {
+  attachPoolMetrics,
+  getPoolStats,
+  resetPoolStats
+}
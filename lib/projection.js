@@ -0,0 +1,164 @@
+/**
+ * Projection Module
+ * ?fields= selection for list and detail responses
+ *
+ * A client asks for a comma separated list of fields, a named preset
+ * (summary, full) or a mix of both. The selection becomes a MongoDB
+ * projection, so unrequested fields are neither read nor serialised.
+ * Derived fields (names joined from master data, ages, embedded items)
+ * declare the stored fields they are computed from; those are projected
+ * too, and handlers skip the lookups behind derived fields nobody asked for.
+ *
+ * Without ?fields (or with fields=full) responses are unchanged.
+ */
+import { ApiError } from './errorHandler'
+
+// Always returned so the client can address the document
+const ALWAYS_INCLUDED = ['id']
+// Always read: the keyset cursor is built from these (see pagination.js)
+const ALWAYS_READ = ['id', 'created_at']
+
+const FIELD_NAME = /^[A-Za-z_][A-Za-z0-9_]*$/
+
+/**
+ * Field views: derived field → stored fields it needs, and named presets
+ * A preset of null means every field.
+ */
+export const FIELD_VIEWS = {
+  plantations: {
+    derived: {
+      range_name: ['range_id'],
+      division_name: ['range_id'],
+      age: ['year_of_planting'],
+      work_type: ['year_of_planting'],
+    },
+    presets: {
+      summary: ['name', 'species', 'range_id', 'range_name', 'division', 'division_name', 'year_of_planting', 'age', 'total_area_ha', 'work_type'],
+      full: null,
+    },
+  },
+  buildings: {
+    derived: {
+      range_name: ['range_id'],
+      division_name: ['range_id'],
+      age: ['year_of_creation'],
+    },
+    presets: {
+      summary: ['name', 'range_id', 'range_name', 'division', 'division_name', 'district', 'taluk', 'building_phase', 'year_of_creation', 'age', 'status'],
+      full: null,
+    },
+  },
+  nurseries: {
+    derived: {
+      range_name: ['range_id'],
+      division_name: ['range_id'],
+    },
+    presets: {
+      summary: ['name', 'range_id', 'range_name', 'division_name', 'nursery_type', 'capacity_seedlings', 'latitude', 'longitude', 'status'],
+      full: null,
+    },
+  },
+  apos: {
+    derived: {
+      division_name: ['division_id'],
+      created_by_name: ['created_by'],
+      ed_approved_by_name: ['approved_by_ed'],
+      md_approved_by_name: ['approved_by_md'],
+      items: [],
+      capex_items: [],
+      revex_items: [],
+    },
+    presets: {
+      summary: ['title', 'financial_year', 'status', 'division_id', 'division_name', 'created_by_name', 'md_approved_by_name', 'rejection_remarks', 'total_sanctioned_amount', 'capex_total', 'revex_total', 'created_at'],
+      full: null,
+    },
+  },
+  fund_indents: {
+    derived: {
+      plantation_name: ['apo_id'],
+      financial_year: ['apo_id'],
+      created_by_name: ['created_by'],
+      items: [],
+      item_count: ['item_ids'],
+    },
+    presets: {
+      summary: ['apo_id', 'status', 'plantation_name', 'financial_year', 'created_by', 'created_by_name', 'total_amount', 'item_count', 'created_at'],
+      full: null,
+    },
+  },
+}
+
+/**
+ * Read ?fields= for a view
+ * @param {Request} request - Next.js request object
+ * @param {string} view - Key of FIELD_VIEWS
+ * @returns {object|null} { fields: Set, projection }, or null for every field
+ * @throws {ApiError} 400 on a malformed field name
+ */
+export function getFieldSelection(request, view) {
+  const { derived, presets } = FIELD_VIEWS[view]
+  const param = new URL(request.url).searchParams.get('fields')
+  if (!param) return null
+
+  const fields = new Set(ALWAYS_INCLUDED)
+  for (const name of param.split(',').map(f => f.trim()).filter(Boolean)) {
+    if (name in presets) {
+      if (presets[name] === null) return null
+      presets[name].forEach(f => fields.add(f))
+    } else if (FIELD_NAME.test(name)) {
+      fields.add(name)
+    } else {
+      throw new ApiError(`Invalid field: ${name}`, 400, 'VALIDATION_ERROR')
+    }
+  }
+
+  const projection = { _id: 0 }
+  ALWAYS_READ.forEach(f => { projection[f] = 1 })
+  fields.forEach(f => {
+    if (f in derived) derived[f].forEach(dep => { projection[dep] = 1 })
+    else projection[f] = 1
+  })
+  return { fields, projection }
+}
+
+/**
+ * Check whether a selection includes a field
+ * @param {object|null} selection - Result of getFieldSelection
+ * @param {...string} names - Field names (true if any is selected)
+ * @returns {boolean} True when every field is selected or one of names is
+ */
+export function wantsField(selection, ...names) {
+  return !selection || names.some(name => selection.fields.has(name))
+}
+
+/**
+ * Driver options applying a selection to find()/findOne()
+ * @param {object|null} selection - Result of getFieldSelection
+ * @returns {object} { projection } or {}
+ */
+export function projectionOptions(selection) {
+  return selection ? { projection: selection.projection } : {}
+}
+
+/**
+ * Drop the fields a client did not select from a response document
+ * @param {object} doc - Enriched document
+ * @param {object|null} selection - Result of getFieldSelection
+ * @returns {object} doc itself when every field is selected
+ */
+export function pickFields(doc, selection) {
+  if (!selection) return doc
+  const picked = {}
+  selection.fields.forEach(f => {
+    if (doc[f] !== undefined) picked[f] = doc[f]
+  })
+  return picked
+}
+
+export default {
+  FIELD_VIEWS,
+  getFieldSelection,
+  wantsField,
+  projectionOptions,
+  pickFields
+}
@@ -0,0 +1,118 @@
+/**
+ * Revised Totals Module
+ * Running revised_total on apo_headers for estimate edits
+ *
+ * PATCH /apo/items/:id/estimate moves the header's revised_total by the
+ * line's cost delta with one conditional $inc that only matches while the
+ * new total stays within total_sanctioned_amount, so the budget check does
+ * not re-read every line and two concurrent edits cannot both pass it. The
+ * line itself is then updated only if its revised_qty is still the one read;
+ * otherwise the delta is given back.
+ *
+ * works.js clears revised_total when lines are added or removed; headers
+ * without it (including those written before it existed) are backfilled
+ * from their items on the next edit.
+ */
+import { withTransaction } from './db'
+
+// revised_total is a running float sum; allow half a paisa of rounding against the sanctioned amount
+export const REVISED_TOTAL_TOLERANCE = 0.005
+
+/**
+ * Parse a requested revised quantity
+ * @param {*} value - revised_qty from the request body
+ * @returns {number|null} Quantity, or null if not a non-negative number
+ */
+export function parseRevisedQty(value) {
+  const qty = parseFloat(value)
+  return Number.isFinite(qty) && qty >= 0 ? qty : null
+}
+
+/**
+ * Effective cost of an item: revised_qty when set, else sanctioned_qty, times the rate
+ * @param {object} item - apo_items document
+ * @returns {number} Cost
+ */
+export function revisedCost(item) {
+  const qty = item.revised_qty !== null && item.revised_qty !== undefined ? item.revised_qty : item.sanctioned_qty
+  return qty * item.sanctioned_rate
+}
+
+/**
+ * Initialise revised_total on an APO header that predates it (or had works added/removed)
+ * No-op when another request got there first.
+ * @param {Db} db - MongoDB database instance
+ * @param {string} apoId - APO id
+ */
+export async function backfillRevisedTotal(db, apoId) {
+  const [totals] = await db.collection('apo_items').aggregate([
+    { $match: { apo_id: apoId } },
+    {
+      $group: {
+        _id: null,
+        revised_total: { $sum: { $multiply: [{ $ifNull: ['$revised_qty', '$sanctioned_qty'] }, '$sanctioned_rate'] } },
+      }
+    },
+  ]).toArray()
+  await db.collection('apo_headers').updateOne(
+    { id: apoId, revised_total: { $exists: false } },
+    { $set: { revised_total: totals?.revised_total || 0 } }
+  )
+}
+
+/**
+ * Set an item's revised_qty if the APO's revised total stays within its sanctioned amount
+ * @param {Db} db - MongoDB database instance
+ * @param {object} item - apo_items document as read
+ * @param {object} apo - APO header ({ id, revised_total })
+ * @param {number} revisedQty - New quantity
+ * @returns {object} { item } on success, { overBudget, revised_total, total_sanctioned_amount },
+ *   or { conflict: 'apo' | 'item' } when the header total was reset or the line changed meanwhile
+ */
+export async function reviseItemQuantity(db, item, apo, revisedQty) {
+  if (apo.revised_total === undefined) await backfillRevisedTotal(db, apo.id)
+  const delta = revisedQty * item.sanctioned_rate - revisedCost(item)
+
+  const outcome = await withTransaction(async (session) => {
+    const budget = await db.collection('apo_headers').updateOne(
+      {
+        id: apo.id,
+        revised_total: { $type: 'number' },
+        $expr: { $lte: [{ $add: ['$revised_total', delta] }, { $add: ['$total_sanctioned_amount', REVISED_TOTAL_TOLERANCE] }] },
+      },
+      { $inc: { revised_total: delta } },
+      { session }
+    )
+    if (budget.matchedCount === 0) return { overBudget: true }
+
+    const updatedItem = await db.collection('apo_items').findOneAndUpdate(
+      { id: item.id, revised_qty: item.revised_qty === undefined ? null : item.revised_qty },
+      { $set: { revised_qty: revisedQty, updated_at: new Date() } },
+      { session, returnDocument: 'after', projection: { _id: 0 } }
+    )
+    if (!updatedItem) {
+      // Someone else changed this line since it was read - give the delta back
+      await db.collection('apo_headers').updateOne({ id: apo.id }, { $inc: { revised_total: -delta } }, { session })
+      return { conflict: 'item' }
+    }
+    return { item: updatedItem }
+  })
+  if (!outcome.overBudget) return outcome
+
+  const current = await db.collection('apo_headers').findOne({ id: apo.id }, { projection: { _id: 0, revised_total: 1, total_sanctioned_amount: 1 } })
+  // Works were added or removed meanwhile and reset the total
+  if (current && current.revised_total === undefined) return { conflict: 'apo' }
+  return {
+    overBudget: true,
+    revised_total: (current?.revised_total || 0) + delta,
+    total_sanctioned_amount: current?.total_sanctioned_amount,
+  }
+}
+
+export default {
+  REVISED_TOTAL_TOLERANCE,
+  parseRevisedQty,
+  revisedCost,
+  backfillRevisedTotal,
+  reviseItemQuantity
+}
@@ -0,0 +1,480 @@
+/**
+ * Dashboard Rollups Module
+ * Incrementally maintained dashboard totals per scope and financial year
+ *
+ * dashboard_rollups holds one document per scope (range:<id>,
+ * division:<id>, org) and financial year, plus an ALL-years row per scope.
+ * The write paths apply $inc deltas through the record* functions, so
+ * /dashboard/stats reads a single document instead of re-aggregating.
+ *
+ * An APO counts towards org and the range (and its division) of the user
+ * who raised it; a plantation towards its own range. Plantations have no
+ * financial year, so their count and area live on the ALL rows only.
+ *
+ * Deltas are applied after the primary write and are not transactional:
+ * a failed delta is logged, never surfaced to the client. rebuildRollups()
+ * recomputes every row from the source collections and reports drift.
+ */
+import { getMasterMap } from './masterData'
+import { logError } from './logger'
+
+export const ROLLUP_COLLECTION = 'dashboard_rollups'
+export const ALL_YEARS = 'ALL'
+export const ORG_SCOPE = 'org'
+
+// Float sums built incrementally and from scratch may differ in the last bits
+const DRIFT_TOLERANCE = 0.01
+
+// Sums the work logs of each apo_items document into `logs.spent` (apo_item_id index)
+const ITEM_SPENT_LOOKUP = {
+  $lookup: {
+    from: 'work_logs',
+    let: { itemId: '$id' },
+    pipeline: [
+      { $match: { $expr: { $eq: ['$apo_item_id', '$$itemId'] } } },
+      { $group: { _id: null, spent: { $sum: '$expenditure' } } },
+    ],
+    as: 'logs',
+  }
+}
+
+// Groups apo_items by activity name: sanctioned cost and logged spend, in insertion order
+const ACTIVITY_GROUP = [
+  ITEM_SPENT_LOOKUP,
+  {
+    $group: {
+      _id: { $ifNull: ['$activity_name', 'Unknown'] },
+      sanctioned: { $sum: '$total_cost' },
+      spent: { $sum: { $sum: '$logs.spent' } },
+      first_item: { $min: '$_id' },
+    }
+  },
+  { $sort: { first_item: 1 } },
+]
+
+/**
+ * Build the _id of a rollup row
+ * @param {string} scope - 'org', 'division:<id>' or 'range:<id>'
+ * @param {string} financialYear - Financial year, or ALL_YEARS
+ * @returns {string} Row id
+ */
+export function rollupId(scope, financialYear = ALL_YEARS) {
+  return `${scope}|${financialYear}`
+}
+
+/**
+ * Get the dashboard scope of a user
+ * @param {object} user - Session user
+ * @returns {string} range scope for RO, division scope for DM, org otherwise
+ */
+export function dashboardScope(user) {
+  if (user.role === 'RO') return `range:${user.range_id}`
+  if (user.role === 'DM') return `division:${user.division_id}`
+  return ORG_SCOPE
+}
+
+/**
+ * Map a field name to a key that is safe inside a MongoDB field path
+ * @param {string} name - Activity name
+ * @returns {string} Name with '.' and '$' replaced
+ */
+export function activityKey(name) {
+  return name.replace(/[.$]/g, '_')
+}
+
+function scopesForRange(rangeMap, rangeId) {
+  const scopes = [ORG_SCOPE]
+  if (!rangeId) return scopes
+  scopes.push(`range:${rangeId}`)
+  const divisionId = rangeMap[rangeId]?.division_id
+  if (divisionId) scopes.push(`division:${divisionId}`)
+  return scopes
+}
+
+async function apoScopes(db, apo) {
+  const creator = await db.collection('users').findOne({ id: apo.created_by }, { projection: { _id: 0, range_id: 1 } })
+  return scopesForRange(await getMasterMap(db, 'ranges'), creator?.range_id)
+}
+
+function emptyUpdate() {
+  return { $inc: {}, $set: {}, $min: {} }
+}
+
+function addActivity(update, name, { sanctioned = 0, spent = 0 }, order) {
+  const path = `activities.${activityKey(name)}`
+  update.$set[`${path}.name`] = name
+  update.$inc[`${path}.sanctioned`] = (update.$inc[`${path}.sanctioned`] || 0) + sanctioned
+  update.$inc[`${path}.spent`] = (update.$inc[`${path}.spent`] || 0) + spent
+  update.$min[`${path}.order`] = order
+}
+
+async function applyUpdate(db, scopes, financialYear, update) {
+  const years = financialYear ? [financialYear, ALL_YEARS] : [ALL_YEARS]
+  const { $inc, $set, $min } = update
+  const ops = []
+  for (const scope of scopes) {
+    for (const year of years) {
+      const change = {
+        $set: { ...$set, updated_at: new Date() },
+        $setOnInsert: { scope, financial_year: year },
+      }
+      if (Object.keys($inc).length > 0) change.$inc = $inc
+      if (Object.keys($min).length > 0) change.$min = $min
+      ops.push({ updateOne: { filter: { _id: rollupId(scope, year) }, update: change, upsert: true } })
+    }
+  }
+  await db.collection(ROLLUP_COLLECTION).bulkWrite(ops, { ordered: false })
+}
+
+// Sanctioning an APO adds its items to the activity totals (and any spend already logged)
+async function addSanctionedItems(db, apo, update) {
+  const rows = await db.collection('apo_items').aggregate([{ $match: { apo_id: apo.id } }, ...ACTIVITY_GROUP]).toArray()
+  const now = Date.now()
+  rows.forEach((row, i) => {
+    addActivity(update, row._id, row, now + i)
+    update.$inc.expenditure = (update.$inc.expenditure || 0) + row.spent
+  })
+}
+
+async function record(context, fn) {
+  try {
+    await fn()
+  } catch (error) {
+    logError(error, { context })
+  }
+}
+
+/**
+ * Record a newly created APO
+ * @param {Db} db - MongoDB database instance
+ * @param {object} apo - Inserted APO header
+ */
+export async function recordApoCreated(db, apo) {
+  await record('recordApoCreated', async () => {
+    const update = emptyUpdate()
+    update.$inc[`apo_count.${apo.status}`] = 1
+    update.$inc[`apo_amount.${apo.status}`] = apo.total_sanctioned_amount || 0
+    if (apo.status === 'SANCTIONED') await addSanctionedItems(db, apo, update)
+    await applyUpdate(db, await apoScopes(db, apo), apo.financial_year, update)
+  })
+}
+
+/**
+ * Record an APO status transition
+ * @param {Db} db - MongoDB database instance
+ * @param {object} apo - APO header as it was before the transition
+ * @param {string} status - New status
+ */
+export async function recordApoStatusChange(db, apo, status) {
+  if (apo.status === status) return
+  await record('recordApoStatusChange', async () => {
+    const amount = apo.total_sanctioned_amount || 0
+    const update = emptyUpdate()
+    update.$inc[`apo_count.${apo.status}`] = -1
+    update.$inc[`apo_count.${status}`] = 1
+    update.$inc[`apo_amount.${apo.status}`] = -amount
+    update.$inc[`apo_amount.${status}`] = amount
+    if (status === 'SANCTIONED') await addSanctionedItems(db, apo, update)
+    await applyUpdate(db, await apoScopes(db, apo), apo.financial_year, update)
+  })
+}
+
+/**
+ * Record a change to an APO's total (works added to or removed from a draft)
+ * @param {Db} db - MongoDB database instance
+ * @param {object} apo - APO header
+ * @param {number} amount - Change of total_sanctioned_amount
+ */
+export async function recordApoAmountChange(db, apo, amount) {
+  if (!amount) return
+  await record('recordApoAmountChange', async () => {
+    const update = emptyUpdate()
+    update.$inc[`apo_amount.${apo.status}`] = amount
+    await applyUpdate(db, await apoScopes(db, apo), apo.financial_year, update)
+  })
+}
+
+/**
+ * Record expenditure logged against a sanctioned APO item
+ * @param {Db} db - MongoDB database instance
+ * @param {object} apo - Sanctioned APO header
+ * @param {object} item - APO item the work was logged against
+ * @param {number} expenditure - Logged expenditure
+ */
+export async function recordWorkLog(db, apo, item, expenditure) {
+  await record('recordWorkLog', async () => {
+    const update = emptyUpdate()
+    update.$inc.expenditure = expenditure
+    addActivity(update, item.activity_name || 'Unknown', { spent: expenditure }, Date.now())
+    await applyUpdate(db, await apoScopes(db, apo), apo.financial_year, update)
+  })
+}
+
+/**
+ * Record a newly created plantation
+ * @param {Db} db - MongoDB database instance
+ * @param {object} plantation - Inserted plantation
+ */
+export async function recordPlantationCreated(db, plantation) {
+  await record('recordPlantationCreated', async () => {
+    const update = emptyUpdate()
+    update.$inc.plantation_count = 1
+    update.$inc.area_ha = plantation.total_area_ha || 0
+    await applyUpdate(db, scopesForRange(await getMasterMap(db, 'ranges'), plantation.range_id), null, update)
+  })
+}
+
+/**
+ * Record a fund indent that reached final approval
+ * @param {Db} db - MongoDB database instance
+ * @param {object} indent - Fund indent
+ */
+export async function recordFundIndentApproved(db, indent) {
+  await record('recordFundIndentApproved', async () => {
+    const apo = await db.collection('apo_headers').findOne({ id: indent.apo_id }, { projection: { _id: 0, created_by: 1, financial_year: 1 } })
+    if (!apo) return
+    const [totals] = await db.collection('apo_items').aggregate([
+      { $match: { fund_indent_id: indent.id, fund_indent_status: { $ne: 'REJECTED' } } },
+      { $group: { _id: null, amount: { $sum: '$total_cost' } } },
+    ]).toArray()
+    const update = emptyUpdate()
+    update.$inc.fund_indents_approved = 1
+    update.$inc.fund_indent_approved_amount = totals?.amount || 0
+    await applyUpdate(db, await apoScopes(db, apo), apo.financial_year, update)
+  })
+}
+
+let ensuring = null
+
+/**
+ * Build the rollups once if the collection is empty (first start after upgrade)
+ * @param {Db} db - MongoDB database instance
+ */
+export async function ensureRollups(db) {
+  if (!ensuring) {
+    ensuring = db.collection(ROLLUP_COLLECTION).countDocuments({}, { limit: 1 })
+      .then(count => (count === 0 ? rebuildRollups(db) : null))
+      .catch(error => {
+        ensuring = null
+        logError(error, { context: 'ensureRollups' })
+      })
+  }
+  await ensuring
+}
+
+/**
+ * Read the rollup rows behind one dashboard
+ * @param {Db} db - MongoDB database instance
+ * @param {string} scope - Result of dashboardScope
+ * @param {string|null} financialYear - Financial year, or null for all years
+ * @returns {object} { apos, plantations } rows (either may be null); the same row without a year
+ */
+export async function getRollup(db, scope, financialYear = null) {
+  const apoId = rollupId(scope, financialYear || ALL_YEARS)
+  const allId = rollupId(scope, ALL_YEARS)
+  const rows = await db.collection(ROLLUP_COLLECTION).find({ _id: { $in: [...new Set([apoId, allId])] } }).toArray()
+  const byId = {}
+  rows.forEach(row => { byId[row._id] = row })
+  return { apos: byId[apoId] || null, plantations: byId[allId] || null }
+}
+
+function emptyRow(scope, financialYear) {
+  return {
+    _id: rollupId(scope, financialYear),
+    scope,
+    financial_year: financialYear,
+    apo_count: {},
+    apo_amount: {},
+    expenditure: 0,
+    activities: {},
+    plantation_count: 0,
+    area_ha: 0,
+    fund_indents_approved: 0,
+    fund_indent_approved_amount: 0,
+  }
+}
+
+// Numeric leaves of a row by path; names, order and bookkeeping fields are not compared
+function numericLeaves(row, prefix = '', out = {}) {
+  for (const [key, value] of Object.entries(row || {})) {
+    if (!prefix && ['_id', 'scope', 'financial_year', 'updated_at'].includes(key)) continue
+    if (prefix.startsWith('activities.') && key === 'order') continue
+    if (typeof value === 'number') out[prefix + key] = value
+    else if (value && typeof value === 'object' && !(value instanceof Date)) numericLeaves(value, `${prefix}${key}.`, out)
+  }
+  return out
+}
+
+/**
+ * Compare a stored row with its recomputed value
+ * @param {object|null} stored - Row in dashboard_rollups
+ * @param {object} expected - Recomputed row
+ * @returns {array} [{ path, stored, expected }] for every numeric field that differs
+ */
+export function diffRollup(stored, expected) {
+  const a = numericLeaves(stored)
+  const b = numericLeaves(expected)
+  const diffs = []
+  new Set([...Object.keys(a), ...Object.keys(b)]).forEach(path => {
+    const have = a[path] || 0
+    const want = b[path] || 0
+    if (Math.abs(have - want) > DRIFT_TOLERANCE) diffs.push({ path, stored: have, expected: want })
+  })
+  return diffs
+}
+
+/**
+ * Recompute every rollup row from the source collections
+ * @param {Db} db - MongoDB database instance
+ * @param {object} options
+ * @param {boolean} options.dryRun - Only report drift, do not write
+ * @returns {object} { rows, drifted, drift (first 50 rows), applied }
+ */
+export async function rebuildRollups(db, { dryRun = false } = {}) {
+  const rangeMap = await getMasterMap(db, 'ranges')
+  const users = await db.collection('users').find({}, { projection: { _id: 0, id: 1, range_id: 1 } }).toArray()
+  const userRange = {}
+  users.forEach(u => { userRange[u.id] = u.range_id })
+
+  const rows = new Map()
+  const forEachRow = (scopes, financialYear, fn) => {
+    const years = financialYear ? [financialYear, ALL_YEARS] : [ALL_YEARS]
+    scopes.forEach(scope => years.forEach(year => {
+      const id = rollupId(scope, year)
+      if (!rows.has(id)) rows.set(id, emptyRow(scope, year))
+      fn(rows.get(id))
+    }))
+  }
+  const creatorScopes = (userId) => scopesForRange(rangeMap, userRange[userId])
+
+  const [apoGroups, activityGroups, plantationGroups, indentGroups] = await Promise.all([
+    db.collection('apo_headers').aggregate([
+      {
+        $group: {
+          _id: { created_by: '$created_by', financial_year: '$financial_year', status: '$status' },
+          count: { $sum: 1 },
+          amount: { $sum: { $ifNull: ['$total_sanctioned_amount', 0] } },
+        }
+      },
+    ]).toArray(),
+    db.collection('apo_headers').aggregate([
+      { $match: { status: 'SANCTIONED' } },
+      { $lookup: { from: 'apo_items', localField: 'id', foreignField: 'apo_id', as: 'item' } },
+      { $unwind: '$item' },
+      { $replaceRoot: { newRoot: { $mergeObjects: ['$item', { apo_created_by: '$created_by', apo_financial_year: '$financial_year' }] } } },
+      ITEM_SPENT_LOOKUP,
+      {
+        $group: {
+          _id: { created_by: '$apo_created_by', financial_year: '$apo_financial_year', activity: { $ifNull: ['$activity_name', 'Unknown'] } },
+          sanctioned: { $sum: '$total_cost' },
+          spent: { $sum: { $sum: '$logs.spent' } },
+          first_item: { $min: '$_id' },
+        }
+      },
+      { $sort: { first_item: 1 } },
+    ]).toArray(),
+    db.collection('plantations').aggregate([
+      { $group: { _id: '$range_id', count: { $sum: 1 }, area: { $sum: '$total_area_ha' } } },
+    ]).toArray(),
+    db.collection('fund_indents').aggregate([
+      { $match: { status: 'APPROVED' } },
+      { $lookup: { from: 'apo_headers', localField: 'apo_id', foreignField: 'id', as: 'apo' } },
+      { $unwind: '$apo' },
+      {
+        $lookup: {
+          from: 'apo_items',
+          let: { indentId: '$id' },
+          pipeline: [
+            { $match: { $expr: { $and: [{ $eq: ['$fund_indent_id', '$$indentId'] }, { $ne: ['$fund_indent_status', 'REJECTED'] }] } } },
+            { $group: { _id: null, amount: { $sum: '$total_cost' } } },
+          ],
+          as: 'items',
+        }
+      },
+      {
+        $group: {
+          _id: { created_by: '$apo.created_by', financial_year: '$apo.financial_year' },
+          count: { $sum: 1 },
+          amount: { $sum: { $sum: '$items.amount' } },
+        }
+      },
+    ]).toArray(),
+  ])
+
+  apoGroups.forEach(({ _id: { created_by, financial_year, status }, count, amount }) => {
+    forEachRow(creatorScopes(created_by), financial_year, row => {
+      row.apo_count[status] = (row.apo_count[status] || 0) + count
+      row.apo_amount[status] = (row.apo_amount[status] || 0) + amount
+    })
+  })
+  activityGroups.forEach(({ _id: { created_by, financial_year, activity }, sanctioned, spent }, order) => {
+    forEachRow(creatorScopes(created_by), financial_year, row => {
+      const key = activityKey(activity)
+      const entry = row.activities[key] || (row.activities[key] = { name: activity, sanctioned: 0, spent: 0, order })
+      entry.sanctioned += sanctioned
+      entry.spent += spent
+      row.expenditure += spent
+    })
+  })
+  plantationGroups.forEach(({ _id: rangeId, count, area }) => {
+    forEachRow(scopesForRange(rangeMap, rangeId), null, row => {
+      row.plantation_count += count
+      row.area_ha += area
+    })
+  })
+  indentGroups.forEach(({ _id: { created_by, financial_year }, count, amount }) => {
+    forEachRow(creatorScopes(created_by), financial_year, row => {
+      row.fund_indents_approved += count
+      row.fund_indent_approved_amount += amount
+    })
+  })
+
+  const stored = {}
+  const existing = await db.collection(ROLLUP_COLLECTION).find({}).toArray()
+  existing.forEach(row => { stored[row._id] = row })
+
+  const drift = []
+  rows.forEach((row, id) => {
+    const diffs = diffRollup(stored[id], row)
+    if (diffs.length > 0) drift.push({ _id: id, diffs })
+  })
+  existing.forEach(row => {
+    if (!rows.has(row._id)) {
+      const diffs = diffRollup(row, emptyRow(row.scope, row.financial_year))
+      if (diffs.length > 0) drift.push({ _id: row._id, diffs })
+    }
+  })
+
+  if (!dryRun) {
+    const now = new Date()
+    const ids = [...rows.keys()]
+    if (ids.length > 0) {
+      await db.collection(ROLLUP_COLLECTION).bulkWrite(
+        [...rows.values()].map(row => ({ replaceOne: { filter: { _id: row._id }, replacement: { ...row, updated_at: now }, upsert: true } })),
+        { ordered: false }
+      )
+    }
+    await db.collection(ROLLUP_COLLECTION).deleteMany({ _id: { $nin: ids } })
+  }
+
+  return { rows: rows.size, drifted: drift.length, drift: drift.slice(0, 50), applied: !dryRun }
+}
+
+export default {
+  ROLLUP_COLLECTION,
+  ALL_YEARS,
+  ORG_SCOPE,
+  rollupId,
+  dashboardScope,
+  activityKey,
+  recordApoCreated,
+  recordApoStatusChange,
+  recordApoAmountChange,
+  recordWorkLog,
+  recordPlantationCreated,
+  recordFundIndentApproved,
+  ensureRollups,
+  getRollup,
+  diffRollup,
+  rebuildRollups
+}
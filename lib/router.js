@@ -0,0 +1,104 @@
+/**
+ * Router Module
+ * Compiled route table for the API catch-all handler
+ *
+ * Static paths are resolved with a single Map lookup keyed by
+ * "METHOD /path". Parameterised paths (e.g. /apo/:id/approve) live in a
+ * segment trie; literal segments take precedence over parameters, with
+ * backtracking, so /fund-indent/pending never resolves to /fund-indent/:id.
+ * Routes registered with { db: false } are dispatched without a database
+ * connection, so they keep answering while MongoDB is unreachable.
+ */
+
+function createNode() {
+  return { children: new Map(), param: null, handlers: new Map() }
+}
+
+function splitPath(path) {
+  return path.split('/').filter(Boolean)
+}
+
+export class Router {
+  constructor() {
+    this.staticRoutes = new Map()
+    this.root = createNode()
+    this.routes = []
+  }
+
+  /**
+   * Register a handler
+   * @param {string} method - HTTP method
+   * @param {string} pattern - Path pattern, parameters prefixed with ':'
+   * @param {function} handler - Async handler (request, { db, params, route })
+   * @param {object} options
+   * @param {boolean} options.db - Whether the handler needs a database connection (default true)
+   * @returns {Router} This router, for chaining
+   */
+  add(method, pattern, handler, { db = true } = {}) {
+    const route = { method, pattern, handler, usesDb: db, paramNames: [] }
+    this.routes.push(route)
+
+    if (!pattern.includes(':')) {
+      const key = `${method} /${splitPath(pattern).join('/')}`
+      if (this.staticRoutes.has(key)) throw new Error(`Duplicate route ${key}`)
+      this.staticRoutes.set(key, route)
+      return this
+    }
+
+    let node = this.root
+    for (const segment of splitPath(pattern)) {
+      if (segment.startsWith(':')) {
+        if (!node.param) node.param = createNode()
+        route.paramNames.push(segment.slice(1))
+        node = node.param
+      } else {
+        if (!node.children.has(segment)) node.children.set(segment, createNode())
+        node = node.children.get(segment)
+      }
+    }
+    if (node.handlers.has(method)) throw new Error(`Duplicate route ${method} ${pattern}`)
+    node.handlers.set(method, route)
+    return this
+  }
+
+  /**
+   * Resolve a request path
+   * @param {string} method - HTTP method
+   * @param {string} path - Request path, e.g. "/apo/abc/approve"
+   * @returns {object|null} { handler, params, pattern, usesDb } or null if no route matches
+   */
+  match(method, path) {
+    const segments = splitPath(path)
+    const staticRoute = this.staticRoutes.get(`${method} /${segments.join('/')}`)
+    if (staticRoute) {
+      return { handler: staticRoute.handler, params: {}, pattern: staticRoute.pattern, usesDb: staticRoute.usesDb }
+    }
+
+    const values = []
+    const route = this._walk(this.root, segments, 0, method, values)
+    if (!route) return null
+    const params = {}
+    route.paramNames.forEach((name, i) => { params[name] = values[i] })
+    return { handler: route.handler, params, pattern: route.pattern, usesDb: route.usesDb }
+  }
+
+  _walk(node, segments, index, method, values) {
+    if (index === segments.length) {
+      return node.handlers.get(method) || null
+    }
+    const child = node.children.get(segments[index])
+    if (child) {
+      const found = this._walk(child, segments, index + 1, method, values)
+      if (found) return found
+    }
+    if (node.param) {
+      values.push(segments[index])
+      const found = this._walk(node.param, segments, index + 1, method, values)
+      if (found) return found
+      values.pop()
+    }
+    return null
+  }
+}
+
+export default Router
@@ -0,0 +1,597 @@
+/**
+ * APO Routes
+ * Annual Plan of Operations: drafts, CRUD, approval workflow and item estimates
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId } from '../helpers'
+import { getSessionUser } from '../auth'
+import { getMasterDoc, getMasterMap } from '../masterData'
+import { getPageParams, findPage, pageBody } from '../pagination'
+import { getFieldSelection, wantsField, projectionOptions, pickFields } from '../projection'
+import { recordApoCreated, recordApoStatusChange } from '../rollups'
+import { parseRevisedQty, reviseItemQuantity } from '../revisedTotals'
+import { getPlantationDraft, getBuildingDraft, getNurseryDraft, draftExpenseType } from '../normResolver'
+
+// Upper bound on the assets of one /apo/generate-drafts call
+const MAX_DRAFT_ASSETS = parseInt(process.env.MAX_DRAFT_ASSETS) || 2000
+
+// Asset collections of /apo/generate-drafts: request field, draft builder and per-item extras
+const DRAFT_SOURCES = [
+  { type: 'plantation', ids: 'plantation_ids', collection: 'plantations', build: getPlantationDraft, extra: draft => ({ plantation_age: draft.age }) },
+  { type: 'building', ids: 'building_ids', collection: 'buildings', build: getBuildingDraft, extra: draft => ({ building_phase: draft.building_phase }) },
+  { type: 'nursery', ids: 'nursery_ids', collection: 'nurseries', build: getNurseryDraft, extra: draft => ({ nursery_type: draft.nursery_type }) },
+]
+
+/**
+ * POST /apo/generate-draft - Generate draft items for a plantation from the age-based norms
+ */
+export async function generateApoDraft(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const body = await request.json()
+  const { plantation_id, financial_year } = body
+  if (!plantation_id || !financial_year) {
+    return handleCORS(NextResponse.json({ error: 'plantation_id and financial_year required' }, { status: 400 }))
+  }
+
+  const plantation = await db.collection('plantations').findOne({ id: plantation_id })
+  if (!plantation) return handleCORS(NextResponse.json({ error: 'Plantation not found' }, { status: 404 }))
+
+  return handleCORS(NextResponse.json(await getPlantationDraft(db, plantation, financial_year)))
+}
+
+/**
+ * POST /apo/generate-drafts - Draft items for many plantations, buildings and nurseries at once
+ * Body: { financial_year, plantation_ids, building_ids, nursery_ids }. Items come back split
+ * into CAPEX and REVEX in selection order, ready for POST /apo; unknown ids are listed in missing.
+ */
+export async function generateApoDrafts(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const body = await request.json()
+  const { financial_year } = body
+  const selections = DRAFT_SOURCES.map(source => ({
+    source,
+    ids: Array.isArray(body[source.ids]) ? [...new Set(body[source.ids])] : [],
+  }))
+  const assetCount = selections.reduce((sum, s) => sum + s.ids.length, 0)
+  if (!financial_year || assetCount === 0) {
+    return handleCORS(NextResponse.json({ error: 'financial_year and at least one plantation, building or nursery id required' }, { status: 400 }))
+  }
+  if (assetCount > MAX_DRAFT_ASSETS) {
+    return handleCORS(NextResponse.json({ error: `At most ${MAX_DRAFT_ASSETS} assets per request` }, { status: 400 }))
+  }
+
+  // One $in query per asset collection, all in parallel
+  const loaded = await Promise.all(selections.map(({ source, ids }) => ids.length === 0 ? [] :
+    db.collection(source.collection).find({ id: { $in: ids } }, { projection: { _id: 0 } }).toArray()
+  ))
+
+  const capexItems = []
+  const revexItems = []
+  const drafts = []
+  const missing = {}
+  for (const [i, { source, ids }] of selections.entries()) {
+    const byId = new Map(loaded[i].map(doc => [doc.id, doc]))
+    missing[source.collection] = ids.filter(id => !byId.has(id))
+    const assets = ids.filter(id => byId.has(id)).map(id => byId.get(id))
+    const built = await Promise.all(assets.map(asset => source.build(db, asset, financial_year)))
+
+    built.forEach((draft, j) => {
+      const asset = assets[j]
+      const expenseType = draftExpenseType(source.type, draft)
+      const target = expenseType === 'CAPEX' ? capexItems : revexItems
+      draft.items.forEach(item => target.push({
+        ...item,
+        sanctioned_qty: item.suggested_qty,
+        source_type: source.type,
+        source_id: asset.id,
+        source_name: asset.name,
+        expense_type: expenseType,
+        ...source.extra(draft),
+      }))
+      drafts.push({
+        source_type: source.type,
+        source_id: asset.id,
+        source_name: asset.name,
+        expense_type: expenseType,
+        item_count: draft.items.length,
+        total_estimated_cost: draft.total_estimated_cost,
+      })
+    })
+  }
+
+  const capexTotal = capexItems.reduce((sum, i) => sum + i.total_cost, 0)
+  const revexTotal = revexItems.reduce((sum, i) => sum + i.total_cost, 0)
+  return handleCORS(NextResponse.json({
+    financial_year,
+    capex_items: capexItems,
+    revex_items: revexItems,
+    capex_total: capexTotal,
+    revex_total: revexTotal,
+    total_estimated_cost: capexTotal + revexTotal,
+    drafts,
+    missing,
+  }))
+}
+
+/**
+ * POST /apo - Create an APO (DO only)
+ * Compiles CapEx/RevEx items from plantations, buildings and nurseries.
+ * Workflow: DO creates → ED approves → MD final approval
+ */
+export async function createApo(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  // Only DO (Division Officer) can create APOs
+  if (!['DO', 'DM', 'ADMIN'].includes(user.role)) {
+    return handleCORS(NextResponse.json({ error: 'Only Division Officers (DO) can create APOs' }, { status: 403 }))
+  }
+
+  const body = await request.json()
+  const { financial_year, title, status, capex_items, revex_items, plantation_items, building_items, nursery_items } = body
+
+  const apoId = generateId()
+
+  // Process all items with expense type classification
+  const processedItems = []
+
+  // Process CapEx items (plantations age 1-7, building creation, all nurseries)
+  const allCapexItems = capex_items || []
+  allCapexItems.forEach(item => {
+    processedItems.push({
+      id: generateId(),
+      apo_id: apoId,
+      activity_id: item.activity_id,
+      activity_name: item.activity_name,
+      sanctioned_qty: parseFloat(item.sanctioned_qty),
+      sanctioned_rate: parseFloat(item.sanctioned_rate),
+      total_cost: parseFloat(item.sanctioned_qty) * parseFloat(item.sanctioned_rate),
+      unit: item.unit,
+      expense_type: 'CAPEX',
+      source_type: item.source_type || 'plantation', // plantation, building, nursery
+      source_id: item.source_id,
+      source_name: item.source_name,
+    })
+  })
+
+  // Process RevEx items (plantations age 8+, building maintenance)
+  const allRevexItems = revex_items || []
+  allRevexItems.forEach(item => {
+    processedItems.push({
+      id: generateId(),
+      apo_id: apoId,
+      activity_id: item.activity_id,
+      activity_name: item.activity_name,
+      sanctioned_qty: parseFloat(item.sanctioned_qty),
+      sanctioned_rate: parseFloat(item.sanctioned_rate),
+      total_cost: parseFloat(item.sanctioned_qty) * parseFloat(item.sanctioned_rate),
+      unit: item.unit,
+      expense_type: 'REVEX',
+      source_type: item.source_type || 'plantation',
+      source_id: item.source_id,
+      source_name: item.source_name,
+    })
+  })
+
+  // Calculate totals
+  const capexTotal = processedItems.filter(i => i.expense_type === 'CAPEX').reduce((sum, i) => sum + i.total_cost, 0)
+  const revexTotal = processedItems.filter(i => i.expense_type === 'REVEX').reduce((sum, i) => sum + i.total_cost, 0)
+  const totalAmount = capexTotal + revexTotal
+
+  const apoHeader = {
+    id: apoId,
+    financial_year,
+    title: title || 'Annual Plan of Operations',
+    status: status || 'DRAFT',
+    total_sanctioned_amount: totalAmount,
+    revised_total: totalAmount,
+    capex_total: capexTotal,
+    revex_total: revexTotal,
+    created_by: user.id,
+    division_id: user.division_id,
+    // Approval workflow: DRAFT → PENDING_ED_APPROVAL → PENDING_MD_APPROVAL → SANCTIONED
+    approved_by_ed: null,
+    approved_by_md: null,
+    ed_approved_at: null,
+    md_approved_at: null,
+    created_at: new Date(),
+    updated_at: new Date(),
+  }
+
+  await db.collection('apo_headers').insertOne(apoHeader)
+  if (processedItems.length > 0) {
+    await db.collection('apo_items').insertMany(processedItems)
+  }
+  await recordApoCreated(db, apoHeader)
+
+  const { _id, ...result } = apoHeader
+  return handleCORS(NextResponse.json({ ...result, items: processedItems.map(({ _id, ...i }) => i) }, { status: 201 }))
+}
+
+/**
+ * GET /apo?status=&limit=&after=&include_total=&fields= - List APOs visible to the current role
+ */
+export async function listApos(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  let filter = {}
+  if (user.role === 'RO') {
+    // RO can only see APOs - but they don't create them anymore
+    const range = await getMasterDoc(db, 'ranges', user.range_id)
+    if (range) {
+      filter = { division_id: range.division_id }
+    }
+  } else if (['DO', 'DM'].includes(user.role)) {
+    // DO/DM sees APOs in their division
+    filter = { division_id: user.division_id }
+  } else if (user.role === 'ED') {
+    // ED sees APOs pending their approval or already approved
+    filter = { status: { $in: ['PENDING_ED_APPROVAL', 'PENDING_MD_APPROVAL', 'SANCTIONED', 'REJECTED'] } }
+  } else if (user.role === 'MD') {
+    // MD sees APOs pending their approval or already approved
+    filter = { status: { $in: ['PENDING_MD_APPROVAL', 'SANCTIONED', 'REJECTED'] } }
+  }
+  // ADMIN sees all
+
+  const url = new URL(request.url)
+  const statusFilter = url.searchParams.get('status')
+  if (statusFilter) filter.status = statusFilter
+
+  const page = getPageParams(request)
+  const selection = getFieldSelection(request, 'apos')
+  const result = await findPage(db.collection('apo_headers'), filter, page, { sort: { created_at: -1 }, ...projectionOptions(selection) })
+
+  // Enrich - user names only when one of them was selected
+  const users = wantsField(selection, 'created_by_name', 'ed_approved_by_name', 'md_approved_by_name')
+    ? await db.collection('users').find({}, { projection: { _id: 0, id: 1, name: 1 } }).toArray()
+    : []
+  const divMap = await getMasterMap(db, 'divisions')
+  const userMap = {}
+  users.forEach(u => { userMap[u.id] = u })
+
+  const enriched = result.items.map(({ _id, ...a }) => pickFields({
+    ...a,
+    division_name: divMap[a.division_id]?.name || 'Unknown',
+    created_by_name: userMap[a.created_by]?.name || 'Unknown',
+    ed_approved_by_name: a.approved_by_ed ? userMap[a.approved_by_ed]?.name : null,
+    md_approved_by_name: a.approved_by_md ? userMap[a.approved_by_md]?.name : null,
+  }, selection))
+  return handleCORS(NextResponse.json(pageBody(page, enriched, result)))
+}
+
+/**
+ * GET /apo/:id?fields= - APO detail with items split into CapEx and RevEx
+ */
+export async function getApo(request, { db, params }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const apoId = params.id
+  const selection = getFieldSelection(request, 'apos')
+  const apo = await db.collection('apo_headers').findOne({ id: apoId }, projectionOptions(selection))
+  if (!apo) return handleCORS(NextResponse.json({ error: 'APO not found' }, { status: 404 }))
+
+  const items = wantsField(selection, 'items', 'capex_items', 'revex_items')
+    ? await db.collection('apo_items').find({ apo_id: apoId }).toArray()
+    : []
+
+  // Separate CapEx and RevEx items
+  const capexItems = items.filter(i => i.expense_type === 'CAPEX').map(({ _id, ...i }) => i)
+  const revexItems = items.filter(i => i.expense_type === 'REVEX').map(({ _id, ...i }) => i)
+
+  const { _id, ...apoData } = apo
+  return handleCORS(NextResponse.json(pickFields({
+    ...apoData,
+    items: items.map(({ _id, ...i }) => i),
+    capex_items: capexItems,
+    revex_items: revexItems,
+  }, selection)))
+}
+
+/**
+ * PATCH /apo/:id/approve - ED and MD approval workflow
+ */
+export async function approveApo(request, { db, params }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const apoId = params.id
+  const apo = await db.collection('apo_headers').findOne({ id: apoId })
+  if (!apo) return handleCORS(NextResponse.json({ error: 'APO not found' }, { status: 404 }))
+
+  const body = await request.json()
+  const { action, remarks } = body // action: 'approve' or 'reject'
+
+  let updateData = {}
+
+  if (user.role === 'ED') {
+    if (apo.status !== 'PENDING_ED_APPROVAL') {
+      return handleCORS(NextResponse.json({ error: 'APO is not pending ED approval' }, { status: 400 }))
+    }
+    if (action === 'approve') {
+      updateData = {
+        status: 'PENDING_MD_APPROVAL',
+        approved_by_ed: user.id,
+        ed_approved_at: new Date(),
+        ed_remarks: remarks || null,
+        updated_at: new Date(),
+      }
+    } else {
+      updateData = {
+        status: 'REJECTED',
+        rejected_by: user.id,
+        rejected_at: new Date(),
+        rejection_remarks: remarks || null,
+        updated_at: new Date(),
+      }
+    }
+  } else if (user.role === 'MD') {
+    if (apo.status !== 'PENDING_MD_APPROVAL') {
+      return handleCORS(NextResponse.json({ error: 'APO is not pending MD approval' }, { status: 400 }))
+    }
+    if (action === 'approve') {
+      updateData = {
+        status: 'SANCTIONED',
+        approved_by_md: user.id,
+        md_approved_at: new Date(),
+        md_remarks: remarks || null,
+        updated_at: new Date(),
+      }
+    } else {
+      updateData = {
+        status: 'REJECTED',
+        rejected_by: user.id,
+        rejected_at: new Date(),
+        rejection_remarks: remarks || null,
+        updated_at: new Date(),
+      }
+    }
+  } else {
+    return handleCORS(NextResponse.json({ error: 'Only ED and MD can approve APOs' }, { status: 403 }))
+  }
+
+  // Conditional on the status we validated, so a concurrent approval cannot apply twice
+  const { matchedCount } = await db.collection('apo_headers').updateOne({ id: apoId, status: apo.status }, { $set: updateData })
+  if (matchedCount === 0) {
+    return handleCORS(NextResponse.json({ error: 'APO status changed concurrently, reload and retry' }, { status: 409 }))
+  }
+  await recordApoStatusChange(db, apo, updateData.status)
+
+  const updatedApo = await db.collection('apo_headers').findOne({ id: apoId })
+  const { _id, ...result } = updatedApo
+  return handleCORS(NextResponse.json(result))
+}
+
+/**
+ * PATCH /apo/:id/status - Move an APO through DO → ED → MD
+ */
+export async function updateApoStatus(request, { db, params }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const apoId = params.id
+  const body = await request.json()
+  const { status, comment } = body
+
+  const apo = await db.collection('apo_headers').findOne({ id: apoId })
+  if (!apo) return handleCORS(NextResponse.json({ error: 'APO not found' }, { status: 404 }))
+
+  // Updated APO Approval Hierarchy: DO → ED → MD
+  // DRAFT → PENDING_ED_APPROVAL (DO submits to ED)
+  // PENDING_ED_APPROVAL → PENDING_MD_APPROVAL (ED approves, forwards to MD)
+  // PENDING_ED_APPROVAL → REJECTED (ED rejects)
+  // PENDING_MD_APPROVAL → SANCTIONED (MD final approval)
+  // PENDING_MD_APPROVAL → REJECTED (MD rejects)
+  // REJECTED → DRAFT (DO can revise and resubmit)
+
+  const validTransitions = {
+    'DRAFT': ['PENDING_ED_APPROVAL'],
+    'PENDING_ED_APPROVAL': ['PENDING_MD_APPROVAL', 'REJECTED'],
+    'PENDING_MD_APPROVAL': ['SANCTIONED', 'REJECTED'],
+    'REJECTED': ['DRAFT'],
+    // Legacy support for old status
+    'PENDING_APPROVAL': ['PENDING_ED_APPROVAL', 'SANCTIONED', 'REJECTED'],
+    'PENDING_DM_APPROVAL': ['PENDING_ED_APPROVAL', 'REJECTED'], // Migration path
+  }
+
+  if (!validTransitions[apo.status]?.includes(status)) {
+    return handleCORS(NextResponse.json({
+      error: `Invalid transition from ${apo.status} to ${status}`,
+      hint: `Valid transitions from ${apo.status}: ${validTransitions[apo.status]?.join(', ') || 'none'}`
+    }, { status: 400 }))
+  }
+
+  // Role-based permissions for status changes
+  // DO can: DRAFT → PENDING_ED_APPROVAL, REJECTED → DRAFT
+  // ED can: PENDING_ED_APPROVAL → PENDING_MD_APPROVAL, PENDING_ED_APPROVAL → REJECTED
+  // MD can: PENDING_MD_APPROVAL → SANCTIONED, PENDING_MD_APPROVAL → REJECTED
+
+  if (status === 'PENDING_ED_APPROVAL') {
+    if (!['DO', 'DM', 'ADMIN'].includes(user.role)) {
+      return handleCORS(NextResponse.json({ error: 'Only Division Officer can submit APO for ED approval' }, { status: 403 }))
+    }
+  }
+
+  if (status === 'PENDING_MD_APPROVAL') {
+    if (!['ED', 'ADMIN'].includes(user.role)) {
+      return handleCORS(NextResponse.json({ error: 'Only Executive Director can forward APO to MD' }, { status: 403 }))
+    }
+  }
+
+  if (status === 'SANCTIONED') {
+    if (!['MD', 'ADMIN'].includes(user.role)) {
+      return handleCORS(NextResponse.json({ error: 'Only Managing Director can give final sanction to APO' }, { status: 403 }))
+    }
+  }
+
+  if (status === 'REJECTED') {
+    // ED can reject from PENDING_ED_APPROVAL, MD can reject from PENDING_MD_APPROVAL
+    if (apo.status === 'PENDING_ED_APPROVAL' && !['ED', 'ADMIN'].includes(user.role)) {
+      return handleCORS(NextResponse.json({ error: 'Only ED can reject at ED approval stage' }, { status: 403 }))
+    }
+    if (apo.status === 'PENDING_MD_APPROVAL' && !['MD', 'ADMIN'].includes(user.role)) {
+      return handleCORS(NextResponse.json({ error: 'Only MD can reject at MD approval stage' }, { status: 403 }))
+    }
+  }
+
+  const updateData = {
+    status,
+    updated_at: new Date(),
+    rejection_comment: status === 'REJECTED' ? (comment || null) : undefined,
+  }
+
+  // Track who approved/rejected at each stage
+  if (status === 'PENDING_MD_APPROVAL') {
+    updateData.approved_by_ed = user.id
+    updateData.ed_approved_at = new Date()
+  }
+  if (status === 'SANCTIONED') {
+    updateData.approved_by_md = user.id
+    updateData.md_approved_at = new Date()
+    updateData.approved_by = user.id // Legacy field
+  }
+  if (status === 'REJECTED') {
+    updateData.rejected_by = user.id
+    updateData.rejected_at = new Date()
+  }
+
+  // Clean undefined fields
+  Object.keys(updateData).forEach(key => updateData[key] === undefined && delete updateData[key])
+
+  const { matchedCount } = await db.collection('apo_headers').updateOne({ id: apoId, status: apo.status }, { $set: updateData })
+  if (matchedCount === 0) {
+    return handleCORS(NextResponse.json({ error: 'APO status changed concurrently, reload and retry' }, { status: 409 }))
+  }
+  await recordApoStatusChange(db, apo, status)
+
+  const statusMessages = {
+    'PENDING_ED_APPROVAL': 'APO submitted to Executive Director for approval',
+    'PENDING_MD_APPROVAL': 'APO approved by ED, forwarded to Managing Director',
+    'SANCTIONED': 'APO sanctioned by Managing Director',
+    'REJECTED': 'APO rejected',
+    'DRAFT': 'APO returned to draft for revision',
+  }
+
+  return handleCORS(NextResponse.json({
+    message: statusMessages[status] || `APO status changed to ${status}`,
+    apo_id: apoId,
+    new_status: status,
+    approved_by: user.name,
+    approved_by_role: user.role
+  }))
+}
+
+/**
+ * PATCH /apo/items/:id/estimate - Update revised_qty
+ * The APO's revised_total moves by the item's cost delta in a conditional update that
+ * fails when it would exceed total_sanctioned_amount; the item update is conditional on
+ * the revised_qty read, so concurrent edits of one line return 409 instead of drifting.
+ */
+export async function updateItemEstimate(request, { db, params }) {
+  const itemId = params.id
+  const body = await request.json()
+  const { revised_qty, user_role } = body
+
+  const item = await db.collection('apo_items').findOne({ id: itemId })
+  if (!item) {
+    return handleCORS(NextResponse.json({ error: 'Item not found' }, { status: 404 }))
+  }
+
+  // Get the APO for budget validation
+  const apo = await db.collection('apo_headers').findOne({ id: item.apo_id }, { projection: { _id: 0, id: 1, revised_total: 1 } })
+  if (!apo) {
+    return handleCORS(NextResponse.json({ error: 'APO not found' }, { status: 404 }))
+  }
+
+  // RBAC: Only CASE_WORKER_ESTIMATES can update, and only if DRAFT or REJECTED
+  if (user_role === 'PLANTATION_SUPERVISOR') {
+    return handleCORS(NextResponse.json({ error: 'Supervisors cannot edit quantities. Only approval allowed.' }, { status: 403 }))
+  }
+
+  const currentStatus = item.estimate_status || 'DRAFT'
+  if (user_role === 'CASE_WORKER_ESTIMATES' && !['DRAFT', 'REJECTED'].includes(currentStatus)) {
+    return handleCORS(NextResponse.json({ error: 'Cannot edit items that are already submitted or approved.' }, { status: 403 }))
+  }
+
+  const revisedQty = parseRevisedQty(revised_qty)
+  if (revisedQty === null) {
+    return handleCORS(NextResponse.json({ error: 'revised_qty must be a non-negative number' }, { status: 400 }))
+  }
+
+  const outcome = await reviseItemQuantity(db, item, apo, revisedQty)
+  if (outcome.overBudget) {
+    return handleCORS(NextResponse.json({
+      error: `Total cost ₹${Math.round(outcome.revised_total)} exceeds sanctioned amount ₹${outcome.total_sanctioned_amount}`
+    }, { status: 400 }))
+  }
+  if (outcome.conflict === 'apo') {
+    return handleCORS(NextResponse.json({ error: 'APO changed concurrently, reload and retry' }, { status: 409 }))
+  }
+  if (outcome.conflict === 'item') {
+    return handleCORS(NextResponse.json({ error: 'Item changed concurrently, reload and retry' }, { status: 409 }))
+  }
+  return handleCORS(NextResponse.json(outcome.item))
+}
+
+/**
+ * PATCH /apo/items/:id/status - Update estimate_status
+ */
+export async function updateItemStatus(request, { db, params }) {
+  const itemId = params.id
+  const body = await request.json()
+  const { status, user_role } = body
+
+  const item = await db.collection('apo_items').findOne({ id: itemId })
+  if (!item) {
+    return handleCORS(NextResponse.json({ error: 'Item not found' }, { status: 404 }))
+  }
+
+  const currentStatus = item.estimate_status || 'DRAFT'
+
+  if (user_role === 'CASE_WORKER_ESTIMATES') {
+    if (status !== 'SUBMITTED') {
+      return handleCORS(NextResponse.json({ error: 'Case workers can only Submit items.' }, { status: 403 }))
+    }
+    if (!['DRAFT', 'REJECTED'].includes(currentStatus)) {
+      return handleCORS(NextResponse.json({ error: 'Can only submit Draft or Rejected items.' }, { status: 403 }))
+    }
+  } else if (user_role === 'PLANTATION_SUPERVISOR') {
+    if (!['APPROVED', 'REJECTED'].includes(status)) {
+      return handleCORS(NextResponse.json({ error: 'Supervisors can only Approve or Reject.' }, { status: 403 }))
+    }
+    if (currentStatus !== 'SUBMITTED') {
+      return handleCORS(NextResponse.json({ error: 'Can only review Submitted items.' }, { status: 403 }))
+    }
+  }
+
+  await db.collection('apo_items').updateOne(
+    { id: itemId },
+    { $set: { estimate_status: status, updated_at: new Date() } }
+  )
+
+  const updatedItem = await db.collection('apo_items').findOne({ id: itemId })
+  const { _id, ...result } = updatedItem
+  return handleCORS(NextResponse.json(result))
+}
+
+/**
+ * Register apo routes
+ * @param {Router} router - Router to register on
+ */
+export function registerApoRoutes(router) {
+  router.add('POST', '/apo/generate-draft', generateApoDraft)
+  router.add('POST', '/apo/generate-drafts', generateApoDrafts)
+  router.add('POST', '/apo', createApo)
+  router.add('GET', '/apo', listApos)
+  router.add('GET', '/apo/:id', getApo)
+  router.add('PATCH', '/apo/:id/approve', approveApo)
+  router.add('PATCH', '/apo/:id/status', updateApoStatus)
+  router.add('PATCH', '/apo/items/:id/estimate', updateItemEstimate)
+  router.add('PATCH', '/apo/items/:id/status', updateItemStatus)
+}
@@ -0,0 +1,59 @@
+/**
+ * Auth Routes
+ * Login, current user and logout
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId } from '../helpers'
+import { getBearerToken, getUserProfile } from '../auth'
+import { invalidateToken } from '../authCache'
+
+/**
+ * POST /auth/login - Exchange email/password for a session token
+ */
+export async function login(request, { db }) {
+  const body = await request.json()
+  const { email, password } = body
+  if (!email || !password) {
+    return handleCORS(NextResponse.json({ error: 'Email and password required' }, { status: 400 }))
+  }
+  const user = await db.collection('users').findOne({ email, password })
+  if (!user) {
+    return handleCORS(NextResponse.json({ error: 'Invalid credentials' }, { status: 401 }))
+  }
+  const token = generateId()
+  await db.collection('sessions').insertOne({ token, user_id: user.id, created_at: new Date() })
+  const { password: _, _id, ...userData } = user
+  return handleCORS(NextResponse.json({ token, user: userData }))
+}
+
+/**
+ * GET /auth/me - Current user with division and range names
+ */
+export async function getCurrentUser(request, { db }) {
+  const profile = await getUserProfile(db, getBearerToken(request))
+  if (!profile) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+  return handleCORS(NextResponse.json(profile))
+}
+
+/**
+ * POST /auth/logout - Delete the session for the bearer token
+ */
+export async function logout(request, { db }) {
+  const token = getBearerToken(request)
+  if (token) {
+    await db.collection('sessions').deleteOne({ token })
+    invalidateToken(token)
+  }
+  return handleCORS(NextResponse.json({ message: 'Logged out' }))
+}
+
+/**
+ * Register auth routes
+ * @param {Router} router - Router to register on
+ */
+export function registerAuthRoutes(router) {
+  router.add('POST', '/auth/login', login)
+  router.add('GET', '/auth/me', getCurrentUser)
+  router.add('POST', '/auth/logout', logout)
+}
@@ -0,0 +1,99 @@
+/**
+ * Bootstrap Routes
+ * Reference and registry sets a screen needs, fetched in one request
+ *
+ * Each set is served by its existing list handler, so role filtering and
+ * enrichment stay in one place. The combined body carries a content
+ * version that doubles as its ETag.
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { contentVersion, cachedJson } from '../httpCache'
+import { listPlantations } from './plantations'
+import { listBuildings, listBuildingActivities, listBuildingNorms } from './buildings'
+import { listNurseries, listNurseryActivities, listNurseryNorms } from './nurseries'
+import { listDivisions, listRanges, listDistricts, listActivities, listNorms } from './masters'
+
+/**
+ * Set name -> list handler and the query string it is called with
+ */
+export const BOOTSTRAP_SETS = {
+  plantations: { handler: listPlantations, query: 'fields=summary' },
+  buildings: { handler: listBuildings, query: 'fields=summary' },
+  nurseries: { handler: listNurseries, query: 'fields=summary' },
+  activities: { handler: listActivities },
+  norms: { handler: listNorms },
+  building_activities: { handler: listBuildingActivities },
+  building_norms: { handler: listBuildingNorms },
+  nursery_activities: { handler: listNurseryActivities },
+  nursery_norms: { handler: listNurseryNorms },
+  divisions: { handler: listDivisions },
+  ranges: { handler: listRanges },
+  districts: { handler: listDistricts },
+}
+
+/**
+ * Build the request a set's handler sees: same caller, its own query,
+ * and no If-None-Match so it always returns a body
+ * @param {Request} request - Bootstrap request
+ * @param {string} query - Query string for the set
+ * @returns {Request} Sub-request
+ */
+function setRequest(request, query) {
+  const url = new URL(request.url)
+  url.search = query || ''
+  const headers = new Headers(request.headers)
+  headers.delete('if-none-match')
+  return new Request(url.toString(), { method: 'GET', headers })
+}
+
+/**
+ * GET /bootstrap?sets=plantations,norms,... - Several list sets in one response
+ * (all sets when none are named)
+ */
+export async function getBootstrap(request, context) {
+  const url = new URL(request.url)
+  const param = url.searchParams.get('sets')
+  const names = param ? [...new Set(param.split(',').map(s => s.trim()).filter(Boolean))] : Object.keys(BOOTSTRAP_SETS)
+  const unknown = names.filter(name => !BOOTSTRAP_SETS[name])
+  if (unknown.length > 0) {
+    return handleCORS(NextResponse.json({
+      error: `Unknown sets: ${unknown.join(', ')}. Valid sets: ${Object.keys(BOOTSTRAP_SETS).join(', ')}`
+    }, { status: 400 }))
+  }
+
+  const responses = await Promise.all(names.map(name => {
+    const { handler, query } = BOOTSTRAP_SETS[name]
+    return handler(setRequest(request, query), context)
+  }))
+  if (responses.some(res => res.status === 401)) {
+    return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+  }
+
+  // Fill in request order so the content version does not depend on timing
+  const bodies = await Promise.all(responses.map(res => res.json()))
+  const sets = {}
+  const errors = {}
+  names.forEach((name, i) => {
+    if (responses[i].status === 200) sets[name] = bodies[i]
+    else errors[name] = bodies[i].error || `HTTP ${responses[i].status}`
+  })
+
+  const data = { version: contentVersion({ sets, errors }), sets }
+  if (Object.keys(errors).length > 0) data.errors = errors
+  return handleCORS(cachedJson(request, data, { scope: 'private', version: data.version }))
+}
+
+/**
+ * Register bootstrap routes
+ * @param {Router} router - Router to register on
+ */
+export function registerBootstrapRoutes(router) {
+  router.add('GET', '/bootstrap', getBootstrap)
+}
+
+export default {
+  BOOTSTRAP_SETS,
+  getBootstrap,
+  registerBootstrapRoutes
+}
@@ -0,0 +1,130 @@
+/**
+ * Building Routes
+ * Buildings module: registry, rate card and draft generation
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId } from '../helpers'
+import { getSessionUser } from '../auth'
+import { getMasterList, getMasterMap } from '../masterData'
+import { getPageParams, findPage, pageBody } from '../pagination'
+import { getFieldSelection, projectionOptions, pickFields } from '../projection'
+import { getBuildingDraft } from '../normResolver'
+import { cachedJson } from '../httpCache'
+
+/**
+ * GET /buildings?limit=&after=&include_total=&fields= - List all buildings (filtered by role)
+ */
+export async function listBuildings(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  let filter = {}
+  if (user.role === 'RO') {
+    filter = { range_id: user.range_id }
+  } else if (['DO', 'DM'].includes(user.role)) {
+    const divRanges = (await getMasterList(db, 'ranges')).filter(r => r.division_id === user.division_id)
+    const rangeIds = divRanges.map(r => r.id)
+    filter = { range_id: { $in: rangeIds } }
+  }
+  // ADMIN, ED, MD see all
+
+  const page = getPageParams(request)
+  const selection = getFieldSelection(request, 'buildings')
+  const result = await findPage(db.collection('buildings'), filter, page, projectionOptions(selection))
+  const rangeMap = await getMasterMap(db, 'ranges')
+  const divMap = await getMasterMap(db, 'divisions')
+
+  const enriched = result.items.map(({ _id, ...b }) => {
+    const range = rangeMap[b.range_id]
+    const division = range ? divMap[range.division_id] : null
+    const age = new Date().getFullYear() - b.year_of_creation
+    return pickFields({ ...b, range_name: range?.name, division_name: division?.name, age }, selection)
+  })
+  return handleCORS(cachedJson(request, pageBody(page, enriched, result), { scope: 'private' }))
+}
+
+/**
+ * POST /buildings - Create a new building (RO only)
+ */
+export async function createBuilding(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'RO') {
+    return handleCORS(NextResponse.json({ error: 'Only Range Officers can create buildings' }, { status: 403 }))
+  }
+  const body = await request.json()
+
+  const building = {
+    id: generateId(),
+    range_id: user.range_id,
+    name: body.name,
+    division: body.division || null,
+    district: body.district || null,
+    taluk: body.taluk || null,
+    year_of_creation: parseInt(body.year_of_creation),
+    latitude: body.latitude ? parseFloat(body.latitude) : null,
+    longitude: body.longitude ? parseFloat(body.longitude) : null,
+    survey_number: body.survey_number || null,
+    building_phase: body.building_phase || 'Creation',
+    status: body.status || 'Active',
+    created_at: new Date(),
+  }
+  await db.collection('buildings').insertOne(building)
+  return handleCORS(NextResponse.json(building, { status: 201 }))
+}
+
+/**
+ * GET /building-activities - List all building activities
+ */
+export async function listBuildingActivities(request, { db }) {
+  const activities = await getMasterList(db, 'building_activities')
+  return handleCORS(cachedJson(request, activities))
+}
+
+/**
+ * GET /building-norms - List all building norms with rates
+ */
+export async function listBuildingNorms(request, { db }) {
+  const norms = await getMasterList(db, 'building_norms')
+  const actMap = await getMasterMap(db, 'building_activities')
+
+  const enriched = norms.map(({ _id, ...n }) => ({
+    ...n,
+    activity_name: actMap[n.activity_id]?.name || 'Unknown',
+    category: actMap[n.activity_id]?.category || 'Unknown',
+    unit: actMap[n.activity_id]?.unit || 'Unknown',
+    ssr_no: actMap[n.activity_id]?.ssr_no || '-',
+  }))
+  return handleCORS(cachedJson(request, enriched))
+}
+
+/**
+ * POST /buildings/generate-draft - Generate draft items for a building
+ */
+export async function generateBuildingDraft(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const body = await request.json()
+  const { building_id, financial_year } = body
+  if (!building_id || !financial_year) {
+    return handleCORS(NextResponse.json({ error: 'building_id and financial_year required' }, { status: 400 }))
+  }
+
+  const building = await db.collection('buildings').findOne({ id: building_id })
+  if (!building) return handleCORS(NextResponse.json({ error: 'Building not found' }, { status: 404 }))
+
+  return handleCORS(NextResponse.json(await getBuildingDraft(db, building, financial_year)))
+}
+
+/**
+ * Register building routes
+ * @param {Router} router - Router to register on
+ */
+export function registerBuildingsRoutes(router) {
+  router.add('GET', '/buildings', listBuildings)
+  router.add('POST', '/buildings', createBuilding)
+  router.add('GET', '/building-activities', listBuildingActivities)
+  router.add('GET', '/building-norms', listBuildingNorms)
+  router.add('POST', '/buildings/generate-draft', generateBuildingDraft)
+}
@@ -0,0 +1,153 @@
+/**
+ * Dashboard Routes
+ * Role-scoped dashboard statistics
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { getSessionUser } from '../auth'
+import { getMasterList } from '../masterData'
+import { dashboardScope, ensureRollups, getRollup } from '../rollups'
+
+/**
+ * GET /dashboard/stats?financial_year= - Dashboard counters, budget chart and recent APOs
+ * Counters and the chart are read from the user's dashboard_rollups row (see lib/rollups.js).
+ */
+export async function getDashboardStats(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  let apoFilter = {}
+  let plantationFilter = {}
+
+  // Lists use the rollup's scope: APOs created by users of the RO's range / DM's division
+  let rangeIds = null
+  if (user.role === 'RO') {
+    rangeIds = [user.range_id]
+  } else if (user.role === 'DM') {
+    const divRanges = (await getMasterList(db, 'ranges')).filter(r => r.division_id === user.division_id)
+    rangeIds = divRanges.map(r => r.id)
+  }
+  if (rangeIds) {
+    const scopeUsers = await db.collection('users').find({ range_id: { $in: rangeIds } }, { projection: { _id: 0, id: 1 } }).toArray()
+    const userIds = scopeUsers.map(u => u.id)
+    apoFilter = { created_by: { $in: userIds } }
+    plantationFilter = { range_id: { $in: rangeIds } }
+  }
+
+  // Only the plantation names of the listed APOs are needed - join them in the database
+  const plantationLookup = {
+    $lookup: {
+      from: 'plantations',
+      let: { plantationId: '$plantation_id' },
+      pipeline: [
+        { $match: { ...plantationFilter, $expr: { $eq: ['$id', '$$plantationId'] } } },
+        { $project: { _id: 0, name: 1 } },
+      ],
+      as: 'plantation',
+    }
+  }
+  const listFields = { _id: 0, id: 1, plantation_id: 1, financial_year: 1, status: 1, total_sanctioned_amount: 1, total_amount: 1, created_at: 1, updated_at: 1 }
+
+  const url = new URL(request.url)
+  const financialYear = url.searchParams.get('financial_year')
+
+  // Totals come from the rollup rows; only the short recent/timeline lists are queried
+  await ensureRollups(db)
+  const [rollup, [apoLists]] = await Promise.all([
+    getRollup(db, dashboardScope(user), financialYear),
+    db.collection('apo_headers').aggregate([
+      { $match: financialYear ? { ...apoFilter, financial_year: financialYear } : apoFilter },
+      {
+        $facet: {
+          recent: [
+            { $sort: { created_at: -1, id: -1 } },
+            { $limit: 5 },
+            { $project: listFields },
+            plantationLookup,
+          ],
+          timeline: [
+            { $match: { status: { $ne: 'DRAFT' } } },
+            { $addFields: { activity_at: { $ifNull: ['$updated_at', '$created_at'] } } },
+            { $sort: { activity_at: -1, id: -1 } },
+            { $limit: 4 },
+            { $project: listFields },
+            plantationLookup,
+          ],
+        }
+      },
+    ]).toArray(),
+  ])
+
+  const apoRow = rollup.apos || {}
+  const apoCount = apoRow.apo_count || {}
+  const totalPlantations = rollup.plantations?.plantation_count || 0
+  const totalArea = rollup.plantations?.area_ha || 0
+  const totalApos = Object.values(apoCount).reduce((sum, n) => sum + n, 0)
+  const draftApos = apoCount.DRAFT || 0
+  const pendingApos = Object.entries(apoCount).filter(([status]) => status.includes('PENDING')).reduce((sum, [, n]) => sum + n, 0)
+  const sanctionedApos = apoCount.SANCTIONED || 0
+  const rejectedApos = apoCount.REJECTED || 0
+  const totalSanctioned = apoRow.apo_amount?.SANCTIONED || 0
+  const totalExpenditure = apoRow.expenditure || 0
+
+  const chartData = Object.values(apoRow.activities || {})
+    .sort((a, b) => a.order - b.order)
+    .map(({ name, sanctioned, spent }) => ({
+      name: name.length > 12 ? name.substring(0, 12) + '...' : name,
+      fullName: name,
+      sanctioned,
+      spent,
+    }))
+
+  // Recent APOs with plantation names
+  const recentApos = apoLists.recent.map(apo => ({
+    id: apo.id,
+    plantation_name: apo.plantation[0]?.name || 'Unknown Plantation',
+    financial_year: apo.financial_year,
+    status: apo.status,
+    total_amount: apo.total_sanctioned_amount || apo.total_amount || 0,
+    created_at: apo.created_at,
+  }))
+
+  // APO Timeline (recent activity)
+  const apoTimeline = apoLists.timeline.map(apo => ({
+    id: apo.id,
+    plantation_name: apo.plantation[0]?.name || 'APO Timeline',
+    status: apo.status,
+    financial_year: apo.financial_year,
+    date: apo.updated_at || apo.created_at,
+  }))
+
+  // Calculate percentages for analytics
+  const utilizationPct = totalSanctioned > 0 ? Math.round((totalExpenditure / totalSanctioned) * 100) : 0
+  const sanctionedPct = totalApos > 0 ? Math.round((sanctionedApos / totalApos) * 100) : 0
+  const reportedPct = totalApos > 0 ? Math.round(((sanctionedApos + pendingApos) / totalApos) * 100) : 0
+
+  return handleCORS(NextResponse.json({
+    total_plantations: totalPlantations,
+    total_area_ha: totalArea,
+    total_apos: totalApos,
+    draft_apos: draftApos,
+    pending_apos: pendingApos,
+    sanctioned_apos: sanctionedApos,
+    rejected_apos: rejectedApos,
+    total_sanctioned_amount: totalSanctioned,
+    total_expenditure: totalExpenditure,
+    utilization_pct: utilizationPct,
+    sanctioned_pct: sanctionedPct,
+    reported_pct: reportedPct,
+    approved_fund_indents: apoRow.fund_indents_approved || 0,
+    approved_fund_indent_amount: apoRow.fund_indent_approved_amount || 0,
+    budget_chart: chartData,
+    recent_apos: recentApos,
+    apo_timeline: apoTimeline,
+  }))
+}
+
+/**
+ * Register dashboard routes
+ * @param {Router} router - Router to register on
+ */
+export function registerDashboardRoutes(router) {
+  router.add('GET', '/dashboard/stats', getDashboardStats)
+}
@@ -0,0 +1,465 @@
+/**
+ * Fund Indent Routes
+ * Fund Indent Hierarchy: RFO → DCF → ED → MD
+ * Phase 1: RFO generates Fund Indent (GFI)
+ * Phase 2: DCF, ED, MD approve Fund Indent (AFI)
+ */
+import { writeFile, mkdir } from 'fs/promises'
+import path from 'path'
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId } from '../helpers'
+import { getSessionUser } from '../auth'
+import { claimFundIndentItems } from '../fundIndentClaims'
+import { getPageParams, findPage } from '../pagination'
+import { getFieldSelection, wantsField, projectionOptions, pickFields } from '../projection'
+import { recordFundIndentApproved } from '../rollups'
+
+/**
+ * GET /fund-indent/works - RFO: Get works available for Fund Indent generation
+ */
+export async function listFundIndentWorks(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  if (!['RFO', 'ADMIN'].includes(user.role)) {
+    return handleCORS(NextResponse.json({ error: 'Access denied. Only RFO can access this.' }, { status: 403 }))
+  }
+
+  const url = new URL(request.url)
+  const year = url.searchParams.get('year') || '2026-27'
+
+  // Get plantations in RFO's jurisdiction
+  let plantationFilter = {}
+  if (user.role === 'RFO' && user.range_id) {
+    plantationFilter = { range_id: user.range_id }
+  }
+
+  const plantations = await db.collection('plantations').find(plantationFilter).toArray()
+  const plantationIds = plantations.map(p => p.id)
+  const pltMap = {}
+  plantations.forEach(p => { pltMap[p.id] = p })
+
+  // Find SANCTIONED APOs
+  const apos = await db.collection('apo_headers').find({
+    plantation_id: { $in: plantationIds },
+    status: 'SANCTIONED',
+    financial_year: year
+  }).toArray()
+
+  const apoIds = apos.map(a => a.id)
+  const apoMap = {}
+  apos.forEach(a => { apoMap[a.id] = a })
+
+  // Get work items that don't have a fund indent yet
+  const items = await db.collection('apo_items').find({
+    apo_id: { $in: apoIds },
+    fund_indent_id: { $exists: false }
+  }).toArray()
+
+  // Group by APO for display
+  const worksByApo = items.reduce((acc, item) => {
+    if (!acc[item.apo_id]) {
+      const apo = apoMap[item.apo_id]
+      const plt = pltMap[apo?.plantation_id]
+      acc[item.apo_id] = {
+        apo_id: item.apo_id,
+        plantation_name: plt?.name || 'Unknown',
+        financial_year: apo?.financial_year,
+        work_count: 0,
+        total_amount: 0,
+      }
+    }
+    acc[item.apo_id].work_count++
+    acc[item.apo_id].total_amount += item.total_cost || 0
+    return acc
+  }, {})
+
+  return handleCORS(NextResponse.json({
+    works: Object.values(worksByApo),
+    years: ['2024-25', '2025-26', '2026-27'],
+    selected_year: year,
+  }))
+}
+
+/**
+ * GET /fund-indent/work-items/:apoId - RFO: Get line items for Fund Indent
+ */
+export async function listFundIndentWorkItems(request, { db, params }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  if (!['RFO', 'ADMIN'].includes(user.role)) {
+    return handleCORS(NextResponse.json({ error: 'Access denied' }, { status: 403 }))
+  }
+
+  const apoId = params.apoId
+  const apo = await db.collection('apo_headers').findOne({ id: apoId })
+  if (!apo) return handleCORS(NextResponse.json({ error: 'APO not found' }, { status: 404 }))
+
+  const items = await db.collection('apo_items').find({
+    apo_id: apoId,
+    fund_indent_id: { $exists: false }
+  }).toArray()
+
+  const plantation = await db.collection('plantations').findOne({ id: apo.plantation_id })
+
+  return handleCORS(NextResponse.json({
+    apo_id: apoId,
+    plantation_name: plantation?.name,
+    financial_year: apo.financial_year,
+    items: items.map(({ _id, ...item }) => ({
+      ...item,
+      period_from: item.period_from || null,
+      period_to: item.period_to || null,
+      cm_date: item.cm_date || null,
+      cm_by: item.cm_by || null,
+      fnb_book_no: item.fnb_book_no || null,
+      fnb_page_no: item.fnb_page_no || null,
+      fnb_pdf_url: item.fnb_pdf_url || null,
+    }))
+  }))
+}
+
+/**
+ * POST /fund-indent/upload-fnb - RFO: Upload FNB PDF file
+ */
+export async function uploadFnb(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  if (user.role !== 'RFO') {
+    return handleCORS(NextResponse.json({ error: 'Only RFO can upload FNB documents' }, { status: 403 }))
+  }
+
+  try {
+    const formData = await request.formData()
+    const file = formData.get('file')
+    const itemId = formData.get('item_id')
+
+    if (!file) {
+      return handleCORS(NextResponse.json({ error: 'No file uploaded' }, { status: 400 }))
+    }
+
+    if (!file.name.toLowerCase().endsWith('.pdf')) {
+      return handleCORS(NextResponse.json({ error: 'Only PDF files are allowed' }, { status: 400 }))
+    }
+
+    // Ensure uploads directory exists
+    const uploadsDir = path.join(process.cwd(), 'public', 'uploads', 'fnb')
+    await mkdir(uploadsDir, { recursive: true })
+
+    // Create unique filename
+    const timestamp = Date.now()
+    const sanitizedName = file.name.replace(/[^a-zA-Z0-9.-]/g, '_')
+    const fileName = `fnb_${timestamp}_${sanitizedName}`
+    const filePath = path.join(uploadsDir, fileName)
+
+    // Write file
+    const bytes = await file.arrayBuffer()
+    const buffer = Buffer.from(bytes)
+    await writeFile(filePath, buffer)
+
+    // Return the URL path
+    const fileUrl = `/uploads/fnb/${fileName}`
+
+    return handleCORS(NextResponse.json({
+      message: 'FNB PDF uploaded successfully',
+      file_url: fileUrl,
+      file_name: fileName,
+      item_id: itemId
+    }))
+  } catch (error) {
+    console.error('File upload error:', error)
+    return handleCORS(NextResponse.json({ error: 'File upload failed: ' + error.message }, { status: 500 }))
+  }
+}
+
+/**
+ * POST /fund-indent/generate - RFO: Generate Fund Indent (GFI)
+ * Items already on another indent are skipped and listed in already_claimed (409 if none are left).
+ */
+export async function generateFundIndent(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  if (user.role !== 'RFO') {
+    return handleCORS(NextResponse.json({ error: 'Only RFO can generate Fund Indent' }, { status: 403 }))
+  }
+
+  const body = await request.json()
+  const { apo_id, items } = body
+
+  if (!apo_id || !items || items.length === 0) {
+    return handleCORS(NextResponse.json({ error: 'APO ID and items are required' }, { status: 400 }))
+  }
+
+  // The id keys the item claims below, so it must be unique even within one millisecond
+  const estId = `EST-${Date.now().toString(36).toUpperCase()}-${generateId().toUpperCase()}`
+
+  const fundIndent = {
+    id: estId,
+    apo_id,
+    created_by: user.id,
+    created_at: new Date(),
+    status: 'PENDING_DCF',
+    approval_chain: [{
+      role: 'RFO',
+      user_id: user.id,
+      user_name: user.name,
+      action: 'GENERATED',
+      timestamp: new Date()
+    }],
+    total_amount: 0,
+    item_ids: [],
+  }
+
+  // Claim only items no other indent holds yet; the claim, total and insert commit together
+  const { indent: claimed, already_claimed: alreadyClaimed } = await claimFundIndentItems(db, fundIndent, items)
+  if (!claimed) {
+    return handleCORS(NextResponse.json({
+      error: 'All selected items are already claimed by another Fund Indent',
+      already_claimed: alreadyClaimed,
+    }, { status: 409 }))
+  }
+
+  return handleCORS(NextResponse.json({
+    message: 'Fund Indent generated successfully',
+    est_id: estId,
+    total_amount: claimed.total_amount,
+    item_count: claimed.item_ids.length,
+    already_claimed: alreadyClaimed,
+    next_approver: 'DCF'
+  }, { status: 201 }))
+}
+
+/**
+ * Attach line items, APO/plantation details and creator names to fund indents
+ * Each relation is a single $in query, so the query count does not grow with the page size.
+ * @param {Db} db - MongoDB database instance
+ * @param {Array} indents - Fund indent documents
+ * @param {object|null} selection - Result of getFieldSelection()
+ * @param {boolean} includeItems - false returns item_count without the item bodies
+ * @returns {Array} Enriched indents, in input order
+ */
+export async function enrichFundIndents(db, indents, selection, includeItems = true) {
+  const withItems = includeItems && wantsField(selection, 'items')
+  const withApo = wantsField(selection, 'plantation_name', 'financial_year')
+  const withCreator = wantsField(selection, 'created_by_name')
+  const distinct = (values) => [...new Set(values.filter(Boolean))]
+
+  const [items, apos, creators] = await Promise.all([
+    withItems
+      ? db.collection('apo_items').find({ fund_indent_id: { $in: indents.map(i => i.id) } }, { projection: { _id: 0 } }).toArray()
+      : [],
+    withApo
+      ? db.collection('apo_headers').aggregate([
+          { $match: { id: { $in: distinct(indents.map(i => i.apo_id)) } } },
+          {
+            $lookup: {
+              from: 'plantations',
+              let: { plantationId: '$plantation_id' },
+              pipeline: [
+                { $match: { $expr: { $eq: ['$id', '$$plantationId'] } } },
+                { $project: { _id: 0, name: 1 } },
+              ],
+              as: 'plantation',
+            }
+          },
+          { $project: { _id: 0, id: 1, financial_year: 1, plantation_name: { $arrayElemAt: ['$plantation.name', 0] } } },
+        ]).toArray()
+      : [],
+    withCreator
+      ? db.collection('users').find({ id: { $in: distinct(indents.map(i => i.created_by)) } }, { projection: { _id: 0, id: 1, name: 1 } }).toArray()
+      : [],
+  ])
+
+  const itemsByIndent = {}
+  for (const item of items) {
+    if (!itemsByIndent[item.fund_indent_id]) itemsByIndent[item.fund_indent_id] = []
+    itemsByIndent[item.fund_indent_id].push(item)
+  }
+  const apoMap = Object.fromEntries(apos.map(a => [a.id, a]))
+  const creatorMap = Object.fromEntries(creators.map(u => [u.id, u.name]))
+
+  return indents.map(({ _id, ...indent }) => {
+    const apo = apoMap[indent.apo_id]
+    const indentItems = withItems ? (itemsByIndent[indent.id] || []) : null
+    return pickFields({
+      ...indent,
+      plantation_name: apo?.plantation_name || 'Unknown',
+      financial_year: apo?.financial_year,
+      created_by_name: creatorMap[indent.created_by],
+      items: indentItems || undefined,
+      item_count: indentItems ? indentItems.length : (indent.item_ids || []).length,
+    }, selection)
+  })
+}
+
+/**
+ * GET /fund-indent/pending?limit=&after=&include_total=&fields=&include_items= - DCF/ED/MD: Get pending Fund Indents
+ * Paginated responses add next_cursor (and total); pending_count is then the page size.
+ * fields=summary or include_items=false leaves out the embedded line items (item_count is kept).
+ */
+export async function listPendingFundIndents(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const roleStatusMap = {
+    'RFO': null, // RFO sees their generated ones
+    'DCF': 'PENDING_DCF',
+    'ED': 'PENDING_ED',
+    'MD': 'PENDING_MD',
+    'ADMIN': null
+  }
+
+  if (!roleStatusMap.hasOwnProperty(user.role)) {
+    return handleCORS(NextResponse.json({ error: 'Access denied' }, { status: 403 }))
+  }
+
+  let filter = {}
+  if (user.role === 'RFO') {
+    filter.created_by = user.id
+  } else if (user.role !== 'ADMIN' && roleStatusMap[user.role]) {
+    filter.status = roleStatusMap[user.role]
+  }
+
+  const page = getPageParams(request)
+  const selection = getFieldSelection(request, 'fund_indents')
+  const { items: indents, ...pageInfo } = await findPage(db.collection('fund_indents'), filter, page, projectionOptions(selection))
+
+  const includeItems = new URL(request.url).searchParams.get('include_items') !== 'false'
+  const enrichedIndents = await enrichFundIndents(db, indents, selection, includeItems)
+
+  return handleCORS(NextResponse.json({
+    indents: enrichedIndents,
+    pending_count: enrichedIndents.length,
+    role: user.role,
+    ...pageInfo,
+  }))
+}
+
+/**
+ * GET /fund-indent/:id?fields=&include_items= - Get Fund Indent details
+ */
+export async function getFundIndent(request, { db, params }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const estId = params.id
+  const selection = getFieldSelection(request, 'fund_indents')
+  const indent = await db.collection('fund_indents').findOne({ id: estId }, projectionOptions(selection))
+  if (!indent) return handleCORS(NextResponse.json({ error: 'Fund Indent not found' }, { status: 404 }))
+
+  const includeItems = new URL(request.url).searchParams.get('include_items') !== 'false'
+  const [enriched] = await enrichFundIndents(db, [indent], selection, includeItems)
+  return handleCORS(NextResponse.json(enriched))
+}
+
+/**
+ * POST /fund-indent/:id/approve - DCF/ED/MD: Approve Fund Indent (AFI)
+ */
+export async function approveFundIndent(request, { db, params }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const estId = params.id
+  const body = await request.json()
+  const { approved_items, rejected_items, comment } = body
+
+  const indent = await db.collection('fund_indents').findOne({ id: estId })
+  if (!indent) return handleCORS(NextResponse.json({ error: 'Fund Indent not found' }, { status: 404 }))
+
+  const expectedRoleForStatus = {
+    'PENDING_DCF': 'DCF',
+    'PENDING_ED': 'ED',
+    'PENDING_MD': 'MD'
+  }
+
+  if (expectedRoleForStatus[indent.status] !== user.role && user.role !== 'ADMIN') {
+    return handleCORS(NextResponse.json({
+      error: `This indent requires ${expectedRoleForStatus[indent.status]} approval`
+    }, { status: 403 }))
+  }
+
+  const nextStatusMap = {
+    'PENDING_DCF': 'PENDING_ED',
+    'PENDING_ED': 'PENDING_MD',
+    'PENDING_MD': 'APPROVED'
+  }
+  const nextStatus = nextStatusMap[indent.status]
+
+  if (approved_items && approved_items.length > 0) {
+    await db.collection('apo_items').updateMany(
+      { id: { $in: approved_items } },
+      { $set: { fund_indent_status: nextStatus } }
+    )
+  }
+
+  if (rejected_items && rejected_items.length > 0) {
+    await db.collection('apo_items').updateMany(
+      { id: { $in: rejected_items } },
+      { $set: { fund_indent_status: 'REJECTED', fund_indent_rejection_comment: comment } }
+    )
+  }
+
+  const approvalEntry = {
+    role: user.role,
+    user_id: user.id,
+    user_name: user.name,
+    action: 'APPROVED',
+    approved_count: approved_items?.length || 0,
+    rejected_count: rejected_items?.length || 0,
+    comment,
+    timestamp: new Date()
+  }
+
+  const remainingItems = await db.collection('apo_items').countDocuments({
+    fund_indent_id: estId,
+    fund_indent_status: { $ne: 'REJECTED' }
+  })
+
+  const finalStatus = remainingItems > 0 ? nextStatus : 'FULLY_REJECTED'
+
+  // Conditional on the status read above, so a concurrent approval cannot
+  // apply the transition (and the rollup delta) twice
+  const { matchedCount } = await db.collection('fund_indents').updateOne(
+    { id: estId, status: indent.status },
+    {
+      $set: { status: finalStatus, updated_at: new Date() },
+      $push: { approval_chain: approvalEntry }
+    }
+  )
+  if (matchedCount === 0) {
+    return handleCORS(NextResponse.json({ error: 'Fund Indent status changed concurrently, reload and retry' }, { status: 409 }))
+  }
+  if (finalStatus === 'APPROVED') await recordFundIndentApproved(db, indent)
+
+  const statusMessages = {
+    'PENDING_ED': 'Fund Indent approved and forwarded to ED',
+    'PENDING_MD': 'Fund Indent approved and forwarded to MD',
+    'APPROVED': 'Fund Indent fully approved by MD',
+    'FULLY_REJECTED': 'All items rejected'
+  }
+
+  return handleCORS(NextResponse.json({
+    message: statusMessages[finalStatus] || `Status updated`,
+    est_id: estId,
+    new_status: finalStatus,
+    approved_by: user.name,
+  }))
+}
+
+/**
+ * Register fund indent routes
+ * @param {Router} router - Router to register on
+ */
+export function registerFundIndentRoutes(router) {
+  router.add('GET', '/fund-indent/works', listFundIndentWorks)
+  router.add('GET', '/fund-indent/work-items/:apoId', listFundIndentWorkItems)
+  router.add('POST', '/fund-indent/upload-fnb', uploadFnb)
+  router.add('POST', '/fund-indent/generate', generateFundIndent)
+  router.add('GET', '/fund-indent/pending', listPendingFundIndents)
+  router.add('GET', '/fund-indent/:id', getFundIndent)
+  router.add('POST', '/fund-indent/:id/approve', approveFundIndent)
+}
@@ -0,0 +1,40 @@
+/**
+ * API Route Table
+ * Builds the router used by app/api/[[...path]]/route.js
+ */
+import { Router } from '../router'
+import { registerSystemRoutes } from './system'
+import { registerAuthRoutes } from './auth'
+import { registerMastersRoutes } from './masters'
+import { registerPlantationsRoutes } from './plantations'
+import { registerBuildingsRoutes } from './buildings'
+import { registerNurseriesRoutes } from './nurseries'
+import { registerApoRoutes } from './apo'
+import { registerWorksRoutes } from './works'
+import { registerFundIndentRoutes } from './fundIndent'
+import { registerWorkLogsRoutes } from './workLogs'
+import { registerDashboardRoutes } from './dashboard'
+import { registerBootstrapRoutes } from './bootstrap'
+
+/**
+ * Build the API router with every module registered
+ * @returns {Router} Compiled router
+ */
+export function buildRouter() {
+  const router = new Router()
+  registerSystemRoutes(router)
+  registerAuthRoutes(router)
+  registerMastersRoutes(router)
+  registerPlantationsRoutes(router)
+  registerBuildingsRoutes(router)
+  registerNurseriesRoutes(router)
+  registerApoRoutes(router)
+  registerWorksRoutes(router)
+  registerFundIndentRoutes(router)
+  registerWorkLogsRoutes(router)
+  registerDashboardRoutes(router)
+  registerBootstrapRoutes(router)
+  return router
+}
+
+export default buildRouter
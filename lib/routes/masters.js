@@ -0,0 +1,115 @@
+/**
+ * Master Data Routes
+ * Divisions, ranges, districts/taluks, activities and the plantation rate card
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId } from '../helpers'
+import { getSessionUser } from '../auth'
+import { getMasterList, getMasterMap, invalidateMasterData } from '../masterData'
+import { SEED_DATA } from '../seedData'
+import { cachedJson } from '../httpCache'
+
+/**
+ * GET /divisions - List all divisions
+ */
+export async function listDivisions(request, { db }) {
+  const divisions = await getMasterList(db, 'divisions')
+  return handleCORS(cachedJson(request, divisions))
+}
+
+/**
+ * GET /ranges?division_id= - List ranges, optionally for one division
+ */
+export async function listRanges(request, { db }) {
+  const url = new URL(request.url)
+  const divisionId = url.searchParams.get('division_id')
+  const ranges = await getMasterList(db, 'ranges')
+  return handleCORS(cachedJson(request, divisionId ? ranges.filter(r => r.division_id === divisionId) : ranges))
+}
+
+/**
+ * GET /districts - Returns all districts with their taluks
+ */
+export async function listDistricts(request) {
+  // Return from seed data (static list)
+  return handleCORS(cachedJson(request, SEED_DATA.districts_taluks))
+}
+
+/**
+ * GET /taluks?district=Dharwad - Returns taluks for a specific district
+ */
+export async function listTaluks(request) {
+  const url = new URL(request.url)
+  const districtName = url.searchParams.get('district')
+  if (!districtName) {
+    // Return all taluks flat list
+    const allTaluks = SEED_DATA.districts_taluks.flatMap(d => d.taluks)
+    return handleCORS(cachedJson(request, allTaluks))
+  }
+  const district = SEED_DATA.districts_taluks.find(d => d.district.toLowerCase() === districtName.toLowerCase())
+  if (!district) {
+    return handleCORS(NextResponse.json({ error: 'District not found' }, { status: 404 }))
+  }
+  return handleCORS(cachedJson(request, district.taluks))
+}
+
+/**
+ * GET /activities - List the plantation activity master
+ */
+export async function listActivities(request, { db }) {
+  const activities = await getMasterList(db, 'activity_master')
+  return handleCORS(cachedJson(request, activities))
+}
+
+/**
+ * GET /norms - Plantation rate card enriched with activity details
+ */
+export async function listNorms(request, { db }) {
+  const norms = await getMasterList(db, 'norms_config')
+  const actMap = await getMasterMap(db, 'activity_master')
+  const enriched = norms.map(({ _id, ...n }) => ({
+    ...n,
+    activity_name: actMap[n.activity_id]?.name || 'Unknown',
+    category: actMap[n.activity_id]?.category || 'Unknown',
+    unit: actMap[n.activity_id]?.unit || 'Unknown',
+    ssr_no: actMap[n.activity_id]?.ssr_no || '-',
+  }))
+  return handleCORS(cachedJson(request, enriched))
+}
+
+/**
+ * POST /norms - Add a rate card entry (ADMIN only)
+ */
+export async function createNorm(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'ADMIN') {
+    return handleCORS(NextResponse.json({ error: 'Only Admin can manage the Rate Card' }, { status: 403 }))
+  }
+  const body = await request.json()
+  const norm = {
+    id: generateId(),
+    activity_id: body.activity_id,
+    applicable_age: body.applicable_age,
+    species_id: body.species_id || null,
+    standard_rate: parseFloat(body.standard_rate),
+    financial_year: body.financial_year || '2025-26',
+  }
+  await db.collection('norms_config').insertOne(norm)
+  invalidateMasterData('norms_config')
+  return handleCORS(NextResponse.json(norm, { status: 201 }))
+}
+
+/**
+ * Register master data routes
+ * @param {Router} router - Router to register on
+ */
+export function registerMastersRoutes(router) {
+  router.add('GET', '/divisions', listDivisions)
+  router.add('GET', '/ranges', listRanges)
+  router.add('GET', '/districts', listDistricts)
+  router.add('GET', '/taluks', listTaluks)
+  router.add('GET', '/activities', listActivities)
+  router.add('GET', '/norms', listNorms)
+  router.add('POST', '/norms', createNorm)
+}
@@ -0,0 +1,125 @@
+/**
+ * Nursery Routes
+ * Nurseries module: registry, rate card and draft generation
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId } from '../helpers'
+import { getSessionUser } from '../auth'
+import { getMasterList, getMasterMap } from '../masterData'
+import { getPageParams, findPage, pageBody } from '../pagination'
+import { getFieldSelection, projectionOptions, pickFields } from '../projection'
+import { getNurseryDraft } from '../normResolver'
+import { cachedJson } from '../httpCache'
+
+/**
+ * GET /nurseries?limit=&after=&include_total=&fields= - List all nurseries (filtered by role)
+ */
+export async function listNurseries(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  let filter = {}
+  if (user.role === 'RO') {
+    filter = { range_id: user.range_id }
+  } else if (['DO', 'DM'].includes(user.role)) {
+    const divRanges = (await getMasterList(db, 'ranges')).filter(r => r.division_id === user.division_id)
+    const rangeIds = divRanges.map(r => r.id)
+    filter = { range_id: { $in: rangeIds } }
+  }
+  // ADMIN, ED, MD see all
+
+  const page = getPageParams(request)
+  const selection = getFieldSelection(request, 'nurseries')
+  const result = await findPage(db.collection('nurseries'), filter, page, projectionOptions(selection))
+  const rangeMap = await getMasterMap(db, 'ranges')
+  const divMap = await getMasterMap(db, 'divisions')
+
+  const enriched = result.items.map(({ _id, ...n }) => {
+    const range = rangeMap[n.range_id]
+    const division = range ? divMap[range.division_id] : null
+    return pickFields({ ...n, range_name: range?.name, division_name: division?.name }, selection)
+  })
+  return handleCORS(cachedJson(request, pageBody(page, enriched, result), { scope: 'private' }))
+}
+
+/**
+ * POST /nurseries - Create a new nursery (RO only)
+ */
+export async function createNursery(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'RO') {
+    return handleCORS(NextResponse.json({ error: 'Only Range Officers can create nurseries' }, { status: 403 }))
+  }
+  const body = await request.json()
+
+  const nursery = {
+    id: generateId(),
+    range_id: user.range_id,
+    name: body.name,
+    nursery_type: body.nursery_type || 'New', // 'New' or 'Raising'
+    latitude: body.latitude ? parseFloat(body.latitude) : null,
+    longitude: body.longitude ? parseFloat(body.longitude) : null,
+    status: body.status || 'Active',
+    capacity_seedlings: parseInt(body.capacity_seedlings) || 0,
+    created_at: new Date(),
+  }
+  await db.collection('nurseries').insertOne(nursery)
+  return handleCORS(NextResponse.json(nursery, { status: 201 }))
+}
+
+/**
+ * GET /nursery-activities - List all nursery activities
+ */
+export async function listNurseryActivities(request, { db }) {
+  const activities = await getMasterList(db, 'nursery_activities')
+  return handleCORS(cachedJson(request, activities))
+}
+
+/**
+ * GET /nursery-norms - List all nursery norms with rates
+ */
+export async function listNurseryNorms(request, { db }) {
+  const norms = await getMasterList(db, 'nursery_norms')
+  const actMap = await getMasterMap(db, 'nursery_activities')
+
+  const enriched = norms.map(({ _id, ...n }) => ({
+    ...n,
+    activity_name: actMap[n.activity_id]?.name || 'Unknown',
+    category: actMap[n.activity_id]?.category || 'Unknown',
+    unit: actMap[n.activity_id]?.unit || 'Unknown',
+    ssr_no: actMap[n.activity_id]?.ssr_no || '-',
+  }))
+  return handleCORS(cachedJson(request, enriched))
+}
+
+/**
+ * POST /nurseries/generate-draft - Generate draft items for a nursery
+ */
+export async function generateNurseryDraft(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const body = await request.json()
+  const { nursery_id, financial_year } = body
+  if (!nursery_id || !financial_year) {
+    return handleCORS(NextResponse.json({ error: 'nursery_id and financial_year required' }, { status: 400 }))
+  }
+
+  const nursery = await db.collection('nurseries').findOne({ id: nursery_id })
+  if (!nursery) return handleCORS(NextResponse.json({ error: 'Nursery not found' }, { status: 404 }))
+
+  return handleCORS(NextResponse.json(await getNurseryDraft(db, nursery, financial_year)))
+}
+
+/**
+ * Register nursery routes
+ * @param {Router} router - Router to register on
+ */
+export function registerNurseriesRoutes(router) {
+  router.add('GET', '/nurseries', listNurseries)
+  router.add('POST', '/nurseries', createNursery)
+  router.add('GET', '/nursery-activities', listNurseryActivities)
+  router.add('GET', '/nursery-norms', listNurseryNorms)
+  router.add('POST', '/nurseries/generate-draft', generateNurseryDraft)
+}
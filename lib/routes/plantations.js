@@ -0,0 +1,221 @@
+/**
+ * Plantation Routes
+ * Plantation registry, detail and APO history
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId, getWorkType } from '../helpers'
+import { getSessionUser } from '../auth'
+import { getMasterDoc, getMasterList, getMasterMap } from '../masterData'
+import { getPageParams, findPage, pageBody } from '../pagination'
+import { getFieldSelection, projectionOptions, pickFields } from '../projection'
+import { recordPlantationCreated } from '../rollups'
+import { cachedJson } from '../httpCache'
+
+const DEFAULT_HISTORY_YEARS = 10
+
+/**
+ * GET /plantations?limit=&after=&include_total=&fields= - List plantations (filtered by role)
+ */
+export async function listPlantations(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  let filter = {}
+  if (user.role === 'RO') {
+    filter = { range_id: user.range_id }
+  } else if (user.role === 'DM') {
+    const divRanges = (await getMasterList(db, 'ranges')).filter(r => r.division_id === user.division_id)
+    const rangeIds = divRanges.map(r => r.id)
+    filter = { range_id: { $in: rangeIds } }
+  }
+  // ADMIN sees all
+
+  const page = getPageParams(request)
+  const selection = getFieldSelection(request, 'plantations')
+  const result = await findPage(db.collection('plantations'), filter, page, projectionOptions(selection))
+  // Enrich with range/division names
+  const rangeMap = await getMasterMap(db, 'ranges')
+  const divMap = await getMasterMap(db, 'divisions')
+
+  const enriched = result.items.map(({ _id, ...p }) => {
+    const range = rangeMap[p.range_id]
+    const division = range ? divMap[range.division_id] : null
+    const age = new Date().getFullYear() - p.year_of_planting
+    // Dynamically calculate work_type based on financial year
+    const dynamicWorkType = getWorkType(p.year_of_planting)
+    return pickFields({ ...p, range_name: range?.name, division_name: division?.name, age, work_type: dynamicWorkType }, selection)
+  })
+  return handleCORS(cachedJson(request, pageBody(page, enriched, result), { scope: 'private' }))
+}
+
+/**
+ * POST /plantations - Create a new plantation (RO only)
+ */
+export async function createPlantation(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'RO') {
+    return handleCORS(NextResponse.json({ error: 'Only Range Officers can create plantations' }, { status: 403 }))
+  }
+  const body = await request.json()
+
+  // Determine work type dynamically based on financial year
+  const plantingYear = parseInt(body.year_of_planting)
+  const workType = getWorkType(plantingYear)
+
+  const plantation = {
+    id: generateId(),
+    range_id: user.range_id,
+    name: body.name,
+    species: body.species,
+    year_of_planting: plantingYear,
+    total_area_ha: parseFloat(body.total_area_ha),
+    village: body.village || null,
+    taluk: body.taluk || null,
+    district: body.district || null,
+    vidhana_sabha: body.vidhana_sabha || null,
+    lok_sabha: body.lok_sabha || null,
+    division: body.division || null,
+    latitude: body.latitude ? parseFloat(body.latitude) : null,
+    longitude: body.longitude ? parseFloat(body.longitude) : null,
+    work_type: workType,
+    created_at: new Date(),
+  }
+  await db.collection('plantations').insertOne(plantation)
+  await recordPlantationCreated(db, plantation)
+  return handleCORS(NextResponse.json(plantation, { status: 201 }))
+}
+
+/**
+ * GET /plantations/:id?fields= - Plantation detail
+ */
+export async function getPlantation(request, { db, params }) {
+  const pId = params.id
+  const selection = getFieldSelection(request, 'plantations')
+  const plantation = await db.collection('plantations').findOne({ id: pId }, projectionOptions(selection))
+  if (!plantation) return handleCORS(NextResponse.json({ error: 'Not found' }, { status: 404 }))
+  const { _id, ...p } = plantation
+  const age = new Date().getFullYear() - p.year_of_planting
+  const dynamicWorkType = getWorkType(p.year_of_planting)
+  const range = await getMasterDoc(db, 'ranges', p.range_id)
+  const division = range ? await getMasterDoc(db, 'divisions', range.division_id) : null
+  return handleCORS(NextResponse.json(pickFields({ ...p, age, work_type: dynamicWorkType, range_name: range?.name, division_name: division?.name }, selection)))
+}
+
+/**
+ * Fold the APOs of one financial year into a CAPEX/REVEX summary row
+ * @param {string} financialYear - Financial year of the row
+ * @param {Array} apos - APO headers, each with items grouped by expense_type
+ * @returns {object} Summary row
+ */
+function summarizeYear(financialYear, apos) {
+  const row = { financial_year: financialYear, apo_count: apos.length, statuses: {}, total_sanctioned_amount: 0, items_amount: 0, capex_amount: 0, revex_amount: 0, item_count: 0 }
+  for (const apo of apos) {
+    row.statuses[apo.status] = (row.statuses[apo.status] || 0) + 1
+    row.total_sanctioned_amount += apo.total_sanctioned_amount || 0
+    for (const group of apo.items) {
+      row.items_amount += group.amount
+      if (group._id === 'CAPEX') row.capex_amount += group.amount
+      if (group._id === 'REVEX') row.revex_amount += group.amount
+      row.item_count += group.count
+    }
+  }
+  return row
+}
+
+/**
+ * Aggregation behind GET /plantations/:id/history
+ * Paginated requests keep whole financial years: one year more than asked is
+ * grouped to tell whether another page exists, then dropped before the item
+ * $lookup and reported as has_more_years on each APO.
+ * @param {string} plantationId - Plantation id
+ * @param {object} options
+ * @param {string|null} options.before - Only financial years before this one
+ * @param {number|null} options.yearLimit - Financial years per page (null = no pagination)
+ * @param {boolean} options.summary - Group items by expense_type instead of returning them
+ * @returns {Array} Pipeline for apo_headers
+ */
+export function historyPipeline(plantationId, { before = null, yearLimit = null, summary = false } = {}) {
+  const filter = { plantation_id: plantationId }
+  if (before) filter.financial_year = { $lt: before }
+
+  const itemsPipeline = [{ $match: { $expr: { $eq: ['$apo_id', '$$apoId'] } } }]
+  itemsPipeline.push(summary
+    ? { $group: { _id: '$expense_type', amount: { $sum: '$total_cost' }, count: { $sum: 1 } } }
+    : { $project: { _id: 0 } })
+
+  return [
+    { $match: filter },
+    { $sort: { created_at: -1 } },
+    ...(yearLimit ? [
+      { $group: { _id: '$financial_year', apos: { $push: '$$ROOT' } } },
+      { $sort: { _id: -1 } },
+      { $limit: yearLimit + 1 },
+      { $group: { _id: null, years: { $push: '$apos' } } },
+      { $project: { has_more_years: { $gt: [{ $size: '$years' }, yearLimit] }, years: { $slice: ['$years', yearLimit] } } },
+      { $unwind: '$years' },
+      { $unwind: '$years' },
+      { $replaceRoot: { newRoot: { $mergeObjects: ['$years', { has_more_years: '$has_more_years' }] } } },
+      { $sort: { financial_year: -1, created_at: -1 } },
+    ] : []),
+    { $lookup: { from: 'apo_items', let: { apoId: '$id' }, pipeline: itemsPipeline, as: 'items' } },
+    { $project: { _id: 0 } },
+  ]
+}
+
+/**
+ * Shape the history aggregation into the response body
+ * @param {Array} rows - Result of historyPipeline
+ * @param {object} options
+ * @param {boolean} options.paginated - Return { items, next_before }
+ * @param {boolean} options.summary - One CAPEX/REVEX row per financial year
+ * @returns {Array|object} Response body
+ */
+export function historyBody(rows, { paginated = false, summary = false } = {}) {
+  const hasMore = rows.some(row => row.has_more_years)
+  const apos = rows.map(({ has_more_years: _, ...apo }) => apo)
+
+  const byYear = new Map()
+  for (const apo of apos) {
+    if (!byYear.has(apo.financial_year)) byYear.set(apo.financial_year, [])
+    byYear.get(apo.financial_year).push(apo)
+  }
+  const yearList = [...byYear.keys()].sort().reverse()
+
+  const items = summary ? yearList.map(fy => summarizeYear(fy, byYear.get(fy))) : apos
+  if (!paginated) return items
+  return { items, next_before: hasMore ? yearList[yearList.length - 1] : null }
+}
+
+/**
+ * GET /plantations/:id/history?years=&before=&summary= - APOs raised for a plantation, with items
+ * Served by one aggregation joining headers to items. years=N returns { items, next_before }
+ * holding the N most recent financial years (before= continues from next_before);
+ * summary=true returns one CAPEX/REVEX row per financial year instead of the APOs.
+ */
+export async function getPlantationHistory(request, { db, params }) {
+  const { searchParams } = new URL(request.url)
+  const summary = searchParams.get('summary') === 'true'
+  const before = searchParams.get('before')
+  const yearsParam = searchParams.get('years')
+  const years = yearsParam === null ? null : Number(yearsParam)
+  if (years !== null && (!Number.isInteger(years) || years < 1)) {
+    return handleCORS(NextResponse.json({ error: 'years must be a positive integer' }, { status: 400 }))
+  }
+  const paginated = years !== null || before !== null
+  const yearLimit = paginated ? (years || DEFAULT_HISTORY_YEARS) : null
+
+  const rows = await db.collection('apo_headers').aggregate(historyPipeline(params.id, { before, yearLimit, summary })).toArray()
+  return handleCORS(NextResponse.json(historyBody(rows, { paginated, summary })))
+}
+
+/**
+ * Register plantation routes
+ * @param {Router} router - Router to register on
+ */
+export function registerPlantationsRoutes(router) {
+  router.add('GET', '/plantations', listPlantations)
+  router.add('POST', '/plantations', createPlantation)
+  router.add('GET', '/plantations/:id', getPlantation)
+  router.add('GET', '/plantations/:id/history', getPlantationHistory)
+}
@@ -0,0 +1,169 @@
+/**
+ * System Routes
+ * API banner, database seeding and admin diagnostics
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { getSessionUser } from '../auth'
+import { getAuthCacheStats } from '../authCache'
+import { getMasterDataStats } from '../masterData'
+import { getNormResolverStats } from '../normResolver'
+import { rebuildRollups } from '../rollups'
+import { reconcileSpendCounters } from '../spendCounters'
+import { SEED_DATA } from '../seedData'
+import { SEED_MODES, seedCollections, snapshotSeed, restoreSeed } from '../seed'
+import { getPoolOptions } from '../db'
+import { getPoolStats } from '../poolMetrics'
+import { renderMetrics } from '../metrics'
+import { getTopSlowOps } from '../slowOps'
+
+/**
+ * GET / - API banner
+ */
+export async function getRoot() {
+  return handleCORS(NextResponse.json({ message: 'KFDC iFMS API v1.0', status: 'running' }))
+}
+
+/**
+ * POST /seed?mode=snapshot|restore - Reset the database with the KFDC master and sample data
+ * snapshot also saves the seeded state to the template database; restore copies it
+ * back server-side (seeding and snapshotting first if there is no current snapshot).
+ */
+export async function seedDatabase(request, { db }) {
+  const mode = new URL(request.url).searchParams.get('mode')
+  if (mode && !SEED_MODES.includes(mode)) {
+    return handleCORS(NextResponse.json({ error: `mode must be one of: ${SEED_MODES.join(', ')}` }, { status: 400 }))
+  }
+
+  let result = mode === 'restore' ? await restoreSeed(db) : null
+  const restored = !!result
+  let snapshot = null
+  if (!restored) {
+    result = await seedCollections(db)
+    if (mode) snapshot = await snapshotSeed(db)
+  }
+
+  return handleCORS(NextResponse.json({
+    message: restored
+      ? 'Database seeded from the saved snapshot'
+      : 'Database seeded with real KFDC data including Buildings & Nurseries',
+    mode: restored ? 'restore' : (mode ? 'snapshot' : 'seed'),
+    counts: {
+      divisions: 4,
+      ranges: 19,
+      users: SEED_DATA.users.length,
+      activities: 25,
+      norms: SEED_DATA.norms.length,
+      plantations: SEED_DATA.plantations.length,
+      buildings: SEED_DATA.buildings.length,
+      nurseries: SEED_DATA.nurseries.length,
+      building_activities: SEED_DATA.building_activities.length,
+      nursery_activities: SEED_DATA.nursery_activities.length,
+      apos: 4
+    },
+    timings: result.timings,
+    snapshot,
+  }))
+}
+
+/**
+ * GET /admin/cache-stats - In-process cache counters (ADMIN only)
+ */
+export async function getCacheStats(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'ADMIN') {
+    return handleCORS(NextResponse.json({ error: 'Only Admin can view cache statistics' }, { status: 403 }))
+  }
+  return handleCORS(NextResponse.json({
+    auth: getAuthCacheStats(),
+    master_data: getMasterDataStats(),
+    norm_resolver: getNormResolverStats(),
+  }))
+}
+
+/**
+ * GET /admin/pool-stats - MongoDB connection pool options and CMAP counters (ADMIN only)
+ */
+export async function getDbPoolStats(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'ADMIN') {
+    return handleCORS(NextResponse.json({ error: 'Only Admin can view pool statistics' }, { status: 403 }))
+  }
+  return handleCORS(NextResponse.json({ options: getPoolOptions(), pool: getPoolStats() }))
+}
+
+/**
+ * GET /admin/slow-ops?limit=20&since=ISO - Slow query shapes ranked by total time (ADMIN only)
+ */
+export async function getSlowOps(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'ADMIN') {
+    return handleCORS(NextResponse.json({ error: 'Only Admin can view slow operations' }, { status: 403 }))
+  }
+  const searchParams = new URL(request.url).searchParams
+  const limit = Math.min(parseInt(searchParams.get('limit')) || 20, 100)
+  let since = null
+  if (searchParams.get('since')) {
+    since = new Date(searchParams.get('since'))
+    if (isNaN(since.getTime())) {
+      return handleCORS(NextResponse.json({ error: 'since must be an ISO date' }, { status: 400 }))
+    }
+  }
+  return handleCORS(NextResponse.json({ shapes: await getTopSlowOps(db, { limit, since }) }))
+}
+
+/**
+ * GET /metrics - Prometheus text exposition of the request and pool metrics
+ * Open unless METRICS_TOKEN is set, in which case scrapers send it as a bearer token.
+ * Registered with { db: false } so scrapes still answer while MongoDB is down.
+ */
+export async function getMetrics(request) {
+  const token = process.env.METRICS_TOKEN
+  if (token && request.headers.get('authorization') !== `Bearer ${token}`) {
+    return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+  }
+  return new NextResponse(renderMetrics(), {
+    status: 200,
+    headers: { 'Content-Type': 'text/plain; version=0.0.4; charset=utf-8' },
+  })
+}
+
+/**
+ * POST /admin/rollups/rebuild?dry_run=true - Recompute dashboard rollups and report drift (ADMIN only)
+ */
+export async function rebuildDashboardRollups(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'ADMIN') {
+    return handleCORS(NextResponse.json({ error: 'Only Admin can rebuild dashboard rollups' }, { status: 403 }))
+  }
+  const dryRun = new URL(request.url).searchParams.get('dry_run') === 'true'
+  return handleCORS(NextResponse.json(await rebuildRollups(db, { dryRun })))
+}
+
+/**
+ * POST /admin/spend-counters/reconcile?dry_run=true - Recompute apo_items spend counters from work logs (ADMIN only)
+ */
+export async function reconcileItemSpendCounters(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user || user.role !== 'ADMIN') {
+    return handleCORS(NextResponse.json({ error: 'Only Admin can reconcile spend counters' }, { status: 403 }))
+  }
+  const dryRun = new URL(request.url).searchParams.get('dry_run') === 'true'
+  return handleCORS(NextResponse.json(await reconcileSpendCounters(db, { dryRun })))
+}
+
+/**
+ * Register system routes
+ * @param {Router} router - Router to register on
+ */
+export function registerSystemRoutes(router) {
+  router.add('GET', '/', getRoot)
+  router.add('GET', '/root', getRoot)
+  router.add('POST', '/seed', seedDatabase)
+  router.add('GET', '/admin/cache-stats', getCacheStats)
+  router.add('GET', '/admin/pool-stats', getDbPoolStats)
+  router.add('GET', '/admin/slow-ops', getSlowOps)
+  router.add('GET', '/metrics', getMetrics, { db: false })
+  router.add('POST', '/admin/rollups/rebuild', rebuildDashboardRollups)
+  router.add('POST', '/admin/spend-counters/reconcile', reconcileItemSpendCounters)
+}
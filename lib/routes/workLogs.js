@@ -0,0 +1,87 @@
+/**
+ * Work Log Routes
+ * Expenditure logging against sanctioned APO items
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId } from '../helpers'
+import { getSessionUser } from '../auth'
+import { getPageParams, findPage, pageBody } from '../pagination'
+import { recordWorkLog } from '../rollups'
+import { logWorkWithinBudget } from '../spendCounters'
+
+/**
+ * POST /work-logs - Log work against a sanctioned APO item (RO only)
+ */
+export async function createWorkLog(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+  if (user.role !== 'RO') return handleCORS(NextResponse.json({ error: 'Only RO can log work' }, { status: 403 }))
+
+  const body = await request.json()
+  const { apo_item_id, actual_qty, expenditure, work_date } = body
+
+  // Validate APO item exists and APO is sanctioned
+  const apoItem = await db.collection('apo_items').findOne({ id: apo_item_id })
+  if (!apoItem) return handleCORS(NextResponse.json({ error: 'APO item not found' }, { status: 404 }))
+
+  const apo = await db.collection('apo_headers').findOne({ id: apoItem.apo_id })
+  if (!apo || apo.status !== 'SANCTIONED') {
+    return handleCORS(NextResponse.json({ error: 'Can only log work against sanctioned APOs' }, { status: 400 }))
+  }
+
+  const amount = parseFloat(expenditure)
+  if (!Number.isFinite(amount) || amount < 0) {
+    return handleCORS(NextResponse.json({ error: 'Expenditure must be a non-negative number' }, { status: 400 }))
+  }
+
+  const workLog = {
+    id: generateId(),
+    apo_item_id,
+    work_date: work_date ? new Date(work_date) : new Date(),
+    actual_qty: parseFloat(actual_qty),
+    expenditure: amount,
+    logged_by: user.id,
+    created_at: new Date(),
+  }
+
+  // Budget check and counter update are one conditional write
+  if (!(await logWorkWithinBudget(db, apoItem, workLog))) {
+    const current = await db.collection('apo_items').findOne({ id: apo_item_id }, { projection: { _id: 0, spent_amount: 1, total_cost: 1 } })
+    const totalSpent = current?.spent_amount || 0
+    return handleCORS(NextResponse.json({
+      error: 'Budget Exceeded',
+      detail: `Budget: ₹${apoItem.total_cost}, Already Spent: ₹${totalSpent}, Requested: ₹${expenditure}, Available: ₹${apoItem.total_cost - totalSpent}`
+    }, { status: 400 }))
+  }
+  await recordWorkLog(db, apo, apoItem, workLog.expenditure)
+  const { _id, ...result } = workLog
+  return handleCORS(NextResponse.json(result, { status: 201 }))
+}
+
+/**
+ * GET /work-logs?apo_item_id=&limit=&after=&include_total= - List work logs
+ */
+export async function listWorkLogs(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const url = new URL(request.url)
+  const apoItemId = url.searchParams.get('apo_item_id')
+  const filter = apoItemId ? { apo_item_id: apoItemId } : {}
+
+  if (user.role === 'RO') filter.logged_by = user.id
+
+  const page = getPageParams(request)
+  const result = await findPage(db.collection('work_logs'), filter, page, { sort: { created_at: -1 } })
+  return handleCORS(NextResponse.json(pageBody(page, result.items.map(({ _id, ...l }) => l), result)))
+}
+
+/**
+ * Register work log routes
+ * @param {Router} router - Router to register on
+ */
+export function registerWorkLogsRoutes(router) {
+  router.add('POST', '/work-logs', createWorkLog)
+  router.add('GET', '/work-logs', listWorkLogs)
+}
@@ -0,0 +1,120 @@
+/**
+ * Works Routes
+ * Activity suggestions and adding/removing works on draft APOs
+ */
+import { NextResponse } from 'next/server'
+import { handleCORS } from '../cors'
+import { generateId } from '../helpers'
+import { getSessionUser } from '../auth'
+import { ageInYears, getPlantationSuggestions } from '../normResolver'
+import { recordApoAmountChange } from '../rollups'
+
+/**
+ * POST /works/suggest-activities - Get suggested activities based on plantation age
+ */
+export async function suggestActivities(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const body = await request.json()
+  const { plantation_id, financial_year } = body
+
+  const plantation = await db.collection('plantations').findOne({ id: plantation_id })
+  if (!plantation) return handleCORS(NextResponse.json({ error: 'Plantation not found' }, { status: 404 }))
+
+  return handleCORS(NextResponse.json({
+    plantation,
+    plantation_age: ageInYears(plantation.year_of_planting),
+    suggested_activities: await getPlantationSuggestions(db, plantation, financial_year || '2026-27'),
+  }))
+}
+
+/**
+ * POST /works - Create a new work (add activities to APO)
+ */
+export async function addWork(request, { db }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+  if (user.role !== 'RO') return handleCORS(NextResponse.json({ error: 'Only RO can add works' }, { status: 403 }))
+
+  const body = await request.json()
+  const { apo_id, plantation_id, name, items } = body
+
+  if (!apo_id || !items || items.length === 0) {
+    return handleCORS(NextResponse.json({ error: 'APO ID and items are required' }, { status: 400 }))
+  }
+
+  const apo = await db.collection('apo_headers').findOne({ id: apo_id })
+  if (!apo) return handleCORS(NextResponse.json({ error: 'APO not found' }, { status: 404 }))
+  if (apo.status !== 'DRAFT') return handleCORS(NextResponse.json({ error: 'Can only add works to DRAFT APOs' }, { status: 400 }))
+
+  // Create APO items from work items
+  let totalAdded = 0
+  for (const item of items) {
+    const itemId = generateId()
+    const totalCost = (item.sanctioned_qty || 0) * (item.sanctioned_rate || 0)
+    await db.collection('apo_items').insertOne({
+      id: itemId,
+      apo_id,
+      activity_id: item.activity_id,
+      activity_name: item.activity_name,
+      ssr_no: item.ssr_no,
+      unit: item.unit,
+      sanctioned_rate: item.sanctioned_rate,
+      sanctioned_qty: item.sanctioned_qty,
+      total_cost: totalCost,
+      estimate_status: 'DRAFT',
+      created_at: new Date(),
+    })
+    totalAdded += totalCost
+  }
+
+  // Update APO total
+  const newTotal = (apo.total_sanctioned_amount || 0) + totalAdded
+  await db.collection('apo_headers').updateOne(
+    { id: apo_id },
+    // The estimate edits recompute revised_total from the new item set on next use
+    { $set: { total_sanctioned_amount: newTotal, plantation_id: plantation_id || apo.plantation_id, updated_at: new Date() }, $unset: { revised_total: '' } }
+  )
+  await recordApoAmountChange(db, apo, newTotal - (apo.total_sanctioned_amount || 0))
+
+  return handleCORS(NextResponse.json({ message: 'Work added successfully', items_added: items.length, total_added: totalAdded }, { status: 201 }))
+}
+
+/**
+ * DELETE /works/:id - Delete a work/item from draft APO
+ */
+export async function deleteWork(request, { db, params }) {
+  const user = await getSessionUser(request, db)
+  if (!user) return handleCORS(NextResponse.json({ error: 'Unauthorized' }, { status: 401 }))
+
+  const itemId = params.id
+  const item = await db.collection('apo_items').findOne({ id: itemId })
+  if (!item) return handleCORS(NextResponse.json({ error: 'Work item not found' }, { status: 404 }))
+
+  const apo = await db.collection('apo_headers').findOne({ id: item.apo_id })
+  if (!apo) return handleCORS(NextResponse.json({ error: 'APO not found' }, { status: 404 }))
+  if (apo.status !== 'DRAFT') return handleCORS(NextResponse.json({ error: 'Can only delete works from DRAFT APOs' }, { status: 400 }))
+
+  await db.collection('apo_items').deleteOne({ id: itemId })
+
+  // Update APO total
+  const newTotal = Math.max(0, (apo.total_sanctioned_amount || 0) - (item.total_cost || 0))
+  await db.collection('apo_headers').updateOne(
+    { id: item.apo_id },
+    { $set: { total_sanctioned_amount: newTotal, updated_at: new Date() }, $unset: { revised_total: '' } }
+  )
+  await recordApoAmountChange(db, apo, newTotal - (apo.total_sanctioned_amount || 0))
+
+  return handleCORS(NextResponse.json({ message: 'Work deleted successfully' }))
+}
+
+/**
+ * Register works routes
+ * @param {Router} router - Router to register on
+ */
+export function registerWorksRoutes(router) {
+  router.add('POST', '/works/suggest-activities', suggestActivities)
+  router.add('POST', '/works', addWork)
+  router.add('DELETE', '/works/:id', deleteWork)
+}
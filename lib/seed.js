@@ -0,0 +1,316 @@
+/**
+ * Seed Module
+ * Resets the database to the KFDC master and sample data for POST /seed
+ *
+ * A plain seed drops the seeded collections and reloads them from
+ * SEED_DATA in parallel. Index definitions are kept: the indexes of
+ * every dropped collection are read first and recreated, together with
+ * the index registry, on the empty collections before the inserts.
+ *
+ * mode=snapshot also copies the seeded collections into a template
+ * database (SEED_TEMPLATE_DB, default <db>_seed_template). mode=restore
+ * replaces the live collections with server-side $out copies of that
+ * template, with no round trip of the documents through the app. $out
+ * keeps the target's indexes. The snapshot stores a fingerprint of the
+ * seed data, so a template left by an older SEED_DATA is never restored.
+ * That case, and a restore with no snapshot, seed afresh and snapshot.
+ */
+import { createHash } from 'crypto'
+import logger from './logger'
+import { clearAuthCache } from './authCache'
+import { ensureIndexes } from './indexes'
+import { invalidateMasterData } from './masterData'
+import { rebuildRollups } from './rollups'
+import { reconcileSpendCounters } from './spendCounters'
+import { SEED_DATA } from './seedData'
+
+export const SEED_MODES = ['snapshot', 'restore']
+
+// Collections a seed resets; anything not loaded below is left empty
+export const SEED_COLLECTIONS = ['users', 'divisions', 'ranges', 'activity_master', 'norms_config', 'plantations', 'buildings', 'nurseries', 'building_activities', 'building_norms', 'nursery_activities', 'nursery_norms', 'apo_headers', 'apo_items', 'work_logs', 'fund_indents', 'sessions', 'dashboard_rollups']
+
+// Snapshot marker in the template database
+const SNAPSHOT_META_COLLECTION = 'seed_snapshot'
+
+// Sample APOs with real plantation refs
+const SAMPLE_APOS = [
+  {
+    id: 'apo-001',
+    plantation_id: 'plt-d01',
+    financial_year: '2026-27',
+    status: 'SANCTIONED',
+    total_sanctioned_amount: 327450,
+    created_by: 'usr-ro1',
+    approved_by: 'usr-dm1',
+    created_at: new Date('2026-04-01'),
+    updated_at: new Date('2026-04-05'),
+  },
+  {
+    id: 'apo-002',
+    plantation_id: 'plt-d06',
+    financial_year: '2026-27',
+    status: 'PENDING_APPROVAL',
+    total_sanctioned_amount: 112050,
+    created_by: 'usr-ro4',
+    approved_by: null,
+    created_at: new Date('2026-05-10'),
+    updated_at: new Date('2026-05-10'),
+  },
+  {
+    id: 'apo-003',
+    plantation_id: 'plt-b01',
+    financial_year: '2026-27',
+    status: 'SANCTIONED',
+    total_sanctioned_amount: 436800,
+    created_by: 'usr-ro2',
+    approved_by: 'usr-dm2',
+    created_at: new Date('2026-04-15'),
+    updated_at: new Date('2026-04-18'),
+  },
+  {
+    id: 'apo-004',
+    plantation_id: 'plt-s01',
+    financial_year: '2026-27',
+    status: 'DRAFT',
+    total_sanctioned_amount: 325800,
+    created_by: 'usr-ro3',
+    approved_by: null,
+    created_at: new Date('2026-05-20'),
+    updated_at: new Date('2026-05-20'),
+  },
+]
+
+const SAMPLE_APO_ITEMS = [
+  // APO-001: Varavanagalavi (12 yr old) - Dharwad
+  { id: 'apoi-001', apo_id: 'apo-001', activity_id: 'act-fireline', activity_name: 'Clearing 5m Wide Fire Lines', sanctioned_qty: 25, sanctioned_rate: 5455.86, total_cost: 136396.5, unit: 'Per Hectare' },
+  { id: 'apoi-002', apo_id: 'apo-001', activity_id: 'act-firewatch', activity_name: 'Engaging Fire Watchers', sanctioned_qty: 25, sanctioned_rate: 1784.01, total_cost: 44600.25, unit: 'Per Month' },
+  { id: 'apoi-003', apo_id: 'apo-001', activity_id: 'act-misc', activity_name: 'Miscellaneous (Implements, Spray pump etc)', sanctioned_qty: 1, sanctioned_rate: 5000, total_cost: 5000, unit: 'Lump Sum' },
+  // APO-002: Alloli-Kanasolli (22 yr old Eucalyptus)
+  { id: 'apoi-004', apo_id: 'apo-002', activity_id: 'act-fireline', activity_name: 'Clearing 5m Wide Fire Lines', sanctioned_qty: 15.5, sanctioned_rate: 5455.86, total_cost: 84565.83, unit: 'Per Hectare' },
+  { id: 'apoi-005', apo_id: 'apo-002', activity_id: 'act-firewatch', activity_name: 'Engaging Fire Watchers', sanctioned_qty: 15.5, sanctioned_rate: 1784.01, total_cost: 27652.16, unit: 'Per Month' },
+  // APO-003: Agara, Bangalore (25 yr old Eucalyptus)
+  { id: 'apoi-006', apo_id: 'apo-003', activity_id: 'act-fireline', activity_name: 'Clearing 5m Wide Fire Lines', sanctioned_qty: 65, sanctioned_rate: 5455.86, total_cost: 354630.9, unit: 'Per Hectare' },
+  { id: 'apoi-007', apo_id: 'apo-003', activity_id: 'act-firewatch', activity_name: 'Engaging Fire Watchers', sanctioned_qty: 65, sanctioned_rate: 1784.01, total_cost: 115960.65, unit: 'Per Month' },
+  // APO-004: Sagara (6 yr old Acacia)
+  { id: 'apoi-008', apo_id: 'apo-004', activity_id: 'act-fireline', activity_name: 'Clearing 5m Wide Fire Lines', sanctioned_qty: 45, sanctioned_rate: 5455.86, total_cost: 245513.7, unit: 'Per Hectare' },
+  { id: 'apoi-009', apo_id: 'apo-004', activity_id: 'act-firewatch', activity_name: 'Engaging Fire Watchers', sanctioned_qty: 45, sanctioned_rate: 1784.01, total_cost: 80280.45, unit: 'Per Month' },
+]
+
+const SAMPLE_WORK_LOGS = [
+  { id: 'wl-001', apo_item_id: 'apoi-001', work_date: new Date('2026-05-15'), actual_qty: 10, expenditure: 54558.6, logged_by: 'usr-ro1', created_at: new Date('2026-05-15') },
+  { id: 'wl-002', apo_item_id: 'apoi-006', work_date: new Date('2026-05-20'), actual_qty: 20, expenditure: 109117.2, logged_by: 'usr-ro2', created_at: new Date('2026-05-20') },
+  { id: 'wl-003', apo_item_id: 'apoi-007', work_date: new Date('2026-05-22'), actual_qty: 20, expenditure: 35680.2, logged_by: 'usr-ro2', created_at: new Date('2026-05-22') },
+]
+
+/**
+ * Documents to insert per collection (fresh copies, with created_at stamped now)
+ * @returns {object} Collection name -> documents
+ */
+export function buildSeedDocuments() {
+  const now = new Date()
+  return {
+    divisions: SEED_DATA.divisions,
+    ranges: SEED_DATA.ranges,
+    users: SEED_DATA.users,
+    activity_master: SEED_DATA.activities,
+    norms_config: SEED_DATA.norms,
+    plantations: SEED_DATA.plantations.map(p => ({ ...p, created_at: now })),
+    buildings: SEED_DATA.buildings.map(b => ({ ...b, created_at: now })),
+    building_activities: SEED_DATA.building_activities,
+    building_norms: SEED_DATA.building_norms,
+    nurseries: SEED_DATA.nurseries.map(n => ({ ...n, created_at: now })),
+    nursery_activities: SEED_DATA.nursery_activities,
+    nursery_norms: SEED_DATA.nursery_norms,
+    apo_headers: SAMPLE_APOS,
+    apo_items: SAMPLE_APO_ITEMS,
+    work_logs: SAMPLE_WORK_LOGS,
+  }
+}
+
+/**
+ * Hash of the seed data, stored with a snapshot to detect a stale template
+ * @returns {string} sha1 hex digest
+ */
+export function seedFingerprint() {
+  return createHash('sha1')
+    .update(JSON.stringify([SEED_COLLECTIONS, SEED_DATA, SAMPLE_APOS, SAMPLE_APO_ITEMS, SAMPLE_WORK_LOGS]))
+    .digest('hex')
+}
+
+/**
+ * Name of the template database holding the seed snapshot
+ * @param {Db} db - Live database
+ * @returns {string} Database name
+ */
+export function templateDbName(db) {
+  return process.env.SEED_TEMPLATE_DB || `${db.databaseName}_seed_template`
+}
+
+/**
+ * Milliseconds since start, rounded to 0.1 ms
+ */
+function elapsed(start) {
+  return Math.round((performance.now() - start) * 10) / 10
+}
+
+/**
+ * Read the non-default indexes of the seeded collections before they are dropped
+ * @param {Db} db - MongoDB database instance
+ * @returns {object} Collection name -> index specs ({ key, options })
+ */
+async function captureIndexes(db) {
+  const existing = new Set((await db.listCollections({}, { nameOnly: true }).toArray()).map(c => c.name))
+  const specs = {}
+  await Promise.all(SEED_COLLECTIONS.filter(name => existing.has(name)).map(async (name) => {
+    const indexes = await db.collection(name).listIndexes().toArray()
+    specs[name] = indexes
+      .filter(index => index.name !== '_id_')
+      .map(({ key, v, ns, ...options }) => ({ key, options }))
+  }))
+  return specs
+}
+
+/**
+ * Recreate captured indexes that the registry does not already define
+ * A failing spec is logged and skipped, like ensureIndexes does.
+ * @param {Db} db - MongoDB database instance
+ * @param {object} specs - Output of captureIndexes
+ * @returns {number} Indexes recreated
+ */
+async function restoreIndexes(db, specs) {
+  let restored = 0
+  await Promise.all(Object.entries(specs).flatMap(([name, indexes]) =>
+    indexes.map(async ({ key, options }) => {
+      try {
+        await db.collection(name).createIndex(key, options)
+        restored++
+      } catch (error) {
+        logger.warn('Could not recreate index after seed', { collection: name, index: options.name, error: error.message })
+      }
+    })
+  ))
+  return restored
+}
+
+/**
+ * Reset every in-process cache that holds seeded data
+ */
+function invalidateSeedCaches() {
+  // Sessions and users are gone - nothing cached can be valid anymore
+  clearAuthCache()
+  // Master collections were rewritten - anything loaded during the reseed is stale too
+  invalidateMasterData()
+}
+
+/**
+ * Drop and reload the seeded collections, all collections in parallel
+ * @param {Db} db - MongoDB database instance
+ * @returns {object} { counts (documents per collection), timings }
+ */
+export async function seedCollections(db) {
+  const started = performance.now()
+  const timings = { collections: {} }
+
+  let stepStart = performance.now()
+  const capturedIndexes = await captureIndexes(db)
+  await Promise.all(SEED_COLLECTIONS.map(name =>
+    db.collection(name).drop().catch(() => { /* ignore if not exists */ })
+  ))
+  invalidateSeedCaches()
+  timings.drop_ms = elapsed(stepStart)
+
+  // Index builds on empty collections are instant; the inserts then keep them current
+  stepStart = performance.now()
+  await ensureIndexes(db)
+  await restoreIndexes(db, capturedIndexes)
+  timings.indexes_ms = elapsed(stepStart)
+
+  stepStart = performance.now()
+  const documents = buildSeedDocuments()
+  const counts = {}
+  await Promise.all(Object.entries(documents).map(async ([name, docs]) => {
+    const collectionStart = performance.now()
+    // insertMany adds _id to the documents it is given
+    await db.collection(name).insertMany(docs.map(doc => ({ ...doc })), { ordered: false })
+    counts[name] = docs.length
+    timings.collections[name] = elapsed(collectionStart)
+  }))
+  timings.insert_ms = elapsed(stepStart)
+  invalidateMasterData()
+
+  stepStart = performance.now()
+  await Promise.all([rebuildRollups(db), reconcileSpendCounters(db)])
+  timings.derived_ms = elapsed(stepStart)
+
+  timings.total_ms = elapsed(started)
+  return { counts, timings }
+}
+
+/**
+ * Copy the seeded collections into the template database
+ * @param {Db} db - Freshly seeded database
+ * @returns {object} { template, timings }
+ */
+export async function snapshotSeed(db) {
+  const started = performance.now()
+  const templateName = templateDbName(db)
+  const template = db.client.db(templateName)
+  const timings = { collections: {} }
+  const counts = {}
+
+  await template.collection(SNAPSHOT_META_COLLECTION).deleteMany({})
+  await Promise.all(SEED_COLLECTIONS.map(async (name) => {
+    const collectionStart = performance.now()
+    counts[name] = await db.collection(name).countDocuments()
+    if (counts[name] > 0) {
+      await db.collection(name).aggregate([{ $out: { db: templateName, coll: name } }]).toArray()
+    } else {
+      await template.collection(name).drop().catch(() => { /* ignore if not exists */ })
+    }
+    timings.collections[name] = elapsed(collectionStart)
+  }))
+  // Written last, so an interrupted snapshot is never restored
+  await template.collection(SNAPSHOT_META_COLLECTION).insertOne({
+    fingerprint: seedFingerprint(),
+    counts,
+    created_at: new Date(),
+  })
+
+  timings.total_ms = elapsed(started)
+  return { template: templateName, timings }
+}
+
+/**
+ * Replace the seeded collections with the template copies
+ * @param {Db} db - MongoDB database instance
+ * @returns {object|null} { counts, timings }, or null without a current snapshot
+ */
+export async function restoreSeed(db) {
+  const started = performance.now()
+  const templateName = templateDbName(db)
+  const template = db.client.db(templateName)
+  const snapshot = await template.collection(SNAPSHOT_META_COLLECTION).findOne({})
+  if (!snapshot || snapshot.fingerprint !== seedFingerprint()) return null
+
+  const timings = { collections: {} }
+  await Promise.all(SEED_COLLECTIONS.map(async (name) => {
+    const collectionStart = performance.now()
+    if (snapshot.counts[name] > 0) {
+      await template.collection(name).aggregate([{ $out: { db: db.databaseName, coll: name } }]).toArray()
+    } else {
+      await db.collection(name).deleteMany({})
+    }
+    timings.collections[name] = elapsed(collectionStart)
+  }))
+  invalidateSeedCaches()
+
+  // No-op for collections $out replaced; builds them where the collection was missing
+  const stepStart = performance.now()
+  await ensureIndexes(db)
+  timings.indexes_ms = elapsed(stepStart)
+
+  timings.total_ms = elapsed(started)
+  return { counts: snapshot.counts, timings }
+}
+
+export default { SEED_MODES, SEED_COLLECTIONS, buildSeedDocuments, seedFingerprint, templateDbName, seedCollections, snapshotSeed, restoreSeed }
@@ -0,0 +1,379 @@
+/**
+ * Seed Data Module
+ * Real KFDC data from the Excel masters, loaded by POST /seed
+ */
+
+export const SEED_DATA = {
+  divisions: [
+    { id: 'div-bangalore', name: 'Bangalore', code: 'BLR' },
+    { id: 'div-dharwad', name: 'Dharwad', code: 'DWD' },
+    { id: 'div-shimoga', name: 'Shivamogga', code: 'SHM' },
+    { id: 'div-chikmagalur', name: 'Chikkamagaluru', code: 'CKM' },
+  ],
+  ranges: [
+    // Bangalore Division
+    { id: 'rng-svpura', division_id: 'div-bangalore', name: 'S.V. Pura' },
+    { id: 'rng-mulbagilu', division_id: 'div-bangalore', name: 'Mulabagilu' },
+    { id: 'rng-dvhalli', division_id: 'div-bangalore', name: 'D.V. Halli' },
+    { id: 'rng-malur', division_id: 'div-bangalore', name: 'Malur' },
+    { id: 'rng-bangarpet', division_id: 'div-bangalore', name: 'Bangarpet' },
+    { id: 'rng-bidadi', division_id: 'div-bangalore', name: 'Bidadi' },
+    // Dharwad Division
+    { id: 'rng-dharwad', division_id: 'div-dharwad', name: 'Dharwad' },
+    { id: 'rng-alloli', division_id: 'div-dharwad', name: 'Alloli-Kanasolli' },
+    { id: 'rng-akrali', division_id: 'div-dharwad', name: 'Akrali' },
+    { id: 'rng-gunji', division_id: 'div-dharwad', name: 'Gunji' },
+    { id: 'rng-dhundashi', division_id: 'div-dharwad', name: 'Dhundashi' },
+    { id: 'rng-khanapur', division_id: 'div-dharwad', name: 'Khanapur' },
+    // Shivamogga Division
+    { id: 'rng-sagara', division_id: 'div-shimoga', name: 'Sagara' },
+    { id: 'rng-soraba', division_id: 'div-shimoga', name: 'Soraba' },
+    { id: 'rng-siddapur', division_id: 'div-shimoga', name: 'Siddapur' },
+    { id: 'rng-hosanagar', division_id: 'div-shimoga', name: 'Hosanagar' },
+    // Chikkamagaluru Division
+    { id: 'rng-koppa', division_id: 'div-chikmagalur', name: 'Koppa' },
+    { id: 'rng-narasimharajapura', division_id: 'div-chikmagalur', name: 'Narasimharajapura' },
+    { id: 'rng-sringeri', division_id: 'div-chikmagalur', name: 'Sringeri' },
+  ],
+  users: [
+    // Range Officers (RO) - Data Entry Only (Plantations, Buildings, Nurseries)
+    { id: 'usr-ro1', email: 'ro.dharwad@kfdc.in', password: 'pass123', name: 'Ramesh Kumar', role: 'RO', division_id: 'div-dharwad', range_id: 'rng-dharwad' },
+    { id: 'usr-ro2', email: 'ro.svpura@kfdc.in', password: 'pass123', name: 'Suresh Gowda', role: 'RO', division_id: 'div-bangalore', range_id: 'rng-svpura' },
+    { id: 'usr-ro3', email: 'ro.sagara@kfdc.in', password: 'pass123', name: 'Manjunath Hegde', role: 'RO', division_id: 'div-shimoga', range_id: 'rng-sagara' },
+    { id: 'usr-ro4', email: 'ro.alloli@kfdc.in', password: 'pass123', name: 'Basavaraj Patil', role: 'RO', division_id: 'div-dharwad', range_id: 'rng-alloli' },
+    // Division Officers (DO) - APO Creation & Compilation - NEW ROLE
+    { id: 'usr-do1', email: 'do.dharwad@kfdc.in', password: 'pass123', name: 'Anjali Sharma', role: 'DO', division_id: 'div-dharwad', range_id: null },
+    { id: 'usr-do2', email: 'do.bangalore@kfdc.in', password: 'pass123', name: 'Priya Hegde', role: 'DO', division_id: 'div-bangalore', range_id: null },
+    { id: 'usr-do3', email: 'do.shimoga@kfdc.in', password: 'pass123', name: 'Nagaraj Rao', role: 'DO', division_id: 'div-shimoga', range_id: null },
+    // Legacy DM users (keep for backward compatibility, mapped to DO)
+    { id: 'usr-dm1', email: 'dm.dharwad@kfdc.in', password: 'pass123', name: 'Anjali Sharma DM', role: 'DO', division_id: 'div-dharwad', range_id: null },
+    { id: 'usr-dm2', email: 'dm.bangalore@kfdc.in', password: 'pass123', name: 'Priya Hegde DM', role: 'DO', division_id: 'div-bangalore', range_id: null },
+    { id: 'usr-dm3', email: 'dm.shimoga@kfdc.in', password: 'pass123', name: 'Nagaraj Rao DM', role: 'DO', division_id: 'div-shimoga', range_id: null },
+    // Executive Director (ED) - First Level APO Approval
+    { id: 'usr-ed1', email: 'ed@kfdc.in', password: 'pass123', name: 'Rajesh Naik ED', role: 'ED', division_id: null, range_id: null },
+    // Managing Director (MD) - Final APO Approval  
+    { id: 'usr-md1', email: 'md@kfdc.in', password: 'pass123', name: 'Dr. Shivakumar MD', role: 'MD', division_id: null, range_id: null },
+    // Admin
+    { id: 'usr-admin1', email: 'admin@kfdc.in', password: 'pass123', name: 'Dr. Venkatesh Rao', role: 'ADMIN', division_id: null, range_id: null },
+    // Fund Indent Hierarchy: RFO → DCF → ED → MD
+    { id: 'usr-rfo1', email: 'rfo.dharwad@kfdc.in', password: 'pass123', name: 'Anil Kumar RFO', role: 'RFO', division_id: 'div-dharwad', range_id: 'rng-dharwad' },
+    { id: 'usr-dcf1', email: 'dcf.dharwad@kfdc.in', password: 'pass123', name: 'Suresh Patil DCF', role: 'DCF', division_id: 'div-dharwad', range_id: null },
+  ],
+  // Districts and Taluks from KFDC Document
+  districts_taluks: [
+    { district: 'Shivamogga', taluks: ['Shivamogga', 'Bhadravathi', 'Nidige', 'Shikaripura', 'Sagara', 'Soraba', 'Thirthahalli', 'Hosanagara', 'Honnali'] },
+    { district: 'Chikkamagalore', taluks: ['Chikkamagalore', 'Kadur', 'N.R.Pura'] },
+    { district: 'Hassan', taluks: ['Hassan', 'Sakaleshapura', 'Arasikere', 'Holenarasipura', 'Chennarayapattana'] },
+    { district: 'Dharwad', taluks: ['Dharwad', 'Kalagatagi'] },
+    { district: 'Belagavi', taluks: ['Khanapura', 'Kittur'] },
+    { district: 'Haveri', taluks: ['Shiggaon', 'Hanagal'] },
+    { district: 'Uttara Kannada', taluks: ['Sirsi', 'Siddapura', 'Mundgod', 'Joida', 'Yellapur', 'Khanapur'] },
+    { district: 'Kolar', taluks: ['Kolar', 'Malur', 'Mulabagilu', 'Srinivasapura', 'S.V. Pura', 'Bangarpet'] },
+    { district: 'Ramanagara', taluks: ['Ramanagara', 'Bangalore rural', 'Nelamangala', 'Devanahalli', 'Magadi', 'Kanakapura'] },
+    { district: 'Chikkaballapura', taluks: ['Chikkaballapura', 'Shidlaghatta'] },
+    { district: 'Doddaballapura', taluks: ['Doddaballapura', 'D.V. Halli'] },
+  ],
+  // Real KFDC Activities with SSR Numbers from Masters Excel
+  activities: [
+    { id: 'act-survey', name: 'Survey & Demarcation', category: 'Advance Works', unit: 'Per Km', ssr_no: '71' },
+    { id: 'act-dozing', name: 'Dozing & Ripping (Fuel cost)', category: 'Advance Works', unit: 'Per Hectare', ssr_no: '-' },
+    { id: 'act-jungle', name: 'Jungle Clearance', category: 'Advance Works', unit: 'Per Hectare', ssr_no: '72(C)' },
+    { id: 'act-debris', name: 'Lifting & Heaping of Debris', category: 'Advance Works', unit: 'Per Hectare', ssr_no: '73(a)' },
+    { id: 'act-preweeding', name: 'Pre-weeding before Planting', category: 'Planting Works', unit: 'Per Hectare', ssr_no: '88(i)' },
+    { id: 'act-loading', name: 'Loading & Unloading of RTS/PBS', category: 'Planting Works', unit: 'Per 1000 Sdls', ssr_no: '81(i)' },
+    { id: 'act-transport', name: 'Transportation of Seedlings', category: 'Planting Works', unit: 'Per 1000 Sdls', ssr_no: '81(ii)' },
+    { id: 'act-antitermite', name: 'Anti-termite Pesticide Treatment', category: 'Planting Works', unit: 'Per Hectare', ssr_no: '82' },
+    { id: 'act-dipping', name: 'Dipping of RT/Pbs in Solution', category: 'Planting Works', unit: 'Per 1000 Sdls', ssr_no: '95(i)' },
+    { id: 'act-conveyance', name: 'Conveyance of RT to Planting Spot', category: 'Planting Works', unit: 'Per 1000 Sdls', ssr_no: '96(i)' },
+    { id: 'act-planting', name: 'Planting of Seedlings', category: 'Planting Works', unit: 'Per 1000 Sdls', ssr_no: '97(ii)' },
+    { id: 'act-fertilizer', name: 'Application of Fertilizer (NPK/DAP)', category: 'Maintenance', unit: 'Per Hectare', ssr_no: '86' },
+    { id: 'act-fertcost', name: 'Cost of Fertilizer', category: 'Maintenance', unit: 'Per 1000 Sdls', ssr_no: '87' },
+    { id: 'act-ferttrans', name: 'Transportation of Fertilizers', category: 'Maintenance', unit: 'Per 1000 Sdls', ssr_no: '103a' },
+    { id: 'act-weeding1', name: '1st Clear Weeding (100% area)', category: 'Maintenance', unit: 'Per Hectare', ssr_no: '88(ii)' },
+    { id: 'act-weeding2', name: '2nd Clear Weeding', category: 'Maintenance', unit: 'Per Hectare', ssr_no: '88(ii)' },
+    { id: 'act-fireline', name: 'Clearing 5m Wide Fire Lines', category: 'Maintenance', unit: 'Per Hectare', ssr_no: '99(a)' },
+    { id: 'act-firewatch', name: 'Engaging Fire Watchers', category: 'Protection', unit: 'Per Month', ssr_no: '76(1)' },
+    { id: 'act-watchward', name: 'Watch & Ward (270 days)', category: 'Protection', unit: 'Per 20 Ha', ssr_no: '76' },
+    { id: 'act-fencing', name: 'Brush Wood Fencing', category: 'Maintenance', unit: 'Per Hectare', ssr_no: '86' },
+    { id: 'act-cpt', name: 'CPT Excavation (Cattle Proof Trench)', category: 'Maintenance', unit: 'Per Rmtr', ssr_no: '-' },
+    { id: 'act-interplough', name: 'Interploughing (Bulldozer Fuel)', category: 'Maintenance', unit: 'Per Hectare', ssr_no: '72(C)' },
+    { id: 'act-nursery', name: 'Nursery Raising (Clonal/Seedling)', category: 'Nursery', unit: 'Per 1000 Sdls', ssr_no: '-' },
+    { id: 'act-nameboard', name: 'Cement/Stone Plantation Name Board', category: 'Planting Works', unit: 'Per Unit', ssr_no: '-' },
+    { id: 'act-misc', name: 'Miscellaneous (Implements, Spray pump etc)', category: 'Maintenance', unit: 'Lump Sum', ssr_no: '-' },
+  ],
+  // Real Norms/Rates from KFDC Masters Excel for FY 2026-27
+  norms: [
+    // === ADVANCE WORKS (Year 0 / Pre-planting) ===
+    { id: 'norm-a1', activity_id: 'act-survey', applicable_age: 0, species_id: null, standard_rate: 1534.16, financial_year: '2026-27' },
+    { id: 'norm-a2', activity_id: 'act-dozing', applicable_age: 0, species_id: null, standard_rate: 12600, financial_year: '2026-27' },
+    { id: 'norm-a3', activity_id: 'act-jungle', applicable_age: 0, species_id: null, standard_rate: 12600, financial_year: '2026-27' },
+    { id: 'norm-a4', activity_id: 'act-debris', applicable_age: 0, species_id: null, standard_rate: 2854.48, financial_year: '2026-27' },
+    // === PLANTING WORKS (Year 1) ===
+    { id: 'norm-p1', activity_id: 'act-preweeding', applicable_age: 1, species_id: null, standard_rate: 1199.94, financial_year: '2026-27' },
+    { id: 'norm-p2', activity_id: 'act-loading', applicable_age: 1, species_id: null, standard_rate: 259.89, financial_year: '2026-27' },
+    { id: 'norm-p3', activity_id: 'act-transport', applicable_age: 1, species_id: null, standard_rate: 595.97, financial_year: '2026-27' },
+    { id: 'norm-p4', activity_id: 'act-antitermite', applicable_age: 1, species_id: null, standard_rate: 300, financial_year: '2026-27' },
+    { id: 'norm-p5', activity_id: 'act-dipping', applicable_age: 1, species_id: null, standard_rate: 400.16, financial_year: '2026-27' },
+    { id: 'norm-p6', activity_id: 'act-conveyance', applicable_age: 1, species_id: null, standard_rate: 918.66, financial_year: '2026-27' },
+    { id: 'norm-p7', activity_id: 'act-planting', applicable_age: 1, species_id: null, standard_rate: 1521.71, financial_year: '2026-27' },
+    { id: 'norm-p8', activity_id: 'act-fertilizer', applicable_age: 1, species_id: null, standard_rate: 1555, financial_year: '2026-27' },
+    { id: 'norm-p9', activity_id: 'act-fertcost', applicable_age: 1, species_id: null, standard_rate: 570.86, financial_year: '2026-27' },
+    { id: 'norm-p10', activity_id: 'act-weeding1', applicable_age: 1, species_id: null, standard_rate: 3586.11, financial_year: '2026-27' },
+    { id: 'norm-p11', activity_id: 'act-weeding2', applicable_age: 1, species_id: null, standard_rate: 3211.18, financial_year: '2026-27' },
+    { id: 'norm-p12', activity_id: 'act-watchward', applicable_age: 1, species_id: null, standard_rate: 4994, financial_year: '2026-27' },
+    { id: 'norm-p13', activity_id: 'act-fencing', applicable_age: 1, species_id: null, standard_rate: 2997.22, financial_year: '2026-27' },
+    { id: 'norm-p14', activity_id: 'act-nameboard', applicable_age: 1, species_id: null, standard_rate: 5000, financial_year: '2026-27' },
+    // === 2ND YEAR MAINTENANCE ===
+    { id: 'norm-m2a', activity_id: 'act-weeding1', applicable_age: 2, species_id: null, standard_rate: 3586.11, financial_year: '2026-27' },
+    { id: 'norm-m2b', activity_id: 'act-weeding2', applicable_age: 2, species_id: null, standard_rate: 3211.18, financial_year: '2026-27' },
+    { id: 'norm-m2c', activity_id: 'act-fertilizer', applicable_age: 2, species_id: null, standard_rate: 1555, financial_year: '2026-27' },
+    { id: 'norm-m2d', activity_id: 'act-fertcost', applicable_age: 2, species_id: null, standard_rate: 570.86, financial_year: '2026-27' },
+    { id: 'norm-m2e', activity_id: 'act-fireline', applicable_age: 2, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m2f', activity_id: 'act-firewatch', applicable_age: 2, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m2g', activity_id: 'act-watchward', applicable_age: 2, species_id: null, standard_rate: 4994, financial_year: '2026-27' },
+    // === 3RD YEAR MAINTENANCE ===
+    { id: 'norm-m3a', activity_id: 'act-weeding1', applicable_age: 3, species_id: null, standard_rate: 3586.11, financial_year: '2026-27' },
+    { id: 'norm-m3b', activity_id: 'act-fertilizer', applicable_age: 3, species_id: null, standard_rate: 1555, financial_year: '2026-27' },
+    { id: 'norm-m3c', activity_id: 'act-fertcost', applicable_age: 3, species_id: null, standard_rate: 570.86, financial_year: '2026-27' },
+    { id: 'norm-m3d', activity_id: 'act-interplough', applicable_age: 3, species_id: null, standard_rate: 12600, financial_year: '2026-27' },
+    { id: 'norm-m3e', activity_id: 'act-fireline', applicable_age: 3, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m3f', activity_id: 'act-firewatch', applicable_age: 3, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 4TH YEAR MAINTENANCE ===
+    { id: 'norm-m4a', activity_id: 'act-fireline', applicable_age: 4, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m4b', activity_id: 'act-firewatch', applicable_age: 4, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 5TH YEAR MAINTENANCE ===
+    { id: 'norm-m5a', activity_id: 'act-fireline', applicable_age: 5, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m5b', activity_id: 'act-firewatch', applicable_age: 5, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 6TH-8TH YEAR (Fire maintenance only) ===
+    { id: 'norm-m6a', activity_id: 'act-fireline', applicable_age: 6, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m6b', activity_id: 'act-firewatch', applicable_age: 6, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m7a', activity_id: 'act-fireline', applicable_age: 7, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m7b', activity_id: 'act-firewatch', applicable_age: 7, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 8TH YEAR (Fire maintenance) ===
+    { id: 'norm-m8a', activity_id: 'act-fireline', applicable_age: 8, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m8b', activity_id: 'act-firewatch', applicable_age: 8, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 9TH YEAR (After 1st Cut Eucalyptus) ===
+    { id: 'norm-m9a', activity_id: 'act-fireline', applicable_age: 9, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m9b', activity_id: 'act-firewatch', applicable_age: 9, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 10TH-15TH YEAR ===
+    { id: 'norm-m10a', activity_id: 'act-firewatch', applicable_age: 10, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m10b', activity_id: 'act-fireline', applicable_age: 10, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    // === 11TH YEAR ===
+    { id: 'norm-m11a', activity_id: 'act-fireline', applicable_age: 11, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m11b', activity_id: 'act-firewatch', applicable_age: 11, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m12a', activity_id: 'act-fireline', applicable_age: 12, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m12b', activity_id: 'act-firewatch', applicable_age: 12, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 13TH-15TH YEAR ===
+    { id: 'norm-m13a', activity_id: 'act-fireline', applicable_age: 13, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m13b', activity_id: 'act-firewatch', applicable_age: 13, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m14a', activity_id: 'act-fireline', applicable_age: 14, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m14b', activity_id: 'act-firewatch', applicable_age: 14, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m15a', activity_id: 'act-fireline', applicable_age: 15, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m15b', activity_id: 'act-firewatch', applicable_age: 15, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 16TH YEAR (After 2nd Cut Eucalyptus) ===
+    { id: 'norm-m16a', activity_id: 'act-fireline', applicable_age: 16, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m16b', activity_id: 'act-firewatch', applicable_age: 16, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === 17TH-21ST YEAR (Continued maintenance for older plantations) ===
+    { id: 'norm-m17a', activity_id: 'act-fireline', applicable_age: 17, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m17b', activity_id: 'act-firewatch', applicable_age: 17, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m18a', activity_id: 'act-fireline', applicable_age: 18, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m18b', activity_id: 'act-firewatch', applicable_age: 18, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m19a', activity_id: 'act-fireline', applicable_age: 19, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m19b', activity_id: 'act-firewatch', applicable_age: 19, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m20a', activity_id: 'act-fireline', applicable_age: 20, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m20b', activity_id: 'act-firewatch', applicable_age: 20, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m21a', activity_id: 'act-fireline', applicable_age: 21, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m21b', activity_id: 'act-firewatch', applicable_age: 21, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m22a', activity_id: 'act-fireline', applicable_age: 22, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m22b', activity_id: 'act-firewatch', applicable_age: 22, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m25a', activity_id: 'act-fireline', applicable_age: 25, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m25b', activity_id: 'act-firewatch', applicable_age: 25, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m27a', activity_id: 'act-fireline', applicable_age: 27, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m27b', activity_id: 'act-firewatch', applicable_age: 27, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m28a', activity_id: 'act-fireline', applicable_age: 28, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m28b', activity_id: 'act-firewatch', applicable_age: 28, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m30a', activity_id: 'act-fireline', applicable_age: 30, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m30b', activity_id: 'act-firewatch', applicable_age: 30, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m31a', activity_id: 'act-fireline', applicable_age: 31, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m31b', activity_id: 'act-firewatch', applicable_age: 31, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m32a', activity_id: 'act-fireline', applicable_age: 32, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m32b', activity_id: 'act-firewatch', applicable_age: 32, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    { id: 'norm-m40a', activity_id: 'act-fireline', applicable_age: 40, species_id: null, standard_rate: 5455.86, financial_year: '2026-27' },
+    { id: 'norm-m40b', activity_id: 'act-firewatch', applicable_age: 40, species_id: null, standard_rate: 1784.01, financial_year: '2026-27' },
+    // === NURSERY ===
+    { id: 'norm-n1', activity_id: 'act-nursery', applicable_age: 0, species_id: null, standard_rate: 47762, financial_year: '2026-27' },
+    // === FIRE WATCHERS (all ages) ===
+    { id: 'norm-fw1', activity_id: 'act-firewatch', applicable_age: 0, species_id: null, standard_rate: 18117, financial_year: '2026-27' },
+  ],
+  // Real Plantations from KFDC Dharwad & Bangalore Division Excel Data
+  plantations: [
+    // Dharwad Division - Dharwad Range
+    { id: 'plt-d01', range_id: 'rng-dharwad', name: 'Varavanagalavi', species: 'Acacia Auriculiformis', year_of_planting: 2014, total_area_ha: 25, village: 'Varavanagalavi', taluk: 'Dharwad', district: 'Dharwad', work_type: 'M', vidhana_sabha: 'Dharwad', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d02', range_id: 'rng-dharwad', name: 'Varavanagalavi (Casuarina)', species: 'Casurina junguniana', year_of_planting: 2017, total_area_ha: 10, village: 'Varavanagalavi', taluk: 'Dharwad', district: 'Dharwad', work_type: 'M', vidhana_sabha: 'Dharwad', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d03', range_id: 'rng-dharwad', name: 'Varavanagalavi (2011)', species: 'Acacia auriculiformis', year_of_planting: 2011, total_area_ha: 22, village: 'Varavanagalavi', taluk: 'Dharwad', district: 'Dharwad', work_type: 'M', vidhana_sabha: 'Dharwad', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d04', range_id: 'rng-dharwad', name: 'Ninganakoppa-Kanvihalkatti', species: 'Acacia auriculiformis', year_of_planting: 2004, total_area_ha: 15.5, village: 'Ninganakoppa', taluk: 'Dharwad', district: 'Dharwad', work_type: 'M', vidhana_sabha: 'Dharwad', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d05', range_id: 'rng-dharwad', name: 'Degaon', species: 'Acacia auriculiformis', year_of_planting: 2018, total_area_ha: 14.6, village: 'Degaon', taluk: 'Dharwad', district: 'Dharwad', work_type: 'M', vidhana_sabha: 'Dharwad', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    // Dharwad Division - Alloli-Kanasolli Range
+    { id: 'plt-d06', range_id: 'rng-alloli', name: 'Alloli-Kanasolli XXV 11,13', species: 'Eucalyptus pellita', year_of_planting: 2004, total_area_ha: 15.5, village: 'Alloli-Kanasolli', taluk: 'Khanapur', district: 'Belagavi', work_type: 'M', vidhana_sabha: 'Khanapur', lok_sabha: 'Belagavi', division: 'Dharwad' },
+    { id: 'plt-d07', range_id: 'rng-alloli', name: 'Alloli-Kanasolli XXV 15,16', species: 'Eucalyptus pellita', year_of_planting: 1999, total_area_ha: 10, village: 'Alloli-Kanasolli', taluk: 'Khanapur', district: 'Belagavi', work_type: 'M', vidhana_sabha: 'Khanapur', lok_sabha: 'Belagavi', division: 'Dharwad' },
+    { id: 'plt-d08', range_id: 'rng-alloli', name: 'Katagali-XXV-28,29p', species: 'Eucalyptus pellita', year_of_planting: 2005, total_area_ha: 13.1, village: 'Kategali', taluk: 'Khanapur', district: 'Belagavi', work_type: 'M', vidhana_sabha: 'Khanapur', lok_sabha: 'Belagavi', division: 'Dharwad' },
+    { id: 'plt-d09', range_id: 'rng-alloli', name: 'Mohishet Nursery', species: 'Eucalyptus pellita', year_of_planting: 2014, total_area_ha: 1.65, village: 'Mohishet', taluk: 'Khanapur', district: 'Belagavi', work_type: 'M', vidhana_sabha: 'Khanapur', lok_sabha: 'Belagavi', division: 'Dharwad' },
+    { id: 'plt-d10', range_id: 'rng-alloli', name: 'Akrali-VII 13p', species: 'Eucalyptus pellita', year_of_planting: 2006, total_area_ha: 81.1, village: 'Akrali', taluk: 'Khanapur', district: 'Belagavi', work_type: 'M', vidhana_sabha: 'Khanapur', lok_sabha: 'Belagavi', division: 'Dharwad' },
+    // Dharwad Division - Akrali Range
+    { id: 'plt-d11', range_id: 'rng-akrali', name: 'Bacholli XXV-7', species: 'Acacia auriculiformis', year_of_planting: 1998, total_area_ha: 16.14, village: 'Bacholli', taluk: 'Khanapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d12', range_id: 'rng-akrali', name: 'Balekoppa', species: 'Acacia auriculiformis', year_of_planting: 2014, total_area_ha: 60, village: 'Balekoppa', taluk: 'Khanapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d13', range_id: 'rng-akrali', name: 'Santalli-Hebbatti-Kiravatti', species: 'Acacia auriculiformis', year_of_planting: 2015, total_area_ha: 39, village: 'Santalli', taluk: 'Khanapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d14', range_id: 'rng-akrali', name: 'Nidgod', species: 'Acacia auriculiformis', year_of_planting: 2015, total_area_ha: 28.4, village: 'Nidgod', taluk: 'Khanapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d15', range_id: 'rng-akrali', name: 'Hattarwada-Mendegali XVII-10p', species: 'Eucalyptus pellita', year_of_planting: 2016, total_area_ha: 12.4, village: 'Hattarwada', taluk: 'Khanapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    // Dharwad Division - Gunji Range
+    { id: 'plt-d16', range_id: 'rng-gunji', name: 'Salakinakoppa', species: 'Acacia auriculiformis', year_of_planting: 2004, total_area_ha: 29.63, village: 'Salakinakoppa', taluk: 'Khanapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d17', range_id: 'rng-gunji', name: 'Hattargunji-Ganebail', species: 'Acacia auriculiformis', year_of_planting: 2001, total_area_ha: 20, village: 'Hattargunji', taluk: 'Mundgod', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d18', range_id: 'rng-gunji', name: 'Karkikoppa VII-11p', species: 'Acacia auriculiformis', year_of_planting: 2007, total_area_ha: 26.5, village: 'Karkikoppa', taluk: 'Yellapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d19', range_id: 'rng-gunji', name: 'Unchalli-Bidralli', species: 'Acacia auriculiformis', year_of_planting: 2023, total_area_ha: 15, village: 'Unchalli', taluk: 'Yellapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    // Dharwad Division - Dhundashi Range
+    { id: 'plt-d20', range_id: 'rng-dhundashi', name: 'Watra VII 12,14', species: 'Acacia auriculiformis', year_of_planting: 2001, total_area_ha: 15, village: 'Watra', taluk: 'Yellapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    { id: 'plt-d21', range_id: 'rng-dhundashi', name: 'Kamataga', species: 'Acacia auriculiformis', year_of_planting: 2019, total_area_ha: 31.2, village: 'Kamataga', taluk: 'Yellapur', district: 'Uttara Kannada', work_type: 'M', lok_sabha: 'Dharwad', division: 'Dharwad' },
+    // Dharwad Division - Khanapur Range - Fresh Works (2025)
+    { id: 'plt-d22', range_id: 'rng-khanapur', name: 'Kinaye R.F 166', species: 'Acacia auriculiformis', year_of_planting: 2025, total_area_ha: 41.5, village: 'Kinaye', taluk: 'Khanapur', district: 'Belagavi', work_type: 'FW', vidhana_sabha: 'Khanapur', lok_sabha: 'Belagavi', division: 'Dharwad' },
+    { id: 'plt-d23', range_id: 'rng-khanapur', name: 'Watra RF 83,86', species: 'Acacia auriculiformis', year_of_planting: 2025, total_area_ha: 30, village: 'Watra', taluk: 'Khanapur', district: 'Belagavi', work_type: 'FW', vidhana_sabha: 'Khanapur', lok_sabha: 'Belagavi', division: 'Dharwad' },
+    // Bangalore Division - S.V. Pura Range
+    { id: 'plt-b01', range_id: 'rng-svpura', name: 'Agara', species: 'Eucalyptus', year_of_planting: 2001, total_area_ha: 65, village: 'Vadigepalli', taluk: 'S.V. Pura', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Srinivasapura', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    { id: 'plt-b02', range_id: 'rng-svpura', name: 'Ganganatta', species: 'Eucalyptus', year_of_planting: 2004, total_area_ha: 20, village: 'Ganganatta', taluk: 'S.V. Pura', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Srinivasapura', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    { id: 'plt-b03', range_id: 'rng-svpura', name: 'Karangi', species: 'Acacia auriculiformis', year_of_planting: 2021, total_area_ha: 5, village: 'Karangi', taluk: 'S.V. Pura', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Srinivasapura', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    { id: 'plt-b04', range_id: 'rng-svpura', name: 'A.M. Palli', species: 'Eucalyptus', year_of_planting: 2011, total_area_ha: 37.24, village: 'Erathimmanapalli', taluk: 'S.V. Pura', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Srinivasapura', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    { id: 'plt-b05', range_id: 'rng-svpura', name: 'Yamanuru', species: 'Eucalyptus', year_of_planting: 2011, total_area_ha: 36.02, village: 'Yamanuru', taluk: 'S.V. Pura', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Srinivasapura', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    { id: 'plt-b06', range_id: 'rng-svpura', name: 'Narayanapura', species: 'Eucalyptus', year_of_planting: 2011, total_area_ha: 48, village: 'Narayanapura', taluk: 'S.V. Pura', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Srinivasapura', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    // Bangalore Division - D.V. Halli Range
+    { id: 'plt-b07', range_id: 'rng-dvhalli', name: 'Koramangala', species: 'Eucalyptus', year_of_planting: 1995, total_area_ha: 50, village: 'Chikkatatnangara', taluk: 'D.V. Halli', district: 'Doddaballapura', work_type: 'M', vidhana_sabha: 'Devanahalli', lok_sabha: 'Bengaluru Rural', division: 'Bengaluru' },
+    { id: 'plt-b08', range_id: 'rng-dvhalli', name: 'Guduvamahalli', species: 'Eucalyptus', year_of_planting: 2004, total_area_ha: 77.5, village: 'Koramangala', taluk: 'D.V. Halli', district: 'Doddaballapura', work_type: 'M', vidhana_sabha: 'Devanahalli', lok_sabha: 'Bengaluru Rural', division: 'Bengaluru' },
+    { id: 'plt-b09', range_id: 'rng-dvhalli', name: 'Kamashettihalli', species: 'Eucalyptus', year_of_planting: 1986, total_area_ha: 85.7, village: 'Adavi Gollavari Halli', taluk: 'Chikkaballapura', district: 'Chikkaballapura', work_type: 'M', vidhana_sabha: 'Shidlagatta', lok_sabha: 'Chikkaballapura', division: 'Bengaluru' },
+    { id: 'plt-b10', range_id: 'rng-dvhalli', name: 'Doddaharadi', species: 'Eucalyptus', year_of_planting: 2003, total_area_ha: 5, village: 'Doddaharadi', taluk: 'Shidlaghatta', district: 'Chikkaballapura', work_type: 'M', vidhana_sabha: 'Shidlagatta', lok_sabha: 'Chikkaballapura', division: 'Bengaluru' },
+    // Bangalore Division - Bidadi Range - Fresh Works (2025)
+    { id: 'plt-b11', range_id: 'rng-bidadi', name: 'Hejjala', species: 'Corymbia', year_of_planting: 2025, total_area_ha: 81.91, village: 'Hejjala', taluk: 'Kanakapura', district: 'Ramanagara', work_type: 'FW', vidhana_sabha: 'Kanakapura', lok_sabha: 'Bengaluru Rural', division: 'Bengaluru' },
+    { id: 'plt-b12', range_id: 'rng-bidadi', name: 'Nelamangala', species: 'Corymbia', year_of_planting: 2025, total_area_ha: 14, village: 'Harlakunte', taluk: 'Magadi', district: 'Ramanagara', work_type: 'FW', vidhana_sabha: 'Magadi', lok_sabha: 'Bengaluru Rural', division: 'Bengaluru' },
+    // Bangalore Division - Malur Range
+    { id: 'plt-b13', range_id: 'rng-malur', name: 'Hale Kurandahalli', species: 'Corymbia', year_of_planting: 1995, total_area_ha: 60.6, village: 'Hale Kurandahalli', taluk: 'Malur', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Malur', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    { id: 'plt-b14', range_id: 'rng-malur', name: 'Mallapanahalli', species: 'Corymbia', year_of_planting: 1999, total_area_ha: 160, village: 'Mallapanahalli', taluk: 'Malur', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Malur', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    // Bangalore Division - Bangarpet Range
+    { id: 'plt-b15', range_id: 'rng-bangarpet', name: 'Bangarpet Block', species: 'Eucalyptus', year_of_planting: 2001, total_area_ha: 74.91, village: 'Bangarpet', taluk: 'Bangarpet', district: 'Kolar', work_type: 'M', vidhana_sabha: 'Mulabagilu', lok_sabha: 'Kolar', division: 'Bengaluru' },
+    // Shivamogga Division
+    { id: 'plt-s01', range_id: 'rng-sagara', name: 'Sagara Acacia Block', species: 'Acacia auriculiformis', year_of_planting: 2020, total_area_ha: 45, village: 'Sagara', taluk: 'Sagara', district: 'Shivamogga', work_type: 'M', vidhana_sabha: 'Sagara', lok_sabha: 'Shivamogga', division: 'Shivamogga' },
+    { id: 'plt-s02', range_id: 'rng-sagara', name: 'Sagara Eucalyptus Block', species: 'Eucalyptus pellita', year_of_planting: 2023, total_area_ha: 27, village: 'Sagara', taluk: 'Sagara', district: 'Shivamogga', work_type: 'M', vidhana_sabha: 'Sagara', lok_sabha: 'Shivamogga', division: 'Shivamogga' },
+    { id: 'plt-s03', range_id: 'rng-soraba', name: 'Soraba Plantation', species: 'Acacia auriculiformis', year_of_planting: 2019, total_area_ha: 52.1, village: 'Soraba', taluk: 'Soraba', district: 'Shivamogga', work_type: 'M', vidhana_sabha: 'Soraba', lok_sabha: 'Shivamogga', division: 'Shivamogga' },
+    { id: 'plt-s04', range_id: 'rng-siddapur', name: 'Siddapur Block', species: 'Eucalyptus pellita', year_of_planting: 2017, total_area_ha: 33.7, village: 'Siddapur', taluk: 'Siddapur', district: 'Uttara Kannada', work_type: 'M', vidhana_sabha: 'Siddapur', lok_sabha: 'Haveri', division: 'Shivamogga' },
+    // Chikkamagaluru Division
+    { id: 'plt-c01', range_id: 'rng-koppa', name: 'Koppa Plantation', species: 'Acacia auriculiformis', year_of_planting: 2018, total_area_ha: 29, village: 'Koppa', taluk: 'Koppa', district: 'Chikkamagaluru', work_type: 'M', vidhana_sabha: 'Koppa', lok_sabha: 'Udupi-Chikkamagalore', division: 'Chikkamagalore', plantation_category: 'Non-Rubber', advance_work_year: 2017, planted_year: 2018 },
+    { id: 'plt-c02', range_id: 'rng-narasimharajapura', name: 'NR Pura Block', species: 'Eucalyptus pellita', year_of_planting: 2022, total_area_ha: 18.6, village: 'NR Pura', taluk: 'NR Pura', district: 'Chikkamagaluru', work_type: 'M', vidhana_sabha: 'Sringeri', lok_sabha: 'Udupi-Chikkamagalore', division: 'Chikkamagalore', plantation_category: 'Non-Rubber', advance_work_year: 2021, planted_year: 2022 },
+  ],
+
+  // ===================== BUILDINGS MODULE =====================
+  buildings: [
+    // Dharwad Division Buildings
+    { id: 'bld-d01', range_id: 'rng-dharwad', name: 'Dharwad Range Office', division: 'Dharwad', district: 'Dharwad', taluk: 'Dharwad', year_of_creation: 2010, latitude: 15.4589, longitude: 75.0078, survey_number: 'SY-101/A', building_phase: 'Maintenance', status: 'Active' },
+    { id: 'bld-d02', range_id: 'rng-dharwad', name: 'Varavanagalavi Rest House', division: 'Dharwad', district: 'Dharwad', taluk: 'Dharwad', year_of_creation: 2015, latitude: 15.4721, longitude: 75.0234, survey_number: 'SY-205/B', building_phase: 'Maintenance', status: 'Active' },
+    { id: 'bld-d03', range_id: 'rng-alloli', name: 'Alloli Nursery Shed', division: 'Dharwad', district: 'Belagavi', taluk: 'Khanapur', year_of_creation: 2020, latitude: 15.6234, longitude: 74.5123, survey_number: 'SY-89/C', building_phase: 'Maintenance', status: 'Active' },
+    { id: 'bld-d04', range_id: 'rng-khanapur', name: 'Khanapur Check Post', division: 'Dharwad', district: 'Belagavi', taluk: 'Khanapur', year_of_creation: 2025, latitude: 15.6512, longitude: 74.5456, survey_number: 'SY-112/D', building_phase: 'Creation', status: 'Under Construction' },
+    // Bangalore Division Buildings
+    { id: 'bld-b01', range_id: 'rng-svpura', name: 'S.V. Pura Division Office', division: 'Bengaluru', district: 'Kolar', taluk: 'S.V. Pura', year_of_creation: 2008, latitude: 13.2456, longitude: 78.1234, survey_number: 'SY-45/A', building_phase: 'Maintenance', status: 'Active' },
+    { id: 'bld-b02', range_id: 'rng-dvhalli', name: 'D.V. Halli Guard House', division: 'Bengaluru', district: 'Doddaballapura', taluk: 'D.V. Halli', year_of_creation: 2018, latitude: 13.5678, longitude: 77.5432, survey_number: 'SY-78/B', building_phase: 'Maintenance', status: 'Active' },
+    { id: 'bld-b03', range_id: 'rng-bidadi', name: 'Bidadi New Office Building', division: 'Bengaluru', district: 'Ramanagara', taluk: 'Kanakapura', year_of_creation: 2026, latitude: 12.7890, longitude: 77.3210, survey_number: 'SY-156/C', building_phase: 'Creation', status: 'Under Construction' },
+    // Shivamogga Division Buildings
+    { id: 'bld-s01', range_id: 'rng-sagara', name: 'Sagara Range Office', division: 'Shivamogga', district: 'Shivamogga', taluk: 'Sagara', year_of_creation: 2012, latitude: 14.1678, longitude: 75.0234, survey_number: 'SY-201/A', building_phase: 'Maintenance', status: 'Active' },
+    { id: 'bld-s02', range_id: 'rng-soraba', name: 'Soraba Plantation Store', division: 'Shivamogga', district: 'Shivamogga', taluk: 'Soraba', year_of_creation: 2019, latitude: 14.3456, longitude: 75.1234, survey_number: 'SY-89/B', building_phase: 'Maintenance', status: 'Active' },
+  ],
+
+  // Buildings Activities (Rate Card)
+  building_activities: [
+    // Creation Phase Activities (CapEx)
+    { id: 'bact-01', name: 'Site Survey & Layout', category: 'Creation', unit: 'Per Building', ssr_no: 'BLD-01' },
+    { id: 'bact-02', name: 'Foundation Work', category: 'Creation', unit: 'Per Sq.Ft', ssr_no: 'BLD-02' },
+    { id: 'bact-03', name: 'Structural Construction', category: 'Creation', unit: 'Per Sq.Ft', ssr_no: 'BLD-03' },
+    { id: 'bact-04', name: 'Roofing Work', category: 'Creation', unit: 'Per Sq.Ft', ssr_no: 'BLD-04' },
+    { id: 'bact-05', name: 'Electrical Installation', category: 'Creation', unit: 'Per Building', ssr_no: 'BLD-05' },
+    { id: 'bact-06', name: 'Plumbing & Sanitation', category: 'Creation', unit: 'Per Building', ssr_no: 'BLD-06' },
+    { id: 'bact-07', name: 'Painting & Finishing', category: 'Creation', unit: 'Per Sq.Ft', ssr_no: 'BLD-07' },
+    // Maintenance Phase Activities (RevEx)
+    { id: 'bact-08', name: 'Annual Building Maintenance', category: 'Maintenance', unit: 'Per Building', ssr_no: 'BLD-08' },
+    { id: 'bact-09', name: 'Roof Repair & Waterproofing', category: 'Maintenance', unit: 'Per Sq.Ft', ssr_no: 'BLD-09' },
+    { id: 'bact-10', name: 'Electrical Maintenance', category: 'Maintenance', unit: 'Per Building', ssr_no: 'BLD-10' },
+    { id: 'bact-11', name: 'Plumbing Repairs', category: 'Maintenance', unit: 'Per Building', ssr_no: 'BLD-11' },
+    { id: 'bact-12', name: 'Repainting & Touch-up', category: 'Maintenance', unit: 'Per Sq.Ft', ssr_no: 'BLD-12' },
+    { id: 'bact-13', name: 'Security & Watchman Services', category: 'Maintenance', unit: 'Per Month', ssr_no: 'BLD-13' },
+  ],
+
+  // Building Norms (Rate Card with Rates)
+  building_norms: [
+    // Creation Phase Norms (CapEx)
+    { id: 'bnorm-01', activity_id: 'bact-01', building_phase: 'Creation', standard_rate: 25000, financial_year: '2026-27' },
+    { id: 'bnorm-02', activity_id: 'bact-02', building_phase: 'Creation', standard_rate: 350, financial_year: '2026-27' },
+    { id: 'bnorm-03', activity_id: 'bact-03', building_phase: 'Creation', standard_rate: 1200, financial_year: '2026-27' },
+    { id: 'bnorm-04', activity_id: 'bact-04', building_phase: 'Creation', standard_rate: 450, financial_year: '2026-27' },
+    { id: 'bnorm-05', activity_id: 'bact-05', building_phase: 'Creation', standard_rate: 75000, financial_year: '2026-27' },
+    { id: 'bnorm-06', activity_id: 'bact-06', building_phase: 'Creation', standard_rate: 45000, financial_year: '2026-27' },
+    { id: 'bnorm-07', activity_id: 'bact-07', building_phase: 'Creation', standard_rate: 85, financial_year: '2026-27' },
+    // Maintenance Phase Norms (RevEx)
+    { id: 'bnorm-08', activity_id: 'bact-08', building_phase: 'Maintenance', standard_rate: 50000, financial_year: '2026-27' },
+    { id: 'bnorm-09', activity_id: 'bact-09', building_phase: 'Maintenance', standard_rate: 120, financial_year: '2026-27' },
+    { id: 'bnorm-10', activity_id: 'bact-10', building_phase: 'Maintenance', standard_rate: 15000, financial_year: '2026-27' },
+    { id: 'bnorm-11', activity_id: 'bact-11', building_phase: 'Maintenance', standard_rate: 12000, financial_year: '2026-27' },
+    { id: 'bnorm-12', activity_id: 'bact-12', building_phase: 'Maintenance', standard_rate: 45, financial_year: '2026-27' },
+    { id: 'bnorm-13', activity_id: 'bact-13', building_phase: 'Maintenance', standard_rate: 18000, financial_year: '2026-27' },
+  ],
+
+  // ===================== NURSERIES MODULE =====================
+  nurseries: [
+    // Dharwad Division Nurseries
+    { id: 'nur-d01', range_id: 'rng-dharwad', name: 'Dharwad Central Nursery', nursery_type: 'Raising', latitude: 15.4567, longitude: 75.0123, status: 'Active', capacity_seedlings: 50000 },
+    { id: 'nur-d02', range_id: 'rng-alloli', name: 'Alloli Clonal Nursery', nursery_type: 'New', latitude: 15.6345, longitude: 74.5234, status: 'Under Development', capacity_seedlings: 75000 },
+    { id: 'nur-d03', range_id: 'rng-khanapur', name: 'Khanapur Seedling Nursery', nursery_type: 'Raising', latitude: 15.6678, longitude: 74.5567, status: 'Active', capacity_seedlings: 40000 },
+    // Bangalore Division Nurseries
+    { id: 'nur-b01', range_id: 'rng-svpura', name: 'S.V. Pura Main Nursery', nursery_type: 'Raising', latitude: 13.2567, longitude: 78.1345, status: 'Active', capacity_seedlings: 100000 },
+    { id: 'nur-b02', range_id: 'rng-dvhalli', name: 'D.V. Halli Tissue Culture', nursery_type: 'New', latitude: 13.5789, longitude: 77.5543, status: 'Active', capacity_seedlings: 30000 },
+    { id: 'nur-b03', range_id: 'rng-bidadi', name: 'Bidadi New Nursery', nursery_type: 'New', latitude: 12.7901, longitude: 77.3321, status: 'Under Development', capacity_seedlings: 60000 },
+    // Shivamogga Division Nurseries
+    { id: 'nur-s01', range_id: 'rng-sagara', name: 'Sagara Forest Nursery', nursery_type: 'Raising', latitude: 14.1789, longitude: 75.0345, status: 'Active', capacity_seedlings: 80000 },
+    { id: 'nur-s02', range_id: 'rng-soraba', name: 'Soraba Eucalyptus Nursery', nursery_type: 'Raising', latitude: 14.3567, longitude: 75.1345, status: 'Active', capacity_seedlings: 45000 },
+  ],
+
+  // Nursery Activities (Rate Card) - All CapEx, No RevEx
+  nursery_activities: [
+    // New Nursery Phase (CapEx)
+    { id: 'nact-01', name: 'Nursery Site Preparation', category: 'New Nursery', unit: 'Per Hectare', ssr_no: 'NUR-01' },
+    { id: 'nact-02', name: 'Irrigation System Setup', category: 'New Nursery', unit: 'Per Nursery', ssr_no: 'NUR-02' },
+    { id: 'nact-03', name: 'Shade Net Installation', category: 'New Nursery', unit: 'Per Sq.Meter', ssr_no: 'NUR-03' },
+    { id: 'nact-04', name: 'Nursery Bed Construction', category: 'New Nursery', unit: 'Per Bed', ssr_no: 'NUR-04' },
+    { id: 'nact-05', name: 'Potting Mix Preparation', category: 'New Nursery', unit: 'Per Cubic Meter', ssr_no: 'NUR-05' },
+    { id: 'nact-06', name: 'Mother Plant Establishment', category: 'New Nursery', unit: 'Per Plant', ssr_no: 'NUR-06' },
+    // Raising Nursery Phase (CapEx)
+    { id: 'nact-07', name: 'Seed Collection & Processing', category: 'Raising Nursery', unit: 'Per Kg', ssr_no: 'NUR-07' },
+    { id: 'nact-08', name: 'Seed Sowing & Germination', category: 'Raising Nursery', unit: 'Per 1000 Seeds', ssr_no: 'NUR-08' },
+    { id: 'nact-09', name: 'Pricking & Transplanting', category: 'Raising Nursery', unit: 'Per 1000 Seedlings', ssr_no: 'NUR-09' },
+    { id: 'nact-10', name: 'Seedling Maintenance', category: 'Raising Nursery', unit: 'Per 1000 Seedlings', ssr_no: 'NUR-10' },
+    { id: 'nact-11', name: 'Fertilizer Application', category: 'Raising Nursery', unit: 'Per 1000 Seedlings', ssr_no: 'NUR-11' },
+    { id: 'nact-12', name: 'Pest & Disease Control', category: 'Raising Nursery', unit: 'Per 1000 Seedlings', ssr_no: 'NUR-12' },
+    { id: 'nact-13', name: 'Hardening of Seedlings', category: 'Raising Nursery', unit: 'Per 1000 Seedlings', ssr_no: 'NUR-13' },
+    { id: 'nact-14', name: 'Polybag Filling & Arrangement', category: 'Raising Nursery', unit: 'Per 1000 Bags', ssr_no: 'NUR-14' },
+  ],
+
+  // Nursery Norms (Rate Card with Rates) - All CapEx
+  nursery_norms: [
+    // New Nursery Phase (CapEx)
+    { id: 'nnorm-01', activity_id: 'nact-01', nursery_type: 'New', standard_rate: 85000, financial_year: '2026-27' },
+    { id: 'nnorm-02', activity_id: 'nact-02', nursery_type: 'New', standard_rate: 150000, financial_year: '2026-27' },
+    { id: 'nnorm-03', activity_id: 'nact-03', nursery_type: 'New', standard_rate: 250, financial_year: '2026-27' },
+    { id: 'nnorm-04', activity_id: 'nact-04', nursery_type: 'New', standard_rate: 5000, financial_year: '2026-27' },
+    { id: 'nnorm-05', activity_id: 'nact-05', nursery_type: 'New', standard_rate: 2500, financial_year: '2026-27' },
+    { id: 'nnorm-06', activity_id: 'nact-06', nursery_type: 'New', standard_rate: 150, financial_year: '2026-27' },
+    // Raising Nursery Phase (CapEx)
+    { id: 'nnorm-07', activity_id: 'nact-07', nursery_type: 'Raising', standard_rate: 500, financial_year: '2026-27' },
+    { id: 'nnorm-08', activity_id: 'nact-08', nursery_type: 'Raising', standard_rate: 1200, financial_year: '2026-27' },
+    { id: 'nnorm-09', activity_id: 'nact-09', nursery_type: 'Raising', standard_rate: 2500, financial_year: '2026-27' },
+    { id: 'nnorm-10', activity_id: 'nact-10', nursery_type: 'Raising', standard_rate: 1800, financial_year: '2026-27' },
+    { id: 'nnorm-11', activity_id: 'nact-11', nursery_type: 'Raising', standard_rate: 800, financial_year: '2026-27' },
+    { id: 'nnorm-12', activity_id: 'nact-12', nursery_type: 'Raising', standard_rate: 600, financial_year: '2026-27' },
+    { id: 'nnorm-13', activity_id: 'nact-13', nursery_type: 'Raising', standard_rate: 400, financial_year: '2026-27' },
+    { id: 'nnorm-14', activity_id: 'nact-14', nursery_type: 'Raising', standard_rate: 3500, financial_year: '2026-27' },
+  ],
+}
+
+export default SEED_DATA
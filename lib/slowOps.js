@@ -0,0 +1,326 @@
+/**
+ * Slow Operations Module
+ * Capture of slow MongoDB commands into the capped perf_slow_ops collection
+ *
+ * Commands slower than MONGO_SLOW_OP_MS are recorded with their collection,
+ * duration, documents returned and a redacted shape of the filter or
+ * pipeline: field names, operators and $field references are kept, values
+ * become "?", so operations differing only in ids group together and no
+ * user data is stored. Read commands are also explained ("executionStats")
+ * at most once per shape every MONGO_SLOW_OP_EXPLAIN_MS, which adds docs
+ * and keys examined and the winning plan, reduced to stages and indexes
+ * (plan filters and index bounds carry the query's values). Capture runs off the request
+ * path and never fails it; MONGO_SLOW_OPS=false turns it off.
+ */
+import { createHash } from 'crypto'
+import { logError } from './logger'
+import { runUntraced, commandTarget, countReplyDocs } from './dbTrace'
+import { planHasCollScan } from './indexes'
+
+export const SLOW_OPS_COLLECTION = 'perf_slow_ops'
+
+const SLOW_OP_MS = parseInt(process.env.MONGO_SLOW_OP_MS) || 100
+const EXPLAIN_INTERVAL_MS = parseInt(process.env.MONGO_SLOW_OP_EXPLAIN_MS) || 600000
+// Capped collection size; the oldest entries are overwritten
+const SLOW_OPS_BYTES = parseInt(process.env.MONGO_SLOW_OPS_BYTES) || 16777216
+
+// Fields kept from the original command when explaining it, per command
+const EXPLAIN_FIELDS = {
+  find: ['find', 'filter', 'sort', 'projection', 'hint', 'skip', 'limit', 'collation'],
+  aggregate: ['aggregate', 'pipeline', 'hint', 'collation'],
+  count: ['count', 'query', 'hint', 'skip', 'limit', 'collation'],
+  distinct: ['distinct', 'key', 'query', 'collation'],
+}
+const CAPTURED_COMMANDS = [...Object.keys(EXPLAIN_FIELDS), 'findAndModify', 'update', 'delete']
+
+// shape_hash -> time of the last explain
+const lastExplained = new Map()
+
+/**
+ * Whether a value is a plain document (not an array, Date, ObjectId...)
+ * @param {*} value
+ * @returns {boolean}
+ */
+function isDocument(value) {
+  if (value === null || typeof value !== 'object') return false
+  const proto = Object.getPrototypeOf(value)
+  return proto === Object.prototype || proto === null
+}
+
+/**
+ * Replace every literal in a filter or pipeline with "?"
+ * Keys, operators and $field references are kept. A "$..." string is only a
+ * field reference in an aggregation expression (under $expr, or in a pipeline
+ * stage other than $match); in a query it is a literal and is redacted like
+ * any other value, as is everything under $literal. Arrays holding documents
+ * or field references ($and, pipeline stages, expression operands) keep
+ * their structure; arrays of plain values ($in lists) collapse to one "?".
+ * @param {*} value - Filter, pipeline or value
+ * @param {boolean} expression - Whether value is in an expression position (pipelines are)
+ * @returns {*} Redacted shape
+ */
+export function redactShape(value, expression = false) {
+  const isReference = (inner) => expression && typeof inner === 'string' && inner.startsWith('$')
+  if (Array.isArray(value)) {
+    const structured = value.some(inner => isDocument(inner) || isReference(inner))
+    return structured ? value.map(inner => redactShape(inner, expression)) : '?'
+  }
+  if (isDocument(value)) {
+    return Object.fromEntries(Object.entries(value).map(([key, inner]) => {
+      if (key === '$literal') return [key, '?']
+      const innerExpression = key === '$expr' ? true : key === '$match' ? false : expression
+      return [key, redactShape(inner, innerExpression)]
+    }))
+  }
+  if (isReference(value)) return value
+  return '?'
+}
+
+/**
+ * Redacted shape of a command's filter / pipeline
+ * Sort specs contain only field names and directions and are kept as is.
+ * @param {string} commandName - Command name
+ * @param {object} command - Command document
+ * @returns {object}
+ */
+export function commandShape(commandName, command) {
+  switch (commandName) {
+    case 'find':
+      return { filter: redactShape(command.filter || {}), sort: command.sort }
+    case 'aggregate':
+      return { pipeline: redactShape(command.pipeline || [], true) }
+    case 'distinct':
+      return { key: command.key, query: redactShape(command.query || {}) }
+    case 'count':
+      return { query: redactShape(command.query || {}) }
+    case 'findAndModify':
+      return { query: redactShape(command.query || {}), sort: command.sort }
+    case 'update':
+      return { q: redactShape(command.updates && command.updates[0] ? command.updates[0].q : {}) }
+    case 'delete':
+      return { q: redactShape(command.deletes && command.deletes[0] ? command.deletes[0].q : {}) }
+    default:
+      return {}
+  }
+}
+
+/**
+ * Stable id of a query shape
+ * @param {string} collection - Collection name
+ * @param {string} commandName - Command name
+ * @param {object} shape - Redacted shape
+ * @returns {string}
+ */
+export function shapeHash(collection, commandName, shape) {
+  return createHash('sha1').update(`${collection}|${commandName}|${JSON.stringify(shape)}`).digest('hex').slice(0, 16)
+}
+
+/**
+ * Whether a command should be explained now (read commands, once per shape per interval)
+ * @param {string} hash - Shape hash
+ * @param {string} commandName - Command name
+ * @param {object} command - Command document
+ * @returns {boolean}
+ */
+function shouldExplain(hash, commandName, command) {
+  if (!EXPLAIN_FIELDS[commandName]) return false
+  // executionStats would run the $out / $merge write
+  if (commandName === 'aggregate' && (command.pipeline || []).some(stage => stage.$out || stage.$merge)) return false
+  const last = lastExplained.get(hash)
+  if (last !== undefined && Date.now() - last < EXPLAIN_INTERVAL_MS) return false
+  lastExplained.set(hash, Date.now())
+  return true
+}
+
+/**
+ * Copy of a command with only the fields explain needs (no session or cluster time)
+ * @param {string} commandName - Command name
+ * @param {object} command - Command document
+ * @returns {object}
+ */
+function explainableCommand(commandName, command) {
+  const explainable = commandName === 'aggregate' ? { cursor: {} } : {}
+  EXPLAIN_FIELDS[commandName].forEach(field => {
+    if (command[field] !== undefined) explainable[field] = command[field]
+  })
+  return explainable
+}
+
+// Plan node fields kept by redactPlan; filters and indexBounds hold literals
+const PLAN_FIELDS = ['stage', 'indexName', 'keyPattern', 'direction', 'isMultiKey']
+const PLAN_CHILDREN = ['inputStage', 'inputStages', 'queryPlan', 'innerStage', 'outerStage']
+
+/**
+ * Reduce a query plan to its structure: stage names, indexes and scan direction
+ * @param {object} plan - winningPlan (or a node of it)
+ * @returns {object|undefined} Plan without any filter or bound values
+ */
+export function redactPlan(plan) {
+  if (!isDocument(plan)) return undefined
+  const redacted = {}
+  PLAN_FIELDS.forEach(field => {
+    if (plan[field] !== undefined) redacted[field] = plan[field]
+  })
+  PLAN_CHILDREN.forEach(child => {
+    if (Array.isArray(plan[child])) redacted[child] = plan[child].map(redactPlan)
+    else if (isDocument(plan[child])) redacted[child] = redactPlan(plan[child])
+  })
+  if (Array.isArray(plan.shards)) {
+    redacted.shards = plan.shards.map(shard => ({ shardName: shard.shardName, winningPlan: redactPlan(shard.winningPlan) }))
+  }
+  return redacted
+}
+
+/**
+ * The parts of explain("executionStats") output worth keeping
+ * Aggregations report under stages[0].$cursor on older servers.
+ * @param {object} explain - explain output
+ * @returns {object} { docs_examined, keys_examined, n_returned, execution_ms, collscan, winning_plan }
+ */
+export function summarizeExplain(explain) {
+  const cursorStage = explain.stages && explain.stages[0] ? explain.stages[0].$cursor : null
+  const stats = explain.executionStats || (cursorStage && cursorStage.executionStats) || {}
+  const planner = explain.queryPlanner || (cursorStage && cursorStage.queryPlanner) || {}
+  return {
+    docs_examined: stats.totalDocsExamined,
+    keys_examined: stats.totalKeysExamined,
+    n_returned: stats.nReturned,
+    execution_ms: stats.executionTimeMillis,
+    collscan: planHasCollScan(planner.winningPlan),
+    winning_plan: redactPlan(planner.winningPlan),
+  }
+}
+
+/**
+ * Record one slow command (and explain it when due)
+ * @param {Db} db - MongoDB database instance
+ * @param {object} op - { collection, commandName, command }
+ * @param {number} durationMs - Command duration
+ * @param {number} docsReturned - Documents in the reply
+ */
+export async function captureSlowOp(db, { collection, commandName, command }, durationMs, docsReturned) {
+  const shape = commandShape(commandName, command)
+  const hash = shapeHash(collection, commandName, shape)
+  let explain = null
+  if (shouldExplain(hash, commandName, command)) {
+    explain = summarizeExplain(await db.command({
+      explain: explainableCommand(commandName, command),
+      verbosity: 'executionStats',
+    }))
+  }
+  await db.collection(SLOW_OPS_COLLECTION).insertOne({
+    shape_hash: hash,
+    collection,
+    command: commandName,
+    shape,
+    duration_ms: durationMs,
+    docs_returned: docsReturned,
+    docs_examined: explain ? explain.docs_examined : null,
+    explain,
+    at: new Date(),
+  })
+}
+
+/**
+ * Subscribe to the command monitoring events of a client
+ * The client must be created with monitorCommands: true.
+ * @param {MongoClient} client - Client, before connect()
+ * @param {Db} db - Database the capture is written to
+ */
+export function attachSlowOpCapture(client, db) {
+  const started = new Map()
+  client.on('commandStarted', (event) => {
+    if (!CAPTURED_COMMANDS.includes(event.commandName)) return
+    const collection = commandTarget(event)
+    if (collection === SLOW_OPS_COLLECTION) return
+    started.set(event.requestId, { collection, commandName: event.commandName, command: event.command })
+  })
+  client.on('commandSucceeded', (event) => {
+    const op = started.get(event.requestId)
+    if (!op) return
+    started.delete(event.requestId)
+    if (event.duration < SLOW_OP_MS) return
+    // Not counted against the request that issued the slow command
+    runUntraced(() => captureSlowOp(db, op, event.duration, countReplyDocs(event.reply)))
+      .catch(error => logError(error, { context: 'captureSlowOp', collection: op.collection }))
+  })
+  client.on('commandFailed', (event) => {
+    started.delete(event.requestId)
+  })
+}
+
+/**
+ * Create the capped perf_slow_ops collection if it does not exist
+ * @param {Db} db - MongoDB database instance
+ */
+export async function ensureSlowOpsCollection(db) {
+  try {
+    await db.createCollection(SLOW_OPS_COLLECTION, { capped: true, size: SLOW_OPS_BYTES })
+  } catch (error) {
+    // 48 = NamespaceExists
+    if (error.code !== 48) logError(error, { context: 'ensureSlowOpsCollection' })
+  }
+}
+
+/**
+ * Query shapes ranked by total time spent in slow executions
+ * @param {Db} db - MongoDB database instance
+ * @param {object} options
+ * @param {number} options.limit - Shapes to return
+ * @param {Date} options.since - Only captures at or after this time
+ * @returns {Array<object>} { shape_hash, collection, command, shape, count, total_ms, avg_ms, max_ms, docs_returned, last_seen, explain }
+ */
+export async function getTopSlowOps(db, { limit = 20, since = null } = {}) {
+  const shapes = await db.collection(SLOW_OPS_COLLECTION).aggregate([
+    ...(since ? [{ $match: { at: { $gte: since } } }] : []),
+    {
+      $group: {
+        _id: '$shape_hash',
+        collection: { $first: '$collection' },
+        command: { $first: '$command' },
+        shape: { $first: '$shape' },
+        count: { $sum: 1 },
+        total_ms: { $sum: '$duration_ms' },
+        max_ms: { $max: '$duration_ms' },
+        docs_returned: { $sum: '$docs_returned' },
+        last_seen: { $max: '$at' },
+      }
+    },
+    { $sort: { total_ms: -1 } },
+    { $limit: limit },
+    // Latest explained capture of each shape
+    {
+      $lookup: {
+        from: SLOW_OPS_COLLECTION,
+        let: { hash: '$_id' },
+        pipeline: [
+          { $match: { $expr: { $eq: ['$shape_hash', '$$hash'] }, explain: { $ne: null } } },
+          { $sort: { at: -1 } },
+          { $limit: 1 },
+          { $project: { _id: 0, explain: 1, at: 1 } },
+        ],
+        as: 'explained',
+      }
+    },
+  ]).toArray()
+
+  return shapes.map(({ _id, explained, ...shape }) => ({
+    shape_hash: _id,
+    ...shape,
+    avg_ms: Math.round((shape.total_ms / shape.count) * 100) / 100,
+    explain: explained.length > 0 ? { ...explained[0].explain, at: explained[0].at } : null,
+  }))
+}
+
+export default {
+  SLOW_OPS_COLLECTION,
+  redactShape,
+  commandShape,
+  shapeHash,
+  redactPlan,
+  summarizeExplain,
+  captureSlowOp,
+  attachSlowOpCapture,
+  ensureSlowOpsCollection,
+  getTopSlowOps
+}
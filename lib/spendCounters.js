@@ -0,0 +1,140 @@
+/**
+ * Spend Counters Module
+ * Running spent_amount / logged_qty totals on apo_items
+ *
+ * POST /work-logs checks the budget and bumps the counters with one
+ * conditional findOneAndUpdate, so the check costs the same however many
+ * logs an item already has, and two concurrent logs cannot both pass it.
+ *
+ * work_logs stays the source of truth. Items written before the counters
+ * existed are backfilled from their logs on first use, and
+ * reconcileSpendCounters() recomputes every item and reports drift.
+ */
+import { withTransaction } from './db'
+
+// Float sums built incrementally and from scratch may differ in the last bits
+const DRIFT_TOLERANCE = 0.01
+
+// Sums the work logs of each apo_items document into `logs` (apo_item_id index)
+const ITEM_LOG_TOTALS = {
+  $lookup: {
+    from: 'work_logs',
+    let: { itemId: '$id' },
+    pipeline: [
+      { $match: { $expr: { $eq: ['$apo_item_id', '$$itemId'] } } },
+      { $group: { _id: null, spent: { $sum: '$expenditure' }, qty: { $sum: '$actual_qty' } } },
+    ],
+    as: 'logs',
+  }
+}
+
+/**
+ * Initialise the counters of an item from its existing work logs
+ * No-op when the item already has counters, so concurrent callers are safe.
+ * @param {Db} db - MongoDB database instance
+ * @param {string} itemId - apo_items id
+ */
+export async function backfillSpendCounter(db, itemId) {
+  const [totals] = await db.collection('work_logs').aggregate([
+    { $match: { apo_item_id: itemId } },
+    { $group: { _id: null, spent: { $sum: '$expenditure' }, qty: { $sum: '$actual_qty' } } },
+  ]).toArray()
+  await db.collection('apo_items').updateOne(
+    { id: itemId, spent_amount: { $exists: false } },
+    { $set: { spent_amount: totals?.spent || 0, logged_qty: totals?.qty || 0 } }
+  )
+}
+
+/**
+ * Record a work log if it fits the item's remaining budget
+ * The counter update only matches while spent_amount + expenditure <= total_cost;
+ * the log is inserted in the same transaction.
+ * @param {Db} db - MongoDB database instance
+ * @param {object} item - apo_items document
+ * @param {object} workLog - Work log to insert
+ * @returns {boolean} false when the budget would be exceeded (nothing written)
+ */
+export async function logWorkWithinBudget(db, item, workLog) {
+  if (item.spent_amount === undefined) await backfillSpendCounter(db, item.id)
+
+  return withTransaction(async (session) => {
+    const updated = await db.collection('apo_items').findOneAndUpdate(
+      { id: item.id, $expr: { $lte: [{ $add: ['$spent_amount', workLog.expenditure] }, '$total_cost'] } },
+      { $inc: { spent_amount: workLog.expenditure, logged_qty: workLog.actual_qty || 0 } },
+      { session, projection: { _id: 0, id: 1 } }
+    )
+    if (!updated) return false
+    await db.collection('work_logs').insertOne(workLog, { session })
+    return true
+  })
+}
+
+/**
+ * Recompute spent_amount / logged_qty of every item from work_logs
+ * Also the backfill job: items without counters get them initialised.
+ * Corrections are conditional on the counters read, so a log recorded
+ * meanwhile is not overwritten (that item is reported as skipped).
+ * @param {Db} db - MongoDB database instance
+ * @param {object} options
+ * @param {boolean} options.dryRun - Only report drift
+ * @returns {object} { items, backfilled, drifted, drift, applied, skipped }
+ */
+export async function reconcileSpendCounters(db, { dryRun = false } = {}) {
+  const items = await db.collection('apo_items').aggregate([
+    ITEM_LOG_TOTALS,
+    {
+      $project: {
+        _id: 0,
+        id: 1,
+        spent_amount: 1,
+        logged_qty: 1,
+        expected_spent: { $ifNull: [{ $arrayElemAt: ['$logs.spent', 0] }, 0] },
+        expected_qty: { $ifNull: [{ $arrayElemAt: ['$logs.qty', 0] }, 0] },
+      }
+    },
+  ]).toArray()
+
+  // Items without counters yet are backfilled, not reported as drift
+  const missing = items.filter(item => item.spent_amount === undefined || item.logged_qty === undefined)
+  const drift = items.filter(item =>
+    item.spent_amount !== undefined && item.logged_qty !== undefined && (
+      Math.abs(item.spent_amount - item.expected_spent) > DRIFT_TOLERANCE ||
+      Math.abs(item.logged_qty - item.expected_qty) > DRIFT_TOLERANCE
+    )
+  )
+
+  let skipped = 0
+  const updates = [...missing, ...drift]
+  if (!dryRun && updates.length > 0) {
+    const result = await db.collection('apo_items').bulkWrite(updates.map(item => ({
+      updateOne: {
+        filter: {
+          id: item.id,
+          spent_amount: item.spent_amount === undefined ? { $exists: false } : item.spent_amount,
+          logged_qty: item.logged_qty === undefined ? { $exists: false } : item.logged_qty,
+        },
+        update: { $set: { spent_amount: item.expected_spent, logged_qty: item.expected_qty } },
+      }
+    })), { ordered: false })
+    skipped = updates.length - result.matchedCount
+  }
+
+  return {
+    items: items.length,
+    backfilled: missing.length,
+    drifted: drift.length,
+    drift: drift.slice(0, 50).map(({ id, spent_amount, logged_qty, expected_spent, expected_qty }) => ({
+      id,
+      stored: { spent_amount, logged_qty },
+      expected: { spent_amount: expected_spent, logged_qty: expected_qty },
+    })),
+    applied: !dryRun,
+    skipped,
+  }
+}
+
+export default {
+  backfillSpendCounter,
+  logWorkWithinBudget,
+  reconcileSpendCounters
+}
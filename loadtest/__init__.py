@@ -0,0 +1,24 @@
+"""
+KFDC iFMS - Concurrent Load Test Harness
+
+Replays the role workflows scripted in backend_test.py, fund_indent_test.py
+and jurisdiction_estimates_test.py as weighted scenarios run by many
+virtual users at once:
+
+    python -m loadtest --base-url http://localhost:3000 --users 20 --rps 40 \\
+        --ramp 30 --duration 120 --json loadtest-report.json
+
+Virtual users start evenly over the ramp, then loop over scenarios picked
+by weight until the run ends; a shared pacer holds the total request rate
+at --rps. The report gives count, error rate and p50/p95/p99 latency per
+route pattern, as text and optionally JSON.
+
+Point it at a local `next start` backed by a local MongoDB. --seed resets
+the database first (POST /api/seed), which is destructive.
+Standard library only: one keep-alive http.client connection per user,
+driven from asyncio.
+
+To test against production-sized data, load a synthetic dataset on top of
+the seed first with `python -m loadtest.dataset --scale 10` (see
+loadtest/dataset.py; needs pymongo).
+"""
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+KFDC iFMS load test - command line entry point
+
+    python -m loadtest --help
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from loadtest.runner import run_load
+from loadtest.scenarios import SCENARIOS
+from loadtest.stats import format_report
+
+
+def parse_weights(value: str):
+    """name=weight[,name=weight...] over the default scenario weights"""
+    weights = {name: weight for name, (_, weight) in SCENARIOS.items()}
+    if not value:
+        return weights
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r} (one of {', '.join(SCENARIOS)})")
+        try:
+            weights[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid weight for {name}: {weight!r}")
+    if not any(weight > 0 for weight in weights.values()):
+        raise argparse.ArgumentTypeError("at least one scenario needs a positive weight")
+    return weights
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Concurrent load test for the KFDC iFMS API")
+    parser.add_argument("--base-url", default=os.getenv("NEXT_PUBLIC_BASE_URL", "http://localhost:3000"),
+                        help="App origin; /api is appended (default: $NEXT_PUBLIC_BASE_URL or http://localhost:3000)")
+    parser.add_argument("--users", type=int, default=10, help="Virtual users (default: 10)")
+    parser.add_argument("--rps", type=float, default=20, help="Target total requests per second, 0 = as fast as possible (default: 20)")
+    parser.add_argument("--ramp", type=float, default=10, help="Seconds over which users start (default: 10)")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds to hold full load after the ramp (default: 60)")
+    parser.add_argument("--year", default="2026-27", help="Financial year used by the scenarios (default: 2026-27)")
+    parser.add_argument("--weights", type=parse_weights, default=parse_weights(""),
+                        help=f"Scenario weights, e.g. dashboard_polling=8,fund_indent_chain=0 ({', '.join(SCENARIOS)})")
+    parser.add_argument("--seed", action="store_true", help="Reset the database with POST /api/seed first (destructive)")
+    parser.add_argument("--random-seed", type=int, default=None, help="Seed for reproducible scenario choices")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout in seconds (default: 30)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON ('-' for stdout)")
+    args = parser.parse_args(argv)
+
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+
+    config = {
+        "base_url": args.base_url.rstrip("/"),
+        "users": args.users,
+        "rps": args.rps,
+        "ramp_s": args.ramp,
+        "duration_s": args.duration,
+        "financial_year": args.year,
+        "weights": args.weights,
+        "seed": args.seed,
+        "random_seed": args.random_seed,
+        "timeout_s": args.timeout,
+    }
+    print(f"Load testing {config['base_url']}/api: {args.users} users, {args.rps} req/s, "
+          f"{args.ramp}s ramp + {args.duration}s hold", file=sys.stderr)
+    try:
+        report = asyncio.run(run_load(config))
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"\nJSON report written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Per-user HTTP client and shared request pacer
+"""
+
+import asyncio
+import http.client
+import json
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from loadtest.stats import LoadStats
+
+
+class StopLoad(Exception):
+    """Raised inside a scenario once the run is over"""
+
+
+class Pacer:
+    """Spaces the requests of all users to hold a target rate (0 = unpaced)
+
+    A request that finds the schedule behind starts immediately instead of
+    bursting to catch up, so a slow server lowers the achieved rate rather
+    than being hit with a backlog.
+    """
+
+    def __init__(self, rps: float):
+        self.interval = 1.0 / rps if rps > 0 else 0.0
+        self.next_slot = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class ApiClient:
+    """One virtual user's keep-alive connection to the API
+
+    Requests are blocking http.client calls run in a worker thread, so the
+    event loop keeps pacing and scheduling the other users meanwhile.
+    """
+
+    def __init__(self, base_url: str, stats: LoadStats, pacer: Pacer, deadline: float, timeout: float = 30.0):
+        parsed = urlsplit(base_url)
+        self.scheme = parsed.scheme or "http"
+        self.host = parsed.netloc
+        self.prefix = parsed.path.rstrip("/") + "/api"
+        self.stats = stats
+        self.pacer = pacer
+        self.deadline = deadline
+        self.timeout = timeout
+        self.connection: Optional[http.client.HTTPConnection] = None
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, timeout=self.timeout)
+
+    def _send(self, method: str, path: str, body: Optional[bytes], headers: Dict[str, str]) -> Tuple[int, bytes]:
+        """Blocking request; reconnects once if the server closed the idle connection"""
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = self._connect()
+            try:
+                self.connection.request(method, path, body=body, headers=headers)
+                response = self.connection.getresponse()
+                return response.status, response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                self.close()
+                if attempt == 1:
+                    raise
+        raise RuntimeError("unreachable")
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    async def request(self, method: str, endpoint: str, token: str = None, data: Dict = None,
+                      route: str = None, expect: Tuple[int, ...] = (200, 201)) -> Tuple[int, Any]:
+        """Make an API request and record it
+
+        route labels the request in the report (e.g. /apo/:id/approve) and
+        defaults to the endpoint without its query string. Statuses outside
+        expect count as errors. Returns (status, parsed JSON or None);
+        status 0 means the request failed without a response.
+        """
+        if time.monotonic() >= self.deadline:
+            raise StopLoad()
+        await self.pacer.wait()
+        if time.monotonic() >= self.deadline:
+            raise StopLoad()
+
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        body = json.dumps(data).encode() if data is not None else None
+
+        started = time.perf_counter()
+        try:
+            status, raw = await asyncio.to_thread(self._send, method, self.prefix + endpoint, body, headers)
+        except (OSError, http.client.HTTPException):
+            self.close()
+            status, raw = 0, b""
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        self.stats.record(method, route or endpoint.split("?")[0], status, latency_ms, status in expect)
+        try:
+            return status, json.loads(raw) if raw else None
+        except ValueError:
+            return status, None
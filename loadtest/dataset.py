@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+"""
+KFDC iFMS - Synthetic Dataset Generator
+
+Adds a production-sized, deterministic dataset on top of the /seed master
+data, for load tests and benchmarks:
+
+    # seed the masters first (POST /api/seed), then
+    python -m loadtest.dataset --scale 10 --seed 42
+    python -m loadtest.dataset --scale 100 --out dump/      # mongorestore dump/
+
+Scale 1 is roughly 100k documents; scale 100 is roughly 10M. It
+generates plantations in every range, plus buildings and nurseries. For
+each financial year there is:
+- an APO per plantation, created by the range RO
+- a divisional APO for buildings and nurseries, created by the DO
+- CAPEX/REVEX items priced from the seeded norms
+- work logs against sanctioned items
+- fund indents at every approval stage
+
+The same --seed and --scale always give the same documents, ids included.
+This holds however the work is split across --workers, because each chunk
+of a range draws from its own seeded generator.
+
+Documents are bulk-inserted with unordered insert_many batches, one process
+per chunk. With --out they are written as mongorestore-compatible BSON
+instead. Denormalised counters (spent_amount/logged_qty, revised_total)
+are written directly. Dashboard rollups are rebuilt by the API:
+--rebuild-rollups BASE_URL calls POST /api/admin/rollups/rebuild when done.
+Requires pymongo (which provides bson).
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import time
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+try:
+    import bson
+    from pymongo import MongoClient
+    from pymongo.errors import BulkWriteError
+except ImportError:
+    bson = None
+    MongoClient = None
+
+# Documents per unit of --scale
+PLANTATIONS_PER_SCALE = 3000
+BUILDINGS_PER_SCALE = 200
+NURSERIES_PER_SCALE = 100
+
+# Assets handled by one worker task (one range at a time)
+CHUNK_SIZE = 250
+INSERT_BATCH = 5000
+# Past norms are the current norms deflated by this much per year
+RATE_INFLATION = 0.05
+
+SPECIES = ["Eucalyptus", "Eucalyptus pellita", "Acacia auriculiformis", "Corymbia", "Casurina junguniana", "Teak"]
+LAST_FY_STATUSES = [("SANCTIONED", 0.65), ("PENDING_MD_APPROVAL", 0.1), ("PENDING_ED_APPROVAL", 0.1), ("DRAFT", 0.1), ("REJECTED", 0.05)]
+INDENT_STATUSES = [("APPROVED", 0.55), ("PENDING_DCF", 0.15), ("PENDING_ED", 0.12), ("PENDING_MD", 0.12), ("FULLY_REJECTED", 0.06)]
+INDENT_CHAIN = {"PENDING_DCF": [], "PENDING_ED": ["DCF"], "PENDING_MD": ["DCF", "ED"], "APPROVED": ["DCF", "ED", "MD"]}
+
+# Collections written by the generator, in load order
+COLLECTIONS = ["users", "plantations", "buildings", "nurseries", "apo_headers", "apo_items", "work_logs", "fund_indents"]
+
+
+def financial_years(last: str, count: int) -> List[str]:
+    """count financial years ending with last, oldest first ('2024-25', ...)"""
+    start = int(last.split("-")[0])
+    return [f"{year}-{str(year + 1)[-2:]}" for year in range(start - count + 1, start + 1)]
+
+
+def weighted(rng: random.Random, choices):
+    return rng.choices([value for value, _ in choices], weights=[weight for _, weight in choices])[0]
+
+
+def fy_date(rng: random.Random, fy: str, month_from: int = 0, month_to: int = 11) -> datetime:
+    """Random time inside a financial year (months counted from April)"""
+    start = datetime(int(fy.split("-")[0]), 4, 1)
+    return start + timedelta(days=rng.randint(month_from * 30, month_to * 30 + 29), hours=rng.randint(8, 18))
+
+
+# ===================== MASTERS =====================
+
+def load_masters(db) -> Dict[str, Any]:
+    """Master data seeded by POST /seed, plus generated users for ranges/divisions without one"""
+    def docs(name):
+        return list(db[name].find({}, {"_id": 0}))
+
+    ranges = docs("ranges")
+    divisions = {d["id"]: d for d in docs("divisions")}
+    if not ranges or not divisions:
+        raise RuntimeError("No ranges/divisions found - seed the database first (POST /api/seed)")
+    users = docs("users")
+    masters = {
+        "ranges": sorted(ranges, key=lambda r: r["id"]),
+        "divisions": divisions,
+        "activities": {a["id"]: a for a in docs("activity_master")},
+        "norms": latest_norms(docs("norms_config")),
+        "building_activities": {a["id"]: a for a in docs("building_activities")},
+        "building_norms": latest_norms(docs("building_norms")),
+        "nursery_activities": {a["id"]: a for a in docs("nursery_activities")},
+        "nursery_norms": latest_norms(docs("nursery_norms")),
+        "new_users": [],
+    }
+
+    def find_user(role, key, value):
+        return next((u for u in users if u["role"] == role and u.get(key) == value), None)
+
+    def user_for(role, key, value, email_prefix):
+        user = find_user(role, key, value)
+        if user is None:
+            suffix = value.split("-", 1)[-1]
+            user = {
+                "id": f"usr-gen-{role.lower()}-{suffix}",
+                "email": f"{email_prefix}.{suffix}.gen@kfdc.in",
+                "password": "pass123",
+                "name": f"{role} {suffix.title()} (generated)",
+                "role": role,
+                "division_id": value if key == "division_id" else None,
+                "range_id": value if key == "range_id" else None,
+            }
+            if role in ("RO", "RFO"):
+                user["division_id"] = next(r["division_id"] for r in ranges if r["id"] == value)
+            users.append(user)
+            masters["new_users"].append(user)
+        return user["id"]
+
+    masters["range_ro"] = {r["id"]: user_for("RO", "range_id", r["id"], "ro") for r in ranges}
+    masters["range_rfo"] = {r["id"]: user_for("RFO", "range_id", r["id"], "rfo") for r in ranges}
+    masters["division_do"] = {d: user_for("DO", "division_id", d, "do") for d in divisions}
+    masters["division_dcf"] = {d: user_for("DCF", "division_id", d, "dcf") for d in divisions}
+    masters["ed"] = user_for("ED", "role", "ED", "ed")
+    masters["md"] = user_for("MD", "role", "MD", "md")
+    masters["user_names"] = {u["id"]: u["name"] for u in users}
+    return masters
+
+
+def latest_norms(norms: List[Dict]) -> List[Dict]:
+    """Norms of the newest financial year; older years are priced by deflating them"""
+    if not norms:
+        return []
+    latest = max(n.get("financial_year", "") for n in norms)
+    return [n for n in norms if n.get("financial_year", "") == latest]
+
+
+def plan_chunks(masters: Dict[str, Any], scale: float) -> List[Dict[str, Any]]:
+    """Split the assets of every range into worker tasks"""
+    ranges = masters["ranges"]
+    chunks = []
+
+    def per_range(total, position):
+        base, extra = divmod(total, len(ranges))
+        return base + (1 if position < extra else 0)
+
+    for position, range_doc in enumerate(ranges):
+        plantations = per_range(int(PLANTATIONS_PER_SCALE * scale), position)
+        buildings = per_range(int(BUILDINGS_PER_SCALE * scale), position)
+        nurseries = per_range(int(NURSERIES_PER_SCALE * scale), position)
+        parts = max(1, -(-plantations // CHUNK_SIZE))
+        for part in range(parts):
+            chunks.append({
+                "index": len(chunks),
+                "range_id": range_doc["id"],
+                "plantations": per_part(plantations, parts, part),
+                "buildings": per_part(buildings, parts, part),
+                "nurseries": per_part(nurseries, parts, part),
+            })
+    return chunks
+
+
+def per_part(total: int, parts: int, part: int) -> int:
+    base, extra = divmod(total, parts)
+    return base + (1 if part < extra else 0)
+
+
+# ===================== GENERATION =====================
+
+class ChunkGenerator:
+    """All documents of one chunk; deterministic from (seed, chunk index)"""
+
+    def __init__(self, chunk: Dict[str, Any], masters: Dict[str, Any], years: List[str], seed: int):
+        self.chunk = chunk
+        self.masters = masters
+        self.years = years
+        self.rng = random.Random(f"{seed}:{chunk['index']}")
+        self.range = next(r for r in masters["ranges"] if r["id"] == chunk["range_id"])
+        self.division = masters["divisions"][self.range["division_id"]]
+        self.prefix = f"gen-{chunk['index']:05d}"
+        self.counters: Dict[str, int] = {}
+        self.docs: Dict[str, List[Dict]] = {name: [] for name in COLLECTIONS}
+
+    def next_id(self, kind: str) -> str:
+        self.counters[kind] = self.counters.get(kind, 0) + 1
+        return f"{kind}-{self.prefix}-{self.counters[kind]:06d}"
+
+    def rate(self, norm: Dict, fy: str) -> float:
+        years_back = int(self.years[-1].split("-")[0]) - int(fy.split("-")[0])
+        return round(norm["standard_rate"] / ((1 + RATE_INFLATION) ** years_back), 2)
+
+    def generate(self) -> Dict[str, List[Dict]]:
+        plantations = [self.plantation() for _ in range(self.chunk["plantations"])]
+        buildings = [self.building() for _ in range(self.chunk["buildings"])]
+        nurseries = [self.nursery() for _ in range(self.chunk["nurseries"])]
+        for fy in self.years:
+            for plantation in plantations:
+                self.plantation_apo(plantation, fy)
+            if buildings or nurseries:
+                self.divisional_apo(buildings, nurseries, fy)
+        return self.docs
+
+    # ---- assets ----
+
+    def plantation(self) -> Dict:
+        first_year = int(self.years[0].split("-")[0])
+        last_year = int(self.years[-1].split("-")[0])
+        planted = self.rng.randint(first_year - 25, last_year)
+        doc = {
+            "id": self.next_id("plt"),
+            "range_id": self.range["id"],
+            "name": f"{self.range['name']} Block {self.counters['plt']}",
+            "species": self.rng.choice(SPECIES),
+            "year_of_planting": planted,
+            "total_area_ha": round(self.rng.uniform(2, 80), 1),
+            "village": f"{self.range['name']} Village {self.rng.randint(1, 40)}",
+            "taluk": self.range["name"],
+            "district": self.division["name"],
+            "vidhana_sabha": self.range["name"],
+            "lok_sabha": self.division["name"],
+            "division": self.division["name"],
+            "latitude": round(self.rng.uniform(11.6, 18.4), 4),
+            "longitude": round(self.rng.uniform(74.1, 78.5), 4),
+            "work_type": "FW" if planted >= last_year else "M",
+            "created_at": datetime(planted, 6, 1),
+        }
+        self.docs["plantations"].append(doc)
+        return doc
+
+    def building(self) -> Dict:
+        created = self.rng.randint(1995, int(self.years[-1].split("-")[0]))
+        doc = {
+            "id": self.next_id("bld"),
+            "range_id": self.range["id"],
+            "name": f"{self.range['name']} {self.rng.choice(['Range Office', 'Rest House', 'Staff Quarters', 'Check Post', 'Depot'])} {self.counters['bld']}",
+            "division": self.division["name"],
+            "district": self.division["name"],
+            "taluk": self.range["name"],
+            "year_of_creation": created,
+            "latitude": round(self.rng.uniform(11.6, 18.4), 4),
+            "longitude": round(self.rng.uniform(74.1, 78.5), 4),
+            "survey_number": f"SY-{self.rng.randint(1, 999)}/{self.rng.choice('ABCD')}",
+            "building_phase": "Creation" if created >= int(self.years[-1].split("-")[0]) - 1 else "Maintenance",
+            "status": "Active",
+            "created_at": datetime(created, 1, 1),
+        }
+        self.docs["buildings"].append(doc)
+        return doc
+
+    def nursery(self) -> Dict:
+        doc = {
+            "id": self.next_id("nur"),
+            "range_id": self.range["id"],
+            "name": f"{self.range['name']} Nursery {self.counters['nur']}",
+            "nursery_type": self.rng.choice(["New", "Raising"]),
+            "latitude": round(self.rng.uniform(11.6, 18.4), 4),
+            "longitude": round(self.rng.uniform(74.1, 78.5), 4),
+            "status": "Active",
+            "capacity_seedlings": self.rng.choice([25000, 50000, 75000, 100000]),
+            "created_at": datetime(int(self.years[0].split("-")[0]), 4, 1),
+        }
+        self.docs["nurseries"].append(doc)
+        return doc
+
+    # ---- norms ----
+
+    def plantation_norms(self, age: int) -> List[Dict]:
+        """Norms of the nearest applicable age <= age (as /apo/generate-draft resolves them)"""
+        norms = [n for n in self.masters["norms"] if n.get("applicable_age", 0) <= max(age, 0)]
+        if not norms:
+            return []
+        nearest = max(n["applicable_age"] for n in norms)
+        return [n for n in norms if n["applicable_age"] == nearest]
+
+    # ---- APOs ----
+
+    def apo_status(self, fy: str) -> str:
+        return weighted(self.rng, LAST_FY_STATUSES) if fy == self.years[-1] else "SANCTIONED"
+
+    def header(self, fy: str, status: str, created_by: str, title: str, plantation_id: str = None) -> Dict:
+        created_at = fy_date(self.rng, fy, 0, 1)
+        sanctioned = status in ("SANCTIONED", "PENDING_MD_APPROVAL", "REJECTED")
+        doc = {
+            "id": self.next_id("apo"),
+            "financial_year": fy,
+            "title": title,
+            "status": status,
+            "created_by": created_by,
+            "division_id": self.division["id"],
+            "approved_by_ed": self.masters["ed"] if sanctioned and status != "REJECTED" else None,
+            "approved_by_md": self.masters["md"] if status == "SANCTIONED" else None,
+            "ed_approved_at": created_at + timedelta(days=3) if sanctioned and status != "REJECTED" else None,
+            "md_approved_at": created_at + timedelta(days=7) if status == "SANCTIONED" else None,
+            "created_at": created_at,
+            "updated_at": created_at + timedelta(days=7 if sanctioned else 0),
+        }
+        if plantation_id:
+            doc["plantation_id"] = plantation_id
+        return doc
+
+    def item(self, apo: Dict, activity: Dict, norm: Dict, qty: float, expense_type: str, source_type: str, source: Dict) -> Dict:
+        rate = self.rate(norm, apo["financial_year"])
+        return {
+            "id": self.next_id("apoi"),
+            "apo_id": apo["id"],
+            "activity_id": norm["activity_id"],
+            "activity_name": activity.get("name", "Unknown"),
+            "sanctioned_qty": qty,
+            "sanctioned_rate": rate,
+            "total_cost": round(qty * rate, 2),
+            "unit": activity.get("unit"),
+            "expense_type": expense_type,
+            "source_type": source_type,
+            "source_id": source["id"],
+            "source_name": source["name"],
+            "spent_amount": 0,
+            "logged_qty": 0,
+        }
+
+    def plantation_apo(self, plantation: Dict, fy: str):
+        if plantation["year_of_planting"] > int(fy.split("-")[0]):
+            return
+        age = int(fy.split("-")[0]) - plantation["year_of_planting"]
+        norms = self.plantation_norms(age)
+        if not norms:
+            return
+        status = self.apo_status(fy)
+        apo = self.header(fy, status, self.masters["range_ro"][self.range["id"]],
+                          f"APO {plantation['name']} {fy}", plantation["id"])
+        expense_type = "CAPEX" if age <= 7 else "REVEX"
+        items = []
+        for norm in self.rng.sample(norms, min(len(norms), self.rng.randint(3, 6))):
+            activity = self.masters["activities"].get(norm["activity_id"], {})
+            per_hectare = activity.get("unit") == "Per Hectare"
+            qty = plantation["total_area_ha"] if per_hectare else float(self.rng.randint(1, 12))
+            items.append(self.item(apo, activity, norm, qty, expense_type, "plantation", plantation))
+        self.finish_apo(apo, items)
+
+    def divisional_apo(self, buildings: List[Dict], nurseries: List[Dict], fy: str):
+        status = self.apo_status(fy)
+        apo = self.header(fy, status, self.masters["division_do"][self.division["id"]],
+                          f"{self.division['name']} Buildings & Nurseries APO {fy}")
+        items = []
+        for building in buildings:
+            phase = building["building_phase"] if building["year_of_creation"] < int(fy.split("-")[0]) else "Creation"
+            norms = [n for n in self.masters["building_norms"] if n.get("building_phase") == phase]
+            for norm in self.rng.sample(norms, min(len(norms), self.rng.randint(1, 3))):
+                activity = self.masters["building_activities"].get(norm["activity_id"], {})
+                items.append(self.item(apo, activity, norm, float(self.rng.randint(1, 20)),
+                                       "CAPEX" if phase == "Creation" else "REVEX", "building", building))
+        for nursery in nurseries:
+            norms = [n for n in self.masters["nursery_norms"] if n.get("nursery_type") == nursery["nursery_type"]]
+            for norm in self.rng.sample(norms, min(len(norms), self.rng.randint(1, 3))):
+                activity = self.masters["nursery_activities"].get(norm["activity_id"], {})
+                items.append(self.item(apo, activity, norm, float(self.rng.randint(1, 5)), "CAPEX", "nursery", nursery))
+        if items:
+            self.finish_apo(apo, items)
+
+    def finish_apo(self, apo: Dict, items: List[Dict]):
+        capex = sum(i["total_cost"] for i in items if i["expense_type"] == "CAPEX")
+        revex = sum(i["total_cost"] for i in items if i["expense_type"] == "REVEX")
+        apo["capex_total"] = round(capex, 2)
+        apo["revex_total"] = round(revex, 2)
+        apo["total_sanctioned_amount"] = round(capex + revex, 2)
+        apo["revised_total"] = apo["total_sanctioned_amount"]
+        if apo["status"] == "SANCTIONED":
+            for item in items:
+                self.work_logs(apo, item)
+            self.fund_indents(apo, items)
+        self.docs["apo_headers"].append(apo)
+        self.docs["apo_items"].extend(items)
+
+    # ---- execution ----
+
+    def work_logs(self, apo: Dict, item: Dict):
+        """0-2 logs per sanctioned item, within its budget"""
+        logged_by = self.masters["range_ro"][self.range["id"]]
+        for _ in range(self.rng.choice([0, 1, 1, 2])):
+            share = self.rng.uniform(0.1, 0.45)
+            qty = round(item["sanctioned_qty"] * share, 2)
+            expenditure = round(item["total_cost"] * share, 2)
+            work_date = fy_date(self.rng, apo["financial_year"], 1, 11)
+            self.docs["work_logs"].append({
+                "id": self.next_id("wl"),
+                "apo_item_id": item["id"],
+                "work_date": work_date,
+                "actual_qty": qty,
+                "expenditure": expenditure,
+                "logged_by": logged_by,
+                "created_at": work_date,
+            })
+            item["spent_amount"] = round(item["spent_amount"] + expenditure, 2)
+            item["logged_qty"] = round(item["logged_qty"] + qty, 2)
+
+    def fund_indents(self, apo: Dict, items: List[Dict]):
+        """Claim logged items in indents of up to 4, at every approval stage"""
+        logged = [item for item in items if item["spent_amount"] > 0]
+        rfo = self.masters["range_rfo"][self.range["id"]]
+        approvers = {"DCF": self.masters["division_dcf"][self.division["id"]], "ED": self.masters["ed"], "MD": self.masters["md"]}
+        for start in range(0, len(logged), 4):
+            group = logged[start:start + 4]
+            status = weighted(self.rng, INDENT_STATUSES) if apo["financial_year"] == self.years[-1] else "APPROVED"
+            created_at = fy_date(self.rng, apo["financial_year"], 2, 11)
+            est_id = self.next_id("EST")
+            chain = [{"role": "RFO", "user_id": rfo, "user_name": self.masters["user_names"][rfo], "action": "GENERATED", "timestamp": created_at}]
+            signed = INDENT_CHAIN.get(status, ["DCF"])
+            for step, role in enumerate(signed, start=1):
+                chain.append({
+                    "role": role,
+                    "user_id": approvers[role],
+                    "user_name": self.masters["user_names"][approvers[role]],
+                    "action": "APPROVED",
+                    "approved_count": 0 if status == "FULLY_REJECTED" else len(group),
+                    "rejected_count": len(group) if status == "FULLY_REJECTED" else 0,
+                    "comment": None,
+                    "timestamp": created_at + timedelta(days=2 * step),
+                })
+            for item in group:
+                item.update({
+                    "fund_indent_id": est_id,
+                    "fund_indent_status": "REJECTED" if status == "FULLY_REJECTED" else status,
+                    "period_from": created_at.strftime("%Y-%m-%d"),
+                    "period_to": (created_at + timedelta(days=30)).strftime("%Y-%m-%d"),
+                    "cm_date": (created_at + timedelta(days=31)).strftime("%Y-%m-%d"),
+                    "cm_by": self.masters["user_names"][rfo],
+                    "fnb_book_no": str(self.rng.randint(1, 500)),
+                    "fnb_page_no": str(self.rng.randint(1, 200)),
+                })
+            self.docs["fund_indents"].append({
+                "id": est_id,
+                "apo_id": apo["id"],
+                "created_by": rfo,
+                "created_at": created_at,
+                "updated_at": chain[-1]["timestamp"],
+                "status": status,
+                "approval_chain": chain,
+                "total_amount": round(sum(item["total_cost"] for item in group), 2),
+                "item_ids": [item["id"] for item in group],
+            })
+
+
+# ===================== OUTPUT =====================
+
+def insert_docs(db, name: str, docs: List[Dict]):
+    """Unordered batches; duplicate ids from an earlier run are skipped"""
+    for start in range(0, len(docs), INSERT_BATCH):
+        try:
+            db[name].insert_many(docs[start:start + INSERT_BATCH], ordered=False)
+        except BulkWriteError as e:
+            if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+                raise
+
+
+def write_docs(out_dir: str, name: str, chunk_index: int, docs: List[Dict]):
+    """One BSON part per chunk and collection; merged into <collection>.bson at the end"""
+    with open(os.path.join(out_dir, f"{name}.part{chunk_index:05d}"), "wb") as f:
+        for doc in docs:
+            f.write(bson.encode(doc))
+
+
+def load_chunk(chunk: Dict, masters: Dict, years: List[str], seed: int, target: Dict) -> Dict[str, int]:
+    """Worker task: generate one chunk and insert or write it"""
+    docs = ChunkGenerator(chunk, masters, years, seed).generate()
+    if target["out_dir"]:
+        for name, rows in docs.items():
+            if rows:
+                write_docs(target["out_dir"], name, chunk["index"], rows)
+    else:
+        client = MongoClient(target["mongo_url"])
+        try:
+            db = client[target["db"]]
+            for name, rows in docs.items():
+                if rows:
+                    insert_docs(db, name, rows)
+        finally:
+            client.close()
+    return {name: len(rows) for name, rows in docs.items()}
+
+
+def merge_parts(out_dir: str):
+    """Concatenate the per-chunk parts (BSON files are plain document sequences)"""
+    for name in COLLECTIONS:
+        parts = sorted(p for p in os.listdir(out_dir) if p.startswith(f"{name}.part"))
+        with open(os.path.join(out_dir, f"{name}.bson"), "wb") as merged:
+            for part in parts:
+                with open(os.path.join(out_dir, part), "rb") as f:
+                    shutil.copyfileobj(f, merged)
+                os.remove(os.path.join(out_dir, part))
+
+
+def rebuild_rollups(base_url: str):
+    """Log in as ADMIN and rebuild the dashboard rollups through the API"""
+    def post(path, data, token=None):
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+        request = urllib.request.Request(f"{base_url}/api{path}", json.dumps(data).encode(), headers, method="POST")
+        with urllib.request.urlopen(request, timeout=600) as response:
+            return json.loads(response.read())
+
+    token = post("/auth/login", {"email": "admin@kfdc.in", "password": "pass123"})["token"]
+    return post("/admin/rollups/rebuild", {}, token)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m loadtest.dataset", description="Deterministic synthetic dataset for KFDC iFMS")
+    parser.add_argument("--scale", type=float, default=1, help="Scale factor; 1 is about 100k documents (default: 1)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--years", type=int, default=5, help="Financial years of APO history (default: 5)")
+    parser.add_argument("--last-year", default="2026-27", help="Most recent financial year (default: 2026-27)")
+    parser.add_argument("--mongo-url", default=os.getenv("MONGO_URL", "mongodb://localhost:27017"), help="MongoDB URL (default: $MONGO_URL)")
+    parser.add_argument("--db", default=os.getenv("DB_NAME", "kfdc_ifms"), help="Database with the seeded masters (default: $DB_NAME)")
+    parser.add_argument("--out", metavar="DIR", help="Write mongorestore-compatible BSON to DIR/<db>/ instead of inserting")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Parallel worker processes (default: CPU count)")
+    parser.add_argument("--rebuild-rollups", metavar="BASE_URL", help="Afterwards call POST /api/admin/rollups/rebuild on this app")
+    args = parser.parse_args(argv)
+
+    if MongoClient is None:
+        print("❌ pymongo is required: pip install pymongo", file=sys.stderr)
+        return 1
+
+    started = time.time()
+    client = MongoClient(args.mongo_url)
+    db = client[args.db]
+    masters = load_masters(db)
+    years = financial_years(args.last_year, args.years)
+    chunks = plan_chunks(masters, args.scale)
+
+    out_dir = os.path.join(args.out, args.db) if args.out else None
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    target = {"mongo_url": args.mongo_url, "db": args.db, "out_dir": out_dir}
+    if masters["new_users"]:
+        if out_dir:
+            write_docs(out_dir, "users", len(chunks), masters["new_users"])
+        else:
+            insert_docs(db, "users", masters["new_users"])
+    client.close()
+
+    print(f"Generating scale {args.scale} ({len(chunks)} chunks, {args.years} years to {args.last_year}) "
+          f"with {args.workers} workers -> {out_dir or args.mongo_url + '/' + args.db}")
+    totals = {name: 0 for name in COLLECTIONS}
+    totals["users"] = len(masters["new_users"])
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(load_chunk, chunk, masters, years, args.seed, target) for chunk in chunks]
+        for done, future in enumerate(as_completed(futures), start=1):
+            for name, count in future.result().items():
+                totals[name] += count
+            if done % max(1, len(chunks) // 20) == 0 or done == len(chunks):
+                elapsed = time.time() - started
+                documents = sum(totals.values())
+                print(f"  {done}/{len(chunks)} chunks, {documents:,} documents, {documents / elapsed:,.0f} docs/s")
+
+    if out_dir:
+        merge_parts(out_dir)
+
+    elapsed = time.time() - started
+    print(json.dumps({"counts": totals, "documents": sum(totals.values()), "seconds": round(elapsed, 1)}, indent=2))
+    if args.rebuild_rollups:
+        print(f"Rollups rebuilt: {json.dumps(rebuild_rollups(args.rebuild_rollups.rstrip('/')))}")
+    elif not out_dir:
+        print("Dashboard rollups are stale - POST /api/admin/rollups/rebuild (or pass --rebuild-rollups)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
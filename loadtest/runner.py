@@ -0,0 +1,74 @@
+"""
+Load test run: login, ramp, hold, report
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from loadtest.client import ApiClient, Pacer, StopLoad
+from loadtest.scenarios import CREDENTIALS, SCENARIOS, UserContext
+from loadtest.stats import LoadStats
+
+
+async def login_all(client: ApiClient) -> Dict[str, str]:
+    """Sign in every role once; the tokens are shared by all virtual users"""
+    tokens = {}
+    for role, creds in CREDENTIALS.items():
+        status, data = await client.request("POST", "/auth/login", data=creds)
+        if status != 200 or not isinstance(data, dict) or not data.get("token"):
+            raise RuntimeError(f"Login failed for {role} ({creds['email']}): status {status}")
+        tokens[role] = data["token"]
+    return tokens
+
+
+async def virtual_user(user_id: int, client: ApiClient, ctx: UserContext, weights: Dict[str, float], start_delay: float):
+    """Wait for this user's ramp slot, then loop over weighted scenarios until the deadline"""
+    await asyncio.sleep(start_delay)
+    names = [name for name, weight in weights.items() if weight > 0]
+    scenario_weights = [weights[name] for name in names]
+    try:
+        while True:
+            name = ctx.rng.choices(names, weights=scenario_weights)[0]
+            await SCENARIOS[name][0](client, ctx)
+    except StopLoad:
+        pass
+    finally:
+        client.close()
+
+
+async def run_load(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one load test and return its report
+
+    config keys: base_url, users, rps, ramp_s, duration_s, financial_year,
+    weights (scenario -> weight), seed (reset the database first),
+    random_seed (reproducible scenario choices) and timeout_s.
+    """
+    loop = asyncio.get_running_loop()
+    # One worker thread per virtual user, so blocking requests never queue
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=config["users"] + 2))
+
+    setup_stats = LoadStats()
+    setup = ApiClient(config["base_url"], setup_stats, Pacer(0), float("inf"), config["timeout_s"])
+    if config["seed"]:
+        status, _ = await setup.request("POST", "/seed?mode=restore")
+        if status != 200:
+            raise RuntimeError(f"POST /api/seed failed: status {status}")
+    tokens = await login_all(setup)
+    setup.close()
+
+    stats = LoadStats()
+    pacer = Pacer(config["rps"])
+    started = time.monotonic()
+    deadline = started + config["ramp_s"] + config["duration_s"]
+    users = []
+    for user_id in range(config["users"]):
+        seed = None if config["random_seed"] is None else config["random_seed"] + user_id
+        ctx = UserContext(user_id, tokens, config["financial_year"], seed)
+        client = ApiClient(config["base_url"], stats, pacer, deadline, config["timeout_s"])
+        start_delay = config["ramp_s"] * user_id / config["users"]
+        users.append(virtual_user(user_id, client, ctx, config["weights"], start_delay))
+    await asyncio.gather(*users)
+
+    return stats.report(time.monotonic() - started, dict(config))
@@ -0,0 +1,180 @@
+"""
+Weighted role workflows replayed by the virtual users
+
+Each scenario is one pass through a workflow from the functional test
+scripts, using the seeded Dharwad users. Statuses a scenario can legitimately
+get under concurrency (another user approved the same APO first, or
+claimed the same line items) are passed as expected and not counted as
+errors.
+"""
+
+import random
+from typing import Any, Callable, Dict, List, Tuple
+
+from loadtest.client import ApiClient
+
+CREDENTIALS = {
+    "RO": {"email": "ro.dharwad@kfdc.in", "password": "pass123"},
+    "DO": {"email": "do.dharwad@kfdc.in", "password": "pass123"},
+    "ED": {"email": "ed@kfdc.in", "password": "pass123"},
+    "MD": {"email": "md@kfdc.in", "password": "pass123"},
+    "ADMIN": {"email": "admin@kfdc.in", "password": "pass123"},
+    "RFO": {"email": "rfo.dharwad@kfdc.in", "password": "pass123"},
+    "DCF": {"email": "dcf.dharwad@kfdc.in", "password": "pass123"},
+}
+
+
+class UserContext:
+    """State of one virtual user"""
+
+    def __init__(self, user_id: int, tokens: Dict[str, str], financial_year: str, seed: int = None):
+        self.user_id = user_id
+        self.tokens = tokens
+        self.financial_year = financial_year
+        self.rng = random.Random(seed)
+        self.counter = 0
+
+    def next_name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix} {self.user_id}-{self.counter}"
+
+
+def as_list(data: Any, key: str = "items") -> List[Dict]:
+    """Rows of a list response, paginated ({items: [...]}) or not"""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict) and isinstance(data.get(key), list):
+        return data[key]
+    return []
+
+
+async def ro_plantation_entry(client: ApiClient, ctx: UserContext):
+    """RO registers a plantation and opens its detail and history"""
+    token = ctx.tokens["RO"]
+    await client.request("GET", "/plantations", token)
+    await client.request("GET", "/activities", token)
+    _, plantation = await client.request("POST", "/plantations", token, {
+        "name": ctx.next_name("Load Test Plot"),
+        "species": ctx.rng.choice(["Teak", "Eucalyptus", "Acacia", "Casuarina"]),
+        "year_of_planting": ctx.rng.randint(2012, 2025),
+        "total_area_ha": round(ctx.rng.uniform(2, 40), 1),
+    })
+    if isinstance(plantation, dict) and plantation.get("id"):
+        plantation_id = plantation["id"]
+        await client.request("GET", f"/plantations/{plantation_id}", token, route="/plantations/:id")
+        await client.request("GET", f"/plantations/{plantation_id}/history", token, route="/plantations/:id/history")
+
+
+async def do_apo_compile(client: ApiClient, ctx: UserContext):
+    """DO drafts an APO from plantation norms and submits it to ED"""
+    token = ctx.tokens["DO"]
+    _, data = await client.request("GET", "/plantations", token)
+    plantations = as_list(data)
+    if not plantations:
+        return
+    plantation = ctx.rng.choice(plantations)
+    _, draft = await client.request("POST", "/apo/generate-draft", token, {
+        "plantation_id": plantation["id"],
+        "financial_year": ctx.financial_year,
+    })
+    draft_items = as_list(draft)[:5]
+    if not draft_items:
+        return
+    capex_items = [{
+        "activity_id": item["activity_id"],
+        "activity_name": item["activity_name"],
+        "sanctioned_qty": item.get("suggested_qty") or 1,
+        "sanctioned_rate": item["sanctioned_rate"],
+        "unit": item.get("unit"),
+        "source_type": "plantation",
+        "source_id": plantation["id"],
+        "source_name": plantation.get("name"),
+    } for item in draft_items]
+    _, apo = await client.request("POST", "/apo", token, {
+        "financial_year": ctx.financial_year,
+        "title": ctx.next_name("Load Test APO"),
+        "status": "PENDING_ED_APPROVAL",
+        "capex_items": capex_items,
+    })
+    if isinstance(apo, dict) and apo.get("id"):
+        await client.request("GET", f"/apo/{apo['id']}", token, route="/apo/:id")
+
+
+async def apo_approvals(client: ApiClient, ctx: UserContext):
+    """ED forwards and MD sanctions pending APOs"""
+    for role, status in (("ED", "PENDING_ED_APPROVAL"), ("MD", "PENDING_MD_APPROVAL")):
+        token = ctx.tokens[role]
+        _, data = await client.request("GET", f"/apo?status={status}&limit=10", token)
+        pending = as_list(data)
+        if not pending:
+            continue
+        apo = ctx.rng.choice(pending)
+        await client.request("GET", f"/apo/{apo['id']}", token, route="/apo/:id")
+        # 409: another reviewer approved it concurrently; 400: it had already moved on
+        await client.request("PATCH", f"/apo/{apo['id']}/approve", token,
+                             {"action": "approve", "remarks": "Load test"},
+                             route="/apo/:id/approve", expect=(200, 400, 409))
+
+
+async def fund_indent_chain(client: ApiClient, ctx: UserContext):
+    """RFO raises a fund indent that DCF, ED and MD approve in turn"""
+    rfo_token = ctx.tokens["RFO"]
+    _, data = await client.request("GET", f"/fund-indent/works?year={ctx.financial_year}", rfo_token)
+    works = as_list(data, "works")
+    if not works:
+        return
+    work = ctx.rng.choice(works)
+    _, data = await client.request("GET", f"/fund-indent/work-items/{work['apo_id']}", rfo_token,
+                                   route="/fund-indent/work-items/:apoId")
+    line_items = as_list(data)
+    if not line_items:
+        return
+    selected = ctx.rng.sample(line_items, min(2, len(line_items)))
+    # 409: every selected item was claimed by a concurrent indent
+    status, indent = await client.request("POST", "/fund-indent/generate", rfo_token, {
+        "apo_id": work["apo_id"],
+        "items": [{
+            "id": item["id"],
+            "period_from": "2026-04-01",
+            "period_to": "2026-05-15",
+            "cm_date": "2026-05-10",
+            "cm_by": "Load Test RFO",
+            "fnb_book_no": str(ctx.user_id),
+            "fnb_page_no": str(ctx.counter),
+        } for item in selected],
+    }, expect=(201, 409))
+    if status != 201 or not isinstance(indent, dict) or not indent.get("est_id"):
+        return
+
+    est_id = indent["est_id"]
+    for role in ("DCF", "ED", "MD"):
+        token = ctx.tokens[role]
+        await client.request("GET", "/fund-indent/pending", token)
+        _, detail = await client.request("GET", f"/fund-indent/{est_id}", token, route="/fund-indent/:id")
+        item_ids = [item["id"] for item in as_list(detail)]
+        await client.request("POST", f"/fund-indent/{est_id}/approve", token, {
+            "approved_items": item_ids,
+            "rejected_items": [],
+            "comment": "Load test",
+        }, route="/fund-indent/:id/approve")
+
+
+async def dashboard_polling(client: ApiClient, ctx: UserContext):
+    """A signed-in user's dashboard refresh"""
+    role = ctx.rng.choice(["RO", "DO", "ED", "MD", "ADMIN"])
+    token = ctx.tokens[role]
+    await client.request("GET", "/auth/me", token)
+    await client.request("GET", "/dashboard/stats", token)
+    await client.request("GET", "/apo?limit=20", token)
+    if role in ("ED", "MD", "ADMIN"):
+        await client.request("GET", "/fund-indent/pending", token)
+
+
+# name -> (scenario, default weight)
+SCENARIOS: Dict[str, Tuple[Callable, float]] = {
+    "ro_plantation_entry": (ro_plantation_entry, 2),
+    "do_apo_compile": (do_apo_compile, 1),
+    "apo_approvals": (apo_approvals, 2),
+    "fund_indent_chain": (fund_indent_chain, 1),
+    "dashboard_polling": (dashboard_polling, 4),
+}
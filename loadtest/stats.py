@@ -0,0 +1,88 @@
+"""
+Per-route latency and error statistics for the load test report
+"""
+
+import math
+from typing import Dict, List, Any
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list (0 when empty)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class RouteStats:
+    """Latencies and outcomes of one route (method + pattern)"""
+
+    def __init__(self):
+        self.latencies_ms: List[float] = []
+        self.errors = 0
+        self.statuses: Dict[str, int] = {}
+
+    def record(self, status: int, latency_ms: float, ok: bool):
+        self.latencies_ms.append(latency_ms)
+        key = str(status) if status else "network_error"
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        if not ok:
+            self.errors += 1
+
+    def summary(self) -> Dict[str, Any]:
+        values = sorted(self.latencies_ms)
+        count = len(values)
+        return {
+            "count": count,
+            "errors": self.errors,
+            "error_rate": round(self.errors / count, 4) if count else 0.0,
+            "p50_ms": round(percentile(values, 50), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "p99_ms": round(percentile(values, 99), 1),
+            "max_ms": round(values[-1], 1) if values else 0.0,
+            "mean_ms": round(sum(values) / count, 1) if count else 0.0,
+            "statuses": dict(sorted(self.statuses.items())),
+        }
+
+
+class LoadStats:
+    """All routes of one run"""
+
+    def __init__(self):
+        self.routes: Dict[str, RouteStats] = {}
+        self.overall = RouteStats()
+
+    def record(self, method: str, route: str, status: int, latency_ms: float, ok: bool):
+        key = f"{method} {route}"
+        if key not in self.routes:
+            self.routes[key] = RouteStats()
+        self.routes[key].record(status, latency_ms, ok)
+        self.overall.record(status, latency_ms, ok)
+
+    def report(self, elapsed_s: float, config: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-serialisable report"""
+        overall = self.overall.summary()
+        return {
+            "config": config,
+            "elapsed_s": round(elapsed_s, 2),
+            "achieved_rps": round(overall["count"] / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+            "overall": overall,
+            "routes": {key: stats.summary() for key, stats in sorted(self.routes.items())},
+        }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Plain-text table of a report, slowest p95 first"""
+    lines = [
+        f"Duration {report['elapsed_s']}s, {report['overall']['count']} requests, "
+        f"{report['achieved_rps']} req/s, error rate {report['overall']['error_rate'] * 100:.2f}%",
+        "",
+        f"{'route':<52} {'count':>7} {'err%':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}",
+    ]
+    rows = sorted(report["routes"].items(), key=lambda item: item[1]["p95_ms"], reverse=True)
+    for key, row in rows + [("TOTAL", report["overall"])]:
+        lines.append(
+            f"{key[:52]:<52} {row['count']:>7} {row['error_rate'] * 100:>6.2f} "
+            f"{row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}"
+        )
+    return "\n".join(lines)